@@ -1,5 +1,7 @@
 import argparse
 
+from app.storage.in_memory.eviction import MaxMemoryPolicy
+
 
 def _parse_replicaof(value: str) -> dict:
     """
@@ -16,6 +18,20 @@ def _parse_replicaof(value: str) -> dict:
     return {"host": host, "port": int(port)}
 
 
+def _parse_memory(value: str) -> int:
+    """
+    Parses a memory size with an optional unit (eg, 100mb) to bytes.
+    """
+    units = {"kb": 1024, "mb": 1024**2, "gb": 1024**3, "b": 1}
+    value = value.strip().lower()
+    for unit, multiplier in units.items():
+        if value.endswith(unit) and value[: -len(unit)].isdigit():
+            return int(value[: -len(unit)]) * multiplier
+    if not value.isdigit():
+        raise argparse.ArgumentTypeError("memory must be bytes or use kb, mb, gb")
+    return int(value)
+
+
 def get_arg_parser() -> argparse.ArgumentParser:
     """
     Returns argument parser for the app.
@@ -50,4 +66,117 @@ def get_arg_parser() -> argparse.ArgumentParser:
         help="Specify master redis server to follow",
     )
 
+    parser.add_argument(
+        "--io-model",
+        type=str,
+        required=False,
+        default="threaded",
+        choices=["threaded", "asyncio"],
+        help="Serve clients with a thread per connection or from an asyncio event loop",
+    )
+
+    parser.add_argument(
+        "--workers",
+        type=int,
+        required=False,
+        default=1,
+        help="Number of worker processes, each owning a partition of the keyspace",
+    )
+
+    parser.add_argument(
+        "--storage",
+        type=str,
+        required=False,
+        default="global-lock",
+        choices=["global-lock", "striped"],
+        help="Guard the keyspace with a single global lock or with a lock per stripe of keys",
+    )
+
+    parser.add_argument(
+        "--maxmemory",
+        type=_parse_memory,
+        required=False,
+        default=0,
+        help="Max memory used by keys (eg, 100mb) before keys are evicted, 0 for no limit",
+    )
+
+    parser.add_argument(
+        "--maxmemory-policy",
+        type=str,
+        required=False,
+        default="noeviction",
+        choices=[policy.value for policy in MaxMemoryPolicy],
+        help="How keys are selected for eviction when maxmemory is reached",
+    )
+
+    parser.add_argument(
+        "--prefix-index",
+        action="store_true",
+        help="Keep keys in a sorted index so KEYS patterns with a literal prefix only visit matching keys",
+    )
+
+    parser.add_argument(
+        "--hash-max-listpack-entries",
+        type=int,
+        required=False,
+        default=128,
+        help="Max number of fields of hashes stored in the compact listpack encoding",
+    )
+
+    parser.add_argument(
+        "--hash-max-listpack-value",
+        type=int,
+        required=False,
+        default=64,
+        help="Max length of fields and values of hashes stored in the compact listpack encoding",
+    )
+
+    parser.add_argument(
+        "--set-max-intset-entries",
+        type=int,
+        required=False,
+        default=512,
+        help="Max number of members of integer sets stored in the compact intset encoding",
+    )
+
+    parser.add_argument(
+        "--zset-max-listpack-entries",
+        type=int,
+        required=False,
+        default=128,
+        help="Max number of members of sorted sets stored in the compact listpack encoding",
+    )
+
+    parser.add_argument(
+        "--zset-max-listpack-value",
+        type=int,
+        required=False,
+        default=64,
+        help="Max length of members of sorted sets stored in the compact listpack encoding",
+    )
+
+    parser.add_argument(
+        "--stream-node-max-bytes",
+        type=int,
+        required=False,
+        default=4096,
+        help="Max bytes of fields and values of a block of stream entries",
+    )
+
+    parser.add_argument(
+        "--stream-node-max-entries",
+        type=int,
+        required=False,
+        default=100,
+        help="Max number of entries of a block of stream entries",
+    )
+
+    parser.add_argument(
+        "--replica-output-buffer-limit",
+        type=int,
+        required=False,
+        default=256 * 1024 * 1024,
+        help="Max bytes pending to be sent to a replica before it is disconnected (0 for no limit)",
+    )
+
     return parser
@@ -0,0 +1,175 @@
+"""This file contains the registry of clients blocked on keys by blocking
+commands (eg, BLPOP or XREAD BLOCK).
+
+A blocked client sleeps on its own event without polling, until a write to
+one of its keys signals it (see `BlockedClients.signal`) or its timeout
+expires. Only the clients blocked on the written key are woken up, and
+each of them retries its command: clients that find nothing left (eg, the
+element was popped by another client) go back to sleep.
+
+Timeouts are kept in a heap served by a single timer thread, which sleeps
+until the earliest deadline (or until a client with an earlier one blocks).
+
+Clients of the asyncio io model wait on the event loop instead (see
+`BlockedClients.wait_for_async`): they are woken up through
+`loop.call_soon_threadsafe`, so a blocked client doesn't hold a thread.
+"""
+
+import asyncio
+import heapq
+import itertools
+import threading
+from time import monotonic
+from typing import Callable, TypeVar, cast
+
+T = TypeVar("T")
+
+
+class BlockedClient:
+    """A client blocked on keys, until a write to one of them or its
+    deadline wakes it up."""
+
+    __slots__ = ("keys", "deadline", "expired", "unblocked", "_event", "_loop")
+
+    def __init__(
+        self,
+        keys: list[bytes],
+        deadline: float | None,
+        loop: asyncio.AbstractEventLoop | None = None,
+    ):
+        self.keys = keys
+        self.deadline = deadline  # monotonic time, None to block forever
+        self.expired = False
+        self.unblocked = False  # no longer waits (its timer may not be dropped yet)
+        # clients waiting on an event loop are woken up from the loop thread
+        self._loop = loop
+        self._event: threading.Event | asyncio.Event = (
+            threading.Event() if loop is None else asyncio.Event()
+        )
+
+    def wake(self):
+        if self.unblocked:
+            return  # eg, the event loop it waited on may be closed since
+        if self._loop is None:
+            self._event.set()
+        else:
+            self._loop.call_soon_threadsafe(self._event.set)
+
+    def expire(self):
+        self.expired = True
+        self.wake()
+
+
+class BlockedClients:
+    """Clients blocked on each key, along with their timeouts.
+
+    The timer thread is started on the first client that blocks with a
+    timeout.
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        # clients blocked on each key, in the order they blocked (a dict is
+        # used as an ordered set)
+        self._clients: dict[bytes, dict[BlockedClient, None]] = {}
+        # deadlines of clients (ties are ordered by a counter), clients that
+        # are no longer blocked are dropped once their deadline passes
+        self._timers: list[tuple[float, int, BlockedClient]] = []
+        self._counter = itertools.count()
+        self._thread: threading.Thread | None = None
+
+    def __len__(self) -> int:
+        """Number of keys clients are blocked on."""
+        return len(self._clients)
+
+    def block(
+        self,
+        keys: list[bytes],
+        timeout: float | None,
+        loop: asyncio.AbstractEventLoop | None = None,
+    ) -> BlockedClient:
+        """Blocks a client on keys, for timeout seconds (None for no
+        timeout). Clients waiting on an event loop pass the loop."""
+        deadline = None if timeout is None else monotonic() + timeout
+        client = BlockedClient(keys, deadline, loop)
+        with self._cond:
+            for key in keys:
+                self._clients.setdefault(key, {})[client] = None
+            if deadline is not None:
+                heapq.heappush(self._timers, (deadline, next(self._counter), client))
+                if self._thread is None:
+                    self._thread = threading.Thread(target=self._run, daemon=True)
+                    self._thread.start()
+                elif self._timers[0][2] is client:
+                    self._cond.notify()  # the timer thread sleeps until later
+        return client
+
+    def unblock(self, client: BlockedClient):
+        with self._cond:
+            client.unblocked = True
+            for key in client.keys:
+                clients = self._clients.get(key)
+                if clients is not None:
+                    clients.pop(client, None)
+                    if not clients:
+                        del self._clients[key]
+
+    def signal(self, key: bytes):
+        """Wakes up the clients blocked on key, once it is written."""
+        if key not in self._clients:
+            return  # most writes are to keys no client is blocked on
+        with self._cond:
+            for client in self._clients.get(key, ()):
+                client.wake()
+
+    def wait_for(
+        self, keys: list[bytes], timeout: float | None, attempt: Callable[[], T | None]
+    ) -> T | None:
+        """Blocks until attempt returns a result (not None), which is called
+        again each time one of keys is written. Returns None once timeout
+        seconds have passed (None for no timeout).
+
+        attempt is called once more after the client is blocked, so writes
+        between a first attempt of the caller and blocking aren't missed.
+        """
+        client = self.block(keys, timeout)
+        event = cast(threading.Event, client._event)
+        try:
+            while True:
+                event.clear()  # writes from now on wake the client up again
+                result = attempt()
+                if result is not None or client.expired:
+                    return result
+                event.wait()
+        finally:
+            self.unblock(client)
+
+    async def wait_for_async(
+        self, keys: list[bytes], timeout: float | None, attempt: Callable[[], T | None]
+    ) -> T | None:
+        """Coroutine counterpart of `wait_for`, which waits on the running
+        event loop instead of holding a thread. attempt is called from the
+        event loop thread."""
+        client = self.block(keys, timeout, asyncio.get_running_loop())
+        event = cast(asyncio.Event, client._event)
+        try:
+            while True:
+                # wake ups are scheduled on the loop, so the ones made while
+                # attempting are only delivered once the client awaits
+                event.clear()
+                result = attempt()
+                if result is not None or client.expired:
+                    return result
+                await event.wait()
+        finally:
+            self.unblock(client)
+
+    def _run(self):
+        timers = self._timers
+        with self._cond:
+            while True:
+                now = monotonic()
+                while timers and timers[0][0] <= now:
+                    _, _, client = heapq.heappop(timers)
+                    client.expire()
+                self._cond.wait(timers[0][0] - now if timers else None)
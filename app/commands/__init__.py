@@ -4,17 +4,66 @@ from .handlers import *  # noqa: F403
 
 # map from command name in bytes to their constructor class
 NAME_TO_COMMANDS_MAP: dict[bytes, type[RedisCommand]] = {
+    b"BLPOP": CommandBLPop,
+    b"BRPOP": CommandBRPop,
     b"CONFIG": CommandConfig,
+    b"DEL": CommandDel,
     b"ECHO": CommandEcho,
+    b"FLUSHALL": CommandFlushAll,
+    b"FLUSHDB": CommandFlushDb,
     b"GET": CommandGet,
+    b"HDEL": CommandHDel,
+    b"HGET": CommandHGet,
+    b"HGETALL": CommandHGetAll,
+    b"HINCRBY": CommandHIncrBy,
+    b"HLEN": CommandHLen,
+    b"HMGET": CommandHMGet,
+    b"HSCAN": CommandHScan,
+    b"HSET": CommandHSet,
     b"INCR": CommandIncr,
     b"INFO": CommandInfo,
     b"KEYS": CommandKeys,
+    b"LINDEX": CommandLIndex,
+    b"LLEN": CommandLLen,
+    b"LPOP": CommandLPop,
+    b"LPUSH": CommandLPush,
+    b"LRANGE": CommandLRange,
+    b"LTRIM": CommandLTrim,
+    b"MEMORY": CommandMemory,
+    b"OBJECT": CommandObject,
     b"PING": CommandPing,
     b"PSYNC": CommandPsync,
+    b"SADD": CommandSAdd,
+    b"SCAN": CommandScan,
+    b"SCARD": CommandSCard,
+    b"SDIFF": CommandSDiff,
+    b"SINTER": CommandSInter,
+    b"SINTERSTORE": CommandSInterStore,
+    b"SISMEMBER": CommandSIsMember,
+    b"SMEMBERS": CommandSMembers,
+    b"SREM": CommandSRem,
+    b"SSCAN": CommandSScan,
+    b"SUNION": CommandSUnion,
     b"REPLCONF": CommandReplConf,
+    b"RPOP": CommandRPop,
+    b"RPUSH": CommandRPush,
     b"SET": CommandSet,
+    b"UNLINK": CommandUnlink,
     b"WAIT": CommandWait,
+    b"XADD": CommandXAdd,
+    b"XLEN": CommandXLen,
+    b"XRANGE": CommandXRange,
+    b"XREAD": CommandXRead,
+    b"XREVRANGE": CommandXRevRange,
+    b"XTRIM": CommandXTrim,
+    b"ZADD": CommandZAdd,
+    b"ZCARD": CommandZCard,
+    b"ZINCRBY": CommandZIncrBy,
+    b"ZRANGE": CommandZRange,
+    b"ZRANK": CommandZRank,
+    b"ZREM": CommandZRem,
+    b"ZSCAN": CommandZScan,
+    b"ZSCORE": CommandZScore,
     b"MULTI": CommandMulti,
     b"EXEC": CommandExec,
     b"DISCARD": CommandDiscard,
@@ -1,8 +1,14 @@
-"""This file defines logic for parsing arguments for redis command. The design choice is similar to the `argparse` library used for parsing command line arguments."""
+"""This file defines logic for parsing arguments for redis command. The design choice is similar to the `argparse` library used for parsing command line arguments.
+
+Argument parsers are declared once per command class (see `RedisCommand.arg_parser`)
+and compiled as arguments are added, so binding arguments of a request is a
+single pass over precomputed rules."""
 
 from dataclasses import dataclass
 from typing import Any, Callable, Optional
 
+from typing_extensions import Self
+
 from app.commands.errors import MissingArgument
 
 
@@ -25,9 +31,14 @@ class CommandArgParser:
     provided."""
 
     args: list  # list of argument rules that define how arguments should be parsed
+    min_args: int  # number of arguments needed to bind all required arguments
 
     def __init__(self):
         self.args = []
+        self.min_args = 0
+        self._names: tuple[str, ...] = ()
+        self._plain = True  # all arguments are required and bound as is
+        self._rules: tuple[tuple, ...] = ()
 
     def add_argument(
         self,
@@ -37,7 +48,7 @@ class CommandArgParser:
         default: Any = None,
         capture: bool = False,
         map_fn: Optional[Callable[[Any], Any]] = None,
-    ):
+    ) -> Self:
         self.args.append(
             CommandArgument(
                 name=name,
@@ -48,31 +59,53 @@ class CommandArgParser:
                 capture=capture,
             )
         )
+        self._compile()
+        return self
+
+    def _compile(self):
+        """Precompute binding rules, so parsing doesn't look up attributes of
+        argument definitions on every request."""
+        self.min_args = max(
+            (arg.pos + 1 for arg in self.args if arg.required), default=0
+        )
+        self._names = tuple(arg.name for arg in self.args)
+        self._plain = all(
+            arg.required and not arg.capture and arg.map_fn is None for arg in self.args
+        ) and [arg.pos for arg in self.args] == list(range(len(self.args)))
+        self._rules = tuple(
+            (arg.name, arg.pos, arg.capture, arg.map_fn, arg.default)
+            for arg in self.args
+        )
+
+    def check_arity(self, num_args: int):
+        """Raises MissingArgument if fewer arguments than required are
+        provided."""
+        if num_args < self.min_args:
+            missing = next(
+                arg for arg in self.args if arg.required and arg.pos >= num_args
+            )
+            raise MissingArgument(f"at position {missing.pos} - '{missing.name}'")
 
     def parse_args(self, args_list: list[bytes]) -> dict:
         """Takes a list of arguments, validates them and labels each based on
         parsing rules."""
-        parsed_args = {}
+        num_args = len(args_list)
+        self.check_arity(num_args)
+
+        if self._plain:
+            # positional arguments bound as is (eg, GET key, SET key value)
+            return dict(zip(self._names, args_list))
 
-        for arg in self.args:
+        parsed_args = {}
+        for name, pos, capture, map_fn, default in self._rules:
             # argument is provided if array is large enough to contain element at position
-            if len(args_list) > arg.pos:
-                if arg.capture:
-                    # include all trailing arguments as argument value
-                    value = args_list[arg.pos :]
-                else:
-                    value = args_list[arg.pos]
+            if pos < num_args:
+                # include all trailing arguments as argument value if captured
+                value = args_list[pos:] if capture else args_list[pos]
 
                 # apply mapping function (if defined)
-                if arg.map_fn:
-                    value = arg.map_fn(value)
-
-                parsed_args[arg.name] = value
-
+                parsed_args[name] = map_fn(value) if map_fn else value
             else:
-                if arg.required:
-                    raise MissingArgument(f"at position {arg.pos} - '{arg.name}'")
-                else:
-                    parsed_args[arg.name] = arg.default
+                parsed_args[name] = default
 
         return parsed_args
@@ -2,6 +2,7 @@
 
 from abc import ABC, abstractmethod
 
+from app.commands.args.parser import CommandArgParser
 from app.context import ConnectionContext, ExecutionContext
 
 # type for result of executing a command
@@ -13,9 +14,17 @@ class RedisCommand(ABC):
 
     args: dict  # arguments to the command, labeled as "argument name": "argument value"
 
-    @abstractmethod
+    # argument definitions, declared once per command class (commands
+    # without arguments bind an empty dict)
+    arg_parser: CommandArgParser = CommandArgParser()
+
+    # bytes of the request the command was parsed from (a view into the
+    # input buffer of the connection, valid while the command is executed),
+    # None for commands built otherwise
+    request: bytes | memoryview | None = None
+
     def __init__(self, args_list: list[bytes]):
-        raise NotImplementedError
+        self.args = self.arg_parser.parse_args(args_list)
 
     # should we always return a list of bytes though?
     # since we init using a list of bytes anyway?
@@ -33,6 +42,49 @@ class RedisCommand(ABC):
         another redis-server (for redis-client capabilities)."""
         raise NotImplementedError
 
+    def blocks(self) -> bool:
+        """Whether executing the command may block the connection until
+        something happens (eg, BLPOP until an element is pushed).
+
+        The asyncio io model executes these commands off the event loop, so
+        the other connections (eg, the client making the push) are still
+        served, unless they block on keys (see `blocked_on`).
+        """
+        return False
+
+    def blocked_on(self) -> tuple[list[bytes], float | None] | None:
+        """Keys a blocking command waits for a write to, along with its
+        timeout in seconds (None to wait forever). None for commands that
+        don't block on keys (eg, WAIT) or whose arguments are invalid.
+
+        Executed with blocking=False, these commands reply with a null array
+        instead of blocking, so the asyncio io model executes them again on
+        the event loop each time one of the keys is written (see
+        `BlockedClients.wait_for_async`), without holding a thread.
+        """
+        return None
+
+    def replication_payload(self) -> bytes | memoryview:
+        """Bytes propagated to replicas once the command is executed (see
+        the `broadcast` decorator).
+
+        This is the request the command was parsed from, so it isn't
+        serialized again. Commands that can't be replayed as received (eg,
+        an expiry relative to the current time) override this to rewrite
+        themselves, and commands without a request are serialized.
+        """
+        if self.request is None:
+            return bytes(self)
+        return self.request
+
+    def keys(self) -> list[bytes]:
+        """Returns the keys the command operates on, which is used to route
+        the command to the worker owning the keys.
+
+        Commands without keys return an empty list.
+        """
+        return []
+
     def name(self) -> str:
         """Returns command name.
 
@@ -1,18 +1,20 @@
-import threading
 from functools import wraps
 
 from app.commands.base import ExecutionResult
 from app.context import ConnectionContext, ExecutionContext
 from app.info.sections.info_replication import ReplicationRole
-from app.resp.types.simple_string import SimpleString
+from app.resp import encoder, shared
+from app.sharding.errors import ShardingError
 
 
 def broadcast(func):
     """Decorator to the command execution method exec() which propagates the
     command (if operating as master replica) to other replicas post execution.
 
-    Note that the command which uses this decorator must also implement
-    the __bytes__ method.
+    The request the command was parsed from is propagated as received,
+    unless the command rewrites it (see `RedisCommand.replication_payload`).
+    Commands that wrote nothing may rewrite it to empty bytes so they are
+    not propagated.
     """
 
     @wraps(func)
@@ -20,14 +22,19 @@ def broadcast(func):
         self, exec_ctx: ExecutionContext, conn_ctx: ConnectionContext, **kwargs
     ) -> ExecutionResult:
         result = func(self, exec_ctx, conn_ctx, **kwargs)
+        if isinstance(result, bytes) and result.startswith(b"-"):
+            return result  # rejected writes (eg, OOM) are not propagated
+        if result is shared.QUEUED:
+            return result  # propagated once executed by EXEC
+
         if exec_ctx.info.server_role() == ReplicationRole.MASTER:
-            replication_payload = bytes(self)
+            replication_payload = self.replication_payload()
+            if not replication_payload:
+                return result  # nothing was written (eg, a timed out BLPOP)
 
-            # send messages to replicas in a background thread (non-blocking)
-            threading.Thread(
-                target=exec_ctx.replica_pool.broadcast_to_all_connections,
-                args=(replication_payload,),
-            ).start()
+            # queued to the outbound buffer of each replica, which is sent
+            # by its writer thread (non-blocking)
+            exec_ctx.replica_pool.broadcast_to_all_connections(replication_payload)
 
             # offset that increments for every byte of replication
             # that is sent to replicas
@@ -49,8 +56,42 @@ def queueable(func):
         self, exec_ctx: ExecutionContext, conn_ctx: ConnectionContext, **kwargs
     ):
         if conn_ctx.tx_queue.is_enabled():
+            if isinstance(self.request, memoryview):
+                # the view is released before EXEC, keep a copy to propagate
+                self.request = bytes(self.request)
             conn_ctx.tx_queue.put(self)
-            return bytes(SimpleString(b"QUEUED"))
+            return shared.QUEUED
         return func(self, exec_ctx, conn_ctx, **kwargs)
 
     return exec_wrapper
+
+
+def sharded(func):
+    """Decorator to command execution method exec() for commands which operate
+    on keys (see keys() method of the command).
+
+    When the keyspace is sharded between multiple workers, the command is
+    forwarded to the worker owning its keys and the reply of that worker is
+    returned instead of executing the command locally.
+    """
+
+    @wraps(func)
+    def wrapper(
+        self, exec_ctx: ExecutionContext, conn_ctx: ConnectionContext, **kwargs
+    ) -> ExecutionResult:
+        router = exec_ctx.shard_router
+        if router is None:
+            return func(self, exec_ctx, conn_ctx, **kwargs)
+
+        try:
+            owner = router.route(self.keys())
+            if owner != router.worker_id:
+                exec_ctx.info.count_keyed_command(forwarded=True)
+                return router.forward(owner, bytes(self))
+        except ShardingError as e:
+            return encoder.error(str(e).encode())
+
+        exec_ctx.info.count_keyed_command(forwarded=False)
+        return func(self, exec_ctx, conn_ctx, **kwargs)
+
+    return wrapper
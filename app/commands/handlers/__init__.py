@@ -6,13 +6,72 @@ from .echo import CommandEcho
 from .get import CommandGet
 from .ping import CommandPing
 from .set import CommandSet
+from .delete import CommandDel
+from .unlink import CommandUnlink
+from .flushall import CommandFlushAll
+from .flushdb import CommandFlushDb
 from .config import CommandConfig
 from .keys import CommandKeys
+from .scan import CommandScan
+from .memory import CommandMemory
+from .object import CommandObject
 from .info import CommandInfo
 from .incr import CommandIncr
 from .replconf import CommandReplConf
 from .psync import CommandPsync
 from .wait import CommandWait
+from .lists import (
+    CommandLPush,
+    CommandRPush,
+    CommandLPop,
+    CommandRPop,
+    CommandLRange,
+    CommandLLen,
+    CommandLIndex,
+    CommandLTrim,
+    CommandBLPop,
+    CommandBRPop,
+)
+from .hashes import (
+    CommandHSet,
+    CommandHGet,
+    CommandHMGet,
+    CommandHDel,
+    CommandHGetAll,
+    CommandHIncrBy,
+    CommandHLen,
+    CommandHScan,
+)
+from .sets import (
+    CommandSAdd,
+    CommandSRem,
+    CommandSIsMember,
+    CommandSMembers,
+    CommandSCard,
+    CommandSInter,
+    CommandSUnion,
+    CommandSDiff,
+    CommandSInterStore,
+    CommandSScan,
+)
+from .zsets import (
+    CommandZAdd,
+    CommandZIncrBy,
+    CommandZScore,
+    CommandZRank,
+    CommandZRange,
+    CommandZRem,
+    CommandZCard,
+    CommandZScan,
+)
+from .streams import (
+    CommandXAdd,
+    CommandXRange,
+    CommandXRevRange,
+    CommandXLen,
+    CommandXTrim,
+    CommandXRead,
+)
 from .tx import CommandMulti, CommandDiscard, CommandExec
 
 __all__ = [
@@ -20,13 +79,62 @@ __all__ = [
     "CommandGet",
     "CommandPing",
     "CommandSet",
+    "CommandDel",
+    "CommandUnlink",
+    "CommandFlushAll",
+    "CommandFlushDb",
     "CommandConfig",
     "CommandKeys",
+    "CommandScan",
+    "CommandMemory",
+    "CommandObject",
     "CommandInfo",
     "CommandIncr",
     "CommandReplConf",
     "CommandPsync",
     "CommandWait",
+    "CommandLPush",
+    "CommandRPush",
+    "CommandLPop",
+    "CommandRPop",
+    "CommandLRange",
+    "CommandLLen",
+    "CommandLIndex",
+    "CommandLTrim",
+    "CommandBLPop",
+    "CommandBRPop",
+    "CommandHSet",
+    "CommandHGet",
+    "CommandHMGet",
+    "CommandHDel",
+    "CommandHGetAll",
+    "CommandHIncrBy",
+    "CommandHLen",
+    "CommandHScan",
+    "CommandSAdd",
+    "CommandSRem",
+    "CommandSIsMember",
+    "CommandSMembers",
+    "CommandSCard",
+    "CommandSInter",
+    "CommandSUnion",
+    "CommandSDiff",
+    "CommandSInterStore",
+    "CommandSScan",
+    "CommandZAdd",
+    "CommandZIncrBy",
+    "CommandZScore",
+    "CommandZRank",
+    "CommandZRange",
+    "CommandZRem",
+    "CommandZCard",
+    "CommandZScan",
+    "CommandXAdd",
+    "CommandXRange",
+    "CommandXRevRange",
+    "CommandXLen",
+    "CommandXTrim",
+    "CommandXRead",
     "CommandMulti",
     "CommandDiscard",
     "CommandExec",
@@ -5,7 +5,7 @@ from app.commands.base import ExecutionResult, RedisCommand
 from app.commands.decorators import queueable
 from app.commands.args.parser import CommandArgParser
 from app.context import ConnectionContext, ExecutionContext
-from app.resp import Array, BulkString
+from app.resp import encoder
 
 
 class CommandConfigGet(RedisCommand):
@@ -18,10 +18,9 @@ class CommandConfigGet(RedisCommand):
 
     args: dict
 
-    def __init__(self, args_list: list[bytes]):
-        parser = CommandArgParser()
-        parser.add_argument("parameter", 0, capture=True, map_fn=map_to_str_list)
-        self.args = parser.parse_args(args_list)
+    arg_parser = CommandArgParser().add_argument(
+        "parameter", 0, capture=True, map_fn=map_to_str_list
+    )
 
     @queueable
     def exec(
@@ -33,15 +32,13 @@ class CommandConfigGet(RedisCommand):
         for param_name in self.args["parameter"]:
             # it is not necessarily a one-one match since glob patterns are supported,
             # but it is out of scope for now
-            if value := config_dict.get(param_name):
-                array.extend(
-                    [BulkString(param_name.encode()), BulkString(value.encode())]
-                )
+            # parameters are named with dashes (eg, maxmemory-policy)
+            value = config_dict.get(param_name.replace("-", "_"))
+            if value is not None:
+                array.extend([param_name.encode(), str(value).encode()])
 
-        return bytes(Array(value=array))
+        return encoder.bulk_string_array(array)
 
     def __bytes__(self) -> bytes:
-        array = [BulkString(b"CONFIG"), BulkString(b"GET")]
-        for param_name in self.args["parameter"]:
-            array.append(BulkString(param_name.encode()))
-        return bytes(Array(array))
+        params = [param_name.encode() for param_name in self.args["parameter"]]
+        return encoder.command(b"CONFIG", b"GET", *params)
@@ -0,0 +1,37 @@
+from app.commands.base import ExecutionResult, RedisCommand
+from app.commands.decorators import broadcast, queueable, sharded
+from app.commands.args.parser import CommandArgParser
+from app.context import ConnectionContext, ExecutionContext
+from app.resp import encoder
+
+
+class CommandDel(RedisCommand):
+    """Removes the specified keys. A key is ignored if it does not exist.
+    Returns the number of keys that were removed.
+
+    Values are freed synchronously, see UNLINK to free them in the
+    background.
+
+    Syntax:
+      DEL key [key ...]
+    """
+
+    args: dict
+    write: bool = True
+    lazy: bool = False  # free removed values in the background
+
+    arg_parser = CommandArgParser().add_argument("keys", 0, capture=True)
+
+    @broadcast
+    @queueable
+    @sharded
+    def exec(
+        self, exec_ctx: ExecutionContext, conn_ctx: ConnectionContext, **kwargs
+    ) -> ExecutionResult:
+        return encoder.integer(exec_ctx.storage.delete(self.args["keys"], self.lazy))
+
+    def keys(self) -> list[bytes]:
+        return self.args["keys"]
+
+    def __bytes__(self) -> bytes:
+        return encoder.command(b"DEL", *self.args["keys"])
@@ -2,8 +2,7 @@ from app.commands.base import ExecutionResult, RedisCommand
 from app.commands.decorators import queueable
 from app.commands.args.parser import CommandArgParser
 from app.context import ConnectionContext, ExecutionContext
-from app.resp import BulkString
-from app.resp.types.array import Array
+from app.resp import encoder
 
 
 class CommandEcho(RedisCommand):
@@ -15,17 +14,13 @@ class CommandEcho(RedisCommand):
 
     args: dict
 
-    def __init__(self, args_list: list[bytes]):
-        parser = CommandArgParser()
-        parser.add_argument("message", 0)
-        self.args = parser.parse_args(args_list)
+    arg_parser = CommandArgParser().add_argument("message", 0)
 
     @queueable
     def exec(
         self, exec_ctx: ExecutionContext, conn_ctx: ConnectionContext, **kwargs
     ) -> ExecutionResult:
-        return bytes(BulkString(self.args["message"]))
+        return encoder.bulk_string(self.args["message"])
 
     def __bytes__(self) -> bytes:
-        message = self.args["message"]
-        return bytes(Array([BulkString(b"ECHO"), BulkString(message)]))
+        return encoder.command(b"ECHO", self.args["message"])
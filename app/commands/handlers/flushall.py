@@ -0,0 +1,58 @@
+from app.commands.args.mapping import map_to_str
+from app.commands.base import ExecutionResult, RedisCommand
+from app.commands.decorators import broadcast, queueable
+from app.commands.args.parser import CommandArgParser
+from app.context import ConnectionContext, ExecutionContext
+from app.resp import encoder, shared
+from app.sharding.errors import ShardingError
+
+
+class CommandFlushAll(RedisCommand):
+    """Removes all keys. With ASYNC, the keyspace is detached and freed in a
+    background thread, so the command returns right away (keys written
+    afterwards are not affected).
+
+    When the keyspace is sharded between multiple workers, the keys of
+    every worker are removed: the command is forwarded to the other workers
+    after flushing the keys of the worker the client is connected to.
+
+    Syntax:
+      FLUSHALL [ASYNC | SYNC]
+    """
+
+    args: dict
+    write: bool = True
+    command_name: bytes = b"FLUSHALL"
+
+    arg_parser = CommandArgParser().add_argument(
+        "mode", 0, required=False, map_fn=map_to_str
+    )
+
+    @broadcast
+    @queueable
+    def exec(
+        self, exec_ctx: ExecutionContext, conn_ctx: ConnectionContext, **kwargs
+    ) -> ExecutionResult:
+        mode = self.args["mode"]
+        if mode is not None and mode.upper() not in ("ASYNC", "SYNC"):
+            return shared.ERR_SYNTAX
+
+        exec_ctx.storage.flush(lazy=mode is not None and mode.upper() == "ASYNC")
+
+        router = exec_ctx.shard_router
+        if router is None or conn_ctx.is_forwarded:
+            return shared.OK
+
+        try:
+            replies = router.forward_to_all(bytes(self))
+        except ShardingError as e:
+            return encoder.error(str(e).encode())
+        for reply in replies:
+            if reply.startswith(b"-"):
+                return reply
+        return shared.OK
+
+    def __bytes__(self) -> bytes:
+        if self.args["mode"] is not None:
+            return encoder.command(self.command_name, self.args["mode"].encode())
+        return encoder.command(self.command_name)
@@ -0,0 +1,12 @@
+from app.commands.handlers.flushall import CommandFlushAll
+
+
+class CommandFlushDb(CommandFlushAll):
+    """Removes all keys of the current database, which is the only database
+    (same as FLUSHALL).
+
+    Syntax:
+      FLUSHDB [ASYNC | SYNC]
+    """
+
+    command_name: bytes = b"FLUSHDB"
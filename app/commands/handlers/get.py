@@ -1,9 +1,8 @@
 from app.commands.base import ExecutionResult, RedisCommand
-from app.commands.decorators import queueable
+from app.commands.decorators import queueable, sharded
 from app.commands.args.parser import CommandArgParser
 from app.context import ConnectionContext, ExecutionContext
-from app.resp.types import NIL, BulkString
-from app.resp.types.array import Array
+from app.resp import encoder, shared
 from app.storage.in_memory.errors import KeyDoesNotExist, KeyExpired
 
 
@@ -18,22 +17,25 @@ class CommandGet(RedisCommand):
 
     args: dict
 
-    def __init__(self, args_list: list[bytes]):
-        parser = CommandArgParser()
-        parser.add_argument("key", 0)
-        self.args = parser.parse_args(args_list)
+    arg_parser = CommandArgParser().add_argument("key", 0)
 
     @queueable
+    @sharded
     def exec(
         self, exec_ctx: ExecutionContext, conn_ctx: ConnectionContext, **kwargs
     ) -> ExecutionResult:
         key = self.args["key"]
         try:
             value = exec_ctx.storage.get(key)
-            return bytes(BulkString(bytes(value)))
+            if value.type_name != "string":
+                return shared.WRONGTYPE
+            return encoder.bulk_string(bytes(value))
         except (KeyDoesNotExist, KeyExpired):
-            return NIL
+            return shared.NIL
+
+    def keys(self) -> list[bytes]:
+        return [self.args["key"]]
 
     def __bytes__(self) -> bytes:
         key = self.args["key"]
-        return bytes(Array([BulkString(b"GET"), BulkString(key)]))
+        return encoder.command(b"GET", key)
@@ -0,0 +1,25 @@
+"""This file includes all logic for handling commands on hash values (see
+`Listpack` and `HashTable` for the structures backing hashes).
+
+Individual commands are split into multiple files as necessary.
+"""
+
+from .hset import CommandHSet
+from .hget import CommandHGet
+from .hmget import CommandHMGet
+from .hdel import CommandHDel
+from .hgetall import CommandHGetAll
+from .hincrby import CommandHIncrBy
+from .hlen import CommandHLen
+from .hscan import CommandHScan
+
+__all__ = [
+    "CommandHSet",
+    "CommandHGet",
+    "CommandHMGet",
+    "CommandHDel",
+    "CommandHGetAll",
+    "CommandHIncrBy",
+    "CommandHLen",
+    "CommandHScan",
+]
@@ -0,0 +1,61 @@
+from app.config import Config
+from app.storage.in_memory.errors import WrongType
+from app.storage.structures import Hash, HashTable, Listpack
+from app.storage.types import INT64_MAX, INT64_MIN, RedisEncoding, RedisValue
+
+
+def new_hash() -> RedisValue:
+    return RedisValue.with_payload(Listpack(), RedisEncoding.HASH_ZIPLIST)
+
+
+def hash_of(key: bytes, value: RedisValue | None) -> Hash | None:
+    """Returns the hash held by the value (None if there is no value).
+
+    Raises WrongType if the value is not a hash.
+    """
+    if value is None:
+        return None
+    if value.encoding not in (RedisEncoding.HASH_ZIPLIST, RedisEncoding.HASH):
+        raise WrongType(key)
+    return value.payload
+
+
+def parse_int64(arg: bytes) -> int:
+    """Parses a 64 bit integer, raises ValueError if arg isn't one."""
+    if not arg.removeprefix(b"-").isdigit():
+        raise ValueError(f"{arg!r} is not an integer")
+    number = int(arg)
+    if not INT64_MIN <= number <= INT64_MAX:
+        raise ValueError(f"{arg!r} is out of range")
+    return number
+
+
+def _convert_to_hashtable(value: RedisValue):
+    value.payload = HashTable(value.payload.items())
+    value.encoding = RedisEncoding.HASH
+
+
+def set_fields(
+    value: RedisValue, pairs: list[tuple[bytes, bytes]], config: Config
+) -> int:
+    """Sets fields of the hash held by value, which is converted to the
+    hashtable encoding once it exceeds the listpack limits of the config.
+
+    Returns the number of fields added.
+    """
+    if value.encoding == RedisEncoding.HASH_ZIPLIST:
+        # converted before the update if the update alone exceeds the limits
+        max_value = config.hash_max_listpack_value
+        if len(pairs) > config.hash_max_listpack_entries or any(
+            len(field) > max_value or len(field_value) > max_value
+            for field, field_value in pairs
+        ):
+            _convert_to_hashtable(value)
+
+    added = value.payload.update(pairs)
+    if (
+        value.encoding == RedisEncoding.HASH_ZIPLIST
+        and len(value.payload) > config.hash_max_listpack_entries
+    ):
+        _convert_to_hashtable(value)
+    return added
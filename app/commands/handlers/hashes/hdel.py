@@ -0,0 +1,56 @@
+from app.commands.base import ExecutionResult, RedisCommand
+from app.commands.decorators import broadcast, queueable, sharded
+from app.commands.args.parser import CommandArgParser
+from app.commands.handlers.hashes.common import hash_of
+from app.context import ConnectionContext, ExecutionContext
+from app.resp import encoder, shared
+from app.storage.in_memory.errors import WrongType
+from app.storage.types import RedisValue
+
+
+class CommandHDel(RedisCommand):
+    """Removes the specified fields from the hash stored at key, fields that
+    do not exist are ignored. Returns the number of fields removed.
+
+    Syntax:
+      HDEL key field [field ...]
+    """
+
+    args: dict
+    write: bool = True
+
+    arg_parser = (
+        CommandArgParser()
+        .add_argument("key", 0)
+        .add_argument("fields", 1, capture=True)
+    )
+
+    @broadcast
+    @queueable
+    @sharded
+    def exec(
+        self, exec_ctx: ExecutionContext, conn_ctx: ConnectionContext, **kwargs
+    ) -> ExecutionResult:
+        key, fields = self.args["key"], self.args["fields"]
+        removed = 0
+
+        def _delete(value: RedisValue | None) -> RedisValue | None:
+            nonlocal removed
+            hash_fields = hash_of(key, value)
+            if hash_fields is None:
+                return None
+            removed = hash_fields.delete(fields)
+            return value if len(hash_fields) else None  # empty hashes are removed
+
+        try:
+            # removing fields never needs memory, so keys are not evicted
+            exec_ctx.storage.upsert(key, _delete, free_memory=False)
+        except WrongType:
+            return shared.WRONGTYPE
+        return encoder.integer(removed)
+
+    def keys(self) -> list[bytes]:
+        return [self.args["key"]]
+
+    def __bytes__(self) -> bytes:
+        return encoder.command(b"HDEL", self.args["key"], *self.args["fields"])
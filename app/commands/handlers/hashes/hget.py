@@ -0,0 +1,43 @@
+from app.commands.base import ExecutionResult, RedisCommand
+from app.commands.decorators import queueable, sharded
+from app.commands.args.parser import CommandArgParser
+from app.commands.handlers.hashes.common import hash_of
+from app.context import ConnectionContext, ExecutionContext
+from app.resp import encoder, shared
+from app.storage.in_memory.errors import WrongType
+from app.storage.types import RedisValue
+
+
+class CommandHGet(RedisCommand):
+    """Returns the value associated with field in the hash stored at key
+    (nil if the field or the key does not exist).
+
+    Syntax:
+      HGET key field
+    """
+
+    args: dict
+
+    arg_parser = CommandArgParser().add_argument("key", 0).add_argument("field", 1)
+
+    @queueable
+    @sharded
+    def exec(
+        self, exec_ctx: ExecutionContext, conn_ctx: ConnectionContext, **kwargs
+    ) -> ExecutionResult:
+        key, field = self.args["key"], self.args["field"]
+
+        def _get(value: RedisValue | None) -> bytes | None:
+            fields = hash_of(key, value)
+            return fields.get(field) if fields is not None else None
+
+        try:
+            return encoder.bulk_string(exec_ctx.storage.view(key, _get))
+        except WrongType:
+            return shared.WRONGTYPE
+
+    def keys(self) -> list[bytes]:
+        return [self.args["key"]]
+
+    def __bytes__(self) -> bytes:
+        return encoder.command(b"HGET", self.args["key"], self.args["field"])
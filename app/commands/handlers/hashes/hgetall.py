@@ -0,0 +1,45 @@
+from app.commands.base import ExecutionResult, RedisCommand
+from app.commands.decorators import queueable, sharded
+from app.commands.args.parser import CommandArgParser
+from app.commands.handlers.hashes.common import hash_of
+from app.context import ConnectionContext, ExecutionContext
+from app.resp import encoder, shared
+from app.storage.in_memory.errors import WrongType
+from app.storage.types import RedisValue
+
+
+class CommandHGetAll(RedisCommand):
+    """Returns all fields and values of the hash stored at key, each field
+    followed by its value (empty if the key does not exist).
+
+    Syntax:
+      HGETALL key
+    """
+
+    args: dict
+
+    arg_parser = CommandArgParser().add_argument("key", 0)
+
+    @queueable
+    @sharded
+    def exec(
+        self, exec_ctx: ExecutionContext, conn_ctx: ConnectionContext, **kwargs
+    ) -> ExecutionResult:
+        key = self.args["key"]
+
+        def _items(value: RedisValue | None) -> list[bytes]:
+            fields = hash_of(key, value)
+            if fields is None:
+                return []
+            return [element for pair in fields.items() for element in pair]
+
+        try:
+            return encoder.bulk_string_array(exec_ctx.storage.view(key, _items))
+        except WrongType:
+            return shared.WRONGTYPE
+
+    def keys(self) -> list[bytes]:
+        return [self.args["key"]]
+
+    def __bytes__(self) -> bytes:
+        return encoder.command(b"HGETALL", self.args["key"])
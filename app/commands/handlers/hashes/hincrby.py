@@ -0,0 +1,90 @@
+from app.commands.base import ExecutionResult, RedisCommand
+from app.commands.decorators import broadcast, queueable, sharded
+from app.commands.args.parser import CommandArgParser
+from app.commands.handlers.hashes.common import (
+    hash_of,
+    new_hash,
+    parse_int64,
+    set_fields,
+)
+from app.context import ConnectionContext, ExecutionContext
+from app.resp import encoder, shared
+from app.storage.in_memory.errors import OutOfMemory, WrongType
+from app.storage.types import INT64_MAX, INT64_MIN, RedisValue
+
+ERR_HASH_NOT_INTEGER = encoder.error(b"ERR hash value is not an integer")
+ERR_OVERFLOW = encoder.error(b"ERR increment or decrement would overflow")
+
+
+class _IncrError(Exception):
+    """Raised from the update with the error reply of the increment."""
+
+    def __init__(self, reply: bytes):
+        super().__init__(reply)
+        self.reply = reply
+
+
+class CommandHIncrBy(RedisCommand):
+    """Increments the number stored at field in the hash stored at key by
+    increment. If key does not exist, a new hash is created, and if field
+    does not exist it is set to 0 before the operation. Returns the value of
+    the field after the increment.
+
+    Syntax:
+      HINCRBY key field increment
+    """
+
+    args: dict
+    write: bool = True
+
+    arg_parser = (
+        CommandArgParser()
+        .add_argument("key", 0)
+        .add_argument("field", 1)
+        .add_argument("increment", 2)
+    )
+
+    @broadcast
+    @queueable
+    @sharded
+    def exec(
+        self, exec_ctx: ExecutionContext, conn_ctx: ConnectionContext, **kwargs
+    ) -> ExecutionResult:
+        key, field = self.args["key"], self.args["field"]
+        try:
+            increment = parse_int64(self.args["increment"])
+        except ValueError:
+            return shared.ERR_NOT_INTEGER
+        result = 0
+
+        def _incr(value: RedisValue | None) -> RedisValue:
+            nonlocal result
+            value = value or new_hash()
+            current = hash_of(key, value).get(field)
+            try:
+                number = parse_int64(current) if current is not None else 0
+            except ValueError:
+                raise _IncrError(ERR_HASH_NOT_INTEGER)
+            result = number + increment
+            if not INT64_MIN <= result <= INT64_MAX:
+                raise _IncrError(ERR_OVERFLOW)
+            set_fields(value, [(field, b"%d" % result)], exec_ctx.config)
+            return value
+
+        try:
+            exec_ctx.storage.upsert(key, _incr)
+        except _IncrError as e:
+            return e.reply
+        except WrongType:
+            return shared.WRONGTYPE
+        except OutOfMemory:
+            return shared.OOM
+        return encoder.integer(result)
+
+    def keys(self) -> list[bytes]:
+        return [self.args["key"]]
+
+    def __bytes__(self) -> bytes:
+        return encoder.command(
+            b"HINCRBY", self.args["key"], self.args["field"], self.args["increment"]
+        )
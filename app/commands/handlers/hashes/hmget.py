@@ -0,0 +1,55 @@
+from app.commands.base import ExecutionResult, RedisCommand
+from app.commands.decorators import queueable, sharded
+from app.commands.args.parser import CommandArgParser
+from app.commands.handlers.hashes.common import hash_of
+from app.context import ConnectionContext, ExecutionContext
+from app.resp import encoder, shared
+from app.storage.in_memory.errors import WrongType
+from app.storage.types import RedisValue
+
+
+class CommandHMGet(RedisCommand):
+    """Returns the values associated with the specified fields in the hash
+    stored at key, nil for fields (or a key) that do not exist.
+
+    Syntax:
+      HMGET key field [field ...]
+    """
+
+    args: dict
+
+    arg_parser = (
+        CommandArgParser()
+        .add_argument("key", 0)
+        .add_argument("fields", 1, capture=True)
+    )
+
+    @queueable
+    @sharded
+    def exec(
+        self, exec_ctx: ExecutionContext, conn_ctx: ConnectionContext, **kwargs
+    ) -> ExecutionResult:
+        key, fields = self.args["key"], self.args["fields"]
+
+        def _get(value: RedisValue | None) -> list[bytes | None]:
+            hash_fields = hash_of(key, value)
+            if hash_fields is None:
+                return [None] * len(fields)
+            return [hash_fields.get(field) for field in fields]
+
+        try:
+            values = exec_ctx.storage.view(key, _get)
+        except WrongType:
+            return shared.WRONGTYPE
+
+        buf = bytearray()
+        encoder.write_array_header(buf, len(values))
+        for value in values:
+            encoder.write_bulk_string(buf, value)  # nil for missing fields
+        return bytes(buf)
+
+    def keys(self) -> list[bytes]:
+        return [self.args["key"]]
+
+    def __bytes__(self) -> bytes:
+        return encoder.command(b"HMGET", self.args["key"], *self.args["fields"])
@@ -0,0 +1,73 @@
+from app.commands.base import ExecutionResult, RedisCommand
+from app.commands.decorators import queueable, sharded
+from app.commands.args.parser import CommandArgParser
+from app.commands.handlers.hashes.common import hash_of
+from app.commands.handlers.scan import (
+    InvalidScanArguments,
+    parse_scan_arguments,
+    scan_reply,
+)
+from app.context import ConnectionContext, ExecutionContext
+from app.resp import encoder, shared
+from app.storage.in_memory.errors import WrongType
+from app.storage.in_memory.scan import compile_pattern
+from app.storage.types import RedisValue
+
+
+class CommandHScan(RedisCommand):
+    """Iterates over the fields of the hash stored at key in steps, like
+    SCAN does over keys. Each step returns the cursor to pass to the next
+    call along with the fields of the step, each followed by its value.
+
+    Hashes in the listpack encoding are returned whole in a single step (the
+    COUNT hint is ignored), like in Redis.
+
+    Syntax:
+      HSCAN key cursor [MATCH pattern] [COUNT count]
+    """
+
+    args: dict
+
+    arg_parser = (
+        CommandArgParser()
+        .add_argument("key", 0)
+        .add_argument("cursor", 1)
+        .add_argument("options", 2, required=False, capture=True, default=[])
+    )
+
+    @queueable
+    @sharded
+    def exec(
+        self, exec_ctx: ExecutionContext, conn_ctx: ConnectionContext, **kwargs
+    ) -> ExecutionResult:
+        key = self.args["key"]
+        try:
+            cursor, pattern, count, _ = parse_scan_arguments(
+                self.args["cursor"], self.args["options"], allow_type=False
+            )
+        except InvalidScanArguments as e:
+            return e.reply
+
+        def _scan(value: RedisValue | None) -> tuple[int, list[tuple[bytes, bytes]]]:
+            fields = hash_of(key, value)
+            if fields is None:
+                return 0, []
+            return fields.scan(cursor, count)
+
+        try:
+            cursor, pairs = exec_ctx.storage.view(key, _scan)
+        except WrongType:
+            return shared.WRONGTYPE
+
+        if pattern:
+            regex = compile_pattern(pattern)
+            pairs = [pair for pair in pairs if regex and regex.fullmatch(pair[0])]
+        return scan_reply(cursor, [element for pair in pairs for element in pair])
+
+    def keys(self) -> list[bytes]:
+        return [self.args["key"]]
+
+    def __bytes__(self) -> bytes:
+        return encoder.command(
+            b"HSCAN", self.args["key"], self.args["cursor"], *self.args["options"]
+        )
@@ -0,0 +1,62 @@
+from app.commands.base import ExecutionResult, RedisCommand
+from app.commands.decorators import broadcast, queueable, sharded
+from app.commands.args.parser import CommandArgParser
+from app.commands.handlers.hashes.common import hash_of, new_hash, set_fields
+from app.context import ConnectionContext, ExecutionContext
+from app.resp import encoder, shared
+from app.storage.in_memory.errors import OutOfMemory, WrongType
+from app.storage.types import RedisValue
+
+ERR_WRONG_NUMBER_OF_ARGS = encoder.error(
+    b"ERR wrong number of arguments for 'hset' command"
+)
+
+
+class CommandHSet(RedisCommand):
+    """Sets the specified fields to their respective values in the hash
+    stored at key, overwriting existing fields. If key does not exist, a new
+    hash is created. Returns the number of fields that were added.
+
+    Syntax:
+      HSET key field value [field value ...]
+    """
+
+    args: dict
+    write: bool = True
+
+    arg_parser = (
+        CommandArgParser().add_argument("key", 0).add_argument("pairs", 1, capture=True)
+    )
+
+    @broadcast
+    @queueable
+    @sharded
+    def exec(
+        self, exec_ctx: ExecutionContext, conn_ctx: ConnectionContext, **kwargs
+    ) -> ExecutionResult:
+        key, args = self.args["key"], self.args["pairs"]
+        if len(args) % 2:
+            return ERR_WRONG_NUMBER_OF_ARGS
+        pairs = list(zip(args[::2], args[1::2]))
+        added = 0
+
+        def _set(value: RedisValue | None) -> RedisValue:
+            nonlocal added
+            value = value or new_hash()
+            hash_of(key, value)  # type check
+            added = set_fields(value, pairs, exec_ctx.config)
+            return value
+
+        try:
+            exec_ctx.storage.upsert(key, _set)
+        except WrongType:
+            return shared.WRONGTYPE
+        except OutOfMemory:
+            return shared.OOM
+        return encoder.integer(added)
+
+    def keys(self) -> list[bytes]:
+        return [self.args["key"]]
+
+    def __bytes__(self) -> bytes:
+        return encoder.command(b"HSET", self.args["key"], *self.args["pairs"])
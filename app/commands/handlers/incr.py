@@ -1,20 +1,21 @@
 from app.commands.base import ExecutionResult, RedisCommand
-from app.commands.decorators import broadcast, queueable
-from app.commands.handlers import CommandSet
+from app.commands.decorators import broadcast, queueable, sharded
 from app.commands.args.parser import CommandArgParser
 from app.context import ConnectionContext, ExecutionContext
-from app.resp.types import Integer
-from app.resp.types.array import Array
-from app.resp.types.bulk_string import BulkString
-from app.resp.types.simple_error import SimpleError
-from app.storage.in_memory.errors import KeyDoesNotExist, KeyExpired
+from app.resp import encoder, shared
+from app.storage.in_memory.errors import (
+    KeyDoesNotExist,
+    KeyExpired,
+    OutOfMemory,
+    WrongType,
+)
 from app.storage.types import RedisValue
 
 
 class CommandIncr(RedisCommand):
-    """Returns the string value of a key. If the key does not exist the special
-    value nil is returned. An error is returned if the value stored at key is
-    not a string, because GET only handles string values.
+    """Increments the number stored at key by one. If the key does not exist,
+    it is set to 0 before performing the operation. An error is returned if
+    the value is not a string that can be represented as a 64 bit integer.
 
     Syntax:
       INCR key
@@ -23,35 +24,49 @@ class CommandIncr(RedisCommand):
     args: dict
     write: bool = True
 
-    def __init__(self, args_list: list[bytes]):
-        parser = CommandArgParser()
-        parser.add_argument("key", 0)
-        self.args = parser.parse_args(args_list)
+    arg_parser = CommandArgParser().add_argument("key", 0)
 
     @broadcast
     @queueable
+    @sharded
     def exec(
         self, exec_ctx: ExecutionContext, conn_ctx: ConnectionContext, **kwargs
     ) -> ExecutionResult:
         key = self.args["key"]
         try:
             value = exec_ctx.storage.update(key, _incr_value)
-            return bytes(Integer(bytes(value)))
+            return encoder.integer(value.int_value)
 
         except (KeyDoesNotExist, KeyExpired):
-            # create a new key with integer value 1
-            CommandSet([key, b"1"]).exec(exec_ctx, conn_ctx, **kwargs)
-            return bytes(Integer(b"1"))
+            # create a new key with integer value 1 (directly in storage, so
+            # only INCR itself is propagated to replicas)
+            try:
+                exec_ctx.storage.set(key, RedisValue(raw_bytes=b"1"))
+            except OutOfMemory:
+                return shared.OOM
+            return shared.INTEGERS[1]
 
-        except (ValueError, UnicodeDecodeError):
-            return bytes(SimpleError(b"ERR value is not an integer or out of range"))
+        except OutOfMemory:
+            return shared.OOM
+
+        except WrongType:
+            return shared.WRONGTYPE
+
+        except ValueError:
+            return shared.ERR_NOT_INTEGER
+
+    def keys(self) -> list[bytes]:
+        return [self.args["key"]]
 
     def __bytes__(self) -> bytes:
         key = self.args["key"]
-        return bytes(Array([BulkString(b"INCR"), BulkString(key)]))
+        return encoder.command(b"INCR", key)
 
 
 def _incr_value(value: RedisValue) -> RedisValue:
-    incr = int(value.raw_bytes.decode()) + 1
-    value.raw_bytes = str(incr).encode()
+    if value.type_name != "string":
+        raise WrongType
+    # values that look like integers are already int encoded, so there is
+    # no parsing or formatting of strings (raises ValueError on overflow)
+    value.int_value += 1
     return value
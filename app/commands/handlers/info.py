@@ -3,8 +3,7 @@ from app.commands.base import ExecutionResult, RedisCommand
 from app.commands.decorators import queueable
 from app.commands.args.parser import CommandArgParser
 from app.context import ConnectionContext, ExecutionContext
-from app.resp.types import BulkString
-from app.resp.types.array import Array
+from app.resp import encoder
 
 
 class CommandInfo(RedisCommand):
@@ -18,21 +17,15 @@ class CommandInfo(RedisCommand):
 
     args: dict
 
-    def __init__(self, args_list: list[bytes]):
-        parser = CommandArgParser()
-        parser.add_argument(
-            "section",
-            0,
-            required=False,
-            capture=True,
-            map_fn=map_to_str_list,
-        )
-        self.args = parser.parse_args(args_list)
+    arg_parser = CommandArgParser().add_argument(
+        "section", 0, required=False, capture=True, map_fn=map_to_str_list
+    )
 
     @queueable
     def exec(
         self, exec_ctx: ExecutionContext, conn_ctx: ConnectionContext, **kwargs
     ) -> ExecutionResult:
+        exec_ctx.info.update_memory_stats(exec_ctx.storage.memory_stats())
         if section_names := self.args["section"]:
             sections = exec_ctx.info.get_sections_by_names(section_names)
         else:
@@ -40,11 +33,10 @@ class CommandInfo(RedisCommand):
             sections = exec_ctx.info.get_all_sections()
 
         info = b"".join(sections.values())
-        return bytes(BulkString(info))
+        return encoder.bulk_string(info)
 
     def __bytes__(self) -> bytes:
-        array = [BulkString(b"INFO")]
-        if isinstance(self.args["section"], list):
-            for section_name in self.args["section"]:
-                array.append(BulkString(section_name.encode()))
-        return bytes(Array(array))
+        sections = [
+            section_name.encode() for section_name in self.args["section"] or []
+        ]
+        return encoder.command(b"INFO", *sections)
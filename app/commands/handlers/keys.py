@@ -2,7 +2,8 @@ from app.commands.base import ExecutionResult, RedisCommand
 from app.commands.decorators import queueable
 from app.commands.args.parser import CommandArgParser
 from app.context import ConnectionContext, ExecutionContext
-from app.resp.types import Array, BulkString
+from app.resp import encoder
+from app.sharding.errors import ShardingError
 
 
 class CommandKeys(RedisCommand):
@@ -16,16 +17,17 @@ class CommandKeys(RedisCommand):
     h[^e]llo matches hallo, hbllo, ... but not hello
     h[a-b]llo matches hallo and hbllo
 
+    When the keyspace is sharded between multiple workers, the keys of
+    every worker are returned: KEYS is forwarded to the other workers and
+    their replies are merged with the local keys.
+
     Syntax:
       KEYS pattern
     """
 
     args: dict
 
-    def __init__(self, args_list: list[bytes]):
-        parser = CommandArgParser()
-        parser.add_argument("pattern", 0)
-        self.args = parser.parse_args(args_list)
+    arg_parser = CommandArgParser().add_argument("pattern", 0)
 
     @queueable
     def exec(
@@ -33,14 +35,33 @@ class CommandKeys(RedisCommand):
     ) -> ExecutionResult:
         pattern = self.args["pattern"]
         keys = exec_ctx.storage.keys(pattern)
-        return bytes(Array([BulkString(k) for k in keys]))
+        buf = bytearray()
+
+        router = exec_ctx.shard_router
+        if router is None or conn_ctx.is_forwarded:
+            encoder.write_bulk_string_array(buf, keys)
+            return bytes(buf)
+
+        try:
+            replies = router.forward_to_all(bytes(self))
+        except ShardingError as e:
+            return encoder.error(str(e).encode())
+
+        # replies are arrays of bulk strings, their elements are appended
+        # as they were received after the local keys
+        count, elements = len(keys), []
+        for reply in replies:
+            if reply.startswith(b"-"):
+                return reply
+            header_end = reply.index(b"\r\n")
+            count += int(reply[1:header_end])
+            elements.append(reply[header_end + 2 :])
+
+        encoder.write_array_header(buf, count)
+        for key in keys:
+            encoder.write_bulk_string(buf, key)
+        buf += b"".join(elements)
+        return bytes(buf)
 
     def __bytes__(self) -> bytes:
-        return bytes(
-            Array(
-                [
-                    BulkString(b"KEYS"),
-                    BulkString(self.args["pattern"]),
-                ]
-            )
-        )
+        return encoder.command(b"KEYS", self.args["pattern"])
@@ -0,0 +1,29 @@
+"""This file includes all logic for handling commands on list values (see
+`QuickList` for the structure backing lists).
+
+Individual commands are split into multiple files as necessary.
+"""
+
+from .lpush import CommandLPush
+from .rpush import CommandRPush
+from .lpop import CommandLPop
+from .rpop import CommandRPop
+from .lrange import CommandLRange
+from .llen import CommandLLen
+from .lindex import CommandLIndex
+from .ltrim import CommandLTrim
+from .blpop import CommandBLPop
+from .brpop import CommandBRPop
+
+__all__ = [
+    "CommandLPush",
+    "CommandRPush",
+    "CommandLPop",
+    "CommandRPop",
+    "CommandLRange",
+    "CommandLLen",
+    "CommandLIndex",
+    "CommandLTrim",
+    "CommandBLPop",
+    "CommandBRPop",
+]
@@ -0,0 +1,142 @@
+import math
+
+from app.commands.base import ExecutionResult, RedisCommand
+from app.commands.decorators import broadcast, queueable, sharded
+from app.commands.args.parser import CommandArgParser
+from app.commands.handlers.lists.common import list_of
+from app.context import ConnectionContext, ExecutionContext
+from app.resp import encoder, shared
+from app.storage.in_memory.errors import WrongType
+from app.storage.types import RedisValue
+
+ERR_TIMEOUT_NOT_FLOAT = encoder.error(b"ERR timeout is not a float or out of range")
+ERR_TIMEOUT_NEGATIVE = encoder.error(b"ERR timeout is negative")
+
+
+class InvalidTimeout(Exception):
+    """Raised with the error reply for an invalid timeout."""
+
+    def __init__(self, reply: bytes):
+        super().__init__(reply)
+        self.reply = reply
+
+
+def parse_timeout(arg: bytes) -> float | None:
+    """Parses a timeout in seconds, returns None for 0 (no timeout).
+
+    Raises InvalidTimeout if it is not a valid timeout.
+    """
+    try:
+        timeout = float(arg)
+    except ValueError:
+        raise InvalidTimeout(ERR_TIMEOUT_NOT_FLOAT)
+    if not math.isfinite(timeout):
+        raise InvalidTimeout(ERR_TIMEOUT_NOT_FLOAT)
+    if timeout < 0:
+        raise InvalidTimeout(ERR_TIMEOUT_NEGATIVE)
+    return timeout or None
+
+
+class CommandBLPop(RedisCommand):
+    """Blocking version of LPOP: pops the first element of the first
+    non-empty list among the given keys. If all lists are empty, the client
+    is blocked until an element is pushed to one of them or timeout seconds
+    have passed (0 blocks forever).
+
+    Replies with the key and the popped element, or a null array on
+    timeout. Blocked clients are woken up by the push itself (see
+    `BlockedClients`), without polling. In a transaction, the command
+    doesn't block.
+
+    The pop is propagated to replicas as LPOP of the key it popped from.
+
+    Syntax:
+      BLPOP key [key ...] timeout
+    """
+
+    args: dict
+    write: bool = True
+    command_name: bytes = b"BLPOP"
+    pop_name: bytes = b"LPOP"  # command propagated to replicas
+    left: bool = True  # pop from the head of the list
+
+    arg_parser = (
+        CommandArgParser().add_argument("key", 0).add_argument("args", 1, capture=True)
+    )
+
+    # serialized pop once executed (empty if nothing was popped)
+    propagated: bytes = b""
+
+    def _keys_and_timeout(self) -> tuple[list[bytes], bytes]:
+        *keys, timeout = [self.args["key"], *self.args["args"]]
+        return keys, timeout
+
+    def _pop_any(
+        self, exec_ctx: ExecutionContext, keys: list[bytes]
+    ) -> tuple[bytes, bytes] | None:
+        """Pops an element from the first non-empty list, returns its key
+        along with the element (None if all lists are empty)."""
+        for key in keys:
+            popped: list[bytes] = []
+
+            def _pop(value: RedisValue | None) -> RedisValue | None:
+                quicklist = list_of(key, value)
+                if quicklist is None:
+                    return None
+                popped.append(
+                    quicklist.pop_left() if self.left else quicklist.pop_right()
+                )
+                return value if len(quicklist) else None  # empty lists are removed
+
+            exec_ctx.storage.upsert(key, _pop, free_memory=False)
+            if popped:
+                return key, popped[0]
+        return None
+
+    @broadcast
+    @queueable
+    @sharded
+    def exec(
+        self, exec_ctx: ExecutionContext, conn_ctx: ConnectionContext, **kwargs
+    ) -> ExecutionResult:
+        keys, timeout_arg = self._keys_and_timeout()
+        try:
+            timeout = parse_timeout(timeout_arg)
+        except InvalidTimeout as e:
+            return e.reply
+
+        try:
+            popped = self._pop_any(exec_ctx, keys)
+            if popped is None and kwargs.get("blocking", True):
+                popped = exec_ctx.blocked_clients.wait_for(
+                    keys, timeout, lambda: self._pop_any(exec_ctx, keys)
+                )
+        except WrongType:
+            return shared.WRONGTYPE
+
+        if popped is None:
+            self.propagated = b""
+            return shared.NULL_ARRAY
+        key, element = popped
+        self.propagated = encoder.command(self.pop_name, key)
+        return encoder.bulk_string_array([key, element])
+
+    def keys(self) -> list[bytes]:
+        keys, _ = self._keys_and_timeout()
+        return keys
+
+    def blocks(self) -> bool:
+        return True
+
+    def blocked_on(self) -> tuple[list[bytes], float | None] | None:
+        keys, timeout_arg = self._keys_and_timeout()
+        try:
+            return keys, parse_timeout(timeout_arg)
+        except InvalidTimeout:
+            return None
+
+    def replication_payload(self) -> bytes:
+        return self.propagated
+
+    def __bytes__(self) -> bytes:
+        return encoder.command(self.command_name, self.args["key"], *self.args["args"])
@@ -0,0 +1,15 @@
+from app.commands.handlers.lists.blpop import CommandBLPop
+
+
+class CommandBRPop(CommandBLPop):
+    """Blocking version of RPOP: pops the last element of the first
+    non-empty list among the given keys, or blocks until there is one (see
+    BLPOP).
+
+    Syntax:
+      BRPOP key [key ...] timeout
+    """
+
+    command_name: bytes = b"BRPOP"
+    pop_name: bytes = b"RPOP"
+    left: bool = False
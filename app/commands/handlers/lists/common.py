@@ -0,0 +1,37 @@
+from app.storage.in_memory.errors import WrongType
+from app.storage.structures import QuickList
+from app.storage.types import RedisEncoding, RedisValue
+
+
+def new_list() -> RedisValue:
+    return RedisValue.with_payload(QuickList(), RedisEncoding.LIST_QUICKLIST)
+
+
+def list_of(key: bytes, value: RedisValue | None) -> QuickList | None:
+    """Returns the list held by the value (None if there is no value).
+
+    Raises WrongType if the value is not a list.
+    """
+    if value is None:
+        return None
+    if value.encoding != RedisEncoding.LIST_QUICKLIST:
+        raise WrongType(key)
+    return value.payload
+
+
+def parse_int(arg: bytes) -> int:
+    """Parses an integer argument, raises ValueError if it isn't one."""
+    if not arg.removeprefix(b"-").isdigit():
+        raise ValueError(f"{arg!r} is not an integer")
+    return int(arg)
+
+
+def normalize_range(start: int, stop: int, length: int) -> tuple[int, int]:
+    """Converts an inclusive range of indexes that can be negative (counting
+    from the end) to a range within bounds that excludes stop."""
+    if start < 0:
+        start = max(length + start, 0)
+    if stop < 0:
+        stop += length
+    stop = min(stop + 1, length)
+    return start, max(stop, start)
@@ -0,0 +1,53 @@
+from app.commands.base import ExecutionResult, RedisCommand
+from app.commands.decorators import queueable, sharded
+from app.commands.args.parser import CommandArgParser
+from app.commands.handlers.lists.common import list_of, parse_int
+from app.context import ConnectionContext, ExecutionContext
+from app.resp import encoder, shared
+from app.storage.in_memory.errors import WrongType
+from app.storage.types import RedisValue
+
+
+class CommandLIndex(RedisCommand):
+    """Returns the element at index in the list stored at key, negative
+    indexes count from the end of the list. Returns nil if the index is out
+    of range or the key does not exist.
+
+    Syntax:
+      LINDEX key index
+    """
+
+    args: dict
+
+    arg_parser = CommandArgParser().add_argument("key", 0).add_argument("index", 1)
+
+    @queueable
+    @sharded
+    def exec(
+        self, exec_ctx: ExecutionContext, conn_ctx: ConnectionContext, **kwargs
+    ) -> ExecutionResult:
+        key = self.args["key"]
+        try:
+            index = parse_int(self.args["index"])
+        except ValueError:
+            return shared.ERR_NOT_INTEGER
+
+        def _index(value: RedisValue | None) -> bytes | None:
+            quicklist = list_of(key, value)
+            if quicklist is None:
+                return None
+            try:
+                return quicklist.index(index)
+            except IndexError:
+                return None
+
+        try:
+            return encoder.bulk_string(exec_ctx.storage.view(key, _index))
+        except WrongType:
+            return shared.WRONGTYPE
+
+    def keys(self) -> list[bytes]:
+        return [self.args["key"]]
+
+    def __bytes__(self) -> bytes:
+        return encoder.command(b"LINDEX", self.args["key"], self.args["index"])
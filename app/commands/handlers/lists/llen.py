@@ -0,0 +1,43 @@
+from app.commands.base import ExecutionResult, RedisCommand
+from app.commands.decorators import queueable, sharded
+from app.commands.args.parser import CommandArgParser
+from app.commands.handlers.lists.common import list_of
+from app.context import ConnectionContext, ExecutionContext
+from app.resp import encoder, shared
+from app.storage.in_memory.errors import WrongType
+from app.storage.types import RedisValue
+
+
+class CommandLLen(RedisCommand):
+    """Returns the length of the list stored at key (0 if the key does not
+    exist).
+
+    Syntax:
+      LLEN key
+    """
+
+    args: dict
+
+    arg_parser = CommandArgParser().add_argument("key", 0)
+
+    @queueable
+    @sharded
+    def exec(
+        self, exec_ctx: ExecutionContext, conn_ctx: ConnectionContext, **kwargs
+    ) -> ExecutionResult:
+        key = self.args["key"]
+
+        def _len(value: RedisValue | None) -> int:
+            quicklist = list_of(key, value)
+            return len(quicklist) if quicklist is not None else 0
+
+        try:
+            return encoder.integer(exec_ctx.storage.view(key, _len))
+        except WrongType:
+            return shared.WRONGTYPE
+
+    def keys(self) -> list[bytes]:
+        return [self.args["key"]]
+
+    def __bytes__(self) -> bytes:
+        return encoder.command(b"LLEN", self.args["key"])
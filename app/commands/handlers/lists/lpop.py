@@ -0,0 +1,80 @@
+from app.commands.base import ExecutionResult, RedisCommand
+from app.commands.decorators import broadcast, queueable, sharded
+from app.commands.args.parser import CommandArgParser
+from app.commands.handlers.lists.common import list_of
+from app.context import ConnectionContext, ExecutionContext
+from app.resp import encoder, shared
+from app.storage.in_memory.errors import WrongType
+from app.storage.types import RedisValue
+
+ERR_NOT_POSITIVE = encoder.error(b"ERR value is out of range, must be positive")
+
+
+class CommandLPop(RedisCommand):
+    """Removes and returns the first elements of the list stored at key.
+
+    By default, the command pops a single element from the beginning of the
+    list (nil if the key does not exist). When provided with the optional
+    count argument, the reply is an array of up to count elements.
+
+    Syntax:
+      LPOP key [count]
+    """
+
+    args: dict
+    write: bool = True
+    command_name: bytes = b"LPOP"
+    left: bool = True  # pop from the head of the list
+
+    arg_parser = (
+        CommandArgParser()
+        .add_argument("key", 0)
+        .add_argument("count", 1, required=False)
+    )
+
+    @broadcast
+    @queueable
+    @sharded
+    def exec(
+        self, exec_ctx: ExecutionContext, conn_ctx: ConnectionContext, **kwargs
+    ) -> ExecutionResult:
+        key, count = self.args["key"], self.args["count"]
+        if count is not None and not count.isdigit():
+            return ERR_NOT_POSITIVE
+        to_pop = 1 if count is None else int(count)
+
+        popped: list[bytes] = []
+        exists = False
+
+        def _pop(value: RedisValue | None) -> RedisValue | None:
+            nonlocal exists
+            quicklist = list_of(key, value)
+            if quicklist is None:
+                return None
+            exists = True
+            pop = quicklist.pop_left if self.left else quicklist.pop_right
+            for _ in range(min(to_pop, len(quicklist))):
+                popped.append(pop())
+            return value if len(quicklist) else None  # empty lists are removed
+
+        try:
+            # popping never needs memory, so keys are not evicted
+            exec_ctx.storage.upsert(key, _pop, free_memory=False)
+        except WrongType:
+            return shared.WRONGTYPE
+
+        if count is None:
+            return encoder.bulk_string(popped[0] if popped else None)
+        if not exists:
+            return shared.NULL_ARRAY
+        return encoder.bulk_string_array(popped)
+
+    def keys(self) -> list[bytes]:
+        return [self.args["key"]]
+
+    def __bytes__(self) -> bytes:
+        if self.args["count"] is not None:
+            return encoder.command(
+                self.command_name, self.args["key"], self.args["count"]
+            )
+        return encoder.command(self.command_name, self.args["key"])
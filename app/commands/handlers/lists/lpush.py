@@ -0,0 +1,63 @@
+from app.commands.base import ExecutionResult, RedisCommand
+from app.commands.decorators import broadcast, queueable, sharded
+from app.commands.args.parser import CommandArgParser
+from app.commands.handlers.lists.common import list_of, new_list
+from app.context import ConnectionContext, ExecutionContext
+from app.resp import encoder, shared
+from app.storage.in_memory.errors import OutOfMemory, WrongType
+from app.storage.types import RedisValue
+
+
+class CommandLPush(RedisCommand):
+    """Inserts all the specified values at the head of the list stored at
+    key, one after the other (so the last value ends up first). If key does
+    not exist, it is created as an empty list before the operation. Returns
+    the length of the list after the push.
+
+    Syntax:
+      LPUSH key element [element ...]
+    """
+
+    args: dict
+    write: bool = True
+    command_name: bytes = b"LPUSH"
+    left: bool = True  # push at the head of the list
+
+    arg_parser = (
+        CommandArgParser()
+        .add_argument("key", 0)
+        .add_argument("elements", 1, capture=True)
+    )
+
+    @broadcast
+    @queueable
+    @sharded
+    def exec(
+        self, exec_ctx: ExecutionContext, conn_ctx: ConnectionContext, **kwargs
+    ) -> ExecutionResult:
+        key, elements = self.args["key"], self.args["elements"]
+
+        def _push(value: RedisValue | None) -> RedisValue:
+            value = value or new_list()
+            quicklist = list_of(key, value)
+            push = quicklist.push_left if self.left else quicklist.push_right
+            for element in elements:
+                push(element)
+            return value
+
+        try:
+            value = exec_ctx.storage.upsert(key, _push)
+        except WrongType:
+            return shared.WRONGTYPE
+        except OutOfMemory:
+            return shared.OOM
+        exec_ctx.blocked_clients.signal(key)  # eg, clients blocked by BLPOP
+        return encoder.integer(len(value.payload))
+
+    def keys(self) -> list[bytes]:
+        return [self.args["key"]]
+
+    def __bytes__(self) -> bytes:
+        return encoder.command(
+            self.command_name, self.args["key"], *self.args["elements"]
+        )
@@ -0,0 +1,58 @@
+from app.commands.base import ExecutionResult, RedisCommand
+from app.commands.decorators import queueable, sharded
+from app.commands.args.parser import CommandArgParser
+from app.commands.handlers.lists.common import list_of, normalize_range, parse_int
+from app.context import ConnectionContext, ExecutionContext
+from app.resp import encoder, shared
+from app.storage.in_memory.errors import WrongType
+from app.storage.types import RedisValue
+
+
+class CommandLRange(RedisCommand):
+    """Returns the specified elements of the list stored at key. The offsets
+    start and stop are zero-based indexes (both inclusive), negative offsets
+    count from the end of the list (-1 is the last element).
+
+    Syntax:
+      LRANGE key start stop
+    """
+
+    args: dict
+
+    arg_parser = (
+        CommandArgParser()
+        .add_argument("key", 0)
+        .add_argument("start", 1)
+        .add_argument("stop", 2)
+    )
+
+    @queueable
+    @sharded
+    def exec(
+        self, exec_ctx: ExecutionContext, conn_ctx: ConnectionContext, **kwargs
+    ) -> ExecutionResult:
+        key = self.args["key"]
+        try:
+            start, stop = parse_int(self.args["start"]), parse_int(self.args["stop"])
+        except ValueError:
+            return shared.ERR_NOT_INTEGER
+
+        def _range(value: RedisValue | None) -> list[bytes]:
+            quicklist = list_of(key, value)
+            if quicklist is None:
+                return []
+            return quicklist.range(*normalize_range(start, stop, len(quicklist)))
+
+        try:
+            elements = exec_ctx.storage.view(key, _range)
+        except WrongType:
+            return shared.WRONGTYPE
+        return encoder.bulk_string_array(elements)
+
+    def keys(self) -> list[bytes]:
+        return [self.args["key"]]
+
+    def __bytes__(self) -> bytes:
+        return encoder.command(
+            b"LRANGE", self.args["key"], self.args["start"], self.args["stop"]
+        )
@@ -0,0 +1,61 @@
+from app.commands.base import ExecutionResult, RedisCommand
+from app.commands.decorators import broadcast, queueable, sharded
+from app.commands.args.parser import CommandArgParser
+from app.commands.handlers.lists.common import list_of, normalize_range, parse_int
+from app.context import ConnectionContext, ExecutionContext
+from app.resp import encoder, shared
+from app.storage.in_memory.errors import WrongType
+from app.storage.types import RedisValue
+
+
+class CommandLTrim(RedisCommand):
+    """Trims the list stored at key so that it only contains the specified
+    range of elements (see LRANGE for how offsets are interpreted). The key
+    is removed if the range is empty.
+
+    Syntax:
+      LTRIM key start stop
+    """
+
+    args: dict
+    write: bool = True
+
+    arg_parser = (
+        CommandArgParser()
+        .add_argument("key", 0)
+        .add_argument("start", 1)
+        .add_argument("stop", 2)
+    )
+
+    @broadcast
+    @queueable
+    @sharded
+    def exec(
+        self, exec_ctx: ExecutionContext, conn_ctx: ConnectionContext, **kwargs
+    ) -> ExecutionResult:
+        key = self.args["key"]
+        try:
+            start, stop = parse_int(self.args["start"]), parse_int(self.args["stop"])
+        except ValueError:
+            return shared.ERR_NOT_INTEGER
+
+        def _trim(value: RedisValue | None) -> RedisValue | None:
+            quicklist = list_of(key, value)
+            if quicklist is None:
+                return None
+            quicklist.trim(*normalize_range(start, stop, len(quicklist)))
+            return value if len(quicklist) else None  # empty lists are removed
+
+        try:
+            exec_ctx.storage.upsert(key, _trim, free_memory=False)
+        except WrongType:
+            return shared.WRONGTYPE
+        return shared.OK
+
+    def keys(self) -> list[bytes]:
+        return [self.args["key"]]
+
+    def __bytes__(self) -> bytes:
+        return encoder.command(
+            b"LTRIM", self.args["key"], self.args["start"], self.args["stop"]
+        )
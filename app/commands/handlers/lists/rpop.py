@@ -0,0 +1,13 @@
+from app.commands.handlers.lists.lpop import CommandLPop
+
+
+class CommandRPop(CommandLPop):
+    """Removes and returns the last elements of the list stored at key (see
+    LPOP).
+
+    Syntax:
+      RPOP key [count]
+    """
+
+    command_name: bytes = b"RPOP"
+    left: bool = False
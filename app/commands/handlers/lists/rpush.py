@@ -0,0 +1,14 @@
+from app.commands.handlers.lists.lpush import CommandLPush
+
+
+class CommandRPush(CommandLPush):
+    """Inserts all the specified values at the tail of the list stored at
+    key. If key does not exist, it is created as an empty list before the
+    operation. Returns the length of the list after the push.
+
+    Syntax:
+      RPUSH key element [element ...]
+    """
+
+    command_name: bytes = b"RPUSH"
+    left: bool = False
@@ -0,0 +1,11 @@
+"""This file includes all logic for handling memory introspection commands,
+under the container command MEMORY.
+
+Individual subcommands are split into multiple files as necessary.
+"""
+
+from .memory_stats import CommandMemoryStats
+from .memory_usage import CommandMemoryUsage
+from .base import CommandMemory
+
+__all__ = ["CommandMemoryStats", "CommandMemoryUsage", "CommandMemory"]
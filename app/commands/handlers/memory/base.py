@@ -0,0 +1,45 @@
+from app.commands.base import ExecutionResult, RedisCommand
+from app.commands.decorators import queueable
+from app.commands.errors import MissingSubcommand, UnrecognizedCommand
+from app.commands.handlers.memory.memory_stats import CommandMemoryStats
+from app.commands.handlers.memory.memory_usage import CommandMemoryUsage
+from app.context import ConnectionContext, ExecutionContext
+
+
+class CommandMemory(RedisCommand):
+    """This handler routes execution through an appropriate handler based on
+    the memory subcommand provided.
+
+    Syntax:
+    MEMORY <subcommand>
+    """
+
+    args: dict
+
+    active_sub_command: RedisCommand
+    sub_commands: dict[bytes, type[RedisCommand]] = {
+        b"STATS": CommandMemoryStats,
+        b"USAGE": CommandMemoryUsage,
+    }
+
+    def __init__(self, args_list: list[bytes]):
+        if len(args_list) == 0:
+            raise MissingSubcommand(b"MEMORY")
+
+        sub_command_name = args_list[0].upper()
+        if sub_command := self.sub_commands.get(sub_command_name):
+            self.active_sub_command = sub_command(args_list[1:])
+        else:
+            raise UnrecognizedCommand(b"MEMORY " + sub_command_name)
+
+    @queueable
+    def exec(
+        self, exec_ctx: ExecutionContext, conn_ctx: ConnectionContext, **kwargs
+    ) -> ExecutionResult:
+        return self.active_sub_command.exec(exec_ctx, conn_ctx, **kwargs)
+
+    def keys(self) -> list[bytes]:
+        return self.active_sub_command.keys()
+
+    def __bytes__(self) -> bytes:
+        return bytes(self.active_sub_command)
@@ -0,0 +1,48 @@
+from app.commands.base import ExecutionResult, RedisCommand
+from app.context import ConnectionContext, ExecutionContext
+from app.resp import encoder
+
+
+class CommandMemoryStats(RedisCommand):
+    """Returns memory usage details of the server, as an array of
+    alternating metric names and values.
+
+    Syntax:
+    MEMORY STATS
+    """
+
+    args: dict
+
+    def exec(
+        self, exec_ctx: ExecutionContext, conn_ctx: ConnectionContext, **kwargs
+    ) -> ExecutionResult:
+        stats = exec_ctx.storage.memory_stats()
+        exec_ctx.info.update_memory_stats(stats)
+
+        bytes_per_key = stats.used_memory // stats.keys if stats.keys else 0
+        dataset_perc = (
+            stats.used_memory_dataset * 100 / stats.used_memory
+            if stats.used_memory
+            else 0.0
+        )
+        metrics = [
+            (b"peak.allocated", stats.used_memory_peak),
+            (b"total.allocated", stats.used_memory),
+            (b"overhead.total", stats.used_memory_overhead),
+            (b"keys.count", stats.keys),
+            (b"keys.bytes-per-key", bytes_per_key),
+            (b"dataset.bytes", stats.used_memory_dataset),
+            (b"evicted.keys", stats.evicted_keys),
+        ]
+
+        buf = bytearray()
+        encoder.write_array_header(buf, 2 * len(metrics) + 2)
+        for name, value in metrics:
+            encoder.write_bulk_string(buf, name)
+            encoder.write_integer(buf, value)
+        encoder.write_bulk_string(buf, b"dataset.percentage")
+        encoder.write_bulk_string(buf, b"%.2f" % dataset_perc)
+        return bytes(buf)
+
+    def __bytes__(self) -> bytes:
+        return encoder.command(b"MEMORY", b"STATS")
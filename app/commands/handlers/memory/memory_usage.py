@@ -0,0 +1,59 @@
+from app.commands.args.mapping import map_to_str
+from app.commands.base import ExecutionResult, RedisCommand
+from app.commands.decorators import sharded
+from app.commands.args.parser import CommandArgParser
+from app.context import ConnectionContext, ExecutionContext
+from app.resp import encoder, shared
+from app.storage.in_memory.errors import KeyDoesNotExist, KeyExpired
+
+
+class CommandMemoryUsage(RedisCommand):
+    """Reports the number of bytes that a key and its value require to be
+    stored in memory (estimated, see storage memory accounting).
+
+    Sizes are maintained incrementally as keys are written, so the SAMPLES
+    option (number of nested values sampled by Redis) is accepted but every
+    estimate is exact with respect to the accounting.
+
+    Syntax:
+    MEMORY USAGE key [SAMPLES count]
+    """
+
+    args: dict
+
+    arg_parser = (
+        CommandArgParser()
+        .add_argument("key", 0)
+        .add_argument("option", 1, required=False, map_fn=map_to_str)
+        .add_argument("samples", 2, required=False)
+    )
+
+    @sharded
+    def exec(
+        self, exec_ctx: ExecutionContext, conn_ctx: ConnectionContext, **kwargs
+    ) -> ExecutionResult:
+        option, samples = self.args["option"], self.args["samples"]
+        if option is not None:
+            if option.upper() != "SAMPLES" or samples is None:
+                return shared.ERR_SYNTAX
+            if not samples.isdigit():
+                return shared.ERR_NOT_INTEGER
+
+        try:
+            return encoder.integer(exec_ctx.storage.memory_usage(self.args["key"]))
+        except (KeyDoesNotExist, KeyExpired):
+            return shared.NIL
+
+    def keys(self) -> list[bytes]:
+        return [self.args["key"]]
+
+    def __bytes__(self) -> bytes:
+        if self.args["option"] is not None and self.args["samples"] is not None:
+            return encoder.command(
+                b"MEMORY",
+                b"USAGE",
+                self.args["key"],
+                self.args["option"].encode(),
+                self.args["samples"],
+            )
+        return encoder.command(b"MEMORY", b"USAGE", self.args["key"])
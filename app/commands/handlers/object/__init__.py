@@ -0,0 +1,10 @@
+"""This file includes all logic for handling object introspection commands,
+under the container command OBJECT.
+
+Individual subcommands are split into multiple files as necessary.
+"""
+
+from .object_encoding import CommandObjectEncoding
+from .base import CommandObject
+
+__all__ = ["CommandObjectEncoding", "CommandObject"]
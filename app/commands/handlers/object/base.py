@@ -0,0 +1,43 @@
+from app.commands.base import ExecutionResult, RedisCommand
+from app.commands.decorators import queueable
+from app.commands.errors import MissingSubcommand, UnrecognizedCommand
+from app.commands.handlers.object.object_encoding import CommandObjectEncoding
+from app.context import ConnectionContext, ExecutionContext
+
+
+class CommandObject(RedisCommand):
+    """This handler routes execution through an appropriate handler based on
+    the object subcommand provided.
+
+    Syntax:
+    OBJECT <subcommand>
+    """
+
+    args: dict
+
+    active_sub_command: RedisCommand
+    sub_commands: dict[bytes, type[RedisCommand]] = {
+        b"ENCODING": CommandObjectEncoding,
+    }
+
+    def __init__(self, args_list: list[bytes]):
+        if len(args_list) == 0:
+            raise MissingSubcommand(b"OBJECT")
+
+        sub_command_name = args_list[0].upper()
+        if sub_command := self.sub_commands.get(sub_command_name):
+            self.active_sub_command = sub_command(args_list[1:])
+        else:
+            raise UnrecognizedCommand(b"OBJECT " + sub_command_name)
+
+    @queueable
+    def exec(
+        self, exec_ctx: ExecutionContext, conn_ctx: ConnectionContext, **kwargs
+    ) -> ExecutionResult:
+        return self.active_sub_command.exec(exec_ctx, conn_ctx, **kwargs)
+
+    def keys(self) -> list[bytes]:
+        return self.active_sub_command.keys()
+
+    def __bytes__(self) -> bytes:
+        return bytes(self.active_sub_command)
@@ -0,0 +1,36 @@
+from app.commands.base import ExecutionResult, RedisCommand
+from app.commands.decorators import sharded
+from app.commands.args.parser import CommandArgParser
+from app.context import ConnectionContext, ExecutionContext
+from app.resp import encoder, shared
+from app.storage.in_memory.errors import KeyDoesNotExist, KeyExpired
+
+
+class CommandObjectEncoding(RedisCommand):
+    """Returns the internal encoding of the value stored at key (int, embstr
+    or raw for strings). If the key does not exist the special value nil is
+    returned.
+
+    Syntax:
+    OBJECT ENCODING key
+    """
+
+    args: dict
+
+    arg_parser = CommandArgParser().add_argument("key", 0)
+
+    @sharded
+    def exec(
+        self, exec_ctx: ExecutionContext, conn_ctx: ConnectionContext, **kwargs
+    ) -> ExecutionResult:
+        try:
+            value = exec_ctx.storage.get(self.args["key"])
+        except (KeyDoesNotExist, KeyExpired):
+            return shared.NIL
+        return encoder.bulk_string(value.object_encoding().encode())
+
+    def keys(self) -> list[bytes]:
+        return [self.args["key"]]
+
+    def __bytes__(self) -> bytes:
+        return encoder.command(b"OBJECT", b"ENCODING", self.args["key"])
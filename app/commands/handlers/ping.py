@@ -2,9 +2,7 @@ from app.commands.base import ExecutionResult, RedisCommand
 from app.commands.decorators import queueable
 from app.commands.args.parser import CommandArgParser
 from app.context import ConnectionContext, ExecutionContext
-from app.resp.types.array import Array
-from app.resp.types.bulk_string import BulkString
-from app.resp.types.simple_string import SimpleString
+from app.resp import encoder, shared
 
 
 class CommandPing(RedisCommand):
@@ -17,21 +15,19 @@ class CommandPing(RedisCommand):
 
     args: dict
 
-    def __init__(self, args_list: list[bytes]):
-        parser = CommandArgParser()
-        parser.add_argument("message", 0, required=False, default=None)
-        self.args = parser.parse_args(args_list)
+    arg_parser = CommandArgParser().add_argument(
+        "message", 0, required=False, default=None
+    )
 
     @queueable
     def exec(
         self, exec_ctx: ExecutionContext, conn_ctx: ConnectionContext, **kwargs
     ) -> ExecutionResult:
         if message := self.args["message"]:
-            return bytes(BulkString(message))
-        return bytes(SimpleString(b"PONG"))
+            return encoder.bulk_string(message)
+        return shared.PONG
 
     def __bytes__(self) -> bytes:
-        array = [BulkString(b"PING")]
         if message := self.args["message"]:
-            array.append(BulkString(message))
-        return bytes(Array(array))
+            return encoder.command(b"PING", message)
+        return encoder.command(b"PING")
@@ -3,10 +3,8 @@ from typing import cast
 from app.commands.base import ExecutionResult, RedisCommand
 from app.commands.args.parser import CommandArgParser
 from app.context import ConnectionContext, ExecutionContext
+from app.resp import encoder
 from app.info.sections.info_replication import InfoReplication
-from app.resp import BulkString
-from app.resp.types.array import Array
-from app.resp.types.simple_string import SimpleString
 
 
 class CommandPsync(RedisCommand):
@@ -19,11 +17,9 @@ class CommandPsync(RedisCommand):
 
     args: dict
 
-    def __init__(self, args_list: list[bytes]):
-        parser = CommandArgParser()
-        parser.add_argument("replicationid", 0)
-        parser.add_argument("offset", 1)
-        self.args = parser.parse_args(args_list)
+    arg_parser = (
+        CommandArgParser().add_argument("replicationid", 0).add_argument("offset", 1)
+    )
 
     def exec(
         self, exec_ctx: ExecutionContext, conn_ctx: ConnectionContext, **kwargs
@@ -31,27 +27,21 @@ class CommandPsync(RedisCommand):
         replication = cast(
             InfoReplication, exec_ctx.info._get_section_by_name("replication")
         )
-        ack = bytes(
-            SimpleString(
-                f"FULLRESYNC {replication.master_replid} {replication.master_repl_offset}".encode()
-            )
+        ack = encoder.simple_string(
+            f"FULLRESYNC {replication.master_replid} {replication.master_repl_offset}".encode()
         )
         snapshot = exec_ctx.rdb.create_snapshot(exec_ctx.storage)
         db = f"${len(snapshot)}\r\n".encode() + snapshot
 
-        # add connection to pool since only replicas send psync requests
-        exec_ctx.replica_pool.add(conn_ctx.uid, conn_ctx.sock)
+        # add connection to pool since only replicas send psync requests, the
+        # reply is sent by the pool so writes propagated to the replica are
+        # always sent after the snapshot
+        exec_ctx.replica_pool.add(conn_ctx.uid, conn_ctx.sock, preamble=[ack, db])
 
-        return [ack, db]
+        return None
 
     def __bytes__(self) -> bytes:
         # client side request for psync
-        return bytes(
-            Array(
-                [
-                    BulkString(b"PSYNC"),
-                    BulkString(self.args["replicationid"]),
-                    BulkString(self.args["offset"]),
-                ]
-            )
+        return encoder.command(
+            b"PSYNC", self.args["replicationid"], self.args["offset"]
         )
@@ -3,9 +3,7 @@ from app.commands.handlers.replconf.replconf_getack import CommandReplConfGetACK
 from app.commands.handlers.replconf.replconf_ack import CommandReplConfACK
 from app.commands.args.parser import CommandArgParser
 from app.context import ExecutionContext, ConnectionContext
-from app.resp import BulkString
-from app.resp.types.array import Array
-from app.resp.types.simple_string import SimpleString
+from app.resp import encoder, shared
 
 
 class CommandReplConf(RedisCommand):
@@ -19,11 +17,7 @@ class CommandReplConf(RedisCommand):
 
     args: dict
 
-    def __init__(self, args_list: list[bytes]):
-        parser = CommandArgParser()
-        parser.add_argument("key", 0)
-        parser.add_argument("value", 1)
-        self.args = parser.parse_args(args_list)
+    arg_parser = CommandArgParser().add_argument("key", 0).add_argument("value", 1)
 
     def exec(
         self, exec_ctx: ExecutionContext, conn_ctx: ConnectionContext, **kwargs
@@ -38,13 +32,8 @@ class CommandReplConf(RedisCommand):
                 exec_ctx, conn_ctx, **kwargs
             )
 
-        return bytes(SimpleString(b"OK"))
+        return shared.OK
 
     def __bytes__(self) -> bytes:
         key, value = self.args["key"], self.args["value"]
-        array = [
-            BulkString(b"REPLCONF"),
-            BulkString(key),
-            BulkString(value),
-        ]
-        return bytes(Array(array))
+        return encoder.command(b"REPLCONF", key, value)
@@ -2,8 +2,7 @@ from app.commands.args.mapping import map_to_int
 from app.commands.base import ExecutionResult, RedisCommand
 from app.commands.args.parser import CommandArgParser
 from app.context import ConnectionContext, ExecutionContext
-from app.resp import BulkString
-from app.resp.types.array import Array
+from app.resp import encoder
 
 
 class CommandReplConfACK(RedisCommand):
@@ -17,10 +16,7 @@ class CommandReplConfACK(RedisCommand):
 
     args: dict
 
-    def __init__(self, args_list: list[bytes]):
-        parser = CommandArgParser()
-        parser.add_argument("offset", 0, map_fn=map_to_int)
-        self.args = parser.parse_args(args_list)
+    arg_parser = CommandArgParser().add_argument("offset", 0, map_fn=map_to_int)
 
     def exec(
         self, exec_ctx: ExecutionContext, conn_ctx: ConnectionContext, **kwargs
@@ -37,9 +33,4 @@ class CommandReplConfACK(RedisCommand):
 
     def __bytes__(self) -> bytes:
         offset = str(self.args["offset"]).encode()
-        array = [
-            BulkString(b"REPLCONF"),
-            BulkString(b"ACK"),
-            BulkString(offset),
-        ]
-        return bytes(Array(array))
+        return encoder.command(b"REPLCONF", b"ACK", offset)
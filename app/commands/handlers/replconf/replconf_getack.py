@@ -1,8 +1,7 @@
 from app.commands.base import ExecutionResult, RedisCommand
 from app.commands.args.parser import CommandArgParser
 from app.context import ExecutionContext, ConnectionContext
-from app.resp import BulkString
-from app.resp.types.array import Array
+from app.resp import encoder
 
 
 class CommandReplConfGetACK(RedisCommand):
@@ -16,30 +15,14 @@ class CommandReplConfGetACK(RedisCommand):
 
     args: dict
 
-    def __init__(self, args_list: list[bytes]):
-        parser = CommandArgParser()
-        parser.add_argument("offset", 0)
-        self.args = parser.parse_args(args_list)
+    arg_parser = CommandArgParser().add_argument("offset", 0)
 
     def exec(
         self, exec_ctx: ExecutionContext, conn_ctx: ConnectionContext, **kwargs
     ) -> ExecutionResult:
         # hardcoded response for now
         current_offset = exec_ctx.info.get_offset()
-        return bytes(
-            Array(
-                [
-                    BulkString(b"REPLCONF"),
-                    BulkString(b"ACK"),
-                    BulkString(f"{current_offset}".encode()),
-                ]
-            )
-        )
+        return encoder.command(b"REPLCONF", b"ACK", str(current_offset).encode())
 
     def __bytes__(self) -> bytes:
-        array = [
-            BulkString(b"REPLCONF"),
-            BulkString(b"GETACK"),
-            BulkString(b"*"),
-        ]
-        return bytes(Array(array))
+        return encoder.command(b"REPLCONF", b"GETACK", b"*")
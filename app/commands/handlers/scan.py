@@ -0,0 +1,139 @@
+from app.commands.base import ExecutionResult, RedisCommand
+from app.commands.decorators import queueable
+from app.commands.args.parser import CommandArgParser
+from app.context import ConnectionContext, ExecutionContext
+from app.resp import encoder, shared
+from app.sharding.errors import ShardingError
+
+DEFAULT_COUNT = 10
+ERR_INVALID_CURSOR = encoder.error(b"ERR invalid cursor")
+
+
+class InvalidScanArguments(Exception):
+    """Raised with the error reply for invalid cursor or options."""
+
+    def __init__(self, reply: bytes):
+        super().__init__(reply)
+        self.reply = reply
+
+
+def parse_scan_arguments(
+    cursor: bytes, options: list[bytes], allow_type: bool = True
+) -> tuple[int, bytes | None, int, str | None]:
+    """Parses the cursor and options shared by the SCAN family of commands,
+    returns the cursor, MATCH pattern, COUNT and TYPE (only accepted with
+    allow_type, eg, not by HSCAN)."""
+    if not cursor.isdigit() or int(cursor) >= 2**64:
+        raise InvalidScanArguments(ERR_INVALID_CURSOR)
+
+    pattern, count, type_name = None, DEFAULT_COUNT, None
+    if len(options) % 2:
+        raise InvalidScanArguments(shared.ERR_SYNTAX)
+    for option, value in zip(options[::2], options[1::2]):
+        match option.upper():
+            case b"MATCH":
+                pattern = None if value == b"*" else value  # '*' matches all
+            case b"COUNT":
+                if not value.lstrip(b"-").isdigit():
+                    raise InvalidScanArguments(shared.ERR_NOT_INTEGER)
+                count = int(value)
+                if count < 1:
+                    raise InvalidScanArguments(shared.ERR_SYNTAX)
+            case b"TYPE" if allow_type:
+                type_name = value.decode(errors="replace").lower()
+            case _:
+                raise InvalidScanArguments(shared.ERR_SYNTAX)
+    return int(cursor), pattern, count, type_name
+
+
+def scan_reply(cursor: int, elements: list[bytes]) -> bytes:
+    """Reply of a SCAN step, the next cursor and the elements returned."""
+    buf = bytearray()
+    encoder.write_array_header(buf, 2)
+    encoder.write_bulk_string(buf, b"%d" % cursor)
+    encoder.write_bulk_string_array(buf, elements)
+    return bytes(buf)
+
+
+class CommandScan(RedisCommand):
+    """Iterates over the keys of the keyspace in steps. Each call returns the
+    cursor to pass to the next call along with the keys of the step, the
+    iteration is complete when the returned cursor is 0.
+
+    Only a step of about COUNT keys is visited per call, so the storage is
+    never locked for long. Keys present for the whole iteration are returned
+    at least once (some may be returned more than once).
+
+    When the keyspace is sharded between multiple workers, the workers are
+    iterated over one after the other, the worker being scanned is encoded
+    in the low bits of the cursor. Steps on other workers are forwarded to
+    them.
+
+    Syntax:
+      SCAN cursor [MATCH pattern] [COUNT count] [TYPE type]
+    """
+
+    args: dict
+
+    arg_parser = (
+        CommandArgParser()
+        .add_argument("cursor", 0)
+        .add_argument("options", 1, required=False, capture=True, default=[])
+    )
+
+    @queueable
+    def exec(
+        self, exec_ctx: ExecutionContext, conn_ctx: ConnectionContext, **kwargs
+    ) -> ExecutionResult:
+        try:
+            cursor, pattern, count, type_name = parse_scan_arguments(
+                self.args["cursor"], self.args["options"]
+            )
+        except InvalidScanArguments as e:
+            return e.reply
+
+        router = exec_ctx.shard_router
+        if router is None or conn_ctx.is_forwarded:
+            cursor, keys = exec_ctx.storage.scan(cursor, count, pattern, type_name)
+            return scan_reply(cursor, keys)
+
+        workers = router.num_workers
+        worker, worker_cursor = cursor % workers, cursor // workers
+        keys_array = bytearray()
+        if worker == router.worker_id:
+            worker_cursor, keys = exec_ctx.storage.scan(
+                worker_cursor, count, pattern, type_name
+            )
+            encoder.write_bulk_string_array(keys_array, keys)
+        else:
+            payload = encoder.command(
+                b"SCAN", b"%d" % worker_cursor, *self.args["options"]
+            )
+            try:
+                reply = router.forward(worker, payload)
+            except ShardingError as e:
+                return encoder.error(str(e).encode())
+            if reply.startswith(b"-"):
+                return reply
+
+            # the reply is the cursor of the worker followed by an array of
+            # keys, which is appended as it was received
+            cursor_start = reply.index(b"\r\n", 4) + 2
+            cursor_end = reply.index(b"\r\n", cursor_start)
+            worker_cursor = int(reply[cursor_start:cursor_end])
+            keys_array += reply[cursor_end + 2 :]
+
+        if worker_cursor == 0:
+            # continue from the start of the next worker, if any
+            cursor = worker + 1 if worker + 1 < workers else 0
+        else:
+            cursor = worker_cursor * workers + worker
+
+        buf = bytearray()
+        encoder.write_array_header(buf, 2)
+        encoder.write_bulk_string(buf, b"%d" % cursor)
+        buf += keys_array
+        return bytes(buf)
+
+    def __bytes__(self) -> bytes:
+        return encoder.command(b"SCAN", self.args["cursor"], *self.args["options"])
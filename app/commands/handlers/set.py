@@ -3,14 +3,12 @@ from time import time
 
 from app.commands.args.mapping import map_to_str
 from app.commands.base import ExecutionResult, RedisCommand
-from app.commands.decorators import queueable, broadcast
+from app.commands.decorators import broadcast, queueable, sharded
 from app.commands.args.parser import CommandArgParser
 from app.context import ConnectionContext, ExecutionContext
-from app.resp.types import NIL
-from app.resp.types.array import Array
-from app.resp.types.bulk_string import BulkString
-from app.resp.types.simple_string import SimpleString
+from app.resp import encoder, shared
 from app.storage.in_memory.base import RedisValue
+from app.storage.in_memory.errors import OutOfMemory
 
 
 class CommandSet(RedisCommand):
@@ -25,43 +23,62 @@ class CommandSet(RedisCommand):
 
     For the purpose of this exercise, we will only incorporate the expiry argument
     (complicated to add nx and get since they are "more optional" than expiry)
+
+    An expiry relative to the current time (EX or PX) is propagated to
+    replicas as the absolute time it was set to (PXAT), so replicas expire
+    the key at the same time as the master.
     """
 
     args: dict = {}
     write: bool = True
 
-    def __init__(self, args_list: list[bytes]):
-        parser = CommandArgParser()
-        parser.add_argument("key", 0)
-        parser.add_argument("value", 1)
-        parser.add_argument("expiry", 2, required=False, map_fn=map_to_str)
-        parser.add_argument("expiry_value", 3, required=False, map_fn=map_to_str)
+    arg_parser = (
+        CommandArgParser()
+        .add_argument("key", 0)
+        .add_argument("value", 1)
+        .add_argument("expiry", 2, required=False, map_fn=map_to_str)
+        .add_argument("expiry_value", 3, required=False, map_fn=map_to_str)
+    )
 
-        self.args = parser.parse_args(args_list)
+    expires_at: int | None = None  # unix time in milliseconds, once executed
 
     @broadcast
     @queueable
+    @sharded
     def exec(
         self, exec_ctx: ExecutionContext, conn_ctx: ConnectionContext, **kwargs
     ) -> ExecutionResult:
         key, value = self.args["key"], self.args["value"]
-        expiry = self._calculate_key_expiry()
+        expiry = self.expires_at = self._calculate_key_expiry()
         try:
             exec_ctx.storage.set(key, RedisValue(raw_bytes=value, expiry=expiry))
-            return bytes(SimpleString(b"OK"))
+            return shared.OK
+        except OutOfMemory:
+            return shared.OOM
         except Exception as e:  # currently an exception type is unknown
             logging.error(f"Command SET - {e}")
-            return NIL
+            return shared.NIL
+
+    def keys(self) -> list[bytes]:
+        return [self.args["key"]]
+
+    def replication_payload(self) -> bytes | memoryview:
+        expiry = self.args["expiry"]
+        if expiry and expiry.upper() in ("EX", "PX") and self.expires_at is not None:
+            key, value = self.args["key"], self.args["value"]
+            return encoder.command(
+                b"SET", key, value, b"PXAT", str(self.expires_at).encode()
+            )
+        return super().replication_payload()
 
     def __bytes__(self) -> bytes:
         key, value = self.args["key"], self.args["value"]
-        array = [BulkString(b"SET"), BulkString(key), BulkString(value)]
-
         expiry, expiry_value = self.args["expiry"], self.args["expiry_value"]
         if expiry and expiry_value:
-            array.extend([BulkString(expiry.encode()), BulkString(expiry.encode())])
-
-        return bytes(Array(array))
+            return encoder.command(
+                b"SET", key, value, expiry.encode(), expiry_value.encode()
+            )
+        return encoder.command(b"SET", key, value)
 
     def _calculate_key_expiry(self) -> int | None:
         # store expiry
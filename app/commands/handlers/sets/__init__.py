@@ -0,0 +1,29 @@
+"""This file includes all logic for handling commands on set values (see
+`IntSet` and `HashSet` for the structures backing sets).
+
+Individual commands are split into multiple files as necessary.
+"""
+
+from .sadd import CommandSAdd
+from .srem import CommandSRem
+from .sismember import CommandSIsMember
+from .smembers import CommandSMembers
+from .scard import CommandSCard
+from .sinter import CommandSInter
+from .sunion import CommandSUnion
+from .sdiff import CommandSDiff
+from .sinterstore import CommandSInterStore
+from .sscan import CommandSScan
+
+__all__ = [
+    "CommandSAdd",
+    "CommandSRem",
+    "CommandSIsMember",
+    "CommandSMembers",
+    "CommandSCard",
+    "CommandSInter",
+    "CommandSUnion",
+    "CommandSDiff",
+    "CommandSInterStore",
+    "CommandSScan",
+]
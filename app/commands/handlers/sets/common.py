@@ -0,0 +1,58 @@
+from app.config import Config
+from app.storage.in_memory.errors import WrongType
+from app.storage.structures import HashSet, IntSet, Set
+from app.storage.structures.set import int_member
+from app.storage.types import RedisEncoding, RedisValue
+
+
+def new_set() -> RedisValue:
+    return RedisValue.with_payload(IntSet(), RedisEncoding.INTSET)
+
+
+def set_of(key: bytes, value: RedisValue | None) -> Set | None:
+    """Returns the set held by the value (None if there is no value).
+
+    Raises WrongType if the value is not a set.
+    """
+    if value is None:
+        return None
+    if value.encoding not in (RedisEncoding.INTSET, RedisEncoding.SET):
+        raise WrongType(key)
+    return value.payload
+
+
+def sets_of(keys: list[bytes], values: list[RedisValue | None]) -> list[Set]:
+    """Sets held by the values of keys, keys that don't exist are empty sets
+    (as in set algebra commands).
+
+    Raises WrongType if any value is not a set.
+    """
+    sets = []
+    for key, value in zip(keys, values):
+        members = set_of(key, value)
+        sets.append(members if members is not None else IntSet())
+    return sets
+
+
+def _convert_to_hashset(value: RedisValue):
+    value.payload = HashSet(value.payload)
+    value.encoding = RedisEncoding.SET
+
+
+def add_members(value: RedisValue, members: list[bytes], config: Config) -> int:
+    """Adds members to the set held by value, which is converted to the
+    hashtable encoding once a member isn't an integer or it exceeds the
+    intset limit of the config.
+
+    Returns the number of members added.
+    """
+    if value.encoding == RedisEncoding.INTSET:
+        numbers = [int_member(member) for member in members]
+        if None in numbers or len(numbers) > config.set_max_intset_entries:
+            _convert_to_hashset(value)
+        else:
+            added = value.payload.add(numbers)
+            if len(value.payload) > config.set_max_intset_entries:
+                _convert_to_hashset(value)
+            return added
+    return value.payload.add(members)
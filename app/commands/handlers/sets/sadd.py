@@ -0,0 +1,57 @@
+from app.commands.base import ExecutionResult, RedisCommand
+from app.commands.decorators import broadcast, queueable, sharded
+from app.commands.args.parser import CommandArgParser
+from app.commands.handlers.sets.common import add_members, new_set, set_of
+from app.context import ConnectionContext, ExecutionContext
+from app.resp import encoder, shared
+from app.storage.in_memory.errors import OutOfMemory, WrongType
+from app.storage.types import RedisValue
+
+
+class CommandSAdd(RedisCommand):
+    """Adds the specified members to the set stored at key, members that are
+    already in the set are ignored. If key does not exist, a new set is
+    created. Returns the number of members that were added.
+
+    Syntax:
+      SADD key member [member ...]
+    """
+
+    args: dict
+    write: bool = True
+
+    arg_parser = (
+        CommandArgParser()
+        .add_argument("key", 0)
+        .add_argument("members", 1, capture=True)
+    )
+
+    @broadcast
+    @queueable
+    @sharded
+    def exec(
+        self, exec_ctx: ExecutionContext, conn_ctx: ConnectionContext, **kwargs
+    ) -> ExecutionResult:
+        key, members = self.args["key"], self.args["members"]
+        added = 0
+
+        def _add(value: RedisValue | None) -> RedisValue:
+            nonlocal added
+            value = value or new_set()
+            set_of(key, value)  # type check
+            added = add_members(value, members, exec_ctx.config)
+            return value
+
+        try:
+            exec_ctx.storage.upsert(key, _add)
+        except WrongType:
+            return shared.WRONGTYPE
+        except OutOfMemory:
+            return shared.OOM
+        return encoder.integer(added)
+
+    def keys(self) -> list[bytes]:
+        return [self.args["key"]]
+
+    def __bytes__(self) -> bytes:
+        return encoder.command(b"SADD", self.args["key"], *self.args["members"])
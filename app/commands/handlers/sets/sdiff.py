@@ -0,0 +1,18 @@
+from app.commands.handlers.sets.sinter import CommandSInter
+from app.storage.structures import Set
+from app.storage.structures.set import difference
+
+
+class CommandSDiff(CommandSInter):
+    """Returns the members of the difference between the first set and all
+    the successive sets, keys that do not exist are considered to be empty
+    sets.
+
+    Syntax:
+      SDIFF key [key ...]
+    """
+
+    command_name: bytes = b"SDIFF"
+
+    def combine(self, sets: list[Set]) -> list[bytes]:
+        return difference(sets[0], sets[1:])
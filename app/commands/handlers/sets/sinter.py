@@ -0,0 +1,53 @@
+from app.commands.base import ExecutionResult, RedisCommand
+from app.commands.decorators import queueable, sharded
+from app.commands.args.parser import CommandArgParser
+from app.commands.handlers.sets.common import sets_of
+from app.context import ConnectionContext, ExecutionContext
+from app.resp import encoder, shared
+from app.storage.in_memory.errors import WrongType
+from app.storage.structures import Set
+from app.storage.structures.set import intersection
+from app.storage.types import RedisValue
+
+
+class CommandSInter(RedisCommand):
+    """Returns the members of the intersection of all the given sets, keys
+    that do not exist are considered to be empty sets.
+
+    Members of the smallest set are checked against the other sets, so the
+    cost depends on the size of the smallest set.
+
+    Syntax:
+      SINTER key [key ...]
+    """
+
+    args: dict
+    command_name: bytes = b"SINTER"
+
+    arg_parser = CommandArgParser().add_argument("keys", 0, capture=True)
+
+    def combine(self, sets: list[Set]) -> list[bytes]:
+        """Members of the result, from the sets of the keys (in order)."""
+        return intersection(sets)
+
+    @queueable
+    @sharded
+    def exec(
+        self, exec_ctx: ExecutionContext, conn_ctx: ConnectionContext, **kwargs
+    ) -> ExecutionResult:
+        keys = self.args["keys"]
+
+        def _combine(values: list[RedisValue | None]) -> list[bytes]:
+            return self.combine(sets_of(keys, values))
+
+        try:
+            members = exec_ctx.storage.view_many(keys, _combine)
+        except WrongType:
+            return shared.WRONGTYPE
+        return encoder.bulk_string_array(members)
+
+    def keys(self) -> list[bytes]:
+        return self.args["keys"]
+
+    def __bytes__(self) -> bytes:
+        return encoder.command(self.command_name, *self.args["keys"])
@@ -0,0 +1,64 @@
+from app.commands.base import ExecutionResult, RedisCommand
+from app.commands.decorators import broadcast, queueable, sharded
+from app.commands.args.parser import CommandArgParser
+from app.commands.handlers.sets.common import add_members, new_set, sets_of
+from app.context import ConnectionContext, ExecutionContext
+from app.resp import encoder, shared
+from app.storage.in_memory.errors import OutOfMemory, WrongType
+from app.storage.structures.set import intersection
+from app.storage.types import RedisValue
+
+
+class CommandSInterStore(RedisCommand):
+    """Like SINTER, but the intersection is stored at destination instead of
+    being returned (destination is overwritten, or removed if the
+    intersection is empty). Returns the number of members of the result.
+
+    Syntax:
+      SINTERSTORE destination key [key ...]
+    """
+
+    args: dict
+    write: bool = True
+
+    arg_parser = (
+        CommandArgParser()
+        .add_argument("destination", 0)
+        .add_argument("keys", 1, capture=True)
+    )
+
+    @broadcast
+    @queueable
+    @sharded
+    def exec(
+        self, exec_ctx: ExecutionContext, conn_ctx: ConnectionContext, **kwargs
+    ) -> ExecutionResult:
+        destination, keys = self.args["destination"], self.args["keys"]
+        storage = exec_ctx.storage
+
+        def _store(values: list[RedisValue | None]) -> int:
+            members = intersection(sets_of(keys, values[:-1]))
+            result = None
+            if members:
+                result = new_set()
+                add_members(result, members, exec_ctx.config)
+            # destination is also held by view_many, so sources can't change
+            # between the intersection and the write
+            storage.upsert(destination, lambda _: result, free_memory=bool(result))
+            return len(members)
+
+        try:
+            stored = storage.view_many([*keys, destination], _store)
+        except WrongType:
+            return shared.WRONGTYPE
+        except OutOfMemory:
+            return shared.OOM
+        return encoder.integer(stored)
+
+    def keys(self) -> list[bytes]:
+        return [self.args["destination"], *self.args["keys"]]
+
+    def __bytes__(self) -> bytes:
+        return encoder.command(
+            b"SINTERSTORE", self.args["destination"], *self.args["keys"]
+        )
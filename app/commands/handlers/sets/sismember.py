@@ -0,0 +1,44 @@
+from app.commands.base import ExecutionResult, RedisCommand
+from app.commands.decorators import queueable, sharded
+from app.commands.args.parser import CommandArgParser
+from app.commands.handlers.sets.common import set_of
+from app.context import ConnectionContext, ExecutionContext
+from app.resp import encoder, shared
+from app.storage.in_memory.errors import WrongType
+from app.storage.types import RedisValue
+
+
+class CommandSIsMember(RedisCommand):
+    """Returns 1 if member is a member of the set stored at key, 0 otherwise
+    (or if the key does not exist).
+
+    Syntax:
+      SISMEMBER key member
+    """
+
+    args: dict
+
+    arg_parser = CommandArgParser().add_argument("key", 0).add_argument("member", 1)
+
+    @queueable
+    @sharded
+    def exec(
+        self, exec_ctx: ExecutionContext, conn_ctx: ConnectionContext, **kwargs
+    ) -> ExecutionResult:
+        key, member = self.args["key"], self.args["member"]
+
+        def _is_member(value: RedisValue | None) -> bool:
+            set_members = set_of(key, value)
+            return set_members is not None and member in set_members
+
+        try:
+            is_member = exec_ctx.storage.view(key, _is_member)
+        except WrongType:
+            return shared.WRONGTYPE
+        return shared.INTEGERS[int(is_member)]
+
+    def keys(self) -> list[bytes]:
+        return [self.args["key"]]
+
+    def __bytes__(self) -> bytes:
+        return encoder.command(b"SISMEMBER", self.args["key"], self.args["member"])
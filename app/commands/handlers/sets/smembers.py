@@ -0,0 +1,43 @@
+from app.commands.base import ExecutionResult, RedisCommand
+from app.commands.decorators import queueable, sharded
+from app.commands.args.parser import CommandArgParser
+from app.commands.handlers.sets.common import set_of
+from app.context import ConnectionContext, ExecutionContext
+from app.resp import encoder, shared
+from app.storage.in_memory.errors import WrongType
+from app.storage.types import RedisValue
+
+
+class CommandSMembers(RedisCommand):
+    """Returns all the members of the set stored at key (empty if the key
+    does not exist).
+
+    Syntax:
+      SMEMBERS key
+    """
+
+    args: dict
+
+    arg_parser = CommandArgParser().add_argument("key", 0)
+
+    @queueable
+    @sharded
+    def exec(
+        self, exec_ctx: ExecutionContext, conn_ctx: ConnectionContext, **kwargs
+    ) -> ExecutionResult:
+        key = self.args["key"]
+
+        def _members(value: RedisValue | None) -> list[bytes]:
+            set_members = set_of(key, value)
+            return list(set_members) if set_members is not None else []
+
+        try:
+            return encoder.bulk_string_array(exec_ctx.storage.view(key, _members))
+        except WrongType:
+            return shared.WRONGTYPE
+
+    def keys(self) -> list[bytes]:
+        return [self.args["key"]]
+
+    def __bytes__(self) -> bytes:
+        return encoder.command(b"SMEMBERS", self.args["key"])
@@ -0,0 +1,57 @@
+from app.commands.base import ExecutionResult, RedisCommand
+from app.commands.decorators import broadcast, queueable, sharded
+from app.commands.args.parser import CommandArgParser
+from app.commands.handlers.sets.common import set_of
+from app.context import ConnectionContext, ExecutionContext
+from app.resp import encoder, shared
+from app.storage.in_memory.errors import WrongType
+from app.storage.types import RedisValue
+
+
+class CommandSRem(RedisCommand):
+    """Removes the specified members from the set stored at key, members
+    that are not in the set are ignored. Returns the number of members
+    removed.
+
+    Syntax:
+      SREM key member [member ...]
+    """
+
+    args: dict
+    write: bool = True
+
+    arg_parser = (
+        CommandArgParser()
+        .add_argument("key", 0)
+        .add_argument("members", 1, capture=True)
+    )
+
+    @broadcast
+    @queueable
+    @sharded
+    def exec(
+        self, exec_ctx: ExecutionContext, conn_ctx: ConnectionContext, **kwargs
+    ) -> ExecutionResult:
+        key, members = self.args["key"], self.args["members"]
+        removed = 0
+
+        def _remove(value: RedisValue | None) -> RedisValue | None:
+            nonlocal removed
+            set_members = set_of(key, value)
+            if set_members is None:
+                return None
+            removed = set_members.remove(members)
+            return value if len(set_members) else None  # empty sets are removed
+
+        try:
+            # removing members never needs memory, so keys are not evicted
+            exec_ctx.storage.upsert(key, _remove, free_memory=False)
+        except WrongType:
+            return shared.WRONGTYPE
+        return encoder.integer(removed)
+
+    def keys(self) -> list[bytes]:
+        return [self.args["key"]]
+
+    def __bytes__(self) -> bytes:
+        return encoder.command(b"SREM", self.args["key"], *self.args["members"])
@@ -0,0 +1,17 @@
+from app.commands.handlers.sets.sinter import CommandSInter
+from app.storage.structures import Set
+from app.storage.structures.set import union
+
+
+class CommandSUnion(CommandSInter):
+    """Returns the members of the union of all the given sets, keys that do
+    not exist are considered to be empty sets.
+
+    Syntax:
+      SUNION key [key ...]
+    """
+
+    command_name: bytes = b"SUNION"
+
+    def combine(self, sets: list[Set]) -> list[bytes]:
+        return union(sets)
@@ -0,0 +1,20 @@
+"""This file includes all logic for handling commands on stream values (see
+`Stream` for the structure backing streams).
+
+Individual commands are split into multiple files as necessary.
+"""
+
+from .xadd import CommandXAdd
+from .xrange import CommandXRange, CommandXRevRange
+from .xlen import CommandXLen
+from .xtrim import CommandXTrim
+from .xread import CommandXRead
+
+__all__ = [
+    "CommandXAdd",
+    "CommandXRange",
+    "CommandXRevRange",
+    "CommandXLen",
+    "CommandXTrim",
+    "CommandXRead",
+]
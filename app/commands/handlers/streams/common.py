@@ -0,0 +1,99 @@
+from app.config import Config
+from app.commands.handlers.lists.common import parse_int
+from app.resp import encoder, shared
+from app.storage.in_memory.errors import WrongType
+from app.storage.structures import Stream, StreamID
+from app.storage.structures.stream import MAX_SEQ, Entry
+from app.storage.types import RedisEncoding, RedisValue
+
+ERR_INVALID_ID = encoder.error(
+    b"ERR Invalid stream ID specified as stream command argument"
+)
+ERR_NEGATIVE_MAXLEN = encoder.error(b"ERR The MAXLEN argument must be >= 0.")
+
+
+class StreamArgError(Exception):
+    """Raised with the error reply for invalid arguments of a stream
+    command."""
+
+    def __init__(self, reply: bytes):
+        super().__init__(reply)
+        self.reply = reply
+
+
+def new_stream() -> RedisValue:
+    return RedisValue.with_payload(Stream(), RedisEncoding.STREAM)
+
+
+def stream_of(key: bytes, value: RedisValue | None) -> Stream | None:
+    """Returns the stream held by the value (None if there is no value).
+
+    Raises WrongType if the value is not a stream.
+    """
+    if value is None:
+        return None
+    if value.encoding != RedisEncoding.STREAM:
+        raise WrongType(key)
+    return value.payload
+
+
+def parse_id(arg: bytes, missing_seq: int = 0) -> StreamID:
+    """Parses an ID (ms-seq, or ms with missing_seq as the sequence number).
+
+    Raises StreamArgError if the argument is not an ID.
+    """
+    ms, separator, seq = arg.partition(b"-")
+    if not ms.isdigit() or (separator and not seq.isdigit()):
+        raise StreamArgError(ERR_INVALID_ID)
+    stream_id = int(ms), int(seq) if separator else missing_seq
+    if max(stream_id) > MAX_SEQ:
+        raise StreamArgError(ERR_INVALID_ID)
+    return stream_id
+
+
+def format_id(stream_id: StreamID) -> bytes:
+    return b"%d-%d" % stream_id
+
+
+def parse_maxlen(args: list[bytes]) -> tuple[int, bool, list[bytes]]:
+    """Parses the threshold of a MAXLEN option (args follow MAXLEN, eg
+    `~ 1000`), returns it along with whether trimming is approximate and
+    the remaining arguments.
+
+    Raises StreamArgError if the threshold is missing or invalid.
+    """
+    approximate = args[:1] == [b"~"]
+    if args[:1] in ([b"~"], [b"="]):
+        args = args[1:]
+    if not args:
+        raise StreamArgError(shared.ERR_SYNTAX)
+    try:
+        maxlen = parse_int(args[0])
+    except ValueError:
+        raise StreamArgError(shared.ERR_NOT_INTEGER)
+    if maxlen < 0:
+        raise StreamArgError(ERR_NEGATIVE_MAXLEN)
+    return maxlen, approximate, args[1:]
+
+
+def add_entry(
+    stream: Stream, stream_id: StreamID, elements: list[bytes], config: Config
+):
+    """Appends an entry to the stream, in blocks of the size set in the
+    config."""
+    stream.add(
+        stream_id,
+        elements,
+        config.stream_node_max_entries,
+        config.stream_node_max_bytes,
+    )
+
+
+def write_entries(buf: bytearray, entries: list[Entry]):
+    """Appends entries as an array of pairs of ID and array of fields and
+    values."""
+    encoder.write_array_header(buf, len(entries))
+    for stream_id, elements in entries:
+        encoder.write_array_header(buf, 2)
+        encoder.write_bulk_string(buf, format_id(stream_id))
+        encoder.write_bulk_string_array(buf, elements)
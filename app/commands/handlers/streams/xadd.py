@@ -0,0 +1,180 @@
+from time import time
+
+from app.commands.base import ExecutionResult, RedisCommand
+from app.commands.decorators import broadcast, queueable, sharded
+from app.commands.args.parser import CommandArgParser
+from app.commands.handlers.streams.common import (
+    StreamArgError,
+    add_entry,
+    format_id,
+    new_stream,
+    parse_id,
+    parse_maxlen,
+    stream_of,
+)
+from app.context import ConnectionContext, ExecutionContext
+from app.resp import encoder, shared
+from app.storage.in_memory.errors import OutOfMemory, WrongType
+from app.storage.structures import Stream, StreamID
+from app.storage.structures.stream import MAX_SEQ, increment
+from app.storage.types import RedisValue
+
+ERR_WRONG_ARGS = encoder.error(b"ERR wrong number of arguments for 'xadd' command")
+ERR_ID_ZERO = encoder.error(b"ERR The ID specified in XADD must be greater than 0-0")
+ERR_ID_TOO_SMALL = encoder.error(
+    b"ERR The ID specified in XADD is equal or smaller than the target stream top item"
+)
+ERR_ID_EXHAUSTED = encoder.error(
+    b"ERR The stream has exhausted the last possible ID, unable to add more items"
+)
+
+
+def _next_id(stream: Stream, ms: int | None, seq: int | None) -> StreamID:
+    """ID of a new entry of the stream, from the milliseconds and sequence
+    number of the argument (None where they are generated, as in * or
+    ms-*).
+
+    Raises StreamArgError if the ID is not greater than the last ID.
+    """
+    last_ms, last_seq = stream.last_id
+    if ms is None:
+        # the current time, unless the clock went back or it already has
+        # an entry (then the last ID is incremented)
+        ms = int(time() * 1000)
+        stream_id = (ms, 0) if ms > last_ms else increment(stream.last_id)
+        if stream_id is None:
+            raise StreamArgError(ERR_ID_EXHAUSTED)
+        return stream_id
+
+    if seq is None:
+        if ms > last_ms:
+            return ms, 0
+        if ms < last_ms or last_seq == MAX_SEQ:
+            raise StreamArgError(ERR_ID_TOO_SMALL)
+        return ms, last_seq + 1
+
+    if (ms, seq) <= stream.last_id:
+        raise StreamArgError(ERR_ID_TOO_SMALL)
+    return ms, seq
+
+
+class CommandXAdd(RedisCommand):
+    """Appends the specified entry (fields and values) to the stream stored
+    at key. If key does not exist, a new stream is created. Returns the ID
+    of the entry.
+
+    IDs are a time in milliseconds and a sequence number (ms-seq) greater
+    than the ID of the last entry of the stream. With * the ID is generated
+    from the current time, and with ms-* only the sequence number is.
+
+    Options:
+      - NOMKSTREAM: the stream is not created if key does not exist (the
+        reply is nil).
+      - MAXLEN: the stream is trimmed to threshold entries after the entry
+        is appended (see XTRIM).
+
+    Syntax:
+      XADD key [NOMKSTREAM] [MAXLEN [= | ~] threshold] <* | id> field value
+        [field value ...]
+    """
+
+    args: dict
+    write: bool = True
+
+    arg_parser = (
+        CommandArgParser().add_argument("key", 0).add_argument("args", 1, capture=True)
+    )
+
+    def _parse(
+        self,
+    ) -> tuple[bool, tuple[int, bool] | None, int | None, int | None, list[bytes]]:
+        """Returns NOMKSTREAM, MAXLEN threshold and approximation, the
+        milliseconds and sequence number of the ID (None where generated),
+        and the fields and values."""
+        args = self.args["args"]
+        nomkstream, maxlen = False, None
+        while args:
+            option = args[0].upper()
+            if option == b"NOMKSTREAM":
+                nomkstream, args = True, args[1:]
+            elif option == b"MAXLEN":
+                threshold, approximate, args = parse_maxlen(args[1:])
+                maxlen = threshold, approximate
+            else:
+                break
+
+        if len(args) < 3 or len(args) % 2 == 0:
+            raise StreamArgError(ERR_WRONG_ARGS)
+        arg, elements = args[0], args[1:]
+        if arg == b"*":
+            return nomkstream, maxlen, None, None, elements
+        if arg.endswith(b"-*"):
+            ms, _ = parse_id(arg[:-2])
+            return nomkstream, maxlen, ms, None, elements
+
+        ms, seq = parse_id(arg)
+        if (ms, seq) == (0, 0):
+            raise StreamArgError(ERR_ID_ZERO)
+        return nomkstream, maxlen, ms, seq, elements
+
+    @broadcast
+    @queueable
+    @sharded
+    def exec(
+        self, exec_ctx: ExecutionContext, conn_ctx: ConnectionContext, **kwargs
+    ) -> ExecutionResult:
+        key = self.args["key"]
+        try:
+            nomkstream, maxlen, ms, seq, elements = self._parse()
+        except StreamArgError as e:
+            return e.reply
+
+        stream_id: StreamID | None = None
+        length = 0
+
+        def _add(value: RedisValue | None) -> RedisValue | None:
+            nonlocal stream_id, length
+            if value is None and nomkstream:
+                return None
+            value = value or new_stream()
+            stream = stream_of(key, value)
+            stream_id = _next_id(stream, ms, seq)
+            add_entry(stream, stream_id, elements, exec_ctx.config)
+            if maxlen is not None:
+                stream.trim(*maxlen)
+            length = len(stream)
+            return value
+
+        try:
+            exec_ctx.storage.upsert(key, _add)
+        except StreamArgError as e:
+            return e.reply
+        except WrongType:
+            return shared.WRONGTYPE
+        except OutOfMemory:
+            return shared.OOM
+
+        if stream_id is None:
+            return shared.NIL
+        exec_ctx.blocked_clients.signal(key)  # eg, clients blocked by XREAD
+        # replicas append the entry with the same ID, and trim the stream to
+        # the same (exact) length, as approximate trimming depends on the
+        # blocks of the stream of the master
+        self.args["args"] = [
+            *([b"NOMKSTREAM"] if nomkstream else []),
+            *([b"MAXLEN", b"=", b"%d" % length] if maxlen is not None else []),
+            format_id(stream_id),
+            *elements,
+        ]
+        return encoder.bulk_string(format_id(stream_id))
+
+    def keys(self) -> list[bytes]:
+        return [self.args["key"]]
+
+    def replication_payload(self) -> bytes:
+        # serialized with the ID of the entry (see exec), which may have been
+        # generated, and the exact length the stream was trimmed to
+        return bytes(self)
+
+    def __bytes__(self) -> bytes:
+        return encoder.command(b"XADD", self.args["key"], *self.args["args"])
@@ -0,0 +1,150 @@
+from app.commands.base import ExecutionResult, RedisCommand
+from app.commands.decorators import queueable, sharded
+from app.commands.args.parser import CommandArgParser
+from app.commands.handlers.lists.common import parse_int
+from app.commands.handlers.streams.common import (
+    StreamArgError,
+    parse_id,
+    stream_of,
+    write_entries,
+)
+from app.context import ConnectionContext, ExecutionContext
+from app.resp import encoder, shared
+from app.storage.in_memory.errors import WrongType
+from app.storage.structures import StreamID
+from app.storage.structures.stream import (
+    MAX_ID,
+    MAX_SEQ,
+    MIN_ID,
+    Entry,
+    decrement,
+    increment,
+)
+from app.storage.types import RedisValue
+
+ERR_INVALID_START = encoder.error(b"ERR invalid start ID for the interval")
+ERR_INVALID_END = encoder.error(b"ERR invalid end ID for the interval")
+
+
+def parse_bound(arg: bytes, start: bool) -> StreamID | None:
+    """Parses the start or end of an interval of IDs (- and + for the first
+    and last possible IDs, ms for all sequence numbers of ms, and ( before
+    an ID to exclude it), returns None for an empty interval.
+
+    Raises StreamArgError if the argument is not a valid bound.
+    """
+    if arg == b"-":
+        return MIN_ID
+    if arg == b"+":
+        return MAX_ID
+    exclusive = arg[:1] == b"("
+    stream_id = parse_id(arg[1:] if exclusive else arg, 0 if start else MAX_SEQ)
+    if not exclusive:
+        return stream_id
+    bound = increment(stream_id) if start else decrement(stream_id)
+    if bound is None:
+        raise StreamArgError(ERR_INVALID_START if start else ERR_INVALID_END)
+    return bound
+
+
+class CommandXRange(RedisCommand):
+    """Returns the entries of the stream stored at key with an ID between
+    start and end (both included), in order.
+
+    start and end are IDs, - and + for the first and last possible IDs, a
+    time in milliseconds for all the IDs of that time, and an ID preceded
+    by ( is excluded from the range. With COUNT, at most count entries are
+    returned.
+
+    Entries are located in O(log n), so the cost depends on the number of
+    entries returned rather than the length of the stream.
+
+    Syntax:
+      XRANGE key start end [COUNT count]
+    """
+
+    args: dict
+    command_name: bytes = b"XRANGE"
+    rev: bool = False  # entries are returned from the end
+
+    arg_parser = (
+        CommandArgParser()
+        .add_argument("key", 0)
+        .add_argument("start", 1)
+        .add_argument("end", 2)
+        .add_argument("options", 3, required=False, capture=True, default=[])
+    )
+
+    def _parse_count(self) -> int | None:
+        options = self.args["options"]
+        if not options:
+            return None
+        if len(options) != 2 or options[0].upper() != b"COUNT":
+            raise StreamArgError(shared.ERR_SYNTAX)
+        try:
+            return max(parse_int(options[1]), 0)
+        except ValueError:
+            raise StreamArgError(shared.ERR_NOT_INTEGER)
+
+    @queueable
+    @sharded
+    def exec(
+        self, exec_ctx: ExecutionContext, conn_ctx: ConnectionContext, **kwargs
+    ) -> ExecutionResult:
+        key = self.args["key"]
+        try:
+            start = parse_bound(self.args["start"], start=True)
+            end = parse_bound(self.args["end"], start=False)
+            count = self._parse_count()
+        except StreamArgError as e:
+            return e.reply
+
+        def _range(value: RedisValue | None) -> list[Entry]:
+            stream = stream_of(key, value)
+            if stream is None or start > end:
+                return []
+            if self.rev:
+                return stream.reverse_range(start, end, count)
+            return stream.range(start, end, count)
+
+        try:
+            entries = exec_ctx.storage.view(key, _range)
+        except WrongType:
+            return shared.WRONGTYPE
+
+        buf = bytearray()
+        write_entries(buf, entries)
+        return bytes(buf)
+
+    def keys(self) -> list[bytes]:
+        return [self.args["key"]]
+
+    def __bytes__(self) -> bytes:
+        first, second = (
+            (self.args["end"], self.args["start"])
+            if self.rev
+            else (self.args["start"], self.args["end"])
+        )
+        return encoder.command(
+            self.command_name, self.args["key"], first, second, *self.args["options"]
+        )
+
+
+class CommandXRevRange(CommandXRange):
+    """Returns the entries of the stream stored at key with an ID between
+    end and start (both included), in reverse order (see XRANGE).
+
+    Syntax:
+      XREVRANGE key end start [COUNT count]
+    """
+
+    command_name: bytes = b"XREVRANGE"
+    rev: bool = True
+
+    arg_parser = (
+        CommandArgParser()
+        .add_argument("key", 0)
+        .add_argument("end", 1)
+        .add_argument("start", 2)
+        .add_argument("options", 3, required=False, capture=True, default=[])
+    )
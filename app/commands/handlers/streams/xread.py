@@ -0,0 +1,178 @@
+from app.commands.base import ExecutionResult, RedisCommand
+from app.commands.decorators import queueable, sharded
+from app.commands.args.parser import CommandArgParser
+from app.commands.handlers.lists.common import parse_int
+from app.commands.handlers.streams.common import (
+    StreamArgError,
+    parse_id,
+    stream_of,
+    write_entries,
+)
+from app.context import ConnectionContext, ExecutionContext
+from app.resp import encoder, shared
+from app.storage.in_memory.errors import WrongType
+from app.storage.structures import StreamID
+from app.storage.structures.stream import MAX_ID, MIN_ID, Entry, increment
+from app.storage.types import RedisValue
+
+ERR_UNBALANCED = encoder.error(
+    b"ERR Unbalanced 'xread' list of streams: for each stream key an ID or '$' "
+    b"must be specified."
+)
+ERR_TIMEOUT_NOT_INTEGER = encoder.error(
+    b"ERR timeout is not an integer or out of range"
+)
+ERR_TIMEOUT_NEGATIVE = encoder.error(b"ERR timeout is negative")
+
+StreamEntries = list[tuple[bytes, list[Entry]]]  # entries of each stream
+
+
+class CommandXRead(RedisCommand):
+    """Returns the entries of each of the given streams with an ID greater
+    than the ID given for the stream, only for streams that have such
+    entries (nil if none does).
+
+    $ as an ID stands for the last ID of the stream when the command is
+    called, so only entries added later are returned. With COUNT, at most
+    count entries are returned per stream.
+
+    With BLOCK, if no stream has such entries, the client is blocked until
+    an entry is added to one of them or milliseconds have passed (0 blocks
+    forever). Blocked clients are woken up by XADD itself (see
+    `BlockedClients`), without polling. In a transaction, the command
+    doesn't block.
+
+    Syntax:
+      XREAD [COUNT count] [BLOCK milliseconds] STREAMS key [key ...]
+        id [id ...]
+    """
+
+    args: dict
+
+    arg_parser = CommandArgParser().add_argument("args", 0, capture=True)
+
+    # IDs read from, once $ is resolved on the first execution (so executing
+    # the command again, eg, once woken up, doesn't skip entries added since)
+    resolved: list[StreamID] | None = None
+
+    def _parse(
+        self,
+    ) -> tuple[int | None, int | None, list[bytes], list[StreamID | None]]:
+        """Returns COUNT (None if there is no limit), BLOCK (None if the
+        command doesn't block), the keys of the streams and the IDs to read
+        from (None for $)."""
+        args, count, block = self.args["args"], None, None
+        i = 0
+        while i < len(args) and args[i].upper() != b"STREAMS":
+            option = args[i].upper()
+            if option not in (b"COUNT", b"BLOCK") or i + 1 == len(args):
+                raise StreamArgError(shared.ERR_SYNTAX)
+            try:
+                number = parse_int(args[i + 1])
+            except ValueError:
+                raise StreamArgError(
+                    ERR_TIMEOUT_NOT_INTEGER
+                    if option == b"BLOCK"
+                    else shared.ERR_NOT_INTEGER
+                )
+            if option == b"COUNT":
+                count = number
+            elif number < 0:
+                raise StreamArgError(ERR_TIMEOUT_NEGATIVE)
+            else:
+                block = number
+            i += 2
+        if i == len(args):
+            raise StreamArgError(shared.ERR_SYNTAX)
+
+        streams = args[i + 1 :]
+        if not streams or len(streams) % 2:
+            raise StreamArgError(ERR_UNBALANCED)
+        half = len(streams) // 2
+        ids = [None if arg == b"$" else parse_id(arg) for arg in streams[half:]]
+        count = count if count and count > 0 else None
+        return count, block, streams[:half], ids
+
+    def read(
+        self,
+        keys: list[bytes],
+        ids: list[StreamID],
+        count: int | None,
+        values: list[RedisValue | None],
+    ) -> StreamEntries:
+        """Entries of each stream after its ID, for streams that have any."""
+        result = []
+        for key, stream_id, value in zip(keys, ids, values):
+            stream = stream_of(key, value)
+            start = increment(stream_id)
+            if stream is None or start is None:
+                continue
+            entries = stream.range(start, MAX_ID, count)
+            if entries:
+                result.append((key, entries))
+        return result
+
+    @queueable
+    @sharded
+    def exec(
+        self, exec_ctx: ExecutionContext, conn_ctx: ConnectionContext, **kwargs
+    ) -> ExecutionResult:
+        try:
+            count, block, keys, ids = self._parse()
+        except StreamArgError as e:
+            return e.reply
+
+        def _read(values: list[RedisValue | None]) -> StreamEntries:
+            if self.resolved is None:
+                # $ is the last ID of the stream at the time of the call
+                self.resolved = []
+                for key, stream_id, value in zip(keys, ids, values):
+                    stream = stream_of(key, value)
+                    last_id = MIN_ID if stream is None else stream.last_id
+                    self.resolved.append(last_id if stream_id is None else stream_id)
+            return self.read(keys, self.resolved, count, values)
+
+        try:
+            streams = exec_ctx.storage.view_many(keys, _read)
+            if not streams and block is not None and kwargs.get("blocking", True):
+                streams = exec_ctx.blocked_clients.wait_for(
+                    keys,
+                    block / 1000 or None,
+                    lambda: exec_ctx.storage.view_many(keys, _read) or None,
+                )
+        except WrongType:
+            return shared.WRONGTYPE
+
+        if not streams:
+            return shared.NULL_ARRAY
+        buf = bytearray()
+        encoder.write_array_header(buf, len(streams))
+        for key, entries in streams:
+            encoder.write_array_header(buf, 2)
+            encoder.write_bulk_string(buf, key)
+            write_entries(buf, entries)
+        return bytes(buf)
+
+    def blocks(self) -> bool:
+        try:
+            _, block, _, _ = self._parse()
+        except StreamArgError:
+            return False
+        return block is not None
+
+    def blocked_on(self) -> tuple[list[bytes], float | None] | None:
+        try:
+            _, block, keys, _ = self._parse()
+        except StreamArgError:
+            return None
+        return None if block is None else (keys, block / 1000 or None)
+
+    def keys(self) -> list[bytes]:
+        try:
+            _, _, keys, _ = self._parse()
+        except StreamArgError:
+            return []
+        return keys
+
+    def __bytes__(self) -> bytes:
+        return encoder.command(b"XREAD", *self.args["args"])
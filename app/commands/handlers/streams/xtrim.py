@@ -0,0 +1,84 @@
+from app.commands.base import ExecutionResult, RedisCommand
+from app.commands.decorators import broadcast, queueable, sharded
+from app.commands.args.parser import CommandArgParser
+from app.commands.handlers.streams.common import (
+    StreamArgError,
+    parse_maxlen,
+    stream_of,
+)
+from app.context import ConnectionContext, ExecutionContext
+from app.resp import encoder, shared
+from app.storage.in_memory.errors import WrongType
+from app.storage.types import RedisValue
+
+
+class CommandXTrim(RedisCommand):
+    """Trims the stream stored at key by removing its oldest entries, so at
+    most threshold entries remain. Returns the number of entries removed.
+
+    With ~, only whole blocks of entries are removed, which is cheaper but
+    may leave a few more entries than threshold. The stream is kept even if
+    it becomes empty (like in Redis).
+
+    Syntax:
+      XTRIM key MAXLEN [= | ~] threshold
+    """
+
+    args: dict
+    write: bool = True
+
+    arg_parser = (
+        CommandArgParser()
+        .add_argument("key", 0)
+        .add_argument("strategy", 1)
+        .add_argument("args", 2, capture=True)
+    )
+
+    @broadcast
+    @queueable
+    @sharded
+    def exec(
+        self, exec_ctx: ExecutionContext, conn_ctx: ConnectionContext, **kwargs
+    ) -> ExecutionResult:
+        key = self.args["key"]
+        if self.args["strategy"].upper() != b"MAXLEN":
+            return shared.ERR_SYNTAX
+        try:
+            maxlen, approximate, rest = parse_maxlen(self.args["args"])
+        except StreamArgError as e:
+            return e.reply
+        if rest:
+            return shared.ERR_SYNTAX
+
+        removed, length = 0, None
+
+        def _trim(value: RedisValue | None) -> RedisValue | None:
+            nonlocal removed, length
+            stream = stream_of(key, value)
+            if stream is not None:
+                removed = stream.trim(maxlen, approximate)
+                length = len(stream)
+            return value
+
+        try:
+            exec_ctx.storage.upsert(key, _trim, free_memory=False)
+        except WrongType:
+            return shared.WRONGTYPE
+        if approximate and length is not None:
+            # replicas trim to the exact length, which depends on the blocks
+            # of the stream of the master
+            self.args["args"] = [b"=", b"%d" % length]
+        return encoder.integer(removed)
+
+    def keys(self) -> list[bytes]:
+        return [self.args["key"]]
+
+    def replication_payload(self) -> bytes:
+        # serialized with the exact threshold of an approximate trim (see
+        # exec)
+        return bytes(self)
+
+    def __bytes__(self) -> bytes:
+        return encoder.command(
+            b"XTRIM", self.args["key"], self.args["strategy"], *self.args["args"]
+        )
@@ -3,11 +3,8 @@ TODO: how do I propagate transactions to replicas? will this be our new test?
 """
 
 from app.commands.base import ExecutionResult, RedisCommand
-from app.commands.args.parser import CommandArgParser
 from app.context import ConnectionContext, ExecutionContext
-from app.resp.types.array import Array
-from app.resp.types.simple_error import SimpleError
-from app.resp.types.simple_string import SimpleString
+from app.resp import encoder, shared
 
 
 class CommandDiscard(RedisCommand):
@@ -20,20 +17,16 @@ class CommandDiscard(RedisCommand):
 
     args: dict
 
-    def __init__(self, args_list: list[bytes]):
-        parser = CommandArgParser()
-        self.args = parser.parse_args(args_list)
-
     def exec(
         self, exec_ctx: ExecutionContext, conn_ctx: ConnectionContext, **kwargs
     ) -> ExecutionResult:
         tx_queue = conn_ctx.tx_queue
         if not tx_queue.is_enabled():
-            return bytes(SimpleError(b"ERR DISCARD without MULTI"))
+            return shared.ERR_DISCARD_WITHOUT_MULTI
 
         tx_queue.flush()
         tx_queue.disable()
-        return bytes(SimpleString(b"OK"))
+        return shared.OK
 
     def __bytes__(self) -> bytes:
-        return bytes(Array([b"DISCARD"]))
+        return encoder.command(b"DISCARD")
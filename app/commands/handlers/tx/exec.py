@@ -1,8 +1,6 @@
 from app.commands.base import ExecutionResult, RedisCommand
-from app.commands.args.parser import CommandArgParser
 from app.context import ExecutionContext, ConnectionContext
-from app.resp.types.array import Array
-from app.resp.types.simple_error import SimpleError
+from app.resp import encoder, shared
 
 
 class CommandExec(RedisCommand):
@@ -15,31 +13,34 @@ class CommandExec(RedisCommand):
 
     args: dict
 
-    def __init__(self, args_list: list[bytes]):
-        parser = CommandArgParser()
-        self.args = parser.parse_args(args_list)
-
     def exec(
         self, exec_ctx: ExecutionContext, conn_ctx: ConnectionContext, **kwargs
     ) -> ExecutionResult:
         tx_queue = conn_ctx.tx_queue
         if not tx_queue.is_enabled():
-            return bytes(SimpleError(b"ERR EXEC without MULTI"))
+            return shared.ERR_EXEC_WITHOUT_MULTI
 
         else:
             tx_queue.disable()
-            results = []
+            results = bytearray()
+            count = 0
             for command in tx_queue.get():
-                result = command.exec(exec_ctx, conn_ctx, **kwargs)
+                # blocking commands (eg, BLPOP) don't block in transactions
+                result = command.exec(exec_ctx, conn_ctx, **kwargs, blocking=False)
 
                 # add result depending on it's type
                 if isinstance(result, list):
-                    results.extend(result)
+                    for res in result:
+                        results += res
+                    count += len(result)
                 else:
                     if result:
-                        results.append(result)
+                        results += result
+                        count += 1
 
-            return f"*{len(results)}\r\n".encode() + b"".join(results)
+            buf = bytearray()
+            encoder.write_array_header(buf, count)
+            return bytes(buf + results)
 
     def __bytes__(self) -> bytes:
-        return bytes(Array([b"EXEC"]))
+        return encoder.command(b"EXEC")
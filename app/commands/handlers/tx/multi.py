@@ -1,8 +1,6 @@
 from app.commands.base import ExecutionResult, RedisCommand
-from app.commands.args.parser import CommandArgParser
 from app.context import ConnectionContext, ExecutionContext
-from app.resp.types.array import Array
-from app.resp.types.simple_string import SimpleString
+from app.resp import encoder, shared
 
 
 class CommandMulti(RedisCommand):
@@ -15,16 +13,12 @@ class CommandMulti(RedisCommand):
 
     args: dict
 
-    def __init__(self, args_list: list[bytes]):
-        parser = CommandArgParser()
-        self.args = parser.parse_args(args_list)
-
     def exec(
         self, exec_ctx: ExecutionContext, conn_ctx: ConnectionContext, **kwargs
     ) -> ExecutionResult:
         tx_queue = conn_ctx.tx_queue
         tx_queue.enable()
-        return bytes(SimpleString(b"OK"))
+        return shared.OK
 
     def __bytes__(self) -> bytes:
-        return bytes(Array([b"MULTI"]))
+        return encoder.command(b"MULTI")
@@ -0,0 +1,17 @@
+from app.commands.handlers.delete import CommandDel
+from app.resp import encoder
+
+
+class CommandUnlink(CommandDel):
+    """Removes the specified keys like DEL, but large values are only
+    unlinked from the keyspace and freed in a background thread, so the
+    command returns without waiting for memory to be reclaimed.
+
+    Syntax:
+      UNLINK key [key ...]
+    """
+
+    lazy: bool = True
+
+    def __bytes__(self) -> bytes:
+        return encoder.command(b"UNLINK", *self.args["keys"])
@@ -1,13 +1,8 @@
-import threading
-from time import sleep, time
-
 from app.commands.args.mapping import map_to_int
 from app.commands.base import ExecutionResult, RedisCommand
 from app.commands.args.parser import CommandArgParser
 from app.context import ConnectionContext, ExecutionContext
-from app.resp.types.array import Array
-from app.resp.types.bulk_string import BulkString
-from app.resp.types.integer import Integer
+from app.resp import encoder
 
 
 class CommandWait(RedisCommand):
@@ -24,11 +19,11 @@ class CommandWait(RedisCommand):
 
     args: dict = {}
 
-    def __init__(self, args_list: list[bytes]):
-        parser = CommandArgParser()
-        parser.add_argument("numreplicas", 0, map_fn=map_to_int)
-        parser.add_argument("timeout", 1, map_fn=map_to_int)
-        self.args = parser.parse_args(args_list)
+    arg_parser = (
+        CommandArgParser()
+        .add_argument("numreplicas", 0, map_fn=map_to_int)
+        .add_argument("timeout", 1, map_fn=map_to_int)
+    )
 
     def exec(
         self, exec_ctx: ExecutionContext, conn_ctx: ConnectionContext, **kwargs
@@ -38,16 +33,17 @@ class CommandWait(RedisCommand):
             self.args["timeout"],
         )
         replicas_in_sync = _count_replicas_in_sync(acks_required, timeout, exec_ctx)
-        return bytes(Integer(str(replicas_in_sync).encode()))
+        return encoder.integer(replicas_in_sync)
+
+    def blocks(self) -> bool:
+        return True
 
     def __bytes__(self) -> bytes:
         numreplicas, timeout = (
             str(self.args["numreplicas"]).encode(),
             str(self.args["timeout"]).encode(),
         )
-        return bytes(
-            Array([BulkString(b"WAIT"), BulkString(numreplicas), BulkString(timeout)])
-        )
+        return encoder.command(b"WAIT", numreplicas, timeout)
 
 
 def _count_replicas_in_sync(
@@ -55,25 +51,7 @@ def _count_replicas_in_sync(
     timeout: int,  # in milliseconds
     ctx: ExecutionContext,
 ) -> int:
+    # the command is woken up by acks from replicas (see
+    # `ReplicaConnectionPool.wait_for_acks`) instead of polling them
     master_offset = ctx.info.get_offset()
-    start = int(time() * 1000)
-
-    # loop until waiting condition is fulfilled
-    while True:
-        if ctx.replica_pool.count_acked_connections(master_offset) >= acks_required:
-            break
-
-        current = int(time() * 1000)
-        if current - start >= timeout:
-            break
-
-        # poll replicas for their latest offset
-        threading.Thread(
-            target=ctx.replica_pool.request_offset_ack_from_connections,
-            args=(master_offset,),
-        ).start()
-
-        sleep(0.02)  # throttle loop by 20ms
-
-    count = ctx.replica_pool.count_acked_connections(master_offset)
-    return count
+    return ctx.replica_pool.wait_for_acks(master_offset, acks_required, timeout / 1000)
@@ -0,0 +1,25 @@
+"""This file includes all logic for handling commands on sorted set values
+(see `ZListpack` and `SortedSet` for the structures backing sorted sets).
+
+Individual commands are split into multiple files as necessary.
+"""
+
+from .zadd import CommandZAdd
+from .zincrby import CommandZIncrBy
+from .zscore import CommandZScore
+from .zrank import CommandZRank
+from .zrange import CommandZRange
+from .zrem import CommandZRem
+from .zcard import CommandZCard
+from .zscan import CommandZScan
+
+__all__ = [
+    "CommandZAdd",
+    "CommandZIncrBy",
+    "CommandZScore",
+    "CommandZRank",
+    "CommandZRange",
+    "CommandZRem",
+    "CommandZCard",
+    "CommandZScan",
+]
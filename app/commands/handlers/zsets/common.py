@@ -0,0 +1,82 @@
+import math
+
+from app.config import Config
+from app.resp import encoder
+from app.storage.in_memory.errors import WrongType
+from app.storage.structures import SortedSet, ZListpack, ZSet
+from app.storage.types import RedisEncoding, RedisValue
+
+ERR_NOT_FLOAT = encoder.error(b"ERR value is not a valid float")
+ERR_NAN = encoder.error(b"ERR resulting score is not a number (NaN)")
+
+
+class ScoreIsNaN(Exception):
+    """Raised from an update when an increment results in a NaN score."""
+
+
+def new_zset() -> RedisValue:
+    return RedisValue.with_payload(ZListpack(), RedisEncoding.ZSET_ZIPLIST)
+
+
+def zset_of(key: bytes, value: RedisValue | None) -> ZSet | None:
+    """Returns the sorted set held by the value (None if there is no value).
+
+    Raises WrongType if the value is not a sorted set.
+    """
+    if value is None:
+        return None
+    if value.encoding not in (RedisEncoding.ZSET_ZIPLIST, RedisEncoding.ZSET):
+        raise WrongType(key)
+    return value.payload
+
+
+def _convert_to_skiplist(value: RedisValue):
+    value.payload = SortedSet(value.payload.items())
+    value.encoding = RedisEncoding.ZSET
+
+
+def add_member(value: RedisValue, member: bytes, score: float, config: Config) -> bool:
+    """Sets the score of member in the sorted set held by value, which is
+    converted to the skiplist encoding once it exceeds the listpack limits
+    of the config.
+
+    Returns whether the member was added.
+    """
+    if (
+        value.encoding == RedisEncoding.ZSET_ZIPLIST
+        and len(member) > config.zset_max_listpack_value
+    ):
+        _convert_to_skiplist(value)
+
+    added = value.payload.add(member, score)
+    if (
+        value.encoding == RedisEncoding.ZSET_ZIPLIST
+        and len(value.payload) > config.zset_max_listpack_entries
+    ):
+        _convert_to_skiplist(value)
+    return added
+
+
+def parse_score(arg: bytes) -> float:
+    """Parses a score (eg, 1.5, -inf), raises ValueError if it isn't one.
+
+    Infinite scores must be spelled as such, values that overflow (eg,
+    1e400) are not scores.
+    """
+    if arg != arg.strip():
+        raise ValueError(f"{arg!r} is not a float")
+    score = float(arg)
+    if math.isnan(score):
+        raise ValueError("score is not a number")
+    if math.isinf(score) and arg.lstrip(b"+-").lower() not in (b"inf", b"infinity"):
+        raise ValueError(f"{arg!r} is out of range")
+    return score
+
+
+def format_score(score: float) -> bytes:
+    """Formats a score as Redis does (eg, 1 rather than 1.0)."""
+    if math.isinf(score):
+        return b"inf" if score > 0 else b"-inf"
+    if score.is_integer() and abs(score) < 2**53:
+        return b"%d" % score
+    return repr(score).encode()
@@ -0,0 +1,133 @@
+import math
+
+from app.commands.base import ExecutionResult, RedisCommand
+from app.commands.decorators import broadcast, queueable, sharded
+from app.commands.args.parser import CommandArgParser
+from app.commands.handlers.zsets.common import (
+    ERR_NAN,
+    ERR_NOT_FLOAT,
+    ScoreIsNaN,
+    add_member,
+    format_score,
+    new_zset,
+    parse_score,
+    zset_of,
+)
+from app.context import ConnectionContext, ExecutionContext
+from app.resp import encoder, shared
+from app.storage.in_memory.errors import OutOfMemory, WrongType
+from app.storage.types import RedisValue
+
+ERR_NX_XX = encoder.error(b"ERR XX and NX options at the same time are not compatible")
+ERR_GT_LT_NX = encoder.error(
+    b"ERR GT, LT, and/or NX options at the same time are not compatible"
+)
+ERR_INCR_PAIRS = encoder.error(
+    b"ERR INCR option supports a single increment-element pair"
+)
+
+FLAGS = {b"NX", b"XX", b"GT", b"LT", b"CH", b"INCR"}
+
+
+class CommandZAdd(RedisCommand):
+    """Adds all the specified members with the specified scores to the
+    sorted set stored at key, scores of existing members are updated. If key
+    does not exist, a new sorted set is created.
+
+    Options:
+      - NX: only add new members, XX: only update existing members.
+      - GT/LT: only update existing members if the new score is greater/less
+        than the current one.
+      - CH: reply with the number of members added or updated, instead of
+        only added.
+      - INCR: increment the score of the member (like ZINCRBY) and reply
+        with the new score (nil if the operation was aborted by an option).
+
+    Syntax:
+      ZADD key [NX | XX] [GT | LT] [CH] [INCR] score member [score member ...]
+    """
+
+    args: dict
+    write: bool = True
+
+    arg_parser = (
+        CommandArgParser().add_argument("key", 0).add_argument("args", 1, capture=True)
+    )
+
+    @broadcast
+    @queueable
+    @sharded
+    def exec(
+        self, exec_ctx: ExecutionContext, conn_ctx: ConnectionContext, **kwargs
+    ) -> ExecutionResult:
+        key, args = self.args["key"], self.args["args"]
+        flags = set()
+        while args and args[0].upper() in FLAGS:
+            flags.add(args[0].upper())
+            args = args[1:]
+
+        if not args or len(args) % 2:
+            return shared.ERR_SYNTAX
+        if {b"NX", b"XX"} <= flags:
+            return ERR_NX_XX
+        if len(flags & {b"NX", b"GT", b"LT"}) > 1:
+            return ERR_GT_LT_NX
+        incr = b"INCR" in flags
+        if incr and len(args) > 2:
+            return ERR_INCR_PAIRS
+        try:
+            pairs = [(parse_score(s), m) for s, m in zip(args[::2], args[1::2])]
+        except ValueError:
+            return ERR_NOT_FLOAT
+
+        added = changed = 0
+        result: float | None = None
+
+        def _add(value: RedisValue | None) -> RedisValue | None:
+            nonlocal added, changed, result
+            created = value is None
+            value = value or new_zset()
+            zset = zset_of(key, value)
+            for score, member in pairs:
+                current = zset.score(member)
+                if current is None:
+                    if b"XX" in flags:
+                        continue
+                elif b"NX" in flags:
+                    continue
+                else:
+                    if incr:
+                        score += current
+                        if math.isnan(score):
+                            raise ScoreIsNaN()
+                    if (b"GT" in flags and score <= current) or (
+                        b"LT" in flags and score >= current
+                    ):
+                        continue
+
+                result = score
+                if add_member(value, member, score, exec_ctx.config):
+                    added += 1
+                elif score != current:
+                    changed += 1
+            # no key is created if no member was added
+            return None if created and not len(zset) else value
+
+        try:
+            exec_ctx.storage.upsert(key, _add)
+        except ScoreIsNaN:
+            return ERR_NAN
+        except WrongType:
+            return shared.WRONGTYPE
+        except OutOfMemory:
+            return shared.OOM
+
+        if incr:
+            return encoder.bulk_string(None if result is None else format_score(result))
+        return encoder.integer(added + changed if b"CH" in flags else added)
+
+    def keys(self) -> list[bytes]:
+        return [self.args["key"]]
+
+    def __bytes__(self) -> bytes:
+        return encoder.command(b"ZADD", self.args["key"], *self.args["args"])
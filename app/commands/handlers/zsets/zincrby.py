@@ -0,0 +1,81 @@
+import math
+
+from app.commands.base import ExecutionResult, RedisCommand
+from app.commands.decorators import broadcast, queueable, sharded
+from app.commands.args.parser import CommandArgParser
+from app.commands.handlers.zsets.common import (
+    ERR_NAN,
+    ERR_NOT_FLOAT,
+    ScoreIsNaN,
+    add_member,
+    format_score,
+    new_zset,
+    parse_score,
+    zset_of,
+)
+from app.context import ConnectionContext, ExecutionContext
+from app.resp import encoder, shared
+from app.storage.in_memory.errors import OutOfMemory, WrongType
+from app.storage.types import RedisValue
+
+
+class CommandZIncrBy(RedisCommand):
+    """Increments the score of member in the sorted set stored at key by
+    increment. If member does not exist, it is added with increment as its
+    score (and a new sorted set is created if key does not exist). Returns
+    the new score of member.
+
+    Syntax:
+      ZINCRBY key increment member
+    """
+
+    args: dict
+    write: bool = True
+
+    arg_parser = (
+        CommandArgParser()
+        .add_argument("key", 0)
+        .add_argument("increment", 1)
+        .add_argument("member", 2)
+    )
+
+    @broadcast
+    @queueable
+    @sharded
+    def exec(
+        self, exec_ctx: ExecutionContext, conn_ctx: ConnectionContext, **kwargs
+    ) -> ExecutionResult:
+        key, member = self.args["key"], self.args["member"]
+        try:
+            increment = parse_score(self.args["increment"])
+        except ValueError:
+            return ERR_NOT_FLOAT
+        score = 0.0
+
+        def _incr(value: RedisValue | None) -> RedisValue:
+            nonlocal score
+            value = value or new_zset()
+            current = zset_of(key, value).score(member)
+            score = increment if current is None else current + increment
+            if math.isnan(score):
+                raise ScoreIsNaN()
+            add_member(value, member, score, exec_ctx.config)
+            return value
+
+        try:
+            exec_ctx.storage.upsert(key, _incr)
+        except ScoreIsNaN:
+            return ERR_NAN
+        except WrongType:
+            return shared.WRONGTYPE
+        except OutOfMemory:
+            return shared.OOM
+        return encoder.bulk_string(format_score(score))
+
+    def keys(self) -> list[bytes]:
+        return [self.args["key"]]
+
+    def __bytes__(self) -> bytes:
+        return encoder.command(
+            b"ZINCRBY", self.args["key"], self.args["increment"], self.args["member"]
+        )
@@ -0,0 +1,196 @@
+from app.commands.base import ExecutionResult, RedisCommand
+from app.commands.decorators import queueable, sharded
+from app.commands.args.parser import CommandArgParser
+from app.commands.handlers.lists.common import normalize_range, parse_int
+from app.commands.handlers.zsets.common import format_score, parse_score, zset_of
+from app.context import ConnectionContext, ExecutionContext
+from app.resp import encoder, shared
+from app.storage.in_memory.errors import WrongType
+from app.storage.structures import ZSet
+from app.storage.types import RedisValue
+
+ERR_SCORE_BOUND = encoder.error(b"ERR min or max is not a float")
+ERR_LEX_BOUND = encoder.error(b"ERR min or max not valid string range item")
+ERR_LIMIT = encoder.error(
+    b"ERR syntax error, LIMIT is only supported in combination with either "
+    b"BYSCORE or BYLEX"
+)
+ERR_LEX_WITHSCORES = encoder.error(
+    b"ERR syntax error, WITHSCORES not supported in combination with BYLEX"
+)
+
+
+class InvalidRange(Exception):
+    """Raised with the error reply for an invalid range or options."""
+
+    def __init__(self, reply: bytes):
+        super().__init__(reply)
+        self.reply = reply
+
+
+def parse_score_bound(arg: bytes) -> tuple[float, bool]:
+    """Parses a score bound (eg, 1.5, (1.5 or -inf), returns the score and
+    whether it is exclusive."""
+    exclusive = arg[:1] == b"("
+    try:
+        return parse_score(arg[1:] if exclusive else arg), exclusive
+    except ValueError:
+        raise InvalidRange(ERR_SCORE_BOUND)
+
+
+def parse_lex_bound(arg: bytes) -> tuple[bytes | None, bool]:
+    """Parses a lexicographical bound ([a, (a, - or +), returns the member
+    (None for - and +) and whether it is exclusive."""
+    if arg in (b"-", b"+"):
+        return None, False
+    if arg[:1] in (b"[", b"("):
+        return arg[1:], arg[:1] == b"("
+    raise InvalidRange(ERR_LEX_BOUND)
+
+
+class CommandZRange(RedisCommand):
+    """Returns the specified range of members of the sorted set stored at
+    key, ordered from the lowest to the highest score (members with equal
+    scores are ordered lexicographically).
+
+    By default, start and stop are ranks (both inclusive, negative ranks
+    count from the end). With BYSCORE they are scores (eg, 1.5, (1.5 to
+    exclude 1.5, -inf or +inf), and with BYLEX members (eg, [a, (a, - or +)
+    in sorted sets where all members have the same score.
+
+    Options:
+      - REV: the order is reversed (start and stop are then the highest and
+        lowest bound for BYSCORE and BYLEX).
+      - LIMIT: only count members are returned (all if count is negative),
+        after skipping offset members of the range (BYSCORE and BYLEX only).
+      - WITHSCORES: members are followed by their score in the reply.
+
+    Ranges are located in O(log n), so the cost depends on the number of
+    members returned rather than the size of the sorted set.
+
+    Syntax:
+      ZRANGE key start stop [BYSCORE | BYLEX] [REV] [LIMIT offset count]
+        [WITHSCORES]
+    """
+
+    args: dict
+
+    arg_parser = (
+        CommandArgParser()
+        .add_argument("key", 0)
+        .add_argument("start", 1)
+        .add_argument("stop", 2)
+        .add_argument("options", 3, required=False, capture=True, default=[])
+    )
+
+    def _parse_options(self) -> tuple[bytes | None, bool, tuple[int, int] | None, bool]:
+        """Returns the range type (BYSCORE, BYLEX or None for ranks), REV,
+        LIMIT offset and count, and WITHSCORES."""
+        by, rev, limit, withscores = None, False, None, False
+        options = self.args["options"]
+        i = 0
+        while i < len(options):
+            option = options[i].upper()
+            if option in (b"BYSCORE", b"BYLEX") and by in (None, option):
+                by = option
+            elif option == b"REV":
+                rev = True
+            elif option == b"WITHSCORES":
+                withscores = True
+            elif option == b"LIMIT" and i + 2 < len(options):
+                try:
+                    limit = (parse_int(options[i + 1]), parse_int(options[i + 2]))
+                except ValueError:
+                    raise InvalidRange(shared.ERR_NOT_INTEGER)
+                i += 2
+            else:
+                raise InvalidRange(shared.ERR_SYNTAX)
+            i += 1
+
+        if limit is not None and by is None:
+            raise InvalidRange(ERR_LIMIT)
+        if withscores and by == b"BYLEX":
+            raise InvalidRange(ERR_LEX_WITHSCORES)
+        return by, rev, limit, withscores
+
+    def _ranks(self, zset: ZSet, by: bytes | None, rev: bool) -> tuple[int, int]:
+        """Ranks (start included, stop excluded) of the range, in ascending
+        order."""
+        start, stop = self.args["start"], self.args["stop"]
+        if by is None:
+            try:
+                start, stop = parse_int(start), parse_int(stop)
+            except ValueError:
+                raise InvalidRange(shared.ERR_NOT_INTEGER)
+            first, last = normalize_range(start, stop, len(zset))
+            # ranks of a reversed range count from the end
+            return (len(zset) - last, len(zset) - first) if rev else (first, last)
+
+        low, high = (stop, start) if rev else (start, stop)
+        if by == b"BYSCORE":
+            return zset.score_range(*parse_score_bound(low), *parse_score_bound(high))
+
+        (low_member, low_exclusive), (high_member, high_exclusive) = (
+            parse_lex_bound(low),
+            parse_lex_bound(high),
+        )
+        if low == b"+" or high == b"-":
+            return 0, 0  # nothing is above + or below -
+        return zset.lex_range(low_member, low_exclusive, high_member, high_exclusive)
+
+    @queueable
+    @sharded
+    def exec(
+        self, exec_ctx: ExecutionContext, conn_ctx: ConnectionContext, **kwargs
+    ) -> ExecutionResult:
+        key = self.args["key"]
+        try:
+            by, rev, limit, withscores = self._parse_options()
+        except InvalidRange as e:
+            return e.reply
+
+        def _range(value: RedisValue | None) -> list[tuple[bytes, float]]:
+            zset = zset_of(key, value)
+            if zset is None:
+                return []
+            start, stop = self._ranks(zset, by, rev)
+            if limit is not None:
+                offset, count = limit
+                if offset < 0:
+                    return []
+                # offset and count apply in the order of the reply
+                if rev:
+                    stop = max(start, stop - offset)
+                    start = max(start, stop - count) if count >= 0 else start
+                else:
+                    start = min(stop, start + offset)
+                    stop = min(stop, start + count) if count >= 0 else stop
+            members = zset.range(start, stop)
+            if rev:
+                members.reverse()
+            return members
+
+        try:
+            members = exec_ctx.storage.view(key, _range)
+        except InvalidRange as e:
+            return e.reply
+        except WrongType:
+            return shared.WRONGTYPE
+
+        if not withscores:
+            return encoder.bulk_string_array([member for member, _ in members])
+        return encoder.bulk_string_array(
+            [element for m, s in members for element in (m, format_score(s))]
+        )
+
+    def keys(self) -> list[bytes]:
+        return [self.args["key"]]
+
+    def __bytes__(self) -> bytes:
+        return encoder.command(
+            b"ZRANGE",
+            self.args["key"],
+            self.args["start"],
+            self.args["stop"],
+            *self.args["options"],
+        )
@@ -0,0 +1,68 @@
+from app.commands.base import ExecutionResult, RedisCommand
+from app.commands.decorators import queueable, sharded
+from app.commands.args.parser import CommandArgParser
+from app.commands.handlers.zsets.common import format_score, zset_of
+from app.context import ConnectionContext, ExecutionContext
+from app.resp import encoder, shared
+from app.storage.in_memory.errors import WrongType
+from app.storage.types import RedisValue
+
+
+class CommandZRank(RedisCommand):
+    """Returns the rank of member in the sorted set stored at key, with the
+    scores ordered from low to high (nil if the member or the key does not
+    exist). With WITHSCORE, the score of the member is returned along with
+    its rank.
+
+    Syntax:
+      ZRANK key member [WITHSCORE]
+    """
+
+    args: dict
+
+    arg_parser = (
+        CommandArgParser()
+        .add_argument("key", 0)
+        .add_argument("member", 1)
+        .add_argument("withscore", 2, required=False)
+    )
+
+    @queueable
+    @sharded
+    def exec(
+        self, exec_ctx: ExecutionContext, conn_ctx: ConnectionContext, **kwargs
+    ) -> ExecutionResult:
+        key, member = self.args["key"], self.args["member"]
+        withscore = self.args["withscore"]
+        if withscore is not None and withscore.upper() != b"WITHSCORE":
+            return shared.ERR_SYNTAX
+
+        def _rank(value: RedisValue | None) -> tuple[int, float] | None:
+            zset = zset_of(key, value)
+            rank = zset.rank(member) if zset is not None else None
+            return None if rank is None else (rank, zset.score(member))
+
+        try:
+            ranked = exec_ctx.storage.view(key, _rank)
+        except WrongType:
+            return shared.WRONGTYPE
+
+        if withscore is None:
+            return shared.NIL if ranked is None else encoder.integer(ranked[0])
+        if ranked is None:
+            return shared.NULL_ARRAY
+        rank, score = ranked
+        buf = bytearray()
+        encoder.write_array_header(buf, 2)
+        buf += encoder.integer(rank)
+        encoder.write_bulk_string(buf, format_score(score))
+        return bytes(buf)
+
+    def keys(self) -> list[bytes]:
+        return [self.args["key"]]
+
+    def __bytes__(self) -> bytes:
+        args = [self.args["key"], self.args["member"]]
+        if self.args["withscore"] is not None:
+            args.append(self.args["withscore"])
+        return encoder.command(b"ZRANK", *args)
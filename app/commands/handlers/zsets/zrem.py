@@ -0,0 +1,57 @@
+from app.commands.base import ExecutionResult, RedisCommand
+from app.commands.decorators import broadcast, queueable, sharded
+from app.commands.args.parser import CommandArgParser
+from app.commands.handlers.zsets.common import zset_of
+from app.context import ConnectionContext, ExecutionContext
+from app.resp import encoder, shared
+from app.storage.in_memory.errors import WrongType
+from app.storage.types import RedisValue
+
+
+class CommandZRem(RedisCommand):
+    """Removes the specified members from the sorted set stored at key,
+    members that do not exist are ignored. Returns the number of members
+    removed.
+
+    Syntax:
+      ZREM key member [member ...]
+    """
+
+    args: dict
+    write: bool = True
+
+    arg_parser = (
+        CommandArgParser()
+        .add_argument("key", 0)
+        .add_argument("members", 1, capture=True)
+    )
+
+    @broadcast
+    @queueable
+    @sharded
+    def exec(
+        self, exec_ctx: ExecutionContext, conn_ctx: ConnectionContext, **kwargs
+    ) -> ExecutionResult:
+        key, members = self.args["key"], self.args["members"]
+        removed = 0
+
+        def _remove(value: RedisValue | None) -> RedisValue | None:
+            nonlocal removed
+            zset = zset_of(key, value)
+            if zset is None:
+                return None
+            removed = sum(zset.remove(member) for member in members)
+            return value if len(zset) else None  # empty sorted sets are removed
+
+        try:
+            # removing members never needs memory, so keys are not evicted
+            exec_ctx.storage.upsert(key, _remove, free_memory=False)
+        except WrongType:
+            return shared.WRONGTYPE
+        return encoder.integer(removed)
+
+    def keys(self) -> list[bytes]:
+        return [self.args["key"]]
+
+    def __bytes__(self) -> bytes:
+        return encoder.command(b"ZREM", self.args["key"], *self.args["members"])
@@ -0,0 +1,44 @@
+from app.commands.base import ExecutionResult, RedisCommand
+from app.commands.decorators import queueable, sharded
+from app.commands.args.parser import CommandArgParser
+from app.commands.handlers.zsets.common import format_score, zset_of
+from app.context import ConnectionContext, ExecutionContext
+from app.resp import encoder, shared
+from app.storage.in_memory.errors import WrongType
+from app.storage.types import RedisValue
+
+
+class CommandZScore(RedisCommand):
+    """Returns the score of member in the sorted set stored at key (nil if
+    the member or the key does not exist).
+
+    Syntax:
+      ZSCORE key member
+    """
+
+    args: dict
+
+    arg_parser = CommandArgParser().add_argument("key", 0).add_argument("member", 1)
+
+    @queueable
+    @sharded
+    def exec(
+        self, exec_ctx: ExecutionContext, conn_ctx: ConnectionContext, **kwargs
+    ) -> ExecutionResult:
+        key, member = self.args["key"], self.args["member"]
+
+        def _score(value: RedisValue | None) -> float | None:
+            zset = zset_of(key, value)
+            return zset.score(member) if zset is not None else None
+
+        try:
+            score = exec_ctx.storage.view(key, _score)
+        except WrongType:
+            return shared.WRONGTYPE
+        return encoder.bulk_string(None if score is None else format_score(score))
+
+    def keys(self) -> list[bytes]:
+        return [self.args["key"]]
+
+    def __bytes__(self) -> bytes:
+        return encoder.command(b"ZSCORE", self.args["key"], self.args["member"])
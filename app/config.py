@@ -10,3 +10,18 @@ class Config:
 
     dir: Optional[str] = None
     dbfilename: Optional[str] = None
+    maxmemory: int = 0  # max bytes used by keys before eviction, 0 means no limit
+    maxmemory_policy: str = "noeviction"
+    # hashes are converted from listpack to hashtable encoding beyond these
+    hash_max_listpack_entries: int = 128  # max number of fields
+    hash_max_listpack_value: int = 64  # max length of a field or value
+    # sets of integers are converted from intset to hashtable encoding beyond this
+    set_max_intset_entries: int = 512  # max number of members
+    # sorted sets are converted from listpack to skiplist encoding beyond these
+    zset_max_listpack_entries: int = 128  # max number of members
+    zset_max_listpack_value: int = 64  # max length of a member
+    # streams store entries in blocks of up to (the first reached of) these
+    stream_node_max_bytes: int = 4096  # max bytes of fields and values
+    stream_node_max_entries: int = 100  # max number of entries
+    # replicas with more bytes than this pending to be sent are disconnected
+    replica_output_buffer_limit: int = 256 * 1024 * 1024  # 0 means no limit
@@ -1,4 +1,9 @@
 from .client import accept_client_connections
+from .event_loop import serve_client_connections_async
 from .replica import connect_to_master_replica
 
-__all__ = ["accept_client_connections", "connect_to_master_replica"]
+__all__ = [
+    "accept_client_connections",
+    "serve_client_connections_async",
+    "connect_to_master_replica",
+]
@@ -7,12 +7,14 @@ from app.connection.common import handle_connection
 
 
 def accept_client_connections(
-    server_socket: socket.socket, execution_context: ExecutionContext
+    server_socket: socket.socket,
+    execution_context: ExecutionContext,
+    forwarded: bool = False,  # connections of other workers forwarding commands
 ):
     """Listens and accepts incoming client connections."""
     while True:
         client_socket, address = server_socket.accept()
-        conn_ctx = ConnectionContext(sock=client_socket)
+        conn_ctx = ConnectionContext(sock=client_socket, is_forwarded=forwarded)
         logging.info(f"client connected: {address}")
         threading.Thread(
             target=handle_connection, args=(conn_ctx, execution_context)
@@ -1,74 +1,142 @@
 import logging
-import socket
+import os
+from typing import Iterator
 
-from app.commands.base import ExecutionResult
+from app.commands.base import ExecutionResult, RedisCommand
 from app.commands.handlers.replconf import CommandReplConf
 from app.context import ConnectionContext, ExecutionContext
 from app.info.sections.info_replication import ReplicationRole
-from app.resp.types.array import bytes_to_resp
+from app.resp import encoder
+from app.resp.errors import ParsingError
+from app.resp.stream import RespStreamParser
+from app.resp.types.array import RespElement
 from app.resp.types.simple_error import SimpleError
-from app.utils.command_from_resp import command_from_resp_array
+from app.utils.command_from_resp import command_from_args, command_from_resp_array
 
+# max number of buffers that can be written with a single sendmsg call
+IOV_MAX = os.sysconf("SC_IOV_MAX") if hasattr(os, "sysconf") else 1024
 
-def _send_response(client_socket: socket.socket, response: ExecutionResult):
-    """Helper function to send response to a client socket."""
+
+def _send_response(conn_ctx: ConnectionContext, response: ExecutionResult):
+    """Helper function to queue a response to the connection output buffer,
+    which is flushed once the current batch of commands is processed."""
     # commands like psync return multiple responses
     if isinstance(response, list):
         for res in response:
             logging.info(f"sending response: {res}")
-            client_socket.sendall(res)
+            conn_ctx.output.append(res)
     else:
         if response:
             logging.info(f"sending response: {response}")
-            client_socket.sendall(response)
-
-
-def _process_and_update_buffer(
-    buf: bytes, conn_ctx: ConnectionContext, exec_ctx: ExecutionContext
-) -> bytes:
-    """Processes recv buffer and returns the updated buffer with remaining
-    unparsed elements (if any)."""
-    while buf:
-        try:
-            resp_element, pos = bytes_to_resp(buf)
-        except Exception as e:
-            # if parsing fails, it can mean we haven't read the entire buffer yet
-            conn_ctx.sock.sendall(bytes(SimpleError(str(e).encode())))
-            logging.error(str(e))
-            break  # return since buffer is still expecting some input
-
-        # update buffer
-        buf = buf[pos:]
-
-        # if the client sends error, simply log it and continue
-        if isinstance(resp_element, SimpleError):
-            logging.error(resp_element)
-            continue
-
-        # parse and execute command
-        try:
-            command = command_from_resp_array(resp_element)
-            response = command.exec(exec_ctx, conn_ctx)
-        except Exception as e:
-            conn_ctx.sock.sendall(bytes(SimpleError(str(e).encode())))
-            logging.error(str(e))
-            continue  # process next buffer stream
-
-        # replicas do not reply on command execution to master
-        # but do reply to master's replconf requests for GETACK
-        if not conn_ctx.is_connection_to_master or isinstance(command, CommandReplConf):
-            _send_response(conn_ctx.sock, response)
-
-        if (
-            exec_ctx.info.server_role() == ReplicationRole.SLAVE
-            and conn_ctx.is_connection_to_master
-        ):
-            # for slave, update offset with number of bytes received
-            # from master through the replication connection, pos is
-            # the amount of byte processed for this iteration
-            exec_ctx.info.add_to_offset(pos)
-
-    return buf
+            conn_ctx.output.append(response)
+
+
+def _flush_output(conn_ctx: ConnectionContext):
+    """Writes all queued responses to the socket, with a single sendmsg
+    syscall (per IOV_MAX buffers) that doesn't concatenate buffers."""
+    buffers = conn_ctx.output
+    while buffers:
+        sent = conn_ctx.sock.sendmsg(buffers[:IOV_MAX])
+
+        # drop buffers that were sent entirely, keep the unsent remainder
+        # of a partially sent buffer at the front
+        flushed = 0
+        while flushed < len(buffers) and sent >= len(buffers[flushed]):
+            sent -= len(buffers[flushed])
+            flushed += 1
+        del buffers[:flushed]
+        if sent:
+            buffers[0] = memoryview(buffers[0])[sent:]
+
+
+def _parse_command(resp_element: RespElement | list[bytes]) -> RedisCommand:
+    if isinstance(resp_element, list):
+        return command_from_args(resp_element)  # decoded by fast path
+    return command_from_resp_array(resp_element)
+
+
+def _parsed_commands(
+    parser: RespStreamParser, conn_ctx: ConnectionContext
+) -> Iterator[tuple[RedisCommand, memoryview]]:
+    """Yields the complete commands buffered in the parser, along with the
+    bytes they span in the input stream (their request, which is
+    propagated to replicas as is, see `RedisCommand.replication_payload`).
+
+    The view of a request is released once the next command is requested,
+    so the parser can receive more bytes. Commands that can't be parsed
+    are replied to with an error, incomplete input is kept in the parser
+    until more bytes are received.
+    """
+    try:
+        for resp_element, size in parser:
+            # if the client sends error, simply log it and continue
+            if isinstance(resp_element, SimpleError):
+                logging.error(resp_element)
+                continue
+
+            with parser.span(size) as request:
+                try:
+                    command = _parse_command(resp_element)
+                except Exception as e:
+                    _send_response(conn_ctx, encoder.error(str(e).encode()))
+                    logging.error(str(e))
+                    continue  # process next command
+                command.request = request
+                yield command, request
+
+    except (ParsingError, ValueError) as e:
+        # protocol error, the remaining input can't be parsed reliably
+        error = encoder.error(f"ERR Protocol error: {e}".encode())
+        _send_response(conn_ctx, error)
+        logging.error(str(e))
+        parser.reset()
+
+
+def _execute(
+    command: RedisCommand,
+    request: memoryview,
+    conn_ctx: ConnectionContext,
+    exec_ctx: ExecutionContext,
+):
+    """Executes a single parsed command and responds with the result."""
+    try:
+        response = command.exec(exec_ctx, conn_ctx)
+    except Exception as e:
+        _send_response(conn_ctx, encoder.error(str(e).encode()))
+        logging.error(str(e))
+        return  # process next command
+
+    # replicas do not reply on command execution to master
+    # but do reply to master's replconf requests for GETACK
+    if not conn_ctx.is_connection_to_master or isinstance(command, CommandReplConf):
+        _send_response(conn_ctx, response)
+
+    if (
+        exec_ctx.info.server_role() == ReplicationRole.SLAVE
+        and conn_ctx.is_connection_to_master
+    ):
+        # for slave, update offset with number of bytes received
+        # from master through the replication connection
+        exec_ctx.info.add_to_offset(len(request))
+
+
+def _process_buffered_input(
+    parser: RespStreamParser, conn_ctx: ConnectionContext, exec_ctx: ExecutionContext
+):
+    """Executes all complete commands buffered in the parser, incomplete
+    input is kept in the parser until more bytes are received.
+
+    Responses are flushed to the socket once all commands are processed,
+    and before a command that may block (so replies to the commands
+    pipelined before it are not held back while it blocks).
+    """
+    for command, request in _parsed_commands(parser, conn_ctx):
+        if command.blocks():
+            _flush_output(conn_ctx)
+        _execute(command, request, conn_ctx, exec_ctx)
+
+    # replies to all commands of the batch are written at once
+    _flush_output(conn_ctx)
 
 
 def handle_connection(
@@ -81,17 +149,19 @@ def handle_connection(
 
     buf: (optional) provide an initial buffer that contains unprocessed input
     """
+    parser = RespStreamParser(commands=True)
+
     # pre-process buffer if it isn't empty before we listen for reads
-    buf = buf or b""
-    buf = _process_and_update_buffer(buf, conn_ctx, exec_ctx)
+    if buf:
+        parser.feed(buf)
+        _process_buffered_input(parser, conn_ctx, exec_ctx)
 
     try:
         while True:
-            chunk = conn_ctx.sock.recv(512)
-            if not chunk:  # empty buffer means client has disconnected
-                break
-            buf += chunk  # add received chunk to buffer
-            buf = _process_and_update_buffer(buf, conn_ctx, exec_ctx)
+            # receive directly into the parser buffer
+            if not parser.recv_into(conn_ctx.sock):
+                break  # no bytes received means client has disconnected
+            _process_buffered_input(parser, conn_ctx, exec_ctx)
 
     except Exception as e:
         logging.exception(str(e))
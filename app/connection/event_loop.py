@@ -0,0 +1,213 @@
+"""This file contains an alternative to the thread-per-connection model in
+`client.py`, where all client connections are served from a single asyncio
+event loop.
+
+Parsing and command dispatch is shared with the threaded model (see
+`common.py`), only the way bytes are read from and written to the socket
+differs.
+
+Commands that block on keys (eg, BLPOP, see `RedisCommand.blocked_on`)
+wait on the event loop for a write to one of their keys, and are executed
+again once woken up, so a blocked client costs no thread. Other commands
+that may block (eg, WAIT, see `RedisCommand.blocks`) are executed on a
+thread of a pool instead of the event loop. Either way, the connection
+waits for them without holding the loop, so other connections (eg, the
+client pushing the element BLPOP waits for) are still served.
+"""
+
+import asyncio
+import logging
+import socket
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from app.commands.base import ExecutionResult, RedisCommand
+from app.connection.common import (
+    _execute,
+    _flush_output,
+    _parsed_commands,
+    _send_response,
+)
+from app.context import ConnectionContext, ExecutionContext
+from app.resp import encoder, shared
+from app.resp.stream import MAX_READ_SIZE, RespStreamParser
+from app.sharding.errors import ShardingError
+
+# max number of blocking commands executed at once on threads (commands
+# blocked on keys don't count), blocking commands beyond this wait for one
+# of them to return before they are executed
+MAX_BLOCKED_CLIENTS = 1024
+
+
+class StreamSocket:
+    """Socket-like adapter over an asyncio stream writer.
+
+    Command handlers (and the replica pool) only use `sendall`, `sendmsg`,
+    `getpeername` and `close` on a connection socket, so wrapping the
+    stream writer lets them run unmodified on top of asyncio streams.
+    Writes are buffered by the transport and never block the event loop,
+    calls from a thread other than the event loop thread are scheduled on
+    the event loop.
+    """
+
+    def __init__(self, writer: asyncio.StreamWriter):
+        self._writer = writer
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+
+    def _call_in_loop(self, fn, *args):
+        if threading.get_ident() == self._loop_thread_id:
+            fn(*args)
+        else:
+            self._loop.call_soon_threadsafe(fn, *args)
+
+    def getpeername(self):
+        return self._writer.get_extra_info("peername")
+
+    def sendall(self, data: bytes):
+        if threading.get_ident() == self._loop_thread_id:
+            self._writer.write(data)
+            return
+
+        # the calling thread (eg, the writer thread of a replica, see
+        # `ReplicaOutput`) waits for the transport buffer to drain, like a
+        # blocking socket send, so writes it couldn't send yet are held in
+        # (and counted by) its own buffer
+        asyncio.run_coroutine_threadsafe(
+            self._write_and_drain(data), self._loop
+        ).result()
+
+    async def _write_and_drain(self, data: bytes):
+        self._writer.write(data)
+        await self._writer.drain()
+
+    def sendmsg(self, buffers: list) -> int:
+        self._call_in_loop(self._writer.writelines, list(buffers))
+        return sum(len(buf) for buf in buffers)
+
+    def close(self):
+        self._call_in_loop(self._writer.close)
+
+
+def _blocked_on_local_keys(
+    command: RedisCommand, exec_ctx: ExecutionContext
+) -> tuple[list[bytes], float | None] | None:
+    """Keys and timeout the command blocks on (see `RedisCommand.blocked_on`),
+    None if it blocks on something else or its keys are owned by another
+    worker (the command is forwarded to the owner, and waits for its reply
+    on a thread)."""
+    blocked_on = command.blocked_on()
+    router = exec_ctx.shard_router
+    if blocked_on is None or router is None:
+        return blocked_on
+    try:
+        owner = router.route(blocked_on[0])
+    except ShardingError:
+        return None
+    return blocked_on if owner == router.worker_id else None
+
+
+async def _execute_blocked(
+    command: RedisCommand,
+    keys: list[bytes],
+    timeout: float | None,
+    conn_ctx: ConnectionContext,
+    exec_ctx: ExecutionContext,
+):
+    """Executes a command blocked on keys without blocking, again each time
+    one of keys is written, until it replies with something other than a
+    null array or timeout seconds have passed."""
+
+    def _attempt() -> ExecutionResult:
+        response = command.exec(exec_ctx, conn_ctx, blocking=False)
+        return None if response is shared.NULL_ARRAY else response
+
+    try:
+        response = _attempt()
+        if response is None:
+            response = await exec_ctx.blocked_clients.wait_for_async(
+                keys, timeout, _attempt
+            )
+    except Exception as e:
+        _send_response(conn_ctx, encoder.error(str(e).encode()))
+        logging.error(str(e))
+        return
+    _send_response(conn_ctx, shared.NULL_ARRAY if response is None else response)
+
+
+async def _process_buffered_input(
+    parser: RespStreamParser,
+    conn_ctx: ConnectionContext,
+    exec_ctx: ExecutionContext,
+    executor: ThreadPoolExecutor,
+):
+    """Coroutine counterpart of `common._process_buffered_input`, which
+    waits for blocking commands to be woken up or executed by the
+    executor."""
+    loop = asyncio.get_running_loop()
+    for command, request in _parsed_commands(parser, conn_ctx):
+        if command.blocks():
+            _flush_output(conn_ctx)  # replies to commands pipelined before it
+            blocked_on = _blocked_on_local_keys(command, exec_ctx)
+            if blocked_on is not None:
+                keys, timeout = blocked_on
+                await _execute_blocked(command, keys, timeout, conn_ctx, exec_ctx)
+            else:
+                await loop.run_in_executor(
+                    executor, _execute, command, request, conn_ctx, exec_ctx
+                )
+        else:
+            _execute(command, request, conn_ctx, exec_ctx)
+
+    # replies to all commands of the batch are written at once
+    _flush_output(conn_ctx)
+
+
+async def _handle_stream(
+    reader: asyncio.StreamReader,
+    writer: asyncio.StreamWriter,
+    exec_ctx: ExecutionContext,
+    executor: ThreadPoolExecutor,
+):
+    """Coroutine counterpart of `handle_connection` for asyncio streams."""
+    conn_ctx = ConnectionContext(sock=StreamSocket(writer))  # type: ignore[arg-type]
+    logging.info(f"client connected: {conn_ctx.uid}")
+
+    parser = RespStreamParser(commands=True)
+    try:
+        while True:
+            chunk = await reader.read(MAX_READ_SIZE)
+            if not chunk:  # empty buffer means client has disconnected
+                break
+            parser.feed(chunk)
+            await _process_buffered_input(parser, conn_ctx, exec_ctx, executor)
+            await writer.drain()  # apply backpressure on slow readers
+
+    except ConnectionError as e:
+        logging.info(f"client disconnected: {conn_ctx.uid} - {e}")
+
+    except Exception as e:
+        logging.exception(str(e))
+
+    finally:
+        writer.close()
+
+
+async def _serve(server_socket: socket.socket, exec_ctx: ExecutionContext):
+    executor = ThreadPoolExecutor(
+        max_workers=MAX_BLOCKED_CLIENTS, thread_name_prefix="blocking"
+    )
+    server = await asyncio.start_server(
+        lambda reader, writer: _handle_stream(reader, writer, exec_ctx, executor),
+        sock=server_socket,
+    )
+    async with server:
+        await server.serve_forever()
+
+
+def serve_client_connections_async(
+    server_socket: socket.socket, execution_context: ExecutionContext
+):
+    """Listens and serves incoming client connections from an asyncio event
+    loop (blocks the calling thread)."""
+    asyncio.run(_serve(server_socket, execution_context))
@@ -1,10 +1,12 @@
 import socket
 from dataclasses import dataclass, field
 
+from app.blocking import BlockedClients
 from app.config import Config
 from app.info import Info
 from app.replication.pool import ReplicaConnectionPool
 from app.queue import TransactionQueue
+from app.sharding import ShardRouter
 from app.storage.in_memory.base import RedisStorage
 from app.storage.rdb.manager import RDBManager
 
@@ -19,6 +21,9 @@ class ExecutionContext:
     info: Info
     rdb: RDBManager
     replica_pool: ReplicaConnectionPool
+    shard_router: ShardRouter | None = None  # set when running multiple workers
+    # clients blocked on keys by blocking commands (eg, BLPOP)
+    blocked_clients: BlockedClients = field(default_factory=BlockedClients)
 
 
 @dataclass
@@ -29,7 +34,9 @@ class ConnectionContext:
 
     sock: socket.socket
     is_connection_to_master: bool = False  # denotes if this is a connection to master (from a replica's perspective)
+    is_forwarded: bool = False  # commands forwarded by another worker (see ShardRouter)
     tx_queue: TransactionQueue = field(default_factory=TransactionQueue)
+    output: list = field(default_factory=list)  # responses pending to be flushed
     uid: str = field(init=False)
 
     def __post_init__(self):
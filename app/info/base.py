@@ -2,8 +2,12 @@ import inspect
 import logging
 import threading
 
+from app.info.sections.info_memory import InfoMemory
 from app.info.sections.info_replication import InfoReplication, ReplicationRole
+from app.info.sections.info_stats import InfoStats
+from app.info.sections.info_workers import InfoWorkers
 from app.info.types import InfoSection
+from app.storage.in_memory.memory import MemoryStats
 
 
 class Info:
@@ -29,10 +33,18 @@ class Info:
 
     _name_to_section_map: dict[str, InfoSection]
 
-    def __init__(self, info_replication: InfoReplication | None = None) -> None:
+    def __init__(
+        self,
+        info_replication: InfoReplication | None = None,
+        info_workers: InfoWorkers | None = None,
+        info_memory: InfoMemory | None = None,
+    ) -> None:
         # required when we need to update the info
         self._lock = threading.RLock()
         self.replication = info_replication or InfoReplication()
+        self.workers = info_workers or InfoWorkers()
+        self.stats = InfoStats()
+        self.memory = info_memory or InfoMemory()
         self._name_to_section_map = {
             name: attr
             for name, attr in inspect.getmembers(self)
@@ -90,3 +102,27 @@ class Info:
 
             self.replication.master_repl_offset = updated_offset
             return updated_offset
+
+    def update_expire_stats(self, expired_keys: int, stale_perc: float):
+        """Update statistics reported by the active expiry cycle (stats)."""
+        with self._lock:
+            self.stats.expired_keys = expired_keys
+            self.stats.expired_stale_perc = round(stale_perc, 2)
+
+    def update_memory_stats(self, stats: MemoryStats):
+        """Update memory usage and eviction statistics (memory, stats)."""
+        with self._lock:
+            self.memory.used_memory = stats.used_memory
+            self.memory.used_memory_peak = stats.used_memory_peak
+            self.memory.used_memory_dataset = stats.used_memory_dataset
+            self.memory.lazyfree_pending_objects = stats.lazyfree_pending_objects
+            self.stats.evicted_keys = stats.evicted_keys
+
+    def count_keyed_command(self, forwarded: bool):
+        """Count a keyed command as executed locally or forwarded to another
+        worker (workers)."""
+        with self._lock:
+            if forwarded:
+                self.workers.forwarded_commands += 1
+            else:
+                self.workers.local_commands += 1
@@ -1,3 +1,6 @@
+from .info_memory import InfoMemory
 from .info_replication import InfoReplication
+from .info_stats import InfoStats
+from .info_workers import InfoWorkers
 
-__all__ = ["InfoReplication"]
+__all__ = ["InfoMemory", "InfoReplication", "InfoStats", "InfoWorkers"]
@@ -0,0 +1,18 @@
+from dataclasses import dataclass
+
+from app.info.types import InfoSection
+
+
+@dataclass
+class InfoMemory(InfoSection):
+    """
+    Memory consumption related information.
+    """
+
+    title: str = "# Memory"
+    used_memory: int = 0  # estimated bytes used by keys and values
+    used_memory_peak: int = 0  # peak of used_memory
+    used_memory_dataset: int = 0  # bytes of key and value contents
+    lazyfree_pending_objects: int = 0  # objects waiting to be freed lazily
+    maxmemory: int = 0  # max bytes used by keys before eviction (0 for no limit)
+    maxmemory_policy: str = "noeviction"  # how keys are selected for eviction
@@ -0,0 +1,15 @@
+from dataclasses import dataclass
+
+from app.info.types import InfoSection
+
+
+@dataclass
+class InfoStats(InfoSection):
+    """
+    General statistics.
+    """
+
+    title: str = "# Stats"
+    expired_keys: int = 0  # keys removed because they expired
+    expired_stale_perc: float = 0.0  # share of keys with expiry found expired
+    evicted_keys: int = 0  # keys removed because maxmemory was reached
@@ -0,0 +1,17 @@
+from dataclasses import dataclass
+
+from app.info.types import InfoSection
+
+
+@dataclass
+class InfoWorkers(InfoSection):
+    """
+    Worker process information (when the keyspace is sharded between workers).
+    """
+
+    title: str = "# Workers"
+    worker_id: int = 0  # id of the worker serving this connection
+    workers: int = 1  # total number of worker processes
+    worker_pid: int = 0  # process id of the worker
+    local_commands: int = 0  # keyed commands executed by this worker
+    forwarded_commands: int = 0  # keyed commands forwarded to other workers
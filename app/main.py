@@ -1,5 +1,7 @@
+import argparse
 import logging
 import os
+import signal
 import socket
 import sys
 import threading
@@ -9,24 +11,50 @@ from app.config import Config
 from app.context import ExecutionContext
 from app.info import Info
 from app.info.sections.info_replication import InfoReplication, ReplicationRole
+from app.info.sections.info_memory import InfoMemory
+from app.info.sections.info_workers import InfoWorkers
 from app.logger import *  # noqa: F403
 from app.replication.pool import ReplicaConnectionPool
-from app.storage.in_memory import ThreadSafeStorage as Storage
+from app.sharding import ShardRouter
+from app.storage.in_memory import StripedLockStorage, ThreadSafeStorage
+from app.storage.in_memory.eviction import MaxMemoryPolicy
+from app.storage.in_memory.expire import run_active_expire
 from app.storage.rdb import RDBManager
-from app.connection import accept_client_connections, connect_to_master_replica
+from app.connection import (
+    accept_client_connections,
+    connect_to_master_replica,
+    serve_client_connections_async,
+)
 
 
-def main():
-    # parse arguments and start server
-    args = get_arg_parser().parse_args(sys.argv[1:])
+def run_server(args: argparse.Namespace, shard_router: ShardRouter | None = None):
+    """Starts the server, connections are served from background threads."""
     server_socket = socket.create_server(("localhost", args.port), reuse_port=True)
     logging.info(f"started server at port: {args.port}")
 
     # initialize config
-    config = Config(dir=args.dir, dbfilename=args.dbfilename)
+    config = Config(
+        dir=args.dir,
+        dbfilename=args.dbfilename,
+        maxmemory=args.maxmemory,
+        maxmemory_policy=args.maxmemory_policy,
+        hash_max_listpack_entries=args.hash_max_listpack_entries,
+        hash_max_listpack_value=args.hash_max_listpack_value,
+        set_max_intset_entries=args.set_max_intset_entries,
+        zset_max_listpack_entries=args.zset_max_listpack_entries,
+        zset_max_listpack_value=args.zset_max_listpack_value,
+        stream_node_max_bytes=args.stream_node_max_bytes,
+        stream_node_max_entries=args.stream_node_max_entries,
+        replica_output_buffer_limit=args.replica_output_buffer_limit,
+    )
 
     # initialize storage
-    storage = Storage()
+    storage_cls = StripedLockStorage if args.storage == "striped" else ThreadSafeStorage
+    storage = storage_cls(
+        maxmemory=config.maxmemory,
+        maxmemory_policy=MaxMemoryPolicy(config.maxmemory_policy),
+        prefix_index=args.prefix_index,
+    )
     rdb = RDBManager()
     if config.dir and config.dbfilename:
         path = os.path.join(config.dir, config.dbfilename)
@@ -36,7 +64,19 @@ def main():
     info_replication = InfoReplication()
     if replicaof := args.replicaof:
         info_replication.role = ReplicationRole.SLAVE
-    info = Info(info_replication)
+    info_workers = InfoWorkers(worker_pid=os.getpid())
+    if shard_router:
+        info_workers.worker_id = shard_router.worker_id
+        info_workers.workers = shard_router.num_workers
+    info_memory = InfoMemory(
+        maxmemory=config.maxmemory, maxmemory_policy=config.maxmemory_policy
+    )
+    info = Info(info_replication, info_workers, info_memory)
+
+    # reclaim expired keys that are never accessed again
+    threading.Thread(
+        target=run_active_expire, args=(storage, info), daemon=True
+    ).start()
 
     # initialize execution context
     exec_context = ExecutionContext(
@@ -44,12 +84,30 @@ def main():
         config=config,
         info=info,
         rdb=rdb,
-        replica_pool=ReplicaConnectionPool(),
+        replica_pool=ReplicaConnectionPool(config.replica_output_buffer_limit),
+        shard_router=shard_router,
     )
 
+    if shard_router:
+        # drop restored keys owned by other workers
+        for key in storage.keys():
+            if not shard_router.owns(key):
+                storage.remove(key)
+
+        # listen for commands forwarded by other workers
+        threading.Thread(
+            target=accept_client_connections,
+            args=(shard_router.listen(), exec_context, True),
+        ).start()
+
     # start accepting client connections
+    if args.io_model == "asyncio":
+        serve_client_connections = serve_client_connections_async
+    else:
+        serve_client_connections = accept_client_connections
+
     threading.Thread(
-        target=accept_client_connections, args=(server_socket, exec_context)
+        target=serve_client_connections, args=(server_socket, exec_context)
     ).start()
 
     # connect to master replica
@@ -62,5 +120,50 @@ def main():
         )
 
 
+def run_workers(args: argparse.Namespace):
+    """Forks worker processes that share the server port (SO_REUSEPORT), each
+    owning a partition of the keyspace.
+
+    The parent process only supervises the workers, it terminates all
+    workers once it is signalled or any worker exits.
+    """
+    pids = []
+    for worker_id in range(args.workers):
+        pid = os.fork()
+        if pid == 0:
+            # worker keeps serving from background threads after returning
+            run_server(args, ShardRouter(worker_id, args.workers, args.port))
+            return
+        pids.append(pid)
+
+    def terminate_workers(*_):
+        for pid in pids:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    try:
+        os.wait()
+    finally:
+        terminate_workers()
+
+
+def main():
+    # parse arguments and start server
+    parser = get_arg_parser()
+    args = parser.parse_args(sys.argv[1:])
+    if args.workers < 1:
+        parser.error("--workers must be a positive integer")
+
+    if args.workers > 1:
+        if args.replicaof:
+            parser.error("--workers can not be used with --replicaof")
+        run_workers(args)
+    else:
+        run_server(args)
+
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,113 @@
+"""This file contains the outbound buffer of a replica connection
+(`ReplicaOutput`), which is drained by a writer thread of its own.
+
+Writes propagated to a replica (and GETACK requests) are appended to the
+buffer without blocking the command that made them, and sent in the order
+they were appended. The writer thread sends everything buffered while it
+was busy at once, so a replica that falls behind is caught up with few
+large sends, and a slow replica never stalls the others.
+
+A replica whose buffer grows beyond the output buffer limit (see
+`replica-output-buffer-limit` in the config) is too far behind to catch up
+and is disconnected, like the hard limit of `client-output-buffer-limit
+replica` in Redis.
+"""
+
+import logging
+import socket
+import threading
+from typing import Callable
+
+
+class ReplicaOutput:
+    """Buffers sent to a replica socket by a writer thread, in order.
+
+    The writer thread is stopped once the output is closed: by the pool, on
+    an overflow (see `write`) or on a send error, which calls on_error.
+    """
+
+    def __init__(
+        self,
+        uid: str,
+        sock: socket.socket,
+        limit: int,  # max bytes pending to be sent, 0 means no limit
+        on_error: Callable[[], None],
+        # sent before anything written, not counted in the limit (eg, the
+        # reply to PSYNC)
+        preamble: list[bytes] | None = None,
+    ):
+        self.uid = uid
+        self._sock = sock
+        self._limit = limit
+        self._on_error = on_error
+        self._preamble = preamble or []
+        self._buffers: list[bytes] = []
+        self._pending = 0  # bytes buffered or being sent (counted in the limit)
+        self._closed = False
+        self._cond = threading.Condition()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def __len__(self) -> int:
+        """Number of bytes pending to be sent."""
+        return self._pending
+
+    def write(self, data: bytes) -> bool:
+        """Appends data to the buffer. Returns False if the output is closed,
+        or once the replica falls behind by more than the limit (which
+        closes the output)."""
+        with self._cond:
+            if self._closed:
+                return False
+            self._buffers.append(data)
+            self._pending += len(data)
+            if self._limit and self._pending > self._limit:
+                logging.warning(
+                    f"replica {self.uid} is {self._pending} bytes behind, "
+                    "over the output buffer limit"
+                )
+                self._close()
+                return False
+            self._cond.notify()
+            return True
+
+    def close(self):
+        """Stops the writer thread, buffers not sent yet are dropped."""
+        with self._cond:
+            self._close()
+
+    def _close(self):
+        self._closed = True
+        self._buffers.clear()
+        self._cond.notify()
+
+    def _send(self, buffers: list[bytes]) -> bool:
+        # everything buffered since the last send is sent at once
+        data = buffers[0] if len(buffers) == 1 else b"".join(buffers)
+        try:
+            self._sock.sendall(data)
+            return True
+        except OSError as e:
+            logging.error(f"Failed to send to {self.uid}: {e}")
+            self.close()
+            self._on_error()
+            return False
+
+    def _run(self):
+        if self._preamble and not self._send(self._preamble):
+            return
+        self._preamble = []
+
+        while True:
+            with self._cond:
+                while not self._buffers and not self._closed:
+                    self._cond.wait()
+                if self._closed:
+                    return
+                buffers, self._buffers = self._buffers, []
+
+            sent = self._send(buffers)
+            with self._cond:
+                self._pending -= sum(map(len, buffers))
+            if not sent:
+                return
@@ -2,7 +2,15 @@ import logging
 import socket
 import threading
 from dataclasses import dataclass
-from time import time
+from time import monotonic
+
+from app.replication.output import ReplicaOutput
+
+GET_ACK = b"*3\r\n$8\r\nREPLCONF\r\n$6\r\nGETACK\r\n$1\r\n*\r\n"
+# replicas that answered a GETACK with an offset still behind the one waited
+# for are asked again after this many seconds (eg, when the ack answered a
+# GETACK sent for an earlier WAIT)
+ACK_RETRY_INTERVAL = 0.2
 
 
 @dataclass
@@ -11,8 +19,11 @@ class ReplicaConnection:
 
     uid: str  # unique id for the connection
     sock: socket.socket  # actual socket used for connection
+    output: ReplicaOutput  # buffer of writes pending to be sent to the replica
     last_ack_offset: int = 0  # track the last acknowledged offset (for replica)
-    awaiting_ack_offset: int | None = None  # time since waiting for an ack of offset
+    # master offset the pending GETACK was sent at (None if no GETACK is
+    # pending), an ack of at least this offset answers it
+    awaiting_ack_offset: int | None = None
 
 
 class ReplicaConnectionPool:
@@ -22,54 +33,110 @@ class ReplicaConnectionPool:
     # so that pool list can be easily removed/updated
     _pool: dict[str, ReplicaConnection]
 
-    def __init__(self) -> None:
+    def __init__(self, output_buffer_limit: int = 0) -> None:
         self._pool = {}
+        # replicas with more bytes than this pending to be sent are
+        # disconnected, 0 means no limit
+        self._output_buffer_limit = output_buffer_limit
         self._lock = threading.RLock()  # use re-entrant lock
-
-    def add(self, uid: str, sock: socket.socket):
+        # notified when a replica acknowledges an offset a WAIT is waiting for
+        self._acked = threading.Condition(self._lock)
+        # offsets WAIT commands are waiting for (with the number of waiters of
+        # each), acks below all of them wake no one up
+        self._waiting: dict[int, int] = {}
+
+    def add(self, uid: str, sock: socket.socket, preamble: list[bytes] | None = None):
+        """Adds a replica connection, preamble is sent to the replica before
+        any write propagated to it (eg, the reply to PSYNC)."""
         with self._lock:
             logging.info(f"adding replica connection {uid} to pool")
-            self._pool[uid] = ReplicaConnection(uid, sock)
+            output = ReplicaOutput(
+                uid,
+                sock,
+                self._output_buffer_limit,
+                on_error=lambda: self.remove(uid),
+                preamble=preamble,
+            )
+            self._pool[uid] = ReplicaConnection(uid, sock, output)
 
     def remove(self, uid: str):
         with self._lock:
             conn = self._pool.pop(uid, None)
             if conn:
                 logging.warning(f"replica connection {uid} removed from pool")
+                conn.output.close()
                 conn.sock.close()
 
     def request_offset_ack_from_connections(self, min_offset: int):
         """
         Request acknowledgement of latest offset from each replica.
-        """
-        GET_ACK = b"*3\r\n$8\r\nREPLCONF\r\n$6\r\nGETACK\r\n$1\r\n*\r\n"
-        ACK_WAIT_FOR_MS = 200
 
+        Replicas that already acknowledged min_offset, or that haven't
+        answered a GETACK covering it yet, are not asked again.
+        """
         with self._lock:
+            lagging = []
             for conn in self._pool.values():
                 if conn.last_ack_offset >= min_offset:
                     continue
 
-                # if connection has been waiting for offset acknowledgement for
-                # less than waiting time, skip sending another ack request for now
                 if (
-                    conn.awaiting_ack_offset
-                    and int(time() * 1000) - conn.awaiting_ack_offset < ACK_WAIT_FOR_MS
+                    conn.awaiting_ack_offset is not None
+                    and conn.awaiting_ack_offset >= min_offset
                 ):
                     continue
 
-                try:
-                    conn.sock.sendall(GET_ACK)
-                    conn.awaiting_ack_offset = int(time() * 1000)
-                except Exception as e:
-                    logging.warning(f"GETACK failed for {conn.uid}: {e}")
+                if conn.output.write(GET_ACK):
+                    conn.awaiting_ack_offset = min_offset
+                else:
+                    logging.warning(f"GETACK failed for {conn.uid}")
+                    lagging.append(conn.uid)
+
+            for uid in lagging:
+                self.remove(uid)
 
     def update_last_ack_offset(self, uid: str, offset: int):
-        """Updates the last acknowledged offset received from a replica."""
+        """Updates the last acknowledged offset received from a replica, and
+        wakes up the WAIT commands waiting for an offset it reaches."""
         with self._lock:
-            if uid in self._pool:
-                self._pool[uid].last_ack_offset = offset
-                self._pool[uid].awaiting_ack_offset = None
+            conn = self._pool.get(uid)
+            if conn is None:
+                return
+            conn.last_ack_offset = offset
+            conn.awaiting_ack_offset = None  # the replica answered
+            if any(offset >= waiting for waiting in self._waiting):
+                self._acked.notify_all()
+
+    def wait_for_acks(self, min_offset: int, required: int, timeout: float) -> int:
+        """Waits until at least required replicas acknowledged min_offset or
+        timeout seconds have passed, returns the number of replicas that
+        acknowledged it.
+
+        A GETACK is sent to the replicas behind min_offset once, then
+        again every `ACK_RETRY_INTERVAL` seconds to replicas that answered
+        with an offset still behind it. The caller sleeps on a condition
+        in between, woken up by acks (see `update_last_ack_offset`).
+        """
+        deadline = monotonic() + timeout
+        with self._lock:
+            acked = self.count_acked_connections(min_offset)
+            if acked >= required or timeout <= 0:
+                return acked
+
+            self._waiting[min_offset] = self._waiting.get(min_offset, 0) + 1
+            try:
+                while acked < required:
+                    remaining = deadline - monotonic()
+                    if remaining <= 0:
+                        break
+                    self.request_offset_ack_from_connections(min_offset)
+                    self._acked.wait(min(remaining, ACK_RETRY_INTERVAL))
+                    acked = self.count_acked_connections(min_offset)
+            finally:
+                waiters = self._waiting.pop(min_offset) - 1
+                if waiters:
+                    self._waiting[min_offset] = waiters
+            return acked
 
     def count_acked_connections(self, min_offset: int) -> int:
         """This returns the number of replicas that have successfully
@@ -79,21 +146,25 @@ class ReplicaConnectionPool:
                 1 for conn in self._pool.values() if conn.last_ack_offset >= min_offset
             )
 
-    def broadcast_to_all_connections(self, data: bytes) -> int:
-        """Forwards data to all connections.
+    def broadcast_to_all_connections(self, data: bytes | memoryview) -> int:
+        """Forwards data to all connections, by appending it to their
+        outbound buffers (see `ReplicaOutput`) without waiting for it to be
+        sent. Replicas too far behind (over the output buffer limit) are
+        disconnected.
+
+        A view (eg, of the request of a command) is copied once, and only if
+        there are replicas to send it to.
 
-        Returns the number of successful replicas the message was
-        forwarded to.
+        Returns the number of replicas the message was forwarded to.
         """
         with self._lock:
-            success = 0
-            for uid, conn in list(self._pool.items()):
-                try:
-                    conn.sock.sendall(data)
-                    success += 1
-                except Exception as e:
-                    logging.error(f"Failed to send to {uid}: {e}")
-                    self._pool[conn.uid].sock.close()
-                    del self._pool[conn.uid]
-
-            return success
+            if not self._pool:
+                return 0
+            if isinstance(data, memoryview):
+                data = bytes(data)
+            lagging = [
+                uid for uid, conn in self._pool.items() if not conn.output.write(data)
+            ]
+            for uid in lagging:
+                self.remove(uid)
+            return len(self._pool)
@@ -0,0 +1,89 @@
+"""This file contains functions to serialize RESP replies by appending
+directly into a caller supplied bytearray, without creating intermediate
+RESP type instances.
+
+The `write_*` functions append to the buffer in place, so large replies
+(eg, KEYS) are built in a single growable buffer. Functions without the
+prefix return the serialized bytes of a single element and make use of
+shared replies (see `shared.py`) where possible.
+"""
+
+from typing import Iterable
+
+from app.resp.shared import INTEGERS, NIL, SHARED_INTEGERS
+
+
+def write_simple_string(buf: bytearray, value: bytes):
+    buf += b"+"
+    buf += value
+    buf += b"\r\n"
+
+
+def write_error(buf: bytearray, message: bytes):
+    buf += b"-"
+    buf += message
+    buf += b"\r\n"
+
+
+def write_integer(buf: bytearray, value: int):
+    if 0 <= value < SHARED_INTEGERS:
+        buf += INTEGERS[value]
+    else:
+        buf += b":%d\r\n" % value
+
+
+def write_bulk_string(buf: bytearray, value: bytes | None):
+    """Appends a bulk string, None is written as the null bulk string."""
+    if value is None:
+        buf += NIL
+        return
+    buf += b"$%d\r\n" % len(value)
+    buf += value
+    buf += b"\r\n"
+
+
+def write_array_header(buf: bytearray, length: int):
+    """Appends the header of an array, elements are written by the caller."""
+    buf += b"*%d\r\n" % length
+
+
+def write_bulk_string_array(buf: bytearray, values: Iterable[bytes]):
+    """Appends an array of bulk strings."""
+    values = values if isinstance(values, (list, tuple)) else list(values)
+    buf += b"*%d\r\n" % len(values)
+    for value in values:
+        buf += b"$%d\r\n" % len(value)
+        buf += value
+        buf += b"\r\n"
+
+
+def simple_string(value: bytes) -> bytes:
+    return b"+" + value + b"\r\n"
+
+
+def error(message: bytes) -> bytes:
+    return b"-" + message + b"\r\n"
+
+
+def integer(value: int) -> bytes:
+    if 0 <= value < SHARED_INTEGERS:
+        return INTEGERS[value]
+    return b":%d\r\n" % value
+
+
+def bulk_string(value: bytes | None) -> bytes:
+    if value is None:
+        return NIL
+    return b"$%d\r\n%b\r\n" % (len(value), value)
+
+
+def bulk_string_array(values: Iterable[bytes]) -> bytes:
+    buf = bytearray()
+    write_bulk_string_array(buf, values)
+    return bytes(buf)
+
+
+def command(*args: bytes) -> bytes:
+    """Serializes a command (array of bulk strings) to be sent to another
+    server."""
+    return bulk_string_array(args)
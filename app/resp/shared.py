@@ -0,0 +1,22 @@
+"""Precomputed serialized replies that are shared by all commands (similar
+to shared objects in Redis), so frequent replies are never built on the
+request path."""
+
+OK = b"+OK\r\n"
+QUEUED = b"+QUEUED\r\n"
+PONG = b"+PONG\r\n"
+NIL = b"$-1\r\n"  # null bulk string
+NULL_ARRAY = b"*-1\r\n"
+EMPTY_ARRAY = b"*0\r\n"
+
+# common errors
+ERR_SYNTAX = b"-ERR syntax error\r\n"
+ERR_NOT_INTEGER = b"-ERR value is not an integer or out of range\r\n"
+ERR_EXEC_WITHOUT_MULTI = b"-ERR EXEC without MULTI\r\n"
+ERR_DISCARD_WITHOUT_MULTI = b"-ERR DISCARD without MULTI\r\n"
+OOM = b"-OOM command not allowed when used memory > 'maxmemory'.\r\n"
+WRONGTYPE = b"-WRONGTYPE Operation against a key holding the wrong kind of value\r\n"
+
+# integers replies from 0 to SHARED_INTEGERS - 1
+SHARED_INTEGERS = 10000
+INTEGERS = tuple(b":%d\r\n" % i for i in range(SHARED_INTEGERS))
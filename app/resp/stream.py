@@ -0,0 +1,138 @@
+"""Incremental parser for a stream of RESP elements (eg, reads from a client
+connection)."""
+
+import socket
+from typing import Iterator
+
+from app.resp.types.array import (
+    PartialArray,
+    PartialCommand,
+    RespElement,
+    parse_at,
+    parse_command_at,
+)
+
+MIN_READ_SIZE = 16 * 1024  # read size for idle connections
+MAX_READ_SIZE = 1024 * 1024  # read size for connections under load
+COMPACT_THRESHOLD = 64 * 1024  # parsed bytes tolerated before compacting
+
+
+class RespStreamParser:
+    """Stateful RESP parser for a single connection.
+
+    Bytes are received (or fed) into a growable input buffer owned by the
+    parser, and completely parsed elements can be iterated over. An
+    incomplete element is never parsed twice, the parser keeps the offset
+    where it stopped along with the partially parsed arrays and resumes
+    from there once more bytes are received.
+
+    The buffer is filled in place with `recv_into`, parsed bytes at the
+    start of the buffer are only reclaimed once they pass a threshold, so
+    pipelined input is not copied around on every read.
+
+    With `commands` set, arrays of bulk strings (ie, commands sent by
+    clients) are decoded directly to lists of byte strings (even when
+    received in parts), other frames are still parsed to RESP types.
+    """
+
+    def __init__(self, commands: bool = False):
+        self._commands = commands
+        self._buf = bytearray(MIN_READ_SIZE)
+        self._end = 0  # offset where received bytes end
+        self._pos = 0  # offset of the next byte to parse
+        self._start = 0  # offset where the element being parsed starts
+        self._stack: list[PartialArray] = []  # partially parsed arrays
+        self._command: PartialCommand = []  # partially parsed command
+        self._read_size = MIN_READ_SIZE
+
+    def _compact(self):
+        """Move unparsed bytes to the start of the buffer."""
+        remaining = self._end - self._start
+        if remaining:
+            self._buf[:remaining] = self._buf[self._start : self._end]
+        self._end = remaining
+        self._pos -= self._start
+        self._start = 0
+
+        # release memory held on to after a large element was parsed
+        if remaining == 0 and len(self._buf) > MAX_READ_SIZE:
+            self._buf = bytearray(MIN_READ_SIZE)
+
+    def _reserve(self, size: int):
+        """Make sure the buffer has space to receive at least size bytes."""
+        if self._start and (
+            self._start == self._end or self._start >= COMPACT_THRESHOLD
+        ):
+            self._compact()
+
+        missing = self._end + size - len(self._buf)
+        if missing > 0:
+            # grow at least by doubling so appends are amortized O(1)
+            self._buf.extend(bytes(max(missing, len(self._buf))))
+
+    def recv_into(self, sock: socket.socket) -> int:
+        """Receive bytes from the socket directly into the buffer.
+
+        The read size adapts to the load, it grows while reads fill the
+        requested size and shrinks back when the connection is mostly idle.
+        Returns the number of bytes received (0 once the peer disconnects).
+        """
+        size = self._read_size
+        self._reserve(size)
+        with memoryview(self._buf) as view:
+            received = sock.recv_into(view[self._end : self._end + size], size)
+        self._end += received
+
+        if received == size:
+            self._read_size = min(size * 2, MAX_READ_SIZE)
+        elif received < size // 4:
+            self._read_size = max(size // 2, MIN_READ_SIZE)
+        return received
+
+    def feed(self, data: bytes):
+        """Append already received bytes to the buffer."""
+        self._reserve(len(data))
+        self._buf[self._end : self._end + len(data)] = data
+        self._end += len(data)
+
+    def reset(self):
+        """Discard buffered bytes and any partially parsed element (eg, after
+        a protocol error)."""
+        self._end = self._pos = self._start = 0
+        self._stack.clear()
+        self._command.clear()
+
+    def span(self, size: int) -> memoryview:
+        """Bytes of the element iterated over last (which spans size bytes),
+        eg to propagate a command as it was received.
+
+        The view points into the input buffer, and must be released before
+        more bytes are received or fed (the buffer can't be resized while
+        it is exported).
+        """
+        return memoryview(self._buf)[self._start - size : self._start]
+
+    def __iter__(self) -> Iterator[tuple[RespElement | list[bytes], int]]:
+        """Iterate over completely parsed elements, as tuples of the element
+        and the number of bytes it spans in the stream."""
+        while True:
+            element = None
+            if self._commands and not self._stack:
+                element, self._pos = parse_command_at(
+                    self._buf, self._pos, self._end, self._command
+                )
+                if element is None:
+                    if self._command:
+                        return  # incomplete, resumed once more bytes arrive
+                    self._pos = self._start  # not a command, parsed again
+            if element is None:
+                # resumes a partially parsed element if there is one
+                element, self._pos = parse_at(
+                    self._buf, self._pos, self._stack, self._end
+                )
+            if element is None:
+                return
+
+            size = self._pos - self._start
+            self._start = self._pos
+            yield element, size
@@ -5,7 +5,7 @@ from .simple_error import SimpleError
 from .simple_string import SimpleString
 
 # type nil/null is simply an empty bulk string
-NIL = bytes(BulkString(b""))
+from app.resp.shared import NIL
 
 __all__ = [
     "Array",
@@ -3,7 +3,6 @@ from typing import Union
 
 from typing_extensions import Self
 
-from app.resp.parser import cr_parser
 from app.resp.base import RESPType
 from app.resp.constants import (
     SB_ARRAY,
@@ -12,6 +11,7 @@ from app.resp.constants import (
     SB_SIMPLE_ERROR,
     SB_SIMPLE_STRING,
 )
+from app.resp.encoder import write_array_header
 from app.resp.errors import EmptyBuffer, InvalidStartingByte
 from app.resp.types.bulk_string import BulkString
 from app.resp.types.integer import Integer
@@ -25,9 +25,11 @@ class Array(RESPType):
     start_byte = SB_ARRAY
 
     def __bytes__(self) -> bytes:
-        out = [f"*{len(self.value)}\r\n".encode()]
-        out.extend(bytes(element) for element in self.value)
-        return b"".join(out)
+        buf = bytearray()
+        write_array_header(buf, len(self.value))
+        for element in self.value:
+            buf += bytes(element)
+        return bytes(buf)
 
     @classmethod
     def from_bytes(cls, data: bytes) -> tuple[Self, int]:
@@ -43,26 +45,179 @@ class Array(RESPType):
             Specific to data validation (see validate() method in base class `Deserializable`)
         """
         cls.validate(data)
-        parser = cr_parser(data)
-        count_bytes, pos = next(parser)
-        count = int(count_bytes[1:].decode())  # skip starting byte
+        element, pos = parse_at(data, 0, [])
+        if element is None:
+            # encountered end of buffer before parsing complete
+            raise EOFError("Unexpected EOF")
+        return element, pos
 
-        array = []
-        for _ in range(count):
-            if pos >= len(data):
-                raise EOFError(
-                    "Unexpected EOF"
-                )  # encountered end of buffer before parsing complete
 
-            element, offset = bytes_to_resp(data, pos)
-            array.append(element)
-            pos += offset
+# Union type
+RespElement = Union[Integer, BulkString, SimpleString, SimpleError, Array]
 
-        return cls(array), pos
 
+ARRAY_BYTE = ord(SB_ARRAY)
+BULK_STRING_BYTE = ord(SB_BULK_STRING)
 
-# Union type
-RespElement = Union[Integer, BulkString, SimpleString, SimpleError, Array]
+# partially parsed array as [number of elements left to parse, parsed elements]
+PartialArray = list
+# partially parsed command as [number of arguments, parsed arguments]
+PartialCommand = list
+
+
+def _parse_element_at(
+    data: bytes | bytearray, pos: int, limit: int
+) -> tuple[object, int]:
+    """Parses a single element starting at offset pos (without slicing the
+    buffer), bytes from offset limit onwards are ignored.
+
+    Returns a tuple of the element and the offset to the next element, or a
+    tuple of None and pos if the buffer doesn't contain the entire element yet.
+    For arrays, only the header is parsed and the element count (int) is
+    returned in place of the element.
+    """
+    end = data.find(b"\r\n", pos, limit)
+    if end == -1:
+        return None, pos
+
+    starting_byte = data[pos]
+    if starting_byte == ord(SB_BULK_STRING):
+        length = int(data[pos + 1 : end])
+        if length == -1:
+            return BulkString(b""), end + 2  # null bulk string
+
+        start, stop = end + 2, end + 2 + length
+        if limit < stop + 2:
+            return None, pos
+        return BulkString(bytes(data[start:stop])), stop + 2
+    elif starting_byte == ord(SB_ARRAY):
+        return int(data[pos + 1 : end]), end + 2
+    elif starting_byte == ord(SB_SIMPLE_STRING):
+        return SimpleString(bytes(data[pos + 1 : end])), end + 2
+    elif starting_byte == ord(SB_SIMPLE_ERROR):
+        return SimpleError(bytes(data[pos + 1 : end])), end + 2
+    elif starting_byte == ord(SB_INTEGER):
+        return Integer(bytes(data[pos + 1 : end])), end + 2
+    else:
+        raise InvalidStartingByte(starting_byte)
+
+
+def parse_at(
+    data: bytes | bytearray,
+    pos: int,
+    stack: list[PartialArray],
+    limit: int | None = None,
+) -> tuple[RespElement | None, int]:
+    """Parses a complete RESP element starting at offset pos, working on
+    offsets so the buffer is never sliced or copied.
+
+    Parsing is resumable, `stack` holds arrays (outermost first) whose
+    elements have been partially parsed. If the buffer ends before the
+    element is complete, (None, pos) is returned where pos is the offset to
+    resume parsing from once more data is available, and the partially
+    parsed arrays are left on the stack.
+
+    limit is the offset where valid data in the buffer ends (defaults to
+    the length of the buffer).
+
+    Returns:
+        tuple[RespElement | None, int]: The parsed element (or None) and the offset after it.
+    """
+    if limit is None:
+        limit = len(data)
+
+    while pos < limit:
+        element, pos = _parse_element_at(data, pos, limit)
+        if element is None:
+            break
+
+        if isinstance(element, int):
+            if element > 0:
+                stack.append([element, []])
+                continue
+            element = Array([])  # empty (or null) array
+
+        # add completed element to parent arrays, bubbling up completed arrays
+        while stack:
+            parent = stack[-1]
+            parent[1].append(element)
+            parent[0] -= 1
+            if parent[0] > 0:
+                break
+            stack.pop()
+            element = Array(parent[1])
+        else:
+            return element, pos
+
+    return None, pos
+
+
+def parse_command_at(
+    data: bytes | bytearray,
+    pos: int,
+    limit: int | None = None,
+    partial: PartialCommand | None = None,
+) -> tuple[list[bytes] | None, int]:
+    """Fast path for the most common frame sent by clients, an array of bulk
+    strings (`*<count>\r\n` followed by `$<length>\r\n<bytes>\r\n` elements),
+    which is decoded directly to a list of byte strings without creating any
+    RESP type instances.
+
+    Returns a tuple of the arguments and the offset after the frame, or a
+    tuple of None and an offset if the frame is incomplete or isn't an array
+    of bulk strings.
+
+    Parsing is resumable if `partial` is given: when the buffer ends before
+    the frame is complete, the arguments parsed so far are kept in partial
+    and the offset returned is where parsing resumes once more data is
+    available. Otherwise (and for frames that aren't arrays of bulk strings,
+    which leave partial empty) the frame is parsed again from its start,
+    with `parse_at`.
+    """
+    if limit is None:
+        limit = len(data)
+    start = pos
+
+    if partial:
+        count, args = partial
+        partial.clear()
+    else:
+        if pos >= limit or data[pos] != ARRAY_BYTE:
+            return None, pos
+        end = data.find(b"\r\n", pos, limit)
+        if end == -1:
+            return None, pos
+        count = int(data[pos + 1 : end])
+        if count <= 0:
+            return None, pos
+        args = []
+        pos = end + 2
+
+    while len(args) < count:
+        if pos >= limit:
+            break
+        if data[pos] != BULK_STRING_BYTE:
+            return None, start
+        end = data.find(b"\r\n", pos, limit)
+        if end == -1:
+            break
+        length = int(data[pos + 1 : end])
+        if length < 0:
+            return None, start  # null bulk string
+
+        stop = end + 2 + length
+        if limit < stop + 2:
+            break
+        args.append(bytes(data[end + 2 : stop]))
+        pos = stop + 2
+    else:
+        return args, pos
+
+    # incomplete, resumed from the next argument
+    if partial is None:
+        return None, start
+    partial += [count, args]
+    return None, pos
 
 
 def bytes_to_resp(data: bytes, pos: int = 0) -> tuple[RespElement, int]:
@@ -73,25 +228,17 @@ def bytes_to_resp(data: bytes, pos: int = 0) -> tuple[RespElement, int]:
         pos (int, optional): The starting position in the byte buffer. Defaults to 0.
 
     Returns:
-        tuple[RespElement, int]: A tuple of a `RespElement` and the updated buffer position after parsing.
+        tuple[RespElement, int]: A tuple of a `RespElement` and the number of bytes parsed (from pos).
 
     Exceptions:
         EmptyBuffer: If the provided data is empty.
         InvalidStartingByte: If the starting byte is not recognized.
+        EOFError: If the buffer ends before the element is complete.
     """
     if len(data) == 0:
         raise EmptyBuffer
 
-    starting_byte = data[pos]
-    if starting_byte == ord(SB_SIMPLE_STRING):
-        return SimpleString.from_bytes(data[pos:])
-    elif starting_byte == ord(SB_SIMPLE_ERROR):
-        return SimpleError.from_bytes(data[pos:])
-    elif starting_byte == ord(SB_INTEGER):
-        return Integer.from_bytes(data[pos:])
-    elif starting_byte == ord(SB_BULK_STRING):
-        return BulkString.from_bytes(data[pos:])
-    elif starting_byte == ord(SB_ARRAY):
-        return Array.from_bytes(data[pos:])
-    else:
-        raise InvalidStartingByte(starting_byte)
+    element, end = parse_at(data, pos, [])
+    if element is None:
+        raise EOFError("Unexpected EOF")
+    return element, end - pos
@@ -4,6 +4,7 @@ from typing_extensions import Self
 
 from app.resp.base import RESPType
 from app.resp.constants import SB_BULK_STRING
+from app.resp.encoder import bulk_string
 from app.resp.parser import cr_parser
 
 
@@ -13,12 +14,8 @@ class BulkString(RESPType):
     start_byte = SB_BULK_STRING
 
     def __bytes__(self) -> bytes:
-        # null bulk string
-        if not self.value:
-            return b"$-1\r\n"
-
-        length = len(self.value)
-        return f"${length}\r\n".encode() + self.value + b"\r\n"
+        # empty value is serialized as the null bulk string
+        return bulk_string(self.value or None)
 
     @classmethod
     def from_bytes(cls, data: bytes) -> tuple[Self, int]:
@@ -37,6 +34,9 @@ class BulkString(RESPType):
         parser = cr_parser(data)
         length_bytes, pos = next(parser)
         length = int(length_bytes[1:].decode())  # skip starting byte
+        if length == -1:
+            return cls(b""), pos  # null bulk string
+
         end = pos + length
         return cls(data[pos:end]), end + 2
 
@@ -4,6 +4,7 @@ from typing_extensions import Self
 from app.resp.parser import cr_parser
 from app.resp.base import RESPType
 from app.resp.constants import SB_INTEGER
+from app.resp.encoder import integer
 
 
 @dataclass
@@ -12,7 +13,7 @@ class Integer(RESPType):
     start_byte = SB_INTEGER
 
     def __bytes__(self) -> bytes:
-        return f":{int(self.value)}\r\n".encode()
+        return integer(int(self.value))
 
     @classmethod
     def from_bytes(cls, data: bytes) -> tuple[Self, int]:
@@ -0,0 +1,3 @@
+from .router import ShardRouter
+
+__all__ = ["ShardRouter"]
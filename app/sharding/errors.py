@@ -0,0 +1,12 @@
+class ShardingError(Exception):
+    pass
+
+
+class CrossShardKeys(ShardingError):
+    def __init__(self) -> None:
+        super().__init__("CROSSSLOT Keys in request don't hash to the same worker")
+
+
+class ForwardingFailed(ShardingError):
+    def __init__(self, worker_id: int, err: str) -> None:
+        super().__init__(f"failed to forward command to worker {worker_id}: {err}")
@@ -0,0 +1,167 @@
+"""This file contains logic to route commands between worker processes that
+each own a partition of the keyspace."""
+
+import logging
+import os
+import socket
+import tempfile
+import threading
+import zlib
+
+from app.resp.stream import RespStreamParser
+from app.sharding.errors import CrossShardKeys, ForwardingFailed
+
+
+# max idle connections kept open to each worker, more are opened while
+# requests are in flight (eg, forwarded BLPOPs blocked on the worker)
+MAX_IDLE_PEER_CONNECTIONS = 4
+
+
+class _PeerConnection:
+    """Connection to another worker's unix socket, used by a single request
+    at a time (a reply can only be matched to its request by order)."""
+
+    def __init__(self, path: str):
+        self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._parser = RespStreamParser()
+        try:
+            self._sock.connect(path)
+        except OSError:
+            self._sock.close()
+            raise
+
+    def close(self):
+        self._sock.close()
+
+    def _recv_reply(self) -> bytes:
+        """Reads exactly one RESP reply from the socket and returns its bytes
+        as received (serializing the parsed reply again would not tell nil
+        replies from empty ones)."""
+        while True:
+            for _, size in self._parser:
+                with self._parser.span(size) as reply:
+                    return bytes(reply)
+
+            chunk = self._sock.recv(4096)
+            if not chunk:
+                raise ConnectionError("connection closed by worker")
+            self._parser.feed(chunk)
+
+    def request(self, payload: bytes) -> bytes:
+        self._sock.sendall(payload)
+        return self._recv_reply()
+
+
+class _PeerPool:
+    """Pool of connections to another worker.
+
+    Each request takes an idle connection (or opens a new one) for itself,
+    so a request blocked on the worker doesn't stall the requests made
+    after it. Connections are closed on errors, since the rest of the
+    stream can't be matched to requests anymore.
+    """
+
+    def __init__(self, path: str):
+        self._path = path
+        self._idle: list[_PeerConnection] = []
+        self._lock = threading.Lock()
+
+    def request(self, payload: bytes) -> bytes:
+        with self._lock:
+            conn = self._idle.pop() if self._idle else None
+        if conn is None:
+            conn = _PeerConnection(self._path)
+
+        try:
+            reply = conn.request(payload)
+        except Exception:
+            conn.close()
+            raise
+
+        with self._lock:
+            if len(self._idle) < MAX_IDLE_PEER_CONNECTIONS:
+                self._idle.append(conn)
+                return reply
+        conn.close()
+        return reply
+
+
+class ShardRouter:
+    """Maps keys to the worker process that owns them and forwards commands
+    to the owner.
+
+    Keys are partitioned with crc32 (which, unlike `hash()`, is stable
+    across processes) modulo the number of workers.
+    """
+
+    worker_id: int  # id of the worker this router belongs to
+    num_workers: int  # total number of workers sharing the keyspace
+    port: int  # tcp port shared by all workers, used to namespace unix sockets
+
+    def __init__(self, worker_id: int, num_workers: int, port: int):
+        self.worker_id = worker_id
+        self.num_workers = num_workers
+        self.port = port
+        self._peers: dict[int, _PeerPool] = {}
+        self._lock = threading.Lock()
+
+    def socket_path(self, worker_id: int) -> str:
+        """Path of the unix socket a worker receives forwarded commands on."""
+        return os.path.join(
+            tempfile.gettempdir(), f"redis-{self.port}-worker-{worker_id}.sock"
+        )
+
+    def listen(self) -> socket.socket:
+        """Creates the unix server socket for commands forwarded to this
+        worker."""
+        path = self.socket_path(self.worker_id)
+        if os.path.exists(path):
+            os.unlink(path)  # stale socket from a previous run
+
+        server_socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        server_socket.bind(path)
+        server_socket.listen()
+        logging.info(f"worker {self.worker_id} listening for forwarded commands")
+        return server_socket
+
+    def owner_of(self, key: bytes) -> int:
+        """Returns the id of the worker that owns the key."""
+        return zlib.crc32(key) % self.num_workers
+
+    def owns(self, key: bytes) -> bool:
+        return self.owner_of(key) == self.worker_id
+
+    def route(self, keys: list[bytes]) -> int:
+        """Returns the id of the worker that should execute a command on the
+        given keys.
+
+        Raises CrossShardKeys if keys belong to different workers.
+        """
+        owners = {self.owner_of(key) for key in keys}
+        if len(owners) > 1:
+            raise CrossShardKeys
+        return owners.pop() if owners else self.worker_id
+
+    def forward(self, worker_id: int, payload: bytes) -> bytes:
+        """Forwards a serialized command to a worker and returns its
+        serialized reply."""
+        with self._lock:
+            peer = self._peers.get(worker_id)
+            if peer is None:
+                peer = _PeerPool(self.socket_path(worker_id))
+                self._peers[worker_id] = peer
+
+        try:
+            return peer.request(payload)
+        except Exception as e:
+            raise ForwardingFailed(worker_id, str(e))
+
+    def forward_to_all(self, payload: bytes) -> list[bytes]:
+        """Forwards a serialized command to every other worker and returns
+        their serialized replies (eg, to gather keys of the whole
+        keyspace)."""
+        return [
+            self.forward(worker_id, payload)
+            for worker_id in range(self.num_workers)
+            if worker_id != self.worker_id
+        ]
@@ -1,5 +1,6 @@
 from .base import RedisStorage
 from .simple import SimpleStorage
+from .striped import StripedLockStorage
 from .thread_safe import ThreadSafeStorage
 
-__all__ = ["RedisStorage", "SimpleStorage", "ThreadSafeStorage"]
+__all__ = ["RedisStorage", "SimpleStorage", "StripedLockStorage", "ThreadSafeStorage"]
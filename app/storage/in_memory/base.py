@@ -2,10 +2,13 @@
 a redis store."""
 
 from abc import ABC, abstractmethod
-from typing import Callable
+from typing import Callable, TypeVar
 
+from app.storage.in_memory.memory import MemoryStats
 from app.storage.types import RedisValue
 
+T = TypeVar("T")
+
 
 class RedisStorage(ABC):
     """
@@ -29,18 +32,99 @@ class RedisStorage(ABC):
         """Removes key from database."""
         raise NotImplementedError
 
+    @abstractmethod
+    def delete(self, keys: list[bytes], lazy: bool = False) -> int:
+        """Removes keys from database, returns the number of keys removed.
+        With lazy set, large values are freed in the background."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def flush(self, lazy: bool = False):
+        """Removes all keys from database. With lazy set, the keyspace is
+        detached and freed in the background."""
+        raise NotImplementedError
+
     @abstractmethod
     def keys(self, pattern: bytes | None = None) -> list[bytes]:
         """Returns all keys in the database that match the pattern."""
         raise NotImplementedError
 
+    @abstractmethod
+    def scan(
+        self,
+        cursor: int,
+        count: int,
+        pattern: bytes | None = None,
+        type_name: str | None = None,
+    ) -> tuple[int, list[bytes]]:
+        """Returns keys in a step of a cursor based iteration over the
+        keyspace (about count keys), filtered by pattern and type, along with
+        the cursor to continue from (0 once the iteration is complete)."""
+        raise NotImplementedError
+
     @abstractmethod
     def update(self, key: bytes, fn: Callable[[RedisValue], RedisValue]) -> RedisValue:
         """Provide an update function that is applied to the key stored in the
         database."""
         raise NotImplementedError
 
+    @abstractmethod
+    def upsert(
+        self,
+        key: bytes,
+        fn: Callable[[RedisValue | None], RedisValue | None],
+        free_memory: bool = True,
+    ) -> RedisValue | None:
+        """Provide an update function that is applied to the value of the key
+        (None if the key doesn't exist), which can modify the value in place.
+        The returned value is stored, or the key is removed if None is
+        returned.
+
+        Keys are evicted before (or OutOfMemory is raised) if free_memory is
+        set, writes that can't grow memory (eg, pops) should unset it."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def view(self, key: bytes, fn: Callable[[RedisValue | None], T]) -> T:
+        """Provide a function that reads the value of the key (None if the key
+        doesn't exist) while no other write can modify it, returns the result
+        of the function."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def view_many(
+        self, keys: list[bytes], fn: Callable[[list[RedisValue | None]], T]
+    ) -> T:
+        """Like `view`, for multi-key reads (eg, SINTER). The function is
+        given the values of all keys (None for keys that don't exist), none
+        of which can be modified by other writes while it runs."""
+        raise NotImplementedError
+
     @abstractmethod
     def restore(self, db: dict[bytes, RedisValue]):
         """Restore db contents."""
         raise NotImplementedError
+
+    @abstractmethod
+    def active_expire(self, max_keys: int) -> int:
+        """Removes up to max_keys keys that have expired (without them being
+        accessed), returns the number of keys removed."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def expire_stats(self) -> tuple[int, int]:
+        """Returns the number of keys removed because they expired and the
+        number of keys with an expiry."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def memory_stats(self) -> MemoryStats:
+        """Returns estimated memory usage of the storage and eviction
+        statistics."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def memory_usage(self, key: bytes) -> int:
+        """Returns the estimated number of bytes used to store a key and its
+        value."""
+        raise NotImplementedError
@@ -24,3 +24,13 @@ class InvalidKeyFormat(StorageException):
 class InvalidValueFormat(StorageException):
     def __init__(self) -> None:
         super().__init__("invalid value format, expected RedisValue")
+
+
+class OutOfMemory(StorageException):
+    def __init__(self) -> None:
+        super().__init__("used memory > 'maxmemory' and no key can be evicted")
+
+
+class WrongType(StorageException):
+    def __init__(self, key: bytes | None = None) -> None:
+        super().__init__(f"key={key} holds a value of another type")
@@ -0,0 +1,131 @@
+"""This file contains the logic to pick keys to evict once the storage uses
+more memory than `maxmemory` allows, which approximates Redis eviction.
+
+Values carry a 24 bit `lru` field which holds, depending on the policy,
+- LRU: the access clock (in seconds) of the last access,
+- LFU: the time of the last decrement (in minutes, 16 bits) and a
+  logarithmic access counter (Morris counter, 8 bits).
+
+Instead of sorting the keyspace, a few keys are sampled on every eviction
+and the best candidates seen so far are kept in an eviction pool.
+"""
+
+import bisect
+import random
+import time
+from enum import StrEnum
+
+LRU_BITS = 24
+LRU_CLOCK_MAX = (1 << LRU_BITS) - 1
+LRU_CLOCK_RESOLUTION = 1  # seconds
+
+LFU_INIT_VAL = 5  # counter of new keys, so they aren't evicted right away
+LFU_LOG_FACTOR = 10  # higher factor means more accesses to increment counter
+LFU_DECAY_TIME = 1  # minutes for the counter to be decremented by one
+
+MAXMEMORY_SAMPLES = 5  # keys sampled per eviction
+EVPOOL_SIZE = 16  # candidates kept in the eviction pool
+
+
+class MaxMemoryPolicy(StrEnum):
+    """How keys are selected for eviction when maxmemory is reached."""
+
+    NOEVICTION = "noeviction"  # reject writes instead
+    ALLKEYS_LRU = "allkeys-lru"
+    ALLKEYS_LFU = "allkeys-lfu"
+    VOLATILE_LRU = "volatile-lru"  # only keys with an expiry
+    VOLATILE_TTL = "volatile-ttl"  # only keys with an expiry, shortest ttl first
+
+    @property
+    def allkeys(self) -> bool:
+        return self in (MaxMemoryPolicy.ALLKEYS_LRU, MaxMemoryPolicy.ALLKEYS_LFU)
+
+    @property
+    def lfu(self) -> bool:
+        return self == MaxMemoryPolicy.ALLKEYS_LFU
+
+
+def lru_clock() -> int:
+    return int(time.monotonic() / LRU_CLOCK_RESOLUTION) & LRU_CLOCK_MAX
+
+
+def lru_idle_time(lru: int) -> int:
+    """Seconds since the last access (the clock wraps around)."""
+    return (lru_clock() - lru) & LRU_CLOCK_MAX
+
+
+def _lfu_minutes() -> int:
+    return int(time.monotonic() // 60) & 0xFFFF
+
+
+def lfu_counter(lru: int) -> int:
+    """Access counter decremented by the decay periods elapsed since the last
+    decrement."""
+    elapsed = (_lfu_minutes() - (lru >> 8)) & 0xFFFF
+    return max((lru & 0xFF) - elapsed // LFU_DECAY_TIME, 0)
+
+
+def lfu_touch(lru: int) -> int:
+    """Logarithmically increments the access counter, the more accesses a key
+    had, the less likely the counter is incremented."""
+    counter = lfu_counter(lru)
+    if counter < 255:
+        base = max(counter - LFU_INIT_VAL, 0)
+        if random.random() < 1 / (base * LFU_LOG_FACTOR + 1):
+            counter += 1
+    return (_lfu_minutes() << 8) | counter
+
+
+def initial_clock(policy: MaxMemoryPolicy) -> int:
+    """Value of the lru field for a new key."""
+    if policy.lfu:
+        return (_lfu_minutes() << 8) | LFU_INIT_VAL
+    return lru_clock()
+
+
+def touch(policy: MaxMemoryPolicy, lru: int) -> int:
+    """Value of the lru field after a key is accessed."""
+    if policy.lfu:
+        return lfu_touch(lru)
+    return lru_clock()
+
+
+def eviction_score(policy: MaxMemoryPolicy, lru: int, expiry: int | None) -> int:
+    """Score of a key for eviction, keys with higher scores are evicted
+    first."""
+    if policy == MaxMemoryPolicy.VOLATILE_TTL:
+        return -(expiry or 0)  # keys expiring sooner are evicted first
+    if policy.lfu:
+        return 255 - lfu_counter(lru)
+    return lru_idle_time(lru)
+
+
+class EvictionPool:
+    """Best candidates for eviction seen across samples, sorted by score.
+
+    Keys in the pool may have been removed (or accessed) since they were
+    sampled, so they should be validated before eviction.
+    """
+
+    def __init__(self, size: int = EVPOOL_SIZE):
+        self._size = size
+        self._entries: list[tuple[int, bytes]] = []
+
+    def insert(self, score: int, key: bytes):
+        entries = self._entries
+        if len(entries) == self._size and score <= entries[0][0]:
+            return  # worse than all candidates in a full pool
+        if any(k == key for _, k in entries):
+            return
+
+        bisect.insort(entries, (score, key))
+        if len(entries) > self._size:
+            entries.pop(0)
+
+    def pop(self) -> bytes | None:
+        """Removes and returns the best candidate (None if the pool is
+        empty)."""
+        return self._entries.pop()[1] if self._entries else None
+
+    def clear(self):
+        self._entries.clear()
@@ -0,0 +1,58 @@
+"""This file contains the active expiry cycle, which reclaims keys that have
+expired but are never accessed again (and would otherwise be kept in memory
+forever since keys are expired lazily on access).
+
+Similar to `activeExpireCycle` in Redis, the cycle runs `hz` times a second
+from a background thread and expires keys in small batches until no
+expired keys are left or its time budget is used up, so the storage lock
+is never held for long.
+"""
+
+import logging
+import time
+
+from app.info import Info
+from app.storage.in_memory.base import RedisStorage
+
+ACTIVE_EXPIRE_HZ = 10  # cycles per second
+ACTIVE_EXPIRE_BATCH = 20  # keys expired per storage call
+ACTIVE_EXPIRE_CYCLE_PERC = 25  # max percentage of cpu time spent per cycle
+STALE_PERC_WEIGHT = 0.05  # weight of the last cycle in expired_stale_perc
+
+
+def active_expire_cycle(storage: RedisStorage, time_limit: float) -> int:
+    """Expires keys in batches until no expired keys are left or time_limit
+    (seconds) has passed, returns the number of keys expired."""
+    deadline = time.perf_counter() + time_limit
+    expired = 0
+    while True:
+        batch = storage.active_expire(ACTIVE_EXPIRE_BATCH)
+        expired += batch
+        if batch < ACTIVE_EXPIRE_BATCH or time.perf_counter() > deadline:
+            return expired
+
+
+def run_active_expire(storage: RedisStorage, info: Info, hz: int = ACTIVE_EXPIRE_HZ):
+    """Runs the active expiry cycle forever (blocks the calling thread) and
+    reports expiry statistics to info."""
+    period = 1 / hz
+    time_limit = period * ACTIVE_EXPIRE_CYCLE_PERC / 100
+    stale_perc = 0.0
+
+    while True:
+        time.sleep(period)
+        try:
+            _, volatile_keys = storage.expire_stats()
+            expired = active_expire_cycle(storage, time_limit)
+
+            # percentage of keys with an expiry that had already expired when
+            # the cycle started, as a moving average like in Redis
+            current_perc = expired / volatile_keys * 100 if volatile_keys else 0.0
+            stale_perc = current_perc * STALE_PERC_WEIGHT + stale_perc * (
+                1 - STALE_PERC_WEIGHT
+            )
+
+            expired_keys, _ = storage.expire_stats()
+            info.update_expire_stats(expired_keys, stale_perc)
+        except Exception as e:
+            logging.exception(f"active expire cycle failed: {e}")
@@ -0,0 +1,106 @@
+"""This file contains the background reclamation of objects removed from the
+keyspace (lazy freeing), used by UNLINK and FLUSHALL/FLUSHDB ASYNC.
+
+Dropping the last reference to a large object (eg, a flushed keyspace)
+deallocates everything it holds in a single call, which holds the GIL (and
+the storage lock, if done while removing) for the whole duration. Instead,
+removed objects are detached from the keyspace in O(1) and handed to a
+background thread, which takes them apart element by element, so other
+threads are scheduled in between.
+"""
+
+import logging
+import queue
+from collections import deque
+import threading
+from typing import Any
+
+from app.storage.types import RedisValue
+
+# objects whose freeing effort is below this are freed right away, since
+# handing them to the background thread costs more (same as Redis)
+LAZYFREE_THRESHOLD = 64
+
+
+def free_effort(obj: Any) -> int:
+    """Estimated number of allocations freed along with an object."""
+    if isinstance(obj, RedisValue):
+        obj = obj.payload
+    if isinstance(obj, (bytes, int)):
+        return 1
+    try:
+        return len(obj)
+    except TypeError:
+        return 1
+
+
+def _release(obj: Any):
+    """Drops the references held by obj one at a time, so no single step
+    deallocates a large object graph.
+
+    The object is emptied in place, it must not be used afterwards.
+    """
+    if isinstance(obj, RedisValue):
+        obj = obj.payload
+    if isinstance(obj, dict):
+        while obj:
+            _, value = obj.popitem()
+            _release(value)
+    elif isinstance(obj, (list, set, deque)):
+        while obj:
+            _release(obj.pop())
+    elif isinstance(obj, tuple):
+        for item in obj:
+            _release(item)
+    elif hasattr(obj, "__dict__"):
+        _release(tuple(vars(obj).values()))
+    elif hasattr(obj, "__slots__"):
+        _release(tuple(getattr(obj, name, None) for name in obj.__slots__))
+
+
+class LazyFree:
+    """Queue of objects to free in a background thread.
+
+    The thread is started on the first object that is freed lazily.
+    """
+
+    def __init__(self):
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        self._pending_objects = 0
+        self._thread: threading.Thread | None = None
+
+    @property
+    def pending_objects(self) -> int:
+        """Number of objects (eg, keys) waiting to be freed."""
+        with self._lock:
+            return self._pending_objects
+
+    def free(self, obj: Any, objects: int = 1, effort: int | None = None):
+        """Frees obj in the background if it is large enough (see
+        `free_effort`), objects is the number of objects (eg, keys) reported
+        as pending until it is freed."""
+        if effort is None:
+            effort = free_effort(obj)
+        if effort < LAZYFREE_THRESHOLD:
+            return  # freed when the caller drops its reference
+
+        with self._lock:
+            self._pending_objects += objects
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+        self._queue.put((obj, objects))
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            obj, objects = item
+            del item
+            try:
+                _release(obj)
+            except Exception as e:
+                logging.exception(f"lazyfree - {e}")
+            del obj  # last reference, if the object was not fully released
+            with self._lock:
+                self._pending_objects -= objects
@@ -0,0 +1,79 @@
+"""This file contains functions to estimate memory used by the in-memory
+storage.
+
+Sizes are estimates of the python objects held for each key (the key, the
+value and its entry in the keyspace dict), not of the process memory. They
+are maintained incrementally by storages as keys are written and removed,
+so memory usage can be queried without walking the keyspace.
+"""
+
+import sys
+from dataclasses import dataclass
+
+from app.storage.types import RedisValue
+
+DICT_ENTRY_SIZE = 3 * 8  # hash, key and value pointers of a dict entry
+INT_DATA_SIZE = 8  # int encoded values count as a 64 bit integer
+
+
+def _value_overhead() -> int:
+    value = RedisValue(b"")
+    size = sys.getsizeof(value)
+    if hasattr(value, "__dict__"):
+        size += sys.getsizeof(value.__dict__)
+    return size
+
+
+VALUE_OVERHEAD = _value_overhead()
+
+
+def data_size(key: bytes, value: RedisValue) -> int:
+    """Number of bytes of the key and value contents (the dataset)."""
+    payload = value.payload
+    if isinstance(payload, int):
+        return len(key) + INT_DATA_SIZE
+    if isinstance(payload, bytes):
+        return len(key) + len(payload)
+    return len(key) + payload.data_size()  # structures of other types
+
+
+def entry_size(key: bytes, value: RedisValue) -> int:
+    """Estimated number of bytes used to store a key and its value."""
+    payload = value.payload
+    if isinstance(payload, (bytes, int)):
+        payload_size = sys.getsizeof(payload)
+    else:
+        payload_size = payload.memory_usage()  # structures of other types
+    return DICT_ENTRY_SIZE + sys.getsizeof(key) + VALUE_OVERHEAD + payload_size
+
+
+@dataclass
+class MemoryStats:
+    """Memory usage of a storage."""
+
+    used_memory: int = 0  # estimated bytes used by keys and values
+    used_memory_peak: int = 0  # peak of used_memory
+    used_memory_dataset: int = 0  # bytes of key and value contents
+    keys: int = 0  # number of keys
+    evicted_keys: int = 0  # keys removed because maxmemory was reached
+    lazyfree_pending_objects: int = 0  # objects waiting to be freed lazily
+
+    @property
+    def used_memory_overhead(self) -> int:
+        """Bytes used by objects holding the dataset."""
+        return self.used_memory - self.used_memory_dataset
+
+    def __add__(self, other: "MemoryStats") -> "MemoryStats":
+        # peaks of partitions may not have been reached at the same time,
+        # so the sum of peaks is an upper bound
+        return MemoryStats(
+            used_memory=self.used_memory + other.used_memory,
+            used_memory_peak=self.used_memory_peak + other.used_memory_peak,
+            used_memory_dataset=self.used_memory_dataset + other.used_memory_dataset,
+            keys=self.keys + other.keys,
+            evicted_keys=self.evicted_keys + other.evicted_keys,
+            # partitions share the lazyfree queue
+            lazyfree_pending_objects=max(
+                self.lazyfree_pending_objects, other.lazyfree_pending_objects
+            ),
+        )
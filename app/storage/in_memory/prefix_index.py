@@ -0,0 +1,90 @@
+"""This file contains an ordered index of keys used to answer pattern
+queries with a literal prefix (eg, KEYS session:1234:*) without visiting
+every key of the keyspace.
+
+Keys are kept sorted in a list of bounded sublists (similar to a B+ tree
+with a single level of inner nodes), so inserting or removing a key only
+moves the keys of one sublist, and keys sharing a prefix are a contiguous
+range found with a binary search.
+"""
+
+import itertools
+from bisect import bisect_left, insort
+from typing import Iterable, Iterator
+
+SUBLIST_SIZE = 1000  # sublists are split once they hold twice as many keys
+
+GLOB_SPECIAL_CHARS = b"*?["
+
+
+def literal_prefix(pattern: bytes) -> bytes:
+    """Returns the prefix of a glob-style pattern that only matches itself."""
+    for pos, char in enumerate(pattern):
+        if char in GLOB_SPECIAL_CHARS:
+            return pattern[:pos]
+    return pattern
+
+
+class PrefixIndex:
+    """Sorted index of keys."""
+
+    def __init__(self, keys: Iterable[bytes] = ()):
+        keys = sorted(keys)
+        self._sublists = [
+            keys[i : i + SUBLIST_SIZE] for i in range(0, len(keys), SUBLIST_SIZE)
+        ]
+        self._maxes = [sublist[-1] for sublist in self._sublists]
+
+    def add(self, key: bytes):
+        """Index a key (which must not be indexed already)."""
+        if not self._sublists:
+            self._sublists.append([key])
+            self._maxes.append(key)
+            return
+
+        pos = bisect_left(self._maxes, key)
+        if pos == len(self._maxes):
+            # key is greater than all keys, append to the last sublist
+            pos -= 1
+            sublist = self._sublists[pos]
+            sublist.append(key)
+            self._maxes[pos] = key
+        else:
+            sublist = self._sublists[pos]
+            insort(sublist, key)
+
+        if len(sublist) > 2 * SUBLIST_SIZE:
+            self._sublists[pos : pos + 1] = [
+                sublist[:SUBLIST_SIZE],
+                sublist[SUBLIST_SIZE:],
+            ]
+            self._maxes[pos : pos + 1] = [sublist[SUBLIST_SIZE - 1], sublist[-1]]
+
+    def discard(self, key: bytes):
+        pos = bisect_left(self._maxes, key)
+        if pos == len(self._maxes):
+            return
+        sublist = self._sublists[pos]
+        i = bisect_left(sublist, key)
+        if i == len(sublist) or sublist[i] != key:
+            return
+
+        del sublist[i]
+        if not sublist:
+            del self._sublists[pos]
+            del self._maxes[pos]
+        elif i == len(sublist):
+            self._maxes[pos] = sublist[-1]
+
+    def with_prefix(self, prefix: bytes) -> Iterator[bytes]:
+        """Iterate over indexed keys that start with prefix, in order."""
+        pos = bisect_left(self._maxes, prefix)
+        if pos == len(self._sublists):
+            return
+        start = bisect_left(self._sublists[pos], prefix)
+        for sublist in itertools.islice(self._sublists, pos, None):
+            for key in itertools.islice(sublist, start, None):
+                if not key.startswith(prefix):
+                    return
+                yield key
+            start = 0
@@ -0,0 +1,206 @@
+"""This file contains the table used to iterate over a keyspace (or any
+collection of elements) with resumable cursors, like SCAN in Redis.
+
+Elements are indexed in a table of 2^n buckets by their hash. A cursor is
+the index of the next bucket to visit, and buckets are visited in
+reverse-binary order (the cursor is incremented from its most significant
+bit). With that order, a bucket visited at one table size covers exactly
+the buckets its elements are rehashed into when the table grows or
+shrinks, so a full iteration returns every element present for its whole
+duration at least once, even if the table is resized in between (elements
+may be returned more than once after the table shrinks).
+
+Like the dict of Redis, a resized table is rehashed incrementally: a few
+buckets of the old table are moved to the new one on each add or discard,
+so no single operation rehashes every element (while holding the lock of
+a storage). Until then elements are in either table, and a cursor visits
+its bucket of the smaller table along with the buckets of the larger table
+that it expands to.
+"""
+
+import fnmatch
+import functools
+import re
+from typing import Generic, Hashable, TypeVar
+
+T = TypeVar("T", bound=Hashable)
+
+MIN_TABLE_SIZE = 4
+EMPTY_VISITS_PER_COUNT = 10  # empty buckets visited per element asked for
+PATTERN_CACHE_SIZE = 128  # compiled patterns kept for KEYS and the SCAN family
+REHASH_BUCKETS_PER_STEP = 4  # buckets of the old table moved per add or discard
+
+# storages may partition elements by the low bits of `hash()` (eg,
+# StripedLockStorage), so buckets are indexed by higher bits of the hash
+_HASH_SHIFT = 16
+
+
+def next_cursor(cursor: int, mask: int) -> int:
+    """Returns the cursor that follows cursor in reverse-binary order for a
+    table of mask + 1 buckets, 0 once all buckets are visited."""
+    # incrementing the reversed cursor clears its set high bits up to the
+    # first unset one, which is set
+    bit = (mask + 1) >> 1
+    cursor &= mask
+    while bit and cursor & bit:
+        cursor ^= bit
+        bit >>= 1
+    return cursor | bit
+
+
+def _collect(bucket, elements: list) -> bool:
+    """Appends the elements of a bucket, returns False if it is empty."""
+    if bucket is None:
+        return False
+    if type(bucket) is list:
+        elements.extend(bucket)
+    else:
+        elements.append(bucket)
+    return True
+
+
+def _remove(table: list, index: int, element) -> bool:
+    """Removes element from the bucket at index, returns False if it is not
+    there."""
+    bucket = table[index]
+    if type(bucket) is list:
+        if element not in bucket:
+            return False
+        bucket.remove(element)
+        if len(bucket) == 1:
+            table[index] = bucket[0]
+        return True
+    if bucket is not None and bucket == element:
+        table[index] = None
+        return True
+    return False
+
+
+@functools.lru_cache(maxsize=PATTERN_CACHE_SIZE)
+def compile_pattern(pattern: bytes) -> re.Pattern | None:
+    """Compiles a glob-style pattern to a regex (None if the pattern can't
+    be decoded)."""
+    try:
+        return re.compile(fnmatch.translate(pattern.decode()).encode())
+    except UnicodeDecodeError:
+        return None
+
+
+class ScanTable(Generic[T]):
+    """Index of elements by bucket for cursor based iteration.
+
+    The table grows when it holds more elements than buckets and shrinks
+    when less than one in eight buckets would be used, so a step visits few
+    empty buckets. It is not resized again until the rehash of the previous
+    resize is complete.
+    """
+
+    def __init__(self, elements=()):
+        self._size = 0
+        # a bucket holds an element, or a list of colliding elements (lists
+        # are unhashable so they are never elements themselves)
+        self._table: list = [None] * MIN_TABLE_SIZE
+        self._mask = MIN_TABLE_SIZE - 1
+        # table being rehashed into _table (None once rehashed), its buckets
+        # before _rehash_index are moved already
+        self._old: list | None = None
+        self._rehash_index = 0
+        for element in elements:
+            self.add(element)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _resize(self, table_size: int):
+        self._old, self._rehash_index = self._table, 0
+        self._table = [None] * table_size
+        self._mask = table_size - 1
+
+    def _rehash_step(self, old: list):
+        end = min(self._rehash_index + REHASH_BUCKETS_PER_STEP, len(old))
+        for index in range(self._rehash_index, end):
+            bucket = old[index]
+            old[index] = None
+            if type(bucket) is list:
+                for element in bucket:
+                    self._insert(element)
+            elif bucket is not None:
+                self._insert(bucket)
+
+        self._rehash_index = end
+        if end == len(old):
+            self._old = None
+
+    def _insert(self, element: T):
+        table = self._table
+        index = hash(element) >> _HASH_SHIFT & self._mask
+        bucket = table[index]
+        if bucket is None:
+            table[index] = element
+        elif type(bucket) is list:
+            bucket.append(element)
+        else:
+            table[index] = [bucket, element]
+
+    def add(self, element: T):
+        """Index an element (which must not be indexed already)."""
+        self._size += 1
+        if self._old is not None:
+            self._rehash_step(self._old)
+        elif self._size > len(self._table):
+            self._resize(2 * len(self._table))
+        self._insert(element)
+
+    def discard(self, element: T):
+        hashed = hash(element) >> _HASH_SHIFT
+        if not _remove(self._table, hashed & self._mask, element):
+            old = self._old
+            if old is None or not _remove(old, hashed & (len(old) - 1), element):
+                return
+
+        self._size -= 1
+        table_size = len(self._table)
+        if self._old is not None:
+            self._rehash_step(self._old)
+        elif table_size > MIN_TABLE_SIZE and self._size < table_size // 8:
+            self._resize(table_size // 2)
+
+    def scan(self, cursor: int, count: int) -> tuple[int, list[T]]:
+        """Visits buckets from cursor until at least count elements are
+        collected (or 10 * count empty buckets are visited).
+
+        Returns the cursor to continue from (0 once the iteration is
+        complete) and the elements of the visited buckets.
+        """
+        table, mask = self._table, self._mask
+        # while rehashing, cursors are indexes of the smaller table, and
+        # each covers the buckets of the larger table it expands to
+        large: list | None = None
+        large_mask = expanded_bits = 0
+        if self._old is not None:
+            table, large = self._old, self._table
+            if len(table) > len(large):
+                table, large = large, table
+            mask = len(table) - 1
+            large_mask = len(large) - 1
+            expanded_bits = mask ^ large_mask
+
+        cursor &= mask
+        elements: list[T] = []
+        empty_visits = count * EMPTY_VISITS_PER_COUNT
+        while True:
+            found = _collect(table[cursor], elements)
+            if large is not None:
+                # the expanded bits are the first ones incremented in
+                # reverse-binary order, so this visits all their values
+                index = cursor
+                while True:
+                    found = _collect(large[index], elements) or found
+                    index = next_cursor(index, large_mask)
+                    if not index & expanded_bits:
+                        break
+            if not found:
+                empty_visits -= 1
+            cursor = next_cursor(cursor, mask)
+            if cursor == 0 or len(elements) >= count or empty_visits <= 0:
+                return cursor, elements
@@ -4,12 +4,26 @@ of RedisStorage.
 Intended for use in single-threaded contexts such as testing, it
 provides basic set, get, and remove operations without locking
 mechanisms.
+
+Keys are indexed in a scan table (see `scan.py`) so the keyspace can be
+iterated in small steps with cursors that remain valid across writes.
+
+Keys with an expiry are expired lazily when accessed, and actively through
+a TTL index (a min-heap of expiry and key) that `active_expire` reclaims
+expired keys from without scanning the keyspace.
+
+With `prefix_index` set, keys are also kept in a sorted index so patterns
+with a literal prefix (eg, `session:1234:*`) only visit keys with that
+prefix (see `prefix_index.py`).
+
+With `maxmemory` set, keys are evicted before writes once the estimated
+memory used by keys exceeds it (see `eviction.py`).
 """
 
-import fnmatch
-import re
+import heapq
+import random
 from time import time
-from typing import Callable
+from typing import Callable, TypeVar
 
 from app.storage.in_memory.base import RedisStorage
 from app.storage.in_memory.errors import (
@@ -17,18 +31,185 @@ from app.storage.in_memory.errors import (
     InvalidValueFormat,
     KeyDoesNotExist,
     KeyExpired,
+    OutOfMemory,
 )
+from app.storage.in_memory.eviction import (
+    MAXMEMORY_SAMPLES,
+    EvictionPool,
+    MaxMemoryPolicy,
+    eviction_score,
+    initial_clock,
+    touch,
+)
+from app.storage.in_memory.lazyfree import LazyFree
+from app.storage.in_memory.memory import MemoryStats, data_size, entry_size
+from app.storage.in_memory.prefix_index import PrefixIndex, literal_prefix
+from app.storage.in_memory.scan import ScanTable, compile_pattern
 from app.storage.types import RedisValue
 
+T = TypeVar("T")
+
+
+# stale entries tolerated in the TTL index (on top of one entry per key with
+# an expiry) before it is rebuilt
+TTL_INDEX_SLACK = 1024
+
 
 class SimpleStorage(RedisStorage):
-    def __init__(self, db: dict | None = None):
+    def __init__(
+        self,
+        db: dict | None = None,
+        maxmemory: int = 0,
+        maxmemory_policy: MaxMemoryPolicy = MaxMemoryPolicy.NOEVICTION,
+        prefix_index: bool = False,
+        lazyfree: LazyFree | None = None,
+    ):
         self.db = db or {}
+        self.maxmemory = maxmemory  # max bytes used by keys, 0 means no limit
+        self.maxmemory_policy = maxmemory_policy
+        self.prefix_index = prefix_index  # index keys in order for KEYS
+        self.expired_keys = 0  # keys removed because they expired
+        self.evicted_keys = 0  # keys removed to free memory
+        self.used_memory_peak = 0
+        self._eviction_pool = EvictionPool()
+        self._lazyfree = lazyfree or LazyFree()  # frees removed keys lazily
+        self._rebuild_indexes()
+
+    def _rebuild_indexes(self):
+        """Compute memory usage and index keys for expiry (and eviction)."""
+        self.used_memory = sum(entry_size(k, v) for k, v in self.db.items())
+        self.used_memory_dataset = sum(data_size(k, v) for k, v in self.db.items())
+        self.used_memory_peak = max(self.used_memory_peak, self.used_memory)
+        self._rebuild_ttl_index()
+        self._scan_table = ScanTable(self.db)
+        self._prefix_index = PrefixIndex(self.db) if self.prefix_index else None
+
+        # keys are sampled by position for eviction from all keys, which a
+        # dict doesn't support
+        self._key_slots: list[bytes] | None = None
+        self._key_slot_of: dict[bytes, int] = {}
+        if self.maxmemory and self.maxmemory_policy.allkeys:
+            self._key_slots = list(self.db)
+            self._key_slot_of = {k: i for i, k in enumerate(self._key_slots)}
+
+    def _rebuild_ttl_index(self):
+        """Index keys with an expiry by expiry time.
+
+        Entries are invalidated lazily, an entry is stale if the key was
+        removed or its expiry has changed since the entry was pushed.
+        """
+        self._ttl_index = [(v.expiry, k) for k, v in self.db.items() if v.expiry]
+        self._volatile_keys = len(self._ttl_index)  # keys with an expiry
+        heapq.heapify(self._ttl_index)
+
+    def _account(self, key: bytes, value: RedisValue, sign: int):
+        """Add (sign=1) or remove (sign=-1) an entry from memory and expiry
+        accounting."""
+        self.used_memory += sign * entry_size(key, value)
+        self.used_memory_dataset += sign * data_size(key, value)
+        if value.expiry:
+            self._volatile_keys += sign
+        if self.used_memory > self.used_memory_peak:
+            self.used_memory_peak = self.used_memory
+
+    def _index_expiry(self, key: bytes, value: RedisValue, old_expiry: int | None):
+        if value.expiry and value.expiry != old_expiry:
+            heapq.heappush(self._ttl_index, (value.expiry, key))
+            if len(self._ttl_index) > 2 * self._volatile_keys + TTL_INDEX_SLACK:
+                self._rebuild_ttl_index()  # too many stale entries
+
+    def _store(self, key: bytes, value: RedisValue):
+        old = self.db.get(key)
+        if old is not None:
+            self._account(key, old, -1)
+        else:
+            self._scan_table.add(key)
+            if self._prefix_index is not None:
+                self._prefix_index.add(key)
+            if self._key_slots is not None:
+                self._key_slot_of[key] = len(self._key_slots)
+                self._key_slots.append(key)
+
+        if self.maxmemory:
+            value.lru = initial_clock(self.maxmemory_policy)
+        self.db[key] = value
+        self._account(key, value, 1)
+        self._index_expiry(key, value, old.expiry if old is not None else None)
+
+    def _unlink(self, key: bytes) -> RedisValue | None:
+        value = self.db.pop(key, None)
+        if value is None:
+            return None
+
+        self._account(key, value, -1)
+        self._scan_table.discard(key)
+        if self._prefix_index is not None:
+            self._prefix_index.discard(key)
+        if self._key_slots is not None:
+            # swap the last key into the slot of the removed key
+            slot = self._key_slot_of.pop(key)
+            last = self._key_slots.pop()
+            if last != key:
+                self._key_slots[slot] = last
+                self._key_slot_of[last] = slot
+        return value
+
+    def _sample_keys(self) -> list[bytes]:
+        """Sample keys that can be evicted under the eviction policy."""
+        if self._key_slots is not None:
+            slots = self._key_slots
+            return (
+                [random.choice(slots) for _ in range(MAXMEMORY_SAMPLES)]
+                if slots
+                else []
+            )
+
+        # keys with an expiry are sampled from the TTL index
+        samples = []
+        for _ in range(min(MAXMEMORY_SAMPLES, len(self._ttl_index))):
+            expiry, key = random.choice(self._ttl_index)
+            value = self.db.get(key)
+            if value is not None and value.expiry == expiry:
+                samples.append(key)
+        return samples
+
+    def _eviction_candidate(self) -> bytes | None:
+        policy = self.maxmemory_policy
+        if policy == MaxMemoryPolicy.NOEVICTION:
+            return None
+
+        pool = self._eviction_pool
+        for key in self._sample_keys():
+            value = self.db[key]
+            pool.insert(eviction_score(policy, value.lru, value.expiry), key)
+
+        # candidates may have been removed since they were sampled
+        while (key := pool.pop()) is not None:
+            value = self.db.get(key)
+            if value is not None and (policy.allkeys or value.expiry):
+                return key
+        return None
+
+    def _free_memory(self):
+        """Evict keys until used memory is within maxmemory, called before
+        writes.
+
+        Raises OutOfMemory if no key can be evicted.
+        """
+        if not self.maxmemory:
+            return
+        while self.used_memory > self.maxmemory:
+            key = self._eviction_candidate()
+            if key is None:
+                raise OutOfMemory
+            self._unlink(key)
+            self.evicted_keys += 1
 
     def _raise_if_expired(self, key: bytes, value: RedisValue):
         expiry = value.expiry
         if expiry and expiry < int(time() * 1000):
-            del self.db[key]
+            self._unlink(key)
+            self.expired_keys += 1
             raise KeyExpired(key)
 
     def _get_value(self, key: bytes) -> RedisValue:
@@ -36,8 +217,16 @@ class SimpleStorage(RedisStorage):
         if not value:
             raise KeyDoesNotExist(key)
         self._raise_if_expired(key, value)
+        if self.maxmemory:
+            value.lru = touch(self.maxmemory_policy, value.lru)
         return value
 
+    def _lookup(self, key: bytes) -> RedisValue | None:
+        try:
+            return self._get_value(key)
+        except (KeyDoesNotExist, KeyExpired):
+            return None
+
     def _validate_db(self, db: dict[bytes, RedisValue]):
         for k, v in db.items():
             if not isinstance(k, bytes):
@@ -49,26 +238,184 @@ class SimpleStorage(RedisStorage):
         return self._get_value(key)
 
     def set(self, key: bytes, value: RedisValue):
-        self.db[key] = value
+        self._free_memory()
+        self._store(key, value)
 
     def remove(self, key: bytes):
-        self.db.pop(key, None)
+        self._unlink(key)
+
+    def delete(self, keys: list[bytes], lazy: bool = False) -> int:
+        now = int(time() * 1000)
+        removed = 0
+        for key in keys:
+            value = self._unlink(key)
+            if value is None:
+                continue
+            if value.expiry and value.expiry < now:
+                self.expired_keys += 1
+                continue
+            if lazy:
+                self._lazyfree.free(value)
+            removed += 1
+        return removed
+
+    def flush(self, lazy: bool = False):
+        # the keyspace and its indexes are detached as is, and replaced with
+        # empty ones
+        detached = (
+            self.db,
+            self._ttl_index,
+            self._scan_table,
+            self._prefix_index,
+            self._key_slots,
+            self._key_slot_of,
+        )
+        keys = len(self.db)
+        self.db = {}
+        self._eviction_pool = EvictionPool()
+        self._rebuild_indexes()
+        if lazy:
+            self._lazyfree.free(detached, objects=keys, effort=keys)
 
     def keys(self, pattern: bytes | None = None) -> list[bytes]:
+        prefix = literal_prefix(pattern) if pattern else b""
+        if prefix and self._prefix_index is not None:
+            # only keys with the literal prefix can match
+            items = ((k, self.db[k]) for k in self._prefix_index.with_prefix(prefix))
+            if pattern == prefix + b"*":
+                pattern = None  # all keys with the prefix match
+        else:
+            items = self.db.items()
+
+        now = int(time() * 1000)
+        keys = [k for k, v in items if not (v.expiry and v.expiry < now)]
+        if pattern:
+            regex = compile_pattern(pattern)
+            return [k for k in keys if regex.fullmatch(k)] if regex else []
+        return keys
+
+    def scan(
+        self,
+        cursor: int,
+        count: int,
+        pattern: bytes | None = None,
+        type_name: str | None = None,
+    ) -> tuple[int, list[bytes]]:
+        cursor, keys = self._scan_table.scan(cursor, count)
+
+        # filters are applied on the keys of the step (like in Redis), so a
+        # step may return fewer keys than count (or none)
         if pattern:
-            try:
-                regex = re.compile(fnmatch.translate(pattern.decode()).encode())
-                return [k for k in self.db if regex.fullmatch(k)]
-            except UnicodeDecodeError:
-                return []
-        return list(self.db)
+            regex = compile_pattern(pattern)
+            keys = [k for k in keys if regex.fullmatch(k)] if regex else []
+
+        now = int(time() * 1000)
+        matches = []
+        for key in keys:
+            value = self.db[key]
+            if value.expiry and value.expiry < now:
+                continue
+            if type_name is None or value.type_name == type_name:
+                matches.append(key)
+        return cursor, matches
 
     def update(self, key: bytes, fn: Callable[[RedisValue], RedisValue]) -> RedisValue:
+        self._free_memory()
         value = self._get_value(key)
-        updated = fn(value)
+
+        # the update function can modify the value in place
+        self._account(key, value, -1)
+        expiry = value.expiry
+        try:
+            updated = fn(value)
+        except Exception:
+            self._account(key, value, 1)  # value is left as is
+            raise
         self.db[key] = updated
+        self._account(key, updated, 1)
+        self._index_expiry(key, updated, expiry)
         return updated
 
+    def upsert(
+        self,
+        key: bytes,
+        fn: Callable[[RedisValue | None], RedisValue | None],
+        free_memory: bool = True,
+    ) -> RedisValue | None:
+        if free_memory:
+            self._free_memory()
+        value = self._lookup(key)
+        if value is None:
+            created = fn(None)
+            if created is not None:
+                self._store(key, created)
+            return created
+
+        # the update function can modify the value in place
+        self._account(key, value, -1)
+        expiry = value.expiry
+        try:
+            updated = fn(value)
+        except Exception:
+            self._account(key, value, 1)  # value is left as is
+            raise
+        if updated is None:
+            self._account(key, value, 1)  # accounted for again when unlinked
+            self._unlink(key)
+            return None
+        self.db[key] = updated
+        self._account(key, updated, 1)
+        self._index_expiry(key, updated, expiry)
+        return updated
+
+    def view(self, key: bytes, fn: Callable[[RedisValue | None], T]) -> T:
+        return fn(self._lookup(key))
+
+    def view_many(
+        self, keys: list[bytes], fn: Callable[[list[RedisValue | None]], T]
+    ) -> T:
+        return fn([self._lookup(key) for key in keys])
+
     def restore(self, db: dict[bytes, RedisValue]):
         self._validate_db(db)
         self.db = db
+        self._rebuild_indexes()
+
+    def active_expire(self, max_keys: int) -> int:
+        now = int(time() * 1000)
+        index = self._ttl_index
+        expired = 0
+        while index and expired < max_keys:
+            expiry, key = index[0]
+            if expiry >= now:
+                break  # no other key in the index has expired
+            heapq.heappop(index)
+
+            value = self.db.get(key)
+            if value is None or value.expiry != expiry:
+                continue  # stale entry
+            self._unlink(key)
+            expired += 1
+
+        self.expired_keys += expired
+        return expired
+
+    def expire_stats(self) -> tuple[int, int]:
+        return self.expired_keys, self._volatile_keys
+
+    def memory_stats(self) -> MemoryStats:
+        return MemoryStats(
+            used_memory=self.used_memory,
+            used_memory_peak=self.used_memory_peak,
+            used_memory_dataset=self.used_memory_dataset,
+            keys=len(self.db),
+            evicted_keys=self.evicted_keys,
+            lazyfree_pending_objects=self._lazyfree.pending_objects,
+        )
+
+    def memory_usage(self, key: bytes) -> int:
+        value = self.db.get(key)
+        if value is None:
+            raise KeyDoesNotExist(key)
+        self._raise_if_expired(key, value)
+        return entry_size(key, value)
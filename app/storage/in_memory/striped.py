@@ -0,0 +1,211 @@
+"""StripedLockStorage is a thread-safe in-memory store that partitions the
+keyspace into a fixed number of stripes, each a SimpleStorage guarded by its
+own lock.
+
+Unlike ThreadSafeStorage, where a single global lock serializes all
+connection threads, operations on keys in different stripes don't contend
+with each other. Operations spanning multiple stripes (eg, KEYS or RESTORE)
+acquire the locks of all involved stripes in ascending order, so they can't
+deadlock with each other.
+
+SCAN iterates over stripes one after the other, holding only the lock of
+the stripe being scanned. The stripe is encoded in the low bits of the
+cursor returned to clients.
+
+With maxmemory set, each stripe is limited to an equal share of it and
+evicts keys independently.
+"""
+
+import threading
+from contextlib import contextmanager
+from typing import Callable, Iterable, Iterator, TypeVar
+
+from app.storage.in_memory.base import RedisStorage
+from app.storage.in_memory.eviction import MaxMemoryPolicy
+from app.storage.in_memory.lazyfree import LazyFree
+from app.storage.in_memory.memory import MemoryStats
+from app.storage.in_memory.simple import SimpleStorage
+from app.storage.types import RedisValue
+
+DEFAULT_STRIPES = 64
+
+T = TypeVar("T")
+
+
+class StripedLockStorage(RedisStorage):
+    def __init__(
+        self,
+        db: dict | None = None,
+        maxmemory: int = 0,
+        maxmemory_policy: MaxMemoryPolicy = MaxMemoryPolicy.NOEVICTION,
+        prefix_index: bool = False,
+        stripes: int = DEFAULT_STRIPES,
+    ):
+        stripe_maxmemory = -(-maxmemory // stripes)  # rounded up
+        lazyfree = LazyFree()  # a single background thread for all stripes
+        self._stripes = [
+            SimpleStorage(
+                maxmemory=stripe_maxmemory,
+                maxmemory_policy=maxmemory_policy,
+                prefix_index=prefix_index,
+                lazyfree=lazyfree,
+            )
+            for _ in range(stripes)
+        ]
+        self._locks = [threading.RLock() for _ in range(stripes)]
+        self._next_expire_stripe = 0  # stripes are expired round-robin
+        if db:
+            self.restore(db)
+
+    def _stripe_of(self, key: bytes) -> int:
+        return hash(key) % len(self._stripes)
+
+    @contextmanager
+    def locked(self, keys: Iterable[bytes] | None = None) -> Iterator[None]:
+        """Holds the locks of all stripes the keys belong to (or all stripes
+        if no keys are provided) for multi-key operations.
+
+        Locks are always acquired in ascending stripe order.
+        """
+        if keys is None:
+            stripes = range(len(self._stripes))
+        else:
+            stripes = sorted({self._stripe_of(key) for key in keys})
+
+        acquired = []
+        try:
+            for stripe in stripes:
+                self._locks[stripe].acquire()
+                acquired.append(stripe)
+            yield
+        finally:
+            for stripe in reversed(acquired):
+                self._locks[stripe].release()
+
+    def get(self, key: bytes) -> RedisValue:
+        stripe = self._stripe_of(key)
+        with self._locks[stripe]:
+            return self._stripes[stripe].get(key)
+
+    def set(self, key: bytes, value: RedisValue):
+        stripe = self._stripe_of(key)
+        with self._locks[stripe]:
+            self._stripes[stripe].set(key, value)
+
+    def remove(self, key: bytes):
+        stripe = self._stripe_of(key)
+        with self._locks[stripe]:
+            self._stripes[stripe].remove(key)
+
+    def delete(self, keys: list[bytes], lazy: bool = False) -> int:
+        by_stripe: dict[int, list[bytes]] = {}
+        for key in keys:
+            by_stripe.setdefault(self._stripe_of(key), []).append(key)
+
+        with self.locked(keys):
+            return sum(
+                self._stripes[stripe].delete(stripe_keys, lazy)
+                for stripe, stripe_keys in by_stripe.items()
+            )
+
+    def flush(self, lazy: bool = False):
+        with self.locked():
+            for storage in self._stripes:
+                storage.flush(lazy)
+
+    def keys(self, pattern: bytes | None = None) -> list[bytes]:
+        with self.locked():
+            keys = []
+            for storage in self._stripes:
+                keys.extend(storage.keys(pattern))
+            return keys
+
+    def scan(
+        self,
+        cursor: int,
+        count: int,
+        pattern: bytes | None = None,
+        type_name: str | None = None,
+    ) -> tuple[int, list[bytes]]:
+        stripes = len(self._stripes)
+        stripe, stripe_cursor = cursor % stripes, cursor // stripes
+        with self._locks[stripe]:
+            stripe_cursor, keys = self._stripes[stripe].scan(
+                stripe_cursor, count, pattern, type_name
+            )
+
+        if stripe_cursor == 0:
+            # continue from the start of the next stripe, if any
+            return (stripe + 1 if stripe + 1 < stripes else 0), keys
+        return stripe_cursor * stripes + stripe, keys
+
+    def update(self, key: bytes, fn: Callable[[RedisValue], RedisValue]) -> RedisValue:
+        stripe = self._stripe_of(key)
+        with self._locks[stripe]:
+            return self._stripes[stripe].update(key, fn)
+
+    def upsert(
+        self,
+        key: bytes,
+        fn: Callable[[RedisValue | None], RedisValue | None],
+        free_memory: bool = True,
+    ) -> RedisValue | None:
+        stripe = self._stripe_of(key)
+        with self._locks[stripe]:
+            return self._stripes[stripe].upsert(key, fn, free_memory)
+
+    def view(self, key: bytes, fn: Callable[[RedisValue | None], T]) -> T:
+        stripe = self._stripe_of(key)
+        with self._locks[stripe]:
+            return self._stripes[stripe].view(key, fn)
+
+    def view_many(
+        self, keys: list[bytes], fn: Callable[[list[RedisValue | None]], T]
+    ) -> T:
+        with self.locked(keys):
+            values = [
+                self._stripes[self._stripe_of(key)].view(key, lambda value: value)
+                for key in keys
+            ]
+            return fn(values)
+
+    def restore(self, db: dict[bytes, RedisValue]):
+        partitions: list[dict[bytes, RedisValue]] = [{} for _ in self._stripes]
+        for key, value in db.items():
+            partitions[self._stripe_of(key)][key] = value
+
+        with self.locked():
+            for storage, partition in zip(self._stripes, partitions):
+                storage.restore(partition)
+
+    def active_expire(self, max_keys: int) -> int:
+        expired = 0
+        for _ in range(len(self._stripes)):
+            stripe = self._next_expire_stripe
+            self._next_expire_stripe = (stripe + 1) % len(self._stripes)
+            with self._locks[stripe]:
+                expired += self._stripes[stripe].active_expire(max_keys - expired)
+            if expired >= max_keys:
+                break
+        return expired
+
+    def expire_stats(self) -> tuple[int, int]:
+        expired_keys = volatile_keys = 0
+        for stripe, storage in enumerate(self._stripes):
+            with self._locks[stripe]:
+                expired, volatile = storage.expire_stats()
+            expired_keys += expired
+            volatile_keys += volatile
+        return expired_keys, volatile_keys
+
+    def memory_stats(self) -> MemoryStats:
+        stats = MemoryStats()
+        for stripe, storage in enumerate(self._stripes):
+            with self._locks[stripe]:
+                stats += storage.memory_stats()
+        return stats
+
+    def memory_usage(self, key: bytes) -> int:
+        stripe = self._stripe_of(key)
+        with self._locks[stripe]:
+            return self._stripes[stripe].memory_usage(key)
@@ -7,16 +7,26 @@ mechanisms, making it suitable for multi-threaded contexts.
 """
 
 import threading
-from typing import Callable
+from typing import Callable, TypeVar
 
+from app.storage.in_memory.eviction import MaxMemoryPolicy
+from app.storage.in_memory.memory import MemoryStats
 from app.storage.in_memory.simple import SimpleStorage
 from app.storage.types import RedisValue
 
+T = TypeVar("T")
+
 
 class ThreadSafeStorage(SimpleStorage):
-    def __init__(self, db: dict | None = None):
+    def __init__(
+        self,
+        db: dict | None = None,
+        maxmemory: int = 0,
+        maxmemory_policy: MaxMemoryPolicy = MaxMemoryPolicy.NOEVICTION,
+        prefix_index: bool = False,
+    ):
         self._lock = threading.RLock()  # use a re-entrant lock
-        super().__init__(db)
+        super().__init__(db, maxmemory, maxmemory_policy, prefix_index)
 
     def set(self, key: bytes, value: RedisValue):
         with self._lock:
@@ -30,14 +40,67 @@ class ThreadSafeStorage(SimpleStorage):
         with self._lock:
             super().remove(key)
 
+    def delete(self, keys: list[bytes], lazy: bool = False) -> int:
+        with self._lock:
+            return super().delete(keys, lazy)
+
+    def flush(self, lazy: bool = False):
+        with self._lock:
+            super().flush(lazy)
+
     def keys(self, pattern: bytes | None = None) -> list[bytes]:
         with self._lock:
             return super().keys(pattern)
 
+    def scan(
+        self,
+        cursor: int,
+        count: int,
+        pattern: bytes | None = None,
+        type_name: str | None = None,
+    ) -> tuple[int, list[bytes]]:
+        with self._lock:
+            return super().scan(cursor, count, pattern, type_name)
+
     def update(self, key: bytes, fn: Callable[[RedisValue], RedisValue]) -> RedisValue:
         with self._lock:
             return super().update(key, fn)
 
+    def upsert(
+        self,
+        key: bytes,
+        fn: Callable[[RedisValue | None], RedisValue | None],
+        free_memory: bool = True,
+    ) -> RedisValue | None:
+        with self._lock:
+            return super().upsert(key, fn, free_memory)
+
+    def view(self, key: bytes, fn: Callable[[RedisValue | None], T]) -> T:
+        with self._lock:
+            return super().view(key, fn)
+
+    def view_many(
+        self, keys: list[bytes], fn: Callable[[list[RedisValue | None]], T]
+    ) -> T:
+        with self._lock:
+            return super().view_many(keys, fn)
+
     def restore(self, db: dict[bytes, RedisValue]):
         with self._lock:
             return super().restore(db)
+
+    def active_expire(self, max_keys: int) -> int:
+        with self._lock:
+            return super().active_expire(max_keys)
+
+    def expire_stats(self) -> tuple[int, int]:
+        with self._lock:
+            return super().expire_stats()
+
+    def memory_stats(self) -> MemoryStats:
+        with self._lock:
+            return super().memory_stats()
+
+    def memory_usage(self, key: bytes) -> int:
+        with self._lock:
+            return super().memory_usage(key)
@@ -202,7 +202,12 @@ class RDBParser:
             raise UnknownEncoding(f"{encoding} is not a valid value type")
 
         key = self._read_string_encoding(reader)[0]
-        value_raw_bytes, _ = self._read_string_encoding(reader)
+        value_raw_bytes, string_encoding = self._read_string_encoding(reader)
+        if string_encoding == StringEncodingType.INTEGER:
+            # load integer encoded strings as int encoded values
+            value = int.from_bytes(value_raw_bytes, "little", signed=True)
+            return key, RedisValue(expiry=expiry, raw_bytes=value, encoding=encoding)
+
         return key, RedisValue(
             expiry=expiry, raw_bytes=value_raw_bytes, encoding=encoding
         )
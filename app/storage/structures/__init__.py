@@ -0,0 +1,22 @@
+"""Data structures backing values of non-string types (eg, lists)."""
+
+from .hash import Hash, HashTable, Listpack
+from .quicklist import QuickList
+from .set import HashSet, IntSet, Set
+from .stream import Stream, StreamID
+from .zset import SortedSet, ZListpack, ZSet
+
+__all__ = [
+    "Hash",
+    "HashTable",
+    "Listpack",
+    "QuickList",
+    "HashSet",
+    "IntSet",
+    "Set",
+    "Stream",
+    "StreamID",
+    "SortedSet",
+    "ZListpack",
+    "ZSet",
+]
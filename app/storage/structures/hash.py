@@ -0,0 +1,193 @@
+"""This file contains the structures backing hash values, in one of two
+encodings (like in Redis):
+
+- `Listpack` for small hashes: fields and values are concatenated in a
+  single bytes object along with an array of offsets, so a field costs a
+  few bytes on top of its contents instead of a dict entry and two python
+  objects. Lookups compare fields in place (without slicing them out), and
+  writes rebuild the packed object, which stays cheap while it is small.
+- `HashTable` for large hashes: a dict, along with a scan table of its
+  fields for cursor based iteration (HSCAN).
+
+A hash starts as a listpack and is converted to a hash table for good once
+it holds more than `max_listpack_entries` fields or a field or value longer
+than `max_listpack_value` bytes (see `hash-max-listpack-entries` and
+`hash-max-listpack-value` in the config).
+"""
+
+import sys
+from array import array
+from typing import Iterable
+
+from app.storage.in_memory.scan import ScanTable
+from app.storage.structures.packed import find, offsets_of, widen
+
+Pairs = Iterable[tuple[bytes, bytes]]
+
+_BYTES_OVERHEAD = sys.getsizeof(b"")
+_POINTER_SIZE = 8
+
+
+class Listpack:
+    """Hash of few short fields, packed in a single bytes object.
+
+    Elements alternate between fields and values, in insertion order.
+    """
+
+    __slots__ = ("data", "offsets")
+
+    def __init__(self, pairs: Pairs = ()):
+        self._pack([element for pair in pairs for element in pair])
+
+    def _pack(self, elements: list[bytes]):
+        self.data = b"".join(elements)
+        self.offsets = offsets_of(elements)
+
+    def __len__(self) -> int:
+        return len(self.offsets) // 2
+
+    def _find(self, field: bytes) -> int:
+        """Index of the element holding field, -1 if there is none."""
+        return find(self.data, self.offsets, field, step=2)
+
+    def _element(self, i: int) -> bytes:
+        return self.data[self.offsets[i] : self.offsets[i + 1]]
+
+    def get(self, field: bytes) -> bytes | None:
+        i = self._find(field)
+        return None if i == -1 else self._element(i + 1)
+
+    def items(self) -> list[tuple[bytes, bytes]]:
+        elements = [self._element(i) for i in range(len(self.offsets) - 1)]
+        return list(zip(elements[::2], elements[1::2]))
+
+    def update(self, pairs: Pairs) -> int:
+        """Sets fields to values, returns the number of fields added.
+
+        Values of existing fields are replaced in place and new fields are
+        appended, each copies the packed object once.
+        """
+        added = 0
+        for field, value in pairs:
+            i = self._find(field)
+            if i == -1:
+                self._append(field, value)
+                added += 1
+            else:
+                self._replace(i + 1, value)
+        return added
+
+    def _append(self, field: bytes, value: bytes):
+        end = len(self.data)
+        self.data += field + value
+        self.offsets = widen(self.offsets, len(self.data))
+        self.offsets.append(end + len(field))
+        self.offsets.append(len(self.data))
+
+    def _replace(self, i: int, element: bytes):
+        offsets = self.offsets
+        start, end = offsets[i], offsets[i + 1]
+        self.data = self.data[:start] + element + self.data[end:]
+        delta = len(element) - (end - start)
+        if delta:
+            shifted = [offset + delta for offset in offsets[i + 1 :]]
+            offsets = self.offsets = widen(offsets, shifted[-1])
+            offsets[i + 1 :] = array(offsets.typecode, shifted)
+
+    def delete(self, fields: Iterable[bytes]) -> int:
+        """Removes fields, returns the number of fields removed."""
+        remaining = dict(self.items())
+        size = len(remaining)
+        for field in fields:
+            remaining.pop(field, None)
+        if len(remaining) < size:
+            self._pack([element for pair in remaining.items() for element in pair])
+        return size - len(remaining)
+
+    def scan(self, cursor: int, count: int) -> tuple[int, list[tuple[bytes, bytes]]]:
+        """Small hashes are returned whole in a single step (like in Redis)."""
+        return 0, self.items()
+
+    def data_size(self) -> int:
+        """Number of bytes of the fields and values."""
+        return len(self.data)
+
+    def memory_usage(self) -> int:
+        """Estimated number of bytes used by the hash, in O(1)."""
+        return (
+            sys.getsizeof(self) + sys.getsizeof(self.data) + sys.getsizeof(self.offsets)
+        )
+
+
+class HashTable:
+    """Hash of any size, backed by a dict."""
+
+    __slots__ = ("_fields", "_scan_table", "_nbytes")
+
+    def __init__(self, pairs: Pairs = ()):
+        self._fields: dict[bytes, bytes] = {}
+        self._scan_table: ScanTable[bytes] = ScanTable()
+        self._nbytes = 0  # total length of fields and values
+        self.update(pairs)
+
+    def __len__(self) -> int:
+        return len(self._fields)
+
+    def get(self, field: bytes) -> bytes | None:
+        return self._fields.get(field)
+
+    def items(self) -> list[tuple[bytes, bytes]]:
+        return list(self._fields.items())
+
+    def update(self, pairs: Pairs) -> int:
+        """Sets fields to values, returns the number of fields added."""
+        fields = self._fields
+        added = 0
+        for field, value in pairs:
+            old = fields.get(field)
+            if old is None:
+                self._scan_table.add(field)
+                self._nbytes += len(field)
+                added += 1
+            else:
+                self._nbytes -= len(old)
+            fields[field] = value
+            self._nbytes += len(value)
+        return added
+
+    def delete(self, fields: Iterable[bytes]) -> int:
+        """Removes fields, returns the number of fields removed."""
+        removed = 0
+        for field in fields:
+            value = self._fields.pop(field, None)
+            if value is not None:
+                self._scan_table.discard(field)
+                self._nbytes -= len(field) + len(value)
+                removed += 1
+        return removed
+
+    def scan(self, cursor: int, count: int) -> tuple[int, list[tuple[bytes, bytes]]]:
+        """Visits about count fields from cursor (see `ScanTable.scan`),
+        returns the cursor to continue from and the visited fields along with
+        their values."""
+        cursor, fields = self._scan_table.scan(cursor, count)
+        return cursor, [(field, self._fields[field]) for field in fields]
+
+    def data_size(self) -> int:
+        """Number of bytes of the fields and values."""
+        return self._nbytes
+
+    def memory_usage(self) -> int:
+        """Estimated number of bytes used by the hash, in O(1)."""
+        # a bytes object for each field and value, and about two buckets of
+        # the scan table per field
+        size = len(self._fields)
+        return (
+            sys.getsizeof(self)
+            + sys.getsizeof(self._fields)
+            + self._nbytes
+            + 2 * size * (_BYTES_OVERHEAD + _POINTER_SIZE)
+        )
+
+
+Hash = Listpack | HashTable
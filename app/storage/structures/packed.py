@@ -0,0 +1,45 @@
+"""This file contains helpers for elements packed in a single bytes object
+along with an array of offsets (see `Listpack` and `ZListpack`).
+
+Offsets are where each element starts, followed by the end of the last
+element, with the smallest item size that fits the data.
+"""
+
+from array import array
+from bisect import bisect_left
+from itertools import accumulate
+
+_MAX_SHORT_OFFSET = 2**16 - 1
+
+
+def offsets_of(elements: list[bytes]) -> array:
+    typecode = "H" if sum(map(len, elements)) <= _MAX_SHORT_OFFSET else "I"
+    return array(typecode, accumulate(map(len, elements), initial=0))
+
+
+def widen(offsets: array, end: int) -> array:
+    """Offsets with an item size that fits end (offsets as is if they do)."""
+    if offsets.typecode == "H" and end > _MAX_SHORT_OFFSET:
+        return array("I", offsets)
+    return offsets
+
+
+def find(data: bytes, offsets: array, element: bytes, step: int = 1) -> int:
+    """Index of the element equal to element, -1 if there is none. Only
+    elements at indexes that are multiples of step are compared (eg, fields
+    of a hash, not values).
+
+    Occurrences are found in data and only compared with elements they
+    start at, so elements are never sliced out of data.
+    """
+    size, last = len(element), len(offsets) - 1
+    pos = data.find(element)
+    while pos != -1:
+        # empty elements share their offset with the next one
+        i = bisect_left(offsets, pos)
+        while i < last and offsets[i] == pos:
+            if i % step == 0 and offsets[i + 1] - pos == size:
+                return i
+            i += 1
+        pos = data.find(element, pos + 1)
+    return -1
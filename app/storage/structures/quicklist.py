@@ -0,0 +1,239 @@
+"""This file contains QuickList, the structure backing list values.
+
+Like the quicklist in Redis, a list is a deque of chunks of up to
+CHUNK_SIZE elements. Chunks in the middle of the list are packed (elements
+concatenated in a single bytes object along with an array of offsets), so
+large lists cost a few bytes per element on top of the elements
+themselves, instead of a python object and a pointer per element.
+
+Only chunks at either end of the list are modified by pushes and pops.
+They are kept as python lists while being modified, and packed once full
+(or unpacked when popped from), so both ends are O(1) amortized. Since a
+new chunk is only started once the end chunk is full, chunks in the middle
+always hold exactly CHUNK_SIZE elements, and the chunk holding an index is
+found without walking the chunks.
+"""
+
+import sys
+from array import array
+from collections import deque
+from itertools import accumulate
+from typing import Iterable
+
+CHUNK_SIZE = 128  # max elements per chunk
+
+
+class PackedChunk:
+    """Immutable chunk of elements packed in a single bytes object."""
+
+    __slots__ = ("data", "offsets")
+
+    def __init__(self, elements: list[bytes]):
+        self.data = b"".join(elements)
+        # offsets where elements start, followed by the end of the last one
+        self.offsets = array("I", accumulate(map(len, elements), initial=0))
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index: int) -> bytes:
+        return self.data[self.offsets[index] : self.offsets[index + 1]]
+
+    def slice(self, start: int, stop: int) -> list[bytes]:
+        data, offsets = self.data, self.offsets
+        return [data[offsets[i] : offsets[i + 1]] for i in range(start, stop)]
+
+    def unpack(self) -> list[bytes]:
+        return self.slice(0, len(self))
+
+
+Chunk = list[bytes] | PackedChunk
+
+_BYTES_OVERHEAD = sys.getsizeof(b"")
+_POINTER_SIZE = 8
+_OFFSET_SIZE = array("I").itemsize
+_CHUNK_OVERHEAD = (
+    sys.getsizeof(PackedChunk([])) + _BYTES_OVERHEAD + sys.getsizeof(array("I"))
+)
+
+
+def _chunk_nbytes(chunk: Chunk) -> int:
+    if type(chunk) is list:
+        return sum(map(len, chunk))
+    return len(chunk.data)
+
+
+def _chunk_slice(chunk: Chunk, start: int, stop: int) -> list[bytes]:
+    if type(chunk) is list:
+        return chunk[start:stop]
+    return chunk.slice(start, stop)
+
+
+class QuickList:
+    """List of byte strings with O(1) pushes and pops at both ends."""
+
+    __slots__ = ("_chunks", "_len", "_nbytes")
+
+    def __init__(self, elements: Iterable[bytes] = ()):
+        self._chunks: deque[Chunk] = deque()
+        self._len = 0
+        self._nbytes = 0  # total length of elements
+        for element in elements:
+            self.push_right(element)
+
+    def __len__(self) -> int:
+        return self._len
+
+    def _head(self) -> list[bytes]:
+        """First chunk, unpacked to be modified in place."""
+        chunk = self._chunks[0]
+        if type(chunk) is not list:
+            chunk = self._chunks[0] = chunk.unpack()
+        return chunk
+
+    def _tail(self) -> list[bytes]:
+        """Last chunk, unpacked to be modified in place."""
+        chunk = self._chunks[-1]
+        if type(chunk) is not list:
+            chunk = self._chunks[-1] = chunk.unpack()
+        return chunk
+
+    def push_left(self, element: bytes):
+        chunks = self._chunks
+        if chunks and len(chunks[0]) < CHUNK_SIZE:
+            self._head().insert(0, element)
+        else:
+            if chunks and type(chunks[0]) is list:
+                chunks[0] = PackedChunk(chunks[0])  # full, no longer at the end
+            chunks.appendleft([element])
+        self._len += 1
+        self._nbytes += len(element)
+
+    def push_right(self, element: bytes):
+        chunks = self._chunks
+        if chunks and len(chunks[-1]) < CHUNK_SIZE:
+            self._tail().append(element)
+        else:
+            if chunks and type(chunks[-1]) is list:
+                chunks[-1] = PackedChunk(chunks[-1])  # full, no longer at the end
+            chunks.append([element])
+        self._len += 1
+        self._nbytes += len(element)
+
+    def pop_left(self) -> bytes:
+        """Removes and returns the first element, raises IndexError if the
+        list is empty."""
+        if not self._len:
+            raise IndexError("pop from an empty list")
+        head = self._head()
+        element = head.pop(0)
+        if not head:
+            self._chunks.popleft()
+        self._len -= 1
+        self._nbytes -= len(element)
+        return element
+
+    def pop_right(self) -> bytes:
+        """Removes and returns the last element, raises IndexError if the
+        list is empty."""
+        if not self._len:
+            raise IndexError("pop from an empty list")
+        tail = self._tail()
+        element = tail.pop()
+        if not tail:
+            self._chunks.pop()
+        self._len -= 1
+        self._nbytes -= len(element)
+        return element
+
+    def _locate(self, index: int) -> tuple[int, int]:
+        """Position of the chunk holding the element at index (within
+        bounds), and of the element in the chunk."""
+        head = len(self._chunks[0])
+        if index < head:
+            return 0, index
+        chunk, offset = divmod(index - head, CHUNK_SIZE)
+        return chunk + 1, offset
+
+    def index(self, index: int) -> bytes:
+        """Element at index (negative indexes count from the end), raises
+        IndexError if out of range."""
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("list index out of range")
+        chunk, offset = self._locate(index)
+        return self._chunks[chunk][offset]
+
+    def range(self, start: int, stop: int) -> list[bytes]:
+        """Elements from start up to (excluding) stop, both within bounds."""
+        elements: list[bytes] = []
+        if start >= stop:
+            return elements
+
+        first, offset = self._locate(start)
+        last, _ = self._locate(stop - 1)
+        chunks = self._chunks
+        remaining = stop - start
+        # chunks are indexed rather than sliced (islice would step over the
+        # chunks before first one at a time, indexing a deque skips over
+        # whole blocks of it from the nearest end)
+        for i in range(first, last + 1):
+            chunk = chunks[i]
+            end = min(offset + remaining, len(chunk))
+            elements.extend(_chunk_slice(chunk, offset, end))
+            remaining -= end - offset
+            offset = 0
+        return elements
+
+    def trim(self, start: int, stop: int):
+        """Keeps only elements from start up to (excluding) stop, both within
+        bounds. Chunks out of the range are dropped as a whole."""
+        if start >= stop:
+            self._chunks.clear()
+            self._len = self._nbytes = 0
+            return
+
+        remove = self._len - stop
+        while remove:
+            size = len(self._chunks[-1])
+            if size <= remove:
+                self._nbytes -= _chunk_nbytes(self._chunks.pop())
+                remove -= size
+            else:
+                tail = self._tail()
+                self._nbytes -= sum(map(len, tail[size - remove :]))
+                del tail[size - remove :]
+                remove = 0
+
+        remove = start
+        while remove:
+            size = len(self._chunks[0])
+            if size <= remove:
+                self._nbytes -= _chunk_nbytes(self._chunks.popleft())
+                remove -= size
+            else:
+                head = self._head()
+                self._nbytes -= sum(map(len, head[:remove]))
+                del head[:remove]
+                remove = 0
+
+        self._len = stop - start
+
+    def data_size(self) -> int:
+        """Number of bytes of the elements."""
+        return self._nbytes
+
+    def memory_usage(self) -> int:
+        """Estimated number of bytes used by the list, in O(1)."""
+        chunks = self._chunks
+        ends = (chunks[0], chunks[-1]) if len(chunks) > 1 else chunks
+        unpacked = sum(len(chunk) for chunk in ends if type(chunk) is list)
+        return (
+            sys.getsizeof(self)
+            + sys.getsizeof(chunks)
+            + len(chunks) * _CHUNK_OVERHEAD
+            + self._nbytes
+            + unpacked * (_POINTER_SIZE + _BYTES_OVERHEAD)
+            + (self._len - unpacked) * _OFFSET_SIZE
+        )
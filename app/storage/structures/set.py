@@ -0,0 +1,245 @@
+"""This file contains the structures backing set values, in one of two
+encodings (like in Redis):
+
+- `IntSet` for sets of integers: members are kept sorted in an array of 64
+  bit integers, so a member costs 8 bytes instead of a set slot and a
+  python object, and membership is a binary search.
+- `HashSet` for any other set: a python set of byte strings.
+
+A set starts as an intset while all its members are integers (in canonical
+form, see `int_or_bytes`) and is converted to a hash set for good once a
+member isn't an integer or it holds more than `max_intset_entries` members
+(see `set-max-intset-entries` in the config).
+
+Set algebra (`intersection`, `union` and `difference`) works on both
+encodings, and compares integers without formatting them while all sets
+involved are intsets.
+"""
+
+import sys
+from array import array
+from bisect import bisect_left
+from typing import Iterable, Iterator
+
+from app.storage.in_memory.scan import ScanTable
+from app.storage.types import int_or_bytes
+
+INT_MEMBER_SIZE = 8  # intset members count as a 64 bit integer
+BULK_ADD_SIZE = 16  # intsets are sorted again when adding more numbers at once
+# intersections binary search an intset for each candidate while it holds
+# this many times more members (a lookup costs more than a member iterated
+# over by a set intersection)
+BISECT_RATIO = 32
+
+_BYTES_OVERHEAD = sys.getsizeof(b"")
+_POINTER_SIZE = 8
+
+
+def int_member(member: bytes) -> int | None:
+    """Integer value of a member that can be stored in an intset, None if
+    it isn't one."""
+    number = int_or_bytes(member)
+    return number if isinstance(number, int) else None
+
+
+class IntSet:
+    """Set of 64 bit integers, sorted in an array."""
+
+    __slots__ = ("_members",)
+
+    def __init__(self, numbers: Iterable[int] = ()):
+        self._members = array("q", sorted(set(numbers)))
+
+    def __len__(self) -> int:
+        return len(self._members)
+
+    def __iter__(self) -> Iterator[bytes]:
+        return (b"%d" % number for number in self._members)
+
+    def __contains__(self, member: bytes) -> bool:
+        try:
+            number = int(member)
+        except ValueError:
+            return False
+        # members are integers in canonical form, which is checked last since
+        # most lookups of a non canonical form (eg, "+1") find no number
+        return self.has(number) and b"%d" % number == member
+
+    def has(self, number: int) -> bool:
+        members = self._members
+        i = bisect_left(members, number)
+        return i < len(members) and members[i] == number
+
+    def numbers(self) -> array:
+        """Members in ascending order (not to be modified)."""
+        return self._members
+
+    def add(self, numbers: Iterable[int]) -> int:
+        """Adds numbers, returns the number of members added.
+
+        Numbers are inserted one at a time (moving the members after them),
+        or merged by sorting the members again when adding many at once.
+        """
+        numbers = list(numbers)
+        members = self._members
+        if len(numbers) > BULK_ADD_SIZE:
+            merged = set(members)
+            size = len(merged)
+            merged.update(numbers)
+            self._members = array("q", sorted(merged))
+            return len(merged) - size
+
+        added = 0
+        for number in numbers:
+            i = bisect_left(members, number)
+            if i == len(members) or members[i] != number:
+                members.insert(i, number)
+                added += 1
+        return added
+
+    def remove(self, members: Iterable[bytes]) -> int:
+        """Removes members, returns the number of members removed."""
+        numbers = self._members
+        removed = 0
+        for member in members:
+            number = int_member(member)
+            if number is None:
+                continue
+            i = bisect_left(numbers, number)
+            if i < len(numbers) and numbers[i] == number:
+                del numbers[i]
+                removed += 1
+        return removed
+
+    def scan(self, cursor: int, count: int) -> tuple[int, list[bytes]]:
+        """Intsets are returned whole in a single step (like in Redis)."""
+        return 0, list(self)
+
+    def data_size(self) -> int:
+        """Number of bytes of the members."""
+        return len(self._members) * INT_MEMBER_SIZE
+
+    def memory_usage(self) -> int:
+        """Estimated number of bytes used by the set, in O(1)."""
+        return sys.getsizeof(self) + sys.getsizeof(self._members)
+
+
+class HashSet:
+    """Set of any byte strings, backed by a python set."""
+
+    __slots__ = ("_members", "_scan_table", "_nbytes")
+
+    def __init__(self, members: Iterable[bytes] = ()):
+        self._members: set[bytes] = set()
+        self._scan_table: ScanTable[bytes] = ScanTable()
+        self._nbytes = 0  # total length of members
+        self.add(members)
+
+    def __len__(self) -> int:
+        return len(self._members)
+
+    def __iter__(self) -> Iterator[bytes]:
+        return iter(self._members)
+
+    def __contains__(self, member: bytes) -> bool:
+        return member in self._members
+
+    def add(self, members: Iterable[bytes]) -> int:
+        """Adds members, returns the number of members added."""
+        added = 0
+        for member in members:
+            if member not in self._members:
+                self._members.add(member)
+                self._scan_table.add(member)
+                self._nbytes += len(member)
+                added += 1
+        return added
+
+    def remove(self, members: Iterable[bytes]) -> int:
+        """Removes members, returns the number of members removed."""
+        removed = 0
+        for member in members:
+            if member in self._members:
+                self._members.remove(member)
+                self._scan_table.discard(member)
+                self._nbytes -= len(member)
+                removed += 1
+        return removed
+
+    def scan(self, cursor: int, count: int) -> tuple[int, list[bytes]]:
+        """Visits about count members from cursor (see `ScanTable.scan`),
+        returns the cursor to continue from and the visited members."""
+        return self._scan_table.scan(cursor, count)
+
+    def data_size(self) -> int:
+        """Number of bytes of the members."""
+        return self._nbytes
+
+    def memory_usage(self) -> int:
+        """Estimated number of bytes used by the set, in O(1)."""
+        # a bytes object per member, and about two buckets of the scan table
+        # per member
+        return (
+            sys.getsizeof(self)
+            + sys.getsizeof(self._members)
+            + self._nbytes
+            + len(self._members) * (_BYTES_OVERHEAD + 2 * _POINTER_SIZE)
+        )
+
+
+Set = IntSet | HashSet
+
+
+def intersection(sets: list[Set]) -> list[bytes]:
+    """Members of all sets.
+
+    Members of the smallest set are checked against the other sets from
+    the smallest to the largest, so few members are checked and most of
+    them are ruled out by the first sets.
+    """
+    if not sets or not all(sets):
+        return []
+    smallest, *others = sorted(sets, key=len)
+    if isinstance(smallest, IntSet) and all(isinstance(s, IntSet) for s in others):
+        # only integers are compared (members are formatted once at the end)
+        numbers: Iterable[int] = smallest.numbers()
+        for other in others:
+            if len(numbers) * BISECT_RATIO < len(other):
+                numbers = [number for number in numbers if other.has(number)]
+            else:
+                numbers = set(numbers).intersection(other.numbers())
+        return [b"%d" % number for number in numbers]
+
+    members: Iterable[bytes] = smallest
+    for other in others:
+        members = [member for member in members if member in other]
+    return list(members)
+
+
+def union(sets: list[Set]) -> list[bytes]:
+    """Members of any of the sets."""
+    if all(isinstance(s, IntSet) for s in sets):
+        numbers: set[int] = set()
+        for intset in sets:
+            numbers.update(intset.numbers())
+        return [b"%d" % number for number in numbers]
+
+    members: set[bytes] = set()
+    for s in sets:
+        members.update(s)
+    return list(members)
+
+
+def difference(first: Set, others: list[Set]) -> list[bytes]:
+    """Members of the first set that are in none of the other sets."""
+    others = [other for other in others if other]
+    if isinstance(first, IntSet) and all(isinstance(s, IntSet) for s in others):
+        numbers: Iterable[int] = first.numbers()
+        for other in others:
+            numbers = [number for number in numbers if not other.has(number)]
+        return [b"%d" % number for number in numbers]
+
+    members: Iterable[bytes] = first
+    for other in others:
+        members = [member for member in members if member not in other]
+    return list(members)
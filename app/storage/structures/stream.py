@@ -0,0 +1,344 @@
+"""This file contains the structure backing stream values (`Stream`), an
+append-only log of entries identified by increasing IDs (like in Redis).
+
+Entries are stored in blocks of up to `node_max_entries` entries and
+`node_max_bytes` bytes (see `stream-node-max-entries` and
+`stream-node-max-bytes` in the config), like the listpacks of a Redis
+stream:
+
+- IDs are delta encoded from the first ID of their block in two arrays of
+  32 bit integers, so an ID costs 8 bytes instead of a tuple of two python
+  ints (an entry whose delta doesn't fit starts a new block).
+- Fields and values are packed in a single bytes object along with an
+  array of offsets. Entries with the same fields as the first entry of
+  their block (the common case of an event log) only store their values.
+
+Redis indexes blocks in a radix tree keyed by their first ID. IDs only
+grow, so blocks are always appended at the end (and trimmed from the
+head) here, and a sorted list of their first IDs searched with bisect
+serves the same purpose. Locating an ID is O(log n) and reading m entries
+from there is O(m).
+"""
+
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Iterable
+
+StreamID = tuple[int, int]  # milliseconds and sequence number
+Entry = tuple[StreamID, list[bytes]]  # ID, fields and values
+
+MAX_SEQ = 2**64 - 1
+MIN_ID: StreamID = (0, 0)
+MAX_ID: StreamID = (MAX_SEQ, MAX_SEQ)
+
+_MAX_DELTA = 2**32 - 1  # deltas are stored as 32 bit integers
+_MAX_SHORT = 2**16 - 1
+ID_SIZE = 8  # IDs count as two 32 bit deltas
+
+_ID_OVERHEAD = sys.getsizeof((0, 0)) + 2 * sys.getsizeof(2**40)
+
+
+def _compact(numbers: array) -> array:
+    """Copy of an array of unsigned integers, with the smallest item size
+    that fits them."""
+    typecode = "H" if max(numbers, default=0) <= _MAX_SHORT else "I"
+    return array(typecode, numbers)
+
+
+def increment(stream_id: StreamID) -> StreamID | None:
+    """Smallest ID greater than stream_id, None if there is none."""
+    ms, seq = stream_id
+    if seq < MAX_SEQ:
+        return ms, seq + 1
+    return (ms + 1, 0) if ms < MAX_SEQ else None
+
+
+def decrement(stream_id: StreamID) -> StreamID | None:
+    """Greatest ID less than stream_id, None if there is none."""
+    ms, seq = stream_id
+    if seq > 0:
+        return ms, seq - 1
+    return (ms - 1, MAX_SEQ) if ms > 0 else None
+
+
+class EntryBlock:
+    """Entries with consecutive IDs, delta encoded and packed.
+
+    Entries trimmed from the head of the block are skipped (see `head`) and
+    only freed along with the block.
+    """
+
+    __slots__ = (
+        "first",
+        "head",
+        "ms_deltas",
+        "seq_deltas",
+        "fields",
+        "values_only",
+        "starts",
+        "data",
+        "offsets",
+    )
+
+    def __init__(self, first: StreamID):
+        self.first = first
+        self.head = 0  # number of entries trimmed from the head
+        # milliseconds of an ID are stored relative to the first ID, and the
+        # sequence number too if the milliseconds are the same
+        self.ms_deltas = array("I")
+        self.seq_deltas = array("I")
+        self.fields: tuple[bytes, ...] = ()  # fields of the first entry
+        # 1 for entries with the fields of the first entry, which only store
+        # their values
+        self.values_only = bytearray()
+        self.starts = array("I", [0])  # index of the first element of entries
+        self.data: bytes | bytearray = bytearray()  # bytes once sealed
+        self.offsets = array("I", [0])
+
+    def __len__(self) -> int:
+        return len(self.ms_deltas) - self.head
+
+    def _deltas(self, stream_id: StreamID) -> tuple[int, int]:
+        ms, seq = stream_id
+        first_ms, first_seq = self.first
+        ms_delta = ms - first_ms
+        return ms_delta, seq - first_seq if ms_delta == 0 else seq
+
+    def id_at(self, i: int) -> StreamID:
+        ms_delta, seq_delta = self.ms_deltas[i], self.seq_deltas[i]
+        first_ms, first_seq = self.first
+        if ms_delta == 0:
+            return first_ms, first_seq + seq_delta
+        return first_ms + ms_delta, seq_delta
+
+    def fits(
+        self, stream_id: StreamID, size: int, max_entries: int, max_bytes: int
+    ) -> bool:
+        """Whether an entry of size bytes can be appended to the block."""
+        if not self.ms_deltas:
+            return True
+        ms_delta, seq_delta = self._deltas(stream_id)
+        return (
+            len(self.ms_deltas) < max_entries
+            and len(self.data) + size <= max_bytes
+            and ms_delta <= _MAX_DELTA
+            and seq_delta <= _MAX_DELTA
+        )
+
+    def append(self, stream_id: StreamID, elements: list[bytes]):
+        """Appends an entry, with an ID greater than the IDs of the block."""
+        ms_delta, seq_delta = self._deltas(stream_id)
+        self.ms_deltas.append(ms_delta)
+        self.seq_deltas.append(seq_delta)
+        if not self.fields:
+            self.fields = tuple(elements[::2])
+        values_only = tuple(elements[::2]) == self.fields
+        stored = elements[1::2] if values_only else elements
+        self.values_only.append(values_only)
+
+        data, offsets = self.data, self.offsets
+        for element in stored:
+            data += element
+            offsets.append(len(data))
+        self.starts.append(len(offsets) - 1)
+
+    def seal(self):
+        """Packs the block once no more entries are appended to it, without
+        the room left to append and with 16 bit arrays where they fit."""
+        self.data = bytes(self.data)
+        for name in ("ms_deltas", "seq_deltas", "starts", "offsets"):
+            setattr(self, name, _compact(getattr(self, name)))
+        self.values_only = bytearray(self.values_only)
+
+    def bisect_left(self, stream_id: StreamID) -> int:
+        """Index of the first entry with an ID not less than stream_id."""
+        return bisect_left(
+            range(len(self.ms_deltas)), stream_id, lo=self.head, key=self.id_at
+        )
+
+    def bisect_right(self, stream_id: StreamID) -> int:
+        """Index of the first entry with an ID greater than stream_id."""
+        return bisect_right(
+            range(len(self.ms_deltas)), stream_id, lo=self.head, key=self.id_at
+        )
+
+    def entries(self, start: int, stop: int) -> list[Entry]:
+        """Entries from index start up to (excluding) stop.
+
+        Elements of all the entries are sliced out of the data at once,
+        then split between entries.
+        """
+        if start >= stop:
+            return []
+        first_ms, first_seq = self.first
+        starts, fields, size = self.starts, self.fields, len(self.fields)
+        bounds = self.offsets[starts[start] : starts[stop] + 1].tolist()
+        elements = list(map(self.data.__getitem__, map(slice, bounds, bounds[1:])))
+
+        entries: list[Entry] = []
+        base = starts[start]
+        for i in range(start, stop):
+            ms_delta, seq_delta = self.ms_deltas[i], self.seq_deltas[i]
+            if ms_delta == 0:
+                stream_id = first_ms, first_seq + seq_delta
+            else:
+                stream_id = first_ms + ms_delta, seq_delta
+            stored = elements[starts[i] - base : starts[i + 1] - base]
+            if self.values_only[i]:
+                pairs: list[bytes] = [b""] * (2 * size)
+                pairs[::2], pairs[1::2] = fields, stored
+                stored = pairs
+            entries.append((stream_id, stored))
+        return entries
+
+    def data_size(self) -> int:
+        """Number of bytes of the IDs, fields and values."""
+        return len(self.ms_deltas) * ID_SIZE + len(self.data)
+
+    def memory_usage(self) -> int:
+        """Estimated number of bytes used by the block, in O(1)."""
+        return (
+            sys.getsizeof(self)
+            + _ID_OVERHEAD
+            + sys.getsizeof(self.ms_deltas)
+            + sys.getsizeof(self.seq_deltas)
+            + sys.getsizeof(self.fields)
+            + sys.getsizeof(self.values_only)
+            + sys.getsizeof(self.starts)
+            + sys.getsizeof(self.data)
+            + sys.getsizeof(self.offsets)
+        )
+
+
+class Stream:
+    """Entries in ID order, in blocks indexed by their first ID."""
+
+    __slots__ = ("_blocks", "_firsts", "_length", "last_id", "_sealed", "_nbytes")
+
+    def __init__(self):
+        self._blocks: list[EntryBlock] = []
+        self._firsts: list[StreamID] = []  # first ID of each block
+        self._length = 0
+        self.last_id: StreamID = MIN_ID  # ID of the last entry ever added
+        # memory used by (and bytes of) blocks before the last one, which
+        # don't change once sealed
+        self._sealed = 0
+        self._nbytes = 0
+
+    def __len__(self) -> int:
+        return self._length
+
+    def add(
+        self,
+        stream_id: StreamID,
+        elements: Iterable[bytes],
+        node_max_entries: int,
+        node_max_bytes: int,
+    ):
+        """Appends an entry, with an ID greater than `last_id`. A new block
+        is started once the last one can't hold the entry."""
+        elements = list(elements)
+        blocks = self._blocks
+        size = sum(map(len, elements))
+        if not blocks or not blocks[-1].fits(
+            stream_id, size, node_max_entries, node_max_bytes
+        ):
+            if blocks:
+                last = blocks[-1]
+                last.seal()
+                self._sealed += last.memory_usage()
+                self._nbytes += last.data_size()
+            blocks.append(EntryBlock(stream_id))
+            self._firsts.append(stream_id)
+        blocks[-1].append(stream_id, elements)
+        self._length += 1
+        self.last_id = stream_id
+
+    def range(
+        self, start: StreamID, end: StreamID, count: int | None = None
+    ) -> list[Entry]:
+        """Entries with an ID from start to end (both included), up to count
+        entries (all if None)."""
+        entries: list[Entry] = []
+        if count == 0:
+            return entries
+        blocks = self._blocks
+        for pos in range(max(bisect_right(self._firsts, start) - 1, 0), len(blocks)):
+            block = blocks[pos]
+            i, stop = block.bisect_left(start), block.bisect_right(end)
+            if count is not None:
+                stop = min(stop, i + count - len(entries))
+            entries.extend(block.entries(i, stop))
+            if stop < len(block.ms_deltas) or len(entries) == count:
+                break
+        return entries
+
+    def reverse_range(
+        self, start: StreamID, end: StreamID, count: int | None = None
+    ) -> list[Entry]:
+        """Entries with an ID from start to end (both included) in reverse
+        order, up to count entries (all if None)."""
+        entries: list[Entry] = []
+        if count == 0:
+            return entries
+        blocks = self._blocks
+        for pos in range(bisect_right(self._firsts, end) - 1, -1, -1):
+            block = blocks[pos]
+            first, stop = block.bisect_left(start), block.bisect_right(end)
+            if count is not None:
+                first = max(first, stop - count + len(entries))
+            entries.extend(reversed(block.entries(first, stop)))
+            if first > block.head or len(entries) == count:
+                break
+        return entries
+
+    def trim(self, maxlen: int, approximate: bool = False) -> int:
+        """Removes the oldest entries so at most maxlen remain, returns the
+        number of entries removed.
+
+        Approximate trimming only removes whole blocks (like `MAXLEN ~`),
+        so a few more entries than maxlen may remain.
+        """
+        blocks, removed = 0, 0
+        while (
+            blocks < len(self._blocks)
+            and self._length - removed - len(self._blocks[blocks]) >= maxlen
+        ):
+            removed += len(self._blocks[blocks])
+            blocks += 1
+        self._drop(blocks)
+
+        excess = self._length - removed - maxlen
+        if not approximate and excess > 0:
+            self._blocks[0].head += excess
+            removed += excess
+        self._length -= removed
+        return removed
+
+    def _drop(self, blocks: int):
+        """Removes the first blocks."""
+        for block in self._blocks[: min(blocks, len(self._blocks) - 1)]:
+            self._sealed -= block.memory_usage()
+            self._nbytes -= block.data_size()
+        if blocks == len(self._blocks):
+            self._sealed = self._nbytes = 0
+        del self._blocks[:blocks]
+        del self._firsts[:blocks]
+
+    def data_size(self) -> int:
+        """Number of bytes of the IDs, fields and values (including trimmed
+        entries of blocks that are not freed yet)."""
+        last = self._blocks[-1].data_size() if self._blocks else 0
+        return self._nbytes + last
+
+    def memory_usage(self) -> int:
+        """Estimated number of bytes used by the stream, in O(1)."""
+        last = self._blocks[-1].memory_usage() if self._blocks else 0
+        return (
+            sys.getsizeof(self)
+            + sys.getsizeof(self._blocks)
+            + sys.getsizeof(self._firsts)
+            + self._sealed
+            + last
+        )
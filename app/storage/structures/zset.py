@@ -0,0 +1,430 @@
+"""This file contains the structures backing sorted set values, in one of
+two encodings (like in Redis):
+
+- `ZListpack` for small sorted sets: members are packed in a single bytes
+  object and scores in an array of doubles, both in order, so a member
+  costs a few bytes on top of its contents. Writes move the members after
+  the written one, which stays cheap while the set is small.
+- `SortedSet` for large sorted sets: a dict of member scores, along with a
+  `ScoreIndex` of (score, member) items in order.
+
+Redis orders large sorted sets in a skiplist with span counts. Walking
+skiplist levels is interpreted code in python, so `ScoreIndex` keeps items
+in a list of sorted sublists instead (like `PrefixIndex`), searched with
+bisect, along with a Fenwick tree of sublist lengths for positional access.
+Inserts, removals, ranks and locating a range are O(log n) (plus moving
+the items of a single sublist), and reading m items of a range is O(m).
+
+A sorted set starts as a listpack and is converted to a sorted set for good
+once it holds more than `max_listpack_entries` members or a member longer
+than `max_listpack_value` bytes (see `zset-max-listpack-entries` and
+`zset-max-listpack-value` in the config).
+
+Ranges are returned as pairs of ranks (start included, stop excluded), so
+they can be read (or counted) with `range`.
+"""
+
+import math
+import sys
+from array import array
+from bisect import bisect_left, bisect_right, insort
+from typing import Iterable
+
+from app.storage.in_memory.scan import ScanTable
+from app.storage.structures.packed import find, offsets_of, widen
+
+SUBLIST_SIZE = 1000  # sublists are split once they hold twice as many items
+
+Item = tuple[float, bytes]  # ordered by score, then by member
+
+SCORE_SIZE = 8  # scores count as a double
+
+_BYTES_OVERHEAD = sys.getsizeof(b"")
+_ITEM_OVERHEAD = sys.getsizeof((0.0, b"")) + sys.getsizeof(0.0)
+_POINTER_SIZE = 8
+
+
+class ZListpack:
+    """Sorted set of few short members, packed in order."""
+
+    __slots__ = ("data", "offsets", "scores")
+
+    def __init__(self, items: Iterable[Item] = ()):
+        items = sorted(items)
+        members = [member for _, member in items]
+        self.data = b"".join(members)
+        self.offsets = offsets_of(members)
+        self.scores = array("d", [score for score, _ in items])
+
+    def __len__(self) -> int:
+        return len(self.scores)
+
+    def _member(self, i: int) -> bytes:
+        return self.data[self.offsets[i] : self.offsets[i + 1]]
+
+    def score(self, member: bytes) -> float | None:
+        i = find(self.data, self.offsets, member)
+        return None if i == -1 else self.scores[i]
+
+    def rank(self, member: bytes) -> int | None:
+        i = find(self.data, self.offsets, member)
+        return None if i == -1 else i
+
+    def add(self, member: bytes, score: float) -> bool:
+        """Sets the score of member, returns whether it was added."""
+        i = find(self.data, self.offsets, member)
+        if i != -1:
+            if self.scores[i] == score:
+                return False
+            self._delete(i)
+
+        # members with an equal score are ordered by member
+        start = bisect_left(self.scores, score)
+        stop = bisect_right(self.scores, score)
+        position = bisect_left(range(start, stop), member, key=self._member)
+        self._insert(start + position, member, score)
+        return i == -1
+
+    def remove(self, member: bytes) -> bool:
+        i = find(self.data, self.offsets, member)
+        if i == -1:
+            return False
+        self._delete(i)
+        return True
+
+    def _insert(self, i: int, member: bytes, score: float):
+        offsets, size = self.offsets, len(member)
+        start = offsets[i]
+        self.data = self.data[:start] + member + self.data[start:]
+        shifted = [offset + size for offset in offsets[i:]]
+        offsets = self.offsets = widen(offsets, shifted[-1])
+        offsets[i + 1 :] = array(offsets.typecode, shifted)
+        self.scores.insert(i, score)
+
+    def _delete(self, i: int):
+        offsets = self.offsets
+        start, end = offsets[i], offsets[i + 1]
+        self.data = self.data[:start] + self.data[end:]
+        size = end - start
+        offsets[i + 1 :] = array(
+            offsets.typecode, [offset - size for offset in offsets[i + 2 :]]
+        )
+        del self.scores[i]
+
+    def range(self, start: int, stop: int) -> list[tuple[bytes, float]]:
+        """Members and their scores from rank start up to (excluding) stop,
+        both within bounds."""
+        return [(self._member(i), self.scores[i]) for i in range(start, stop)]
+
+    def items(self) -> list[Item]:
+        return [(score, member) for member, score in self.range(0, len(self))]
+
+    def scan(self, cursor: int, count: int) -> tuple[int, list[tuple[bytes, float]]]:
+        """Small sorted sets are returned whole in a single step (like in
+        Redis)."""
+        return 0, self.range(0, len(self))
+
+    def score_range(
+        self, low: float, low_exclusive: bool, high: float, high_exclusive: bool
+    ) -> tuple[int, int]:
+        """Ranks of members with a score between low and high."""
+        scores = self.scores
+        start = (bisect_right if low_exclusive else bisect_left)(scores, low)
+        stop = (bisect_left if high_exclusive else bisect_right)(scores, high)
+        return start, max(start, stop)
+
+    def lex_range(
+        self,
+        low: bytes | None,
+        low_exclusive: bool,
+        high: bytes | None,
+        high_exclusive: bool,
+    ) -> tuple[int, int]:
+        """Ranks of members between low and high (None for no bound), for
+        sorted sets where all members have the same score."""
+        ranks = range(len(self))
+        start, stop = 0, len(self)
+        if low is not None:
+            bisect = bisect_right if low_exclusive else bisect_left
+            start = bisect(ranks, low, key=self._member)
+        if high is not None:
+            bisect = bisect_left if high_exclusive else bisect_right
+            stop = bisect(ranks, high, key=self._member)
+        return start, max(start, stop)
+
+    def data_size(self) -> int:
+        """Number of bytes of the members and scores."""
+        return len(self.data) + len(self.scores) * SCORE_SIZE
+
+    def memory_usage(self) -> int:
+        """Estimated number of bytes used by the sorted set, in O(1)."""
+        return (
+            sys.getsizeof(self)
+            + sys.getsizeof(self.data)
+            + sys.getsizeof(self.offsets)
+            + sys.getsizeof(self.scores)
+        )
+
+
+class ScoreIndex:
+    """Items in order with positional access."""
+
+    __slots__ = ("_sublists", "_maxes", "_tree", "_len")
+
+    def __init__(self, items: Iterable[Item] = ()):
+        items = sorted(items)
+        self._sublists = [
+            items[i : i + SUBLIST_SIZE] for i in range(0, len(items), SUBLIST_SIZE)
+        ]
+        self._maxes = [sublist[-1] for sublist in self._sublists]
+        self._len = len(items)
+        self._build_tree()
+
+    def __len__(self) -> int:
+        return self._len
+
+    def _build_tree(self):
+        """Fenwick tree of sublist lengths, node i (from 1) holds the total
+        length of the i & -i sublists up to sublist i."""
+        tree = [0] + [len(sublist) for sublist in self._sublists]
+        for i in range(1, len(tree)):
+            parent = i + (i & -i)
+            if parent < len(tree):
+                tree[parent] += tree[i]
+        self._tree = tree
+
+    def _grow(self, pos: int, delta: int):
+        """Adds delta to the length of sublist pos in the tree."""
+        tree = self._tree
+        i = pos + 1
+        while i < len(tree):
+            tree[i] += delta
+            i += i & -i
+
+    def _before(self, pos: int) -> int:
+        """Number of items in the sublists before sublist pos."""
+        tree, total = self._tree, 0
+        while pos:
+            total += tree[pos]
+            pos -= pos & -pos
+        return total
+
+    def _locate(self, index: int) -> tuple[int, int]:
+        """Position of the sublist holding the item at index (within
+        bounds), and of the item in the sublist."""
+        tree, pos = self._tree, 0
+        bit = 1 << (len(tree) - 1).bit_length()
+        while bit:
+            nxt = pos + bit
+            if nxt < len(tree) and tree[nxt] <= index:
+                index -= tree[nxt]
+                pos = nxt
+            bit >>= 1
+        return pos, index
+
+    def add(self, item: Item):
+        """Index an item (which must not be indexed already)."""
+        self._len += 1
+        if not self._sublists:
+            self._sublists.append([item])
+            self._maxes.append(item)
+            self._build_tree()
+            return
+
+        pos = bisect_left(self._maxes, item)
+        if pos == len(self._maxes):
+            # item is greater than all items, append to the last sublist
+            pos -= 1
+            sublist = self._sublists[pos]
+            sublist.append(item)
+            self._maxes[pos] = item
+        else:
+            sublist = self._sublists[pos]
+            insort(sublist, item)
+
+        if len(sublist) > 2 * SUBLIST_SIZE:
+            self._sublists[pos : pos + 1] = [
+                sublist[:SUBLIST_SIZE],
+                sublist[SUBLIST_SIZE:],
+            ]
+            self._maxes[pos : pos + 1] = [sublist[SUBLIST_SIZE - 1], sublist[-1]]
+            self._build_tree()
+        else:
+            self._grow(pos, 1)
+
+    def remove(self, item: Item):
+        """Removes an item (which must be indexed)."""
+        pos = bisect_left(self._maxes, item)
+        sublist = self._sublists[pos]
+        i = bisect_left(sublist, item)
+        del sublist[i]
+        self._len -= 1
+        if not sublist:
+            del self._sublists[pos]
+            del self._maxes[pos]
+            self._build_tree()
+            return
+        if i == len(sublist):
+            self._maxes[pos] = sublist[-1]
+        self._grow(pos, -1)
+
+    def bisect_left(self, item: Item) -> int:
+        """Index of the first item that is not less than item."""
+        pos = bisect_left(self._maxes, item)
+        if pos == len(self._maxes):
+            return self._len
+        return self._before(pos) + bisect_left(self._sublists[pos], item)
+
+    def bisect_right(self, item: Item) -> int:
+        """Index of the first item that is greater than item."""
+        pos = bisect_right(self._maxes, item)
+        if pos == len(self._maxes):
+            return self._len
+        return self._before(pos) + bisect_right(self._sublists[pos], item)
+
+    def slice(self, start: int, stop: int) -> list[Item]:
+        """Items from start up to (excluding) stop, both within bounds."""
+        items: list[Item] = []
+        if start >= stop:
+            return items
+
+        pos, offset = self._locate(start)
+        remaining = stop - start
+        # sublists are indexed rather than sliced (islice would step over
+        # the sublists before pos one at a time)
+        for i in range(pos, len(self._sublists)):
+            sublist = self._sublists[i]
+            end = min(offset + remaining, len(sublist))
+            items.extend(sublist[offset:end])
+            remaining -= end - offset
+            if not remaining:
+                break
+            offset = 0
+        return items
+
+
+class SortedSet:
+    """Sorted set of any size, backed by a dict and a `ScoreIndex`."""
+
+    __slots__ = ("_scores", "_index", "_scan_table", "_nbytes")
+
+    def __init__(self, items: Iterable[Item] = ()):
+        self._scores: dict[bytes, float] = {}
+        self._nbytes = 0  # total length of members
+        for score, member in items:
+            self._scores[member] = score
+            self._nbytes += len(member)
+        self._index = ScoreIndex(
+            (score, member) for member, score in self._scores.items()
+        )
+        self._scan_table: ScanTable[bytes] = ScanTable(self._scores)
+
+    def __len__(self) -> int:
+        return len(self._scores)
+
+    def score(self, member: bytes) -> float | None:
+        return self._scores.get(member)
+
+    def rank(self, member: bytes) -> int | None:
+        score = self._scores.get(member)
+        if score is None:
+            return None
+        return self._index.bisect_left((score, member))
+
+    def add(self, member: bytes, score: float) -> bool:
+        """Sets the score of member, returns whether it was added."""
+        old = self._scores.get(member)
+        if old is not None:
+            if old == score:
+                return False
+            self._index.remove((old, member))
+        else:
+            self._scan_table.add(member)
+            self._nbytes += len(member)
+        self._scores[member] = score
+        self._index.add((score, member))
+        return old is None
+
+    def remove(self, member: bytes) -> bool:
+        score = self._scores.pop(member, None)
+        if score is None:
+            return False
+        self._index.remove((score, member))
+        self._scan_table.discard(member)
+        self._nbytes -= len(member)
+        return True
+
+    def range(self, start: int, stop: int) -> list[tuple[bytes, float]]:
+        """Members and their scores from rank start up to (excluding) stop,
+        both within bounds."""
+        return [(member, score) for score, member in self._index.slice(start, stop)]
+
+    def items(self) -> list[Item]:
+        return self._index.slice(0, len(self))
+
+    def scan(self, cursor: int, count: int) -> tuple[int, list[tuple[bytes, float]]]:
+        """Visits about count members from cursor (see `ScanTable.scan`),
+        returns the cursor to continue from and the visited members along
+        with their scores."""
+        cursor, members = self._scan_table.scan(cursor, count)
+        return cursor, [(member, self._scores[member]) for member in members]
+
+    def _first_from(self, score: float) -> int:
+        """Rank of the first member with a score not less than score."""
+        return self._index.bisect_left((score, b""))  # b"" is the least member
+
+    def _first_above(self, score: float) -> int:
+        """Rank of the first member with a score greater than score."""
+        if score == math.inf:
+            return len(self)
+        return self._first_from(math.nextafter(score, math.inf))
+
+    def score_range(
+        self, low: float, low_exclusive: bool, high: float, high_exclusive: bool
+    ) -> tuple[int, int]:
+        """Ranks of members with a score between low and high."""
+        start = self._first_above(low) if low_exclusive else self._first_from(low)
+        stop = self._first_from(high) if high_exclusive else self._first_above(high)
+        return start, max(start, stop)
+
+    def lex_range(
+        self,
+        low: bytes | None,
+        low_exclusive: bool,
+        high: bytes | None,
+        high_exclusive: bool,
+    ) -> tuple[int, int]:
+        """Ranks of members between low and high (None for no bound), for
+        sorted sets where all members have the same score."""
+        if not self._scores:
+            return 0, 0
+        score, _ = self._index.slice(0, 1)[0]
+        index = self._index
+        start, stop = 0, len(self)
+        if low is not None:
+            bisect = index.bisect_right if low_exclusive else index.bisect_left
+            start = bisect((score, low))
+        if high is not None:
+            bisect = index.bisect_left if high_exclusive else index.bisect_right
+            stop = bisect((score, high))
+        return start, max(start, stop)
+
+    def data_size(self) -> int:
+        """Number of bytes of the members and scores."""
+        return self._nbytes + len(self._scores) * SCORE_SIZE
+
+    def memory_usage(self) -> int:
+        """Estimated number of bytes used by the sorted set, in O(1)."""
+        # a bytes object per member, an item (tuple and float) per member
+        # referenced from the index, and about two buckets of the scan table
+        # per member
+        size = len(self._scores)
+        return (
+            sys.getsizeof(self)
+            + sys.getsizeof(self._scores)
+            + self._nbytes
+            + size * (_BYTES_OVERHEAD + _ITEM_OVERHEAD + 3 * _POINTER_SIZE)
+        )
+
+
+ZSet = ZListpack | SortedSet
@@ -1,5 +1,4 @@
 from enum import IntEnum
-from dataclasses import dataclass
 from io import BufferedReader, BytesIO
 
 
@@ -17,16 +16,158 @@ class RedisEncoding(IntEnum):
     ZSET_ZIPLIST = 12
     HASH_ZIPLIST = 13
     LIST_QUICKLIST = 14
+    STREAM = 15
+
+
+# name of the data type reported for values of each encoding (eg, by TYPE)
+TYPE_NAMES = {
+    RedisEncoding.STRING: "string",
+    RedisEncoding.LIST: "list",
+    RedisEncoding.ZIPLIST: "list",
+    RedisEncoding.LIST_QUICKLIST: "list",
+    RedisEncoding.SET: "set",
+    RedisEncoding.INTSET: "set",
+    RedisEncoding.ZSET: "zset",
+    RedisEncoding.ZSET_ZIPLIST: "zset",
+    RedisEncoding.HASH: "hash",
+    RedisEncoding.ZIPMAP: "hash",
+    RedisEncoding.HASH_ZIPLIST: "hash",
+    RedisEncoding.STREAM: "stream",
+}
+
+# internal encodings reported by OBJECT ENCODING for non-string values
+OBJECT_ENCODINGS = {
+    RedisEncoding.LIST_QUICKLIST: "quicklist",
+    RedisEncoding.HASH_ZIPLIST: "listpack",
+    RedisEncoding.HASH: "hashtable",
+    RedisEncoding.INTSET: "intset",
+    RedisEncoding.SET: "hashtable",
+    RedisEncoding.ZSET_ZIPLIST: "listpack",
+    RedisEncoding.ZSET: "skiplist",
+    RedisEncoding.STREAM: "stream",
+}
+
+INT64_MIN, INT64_MAX = -(2**63), 2**63 - 1
+EMBSTR_SIZE_LIMIT = 44  # strings up to this size are reported as embstr
+
+
+def int_or_bytes(value: bytes | int) -> bytes | int:
+    """Converts strings that are the canonical form of a 64 bit integer to
+    int, other strings are kept as is."""
+    if not isinstance(value, bytes) or not 0 < len(value) <= 20:
+        return value
+    digits = value[1:] if value[:1] == b"-" else value
+    if not digits.isdigit() or (digits[:1] == b"0" and value != b"0"):
+        return value  # not canonical (eg, "+1", "01" or "-0")
+    number = int(value)
+    return number if INT64_MIN <= number <= INT64_MAX else value
 
 
-@dataclass
 class RedisValue:
-    raw_bytes: bytes  # actual value in raw bytes (rename this to raw_bytes?)
-    expiry: int | None = None  # unix timestamp when the key-value pair expires
-    encoding: RedisEncoding = RedisEncoding.STRING  # default string encoding
+    """Value of a key, along with its metadata.
+
+    Instances use slots (no per-instance __dict__) since one exists per key.
+    Strings that are the canonical form of a 64 bit integer are stored as
+    native int (like OBJ_ENCODING_INT in Redis) and serialized to bytes only
+    when read through `raw_bytes`.
+
+    Values of other types hold the structure backing them (eg, a QuickList
+    for lists), see `with_payload`.
+    """
+
+    __slots__ = ("_value", "expiry", "encoding", "lru")
+
+    def __init__(
+        self,
+        raw_bytes: bytes | int,
+        expiry: int | None = None,  # unix timestamp when the key-value pair expires
+        encoding: RedisEncoding = RedisEncoding.STRING,  # default string encoding
+        lru: int = 0,  # access clock or LFU counter (see storage eviction)
+    ):
+        self._value = int_or_bytes(raw_bytes)
+        self.expiry = expiry
+        self.encoding = encoding
+        self.lru = lru
+
+    @classmethod
+    def with_payload(
+        cls, payload, encoding: RedisEncoding, expiry: int | None = None
+    ) -> "RedisValue":
+        """Value of a non-string type, backed by the given structure."""
+        value = cls(b"", expiry, encoding)
+        value._value = payload
+        return value
+
+    @property
+    def raw_bytes(self) -> bytes:
+        value = self._value
+        if isinstance(value, int):
+            return b"%d" % value
+        if not isinstance(value, bytes):
+            raise TypeError(f"{self.type_name} value is not a string")
+        return value
+
+    @raw_bytes.setter
+    def raw_bytes(self, value: bytes | int):
+        self._value = int_or_bytes(value)
+
+    @property
+    def int_value(self) -> int:
+        """Value as an integer, raises ValueError if the value isn't one."""
+        value = self._value
+        if isinstance(value, int):
+            return value
+        raise ValueError("value is not an integer")
+
+    @int_value.setter
+    def int_value(self, value: int):
+        if not INT64_MIN <= value <= INT64_MAX:
+            raise ValueError("integer overflow")
+        self._value = value
+
+    @property
+    def payload(self) -> bytes | int:
+        """Value as it is stored (int for int encoded strings)."""
+        return self._value
+
+    @payload.setter
+    def payload(self, payload):
+        """Replaces the structure backing a non-string value (eg, when it is
+        converted to another encoding)."""
+        self._value = payload
+
+    @property
+    def type_name(self) -> str:
+        """Name of the data type of the value (string, list, set, ...)."""
+        return TYPE_NAMES[self.encoding]
+
+    def object_encoding(self) -> str:
+        """Internal encoding of the value (see OBJECT ENCODING)."""
+        if isinstance(self._value, int):
+            return "int"
+        if not isinstance(self._value, bytes):
+            return OBJECT_ENCODINGS[self.encoding]
+        if len(self._value) <= EMBSTR_SIZE_LIMIT:
+            return "embstr"
+        return "raw"
 
     def __bytes__(self):
         return self.raw_bytes
 
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, RedisValue):
+            return NotImplemented
+        return (self._value, self.expiry, self.encoding) == (
+            other._value,
+            other.expiry,
+            other.encoding,
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"RedisValue(raw_bytes={self._value!r}, expiry={self.expiry}, "
+            f"encoding={self.encoding!r})"
+        )
+
 
 RDBReader = BufferedReader | BytesIO
@@ -19,13 +19,25 @@ def command_from_resp_array(parsed_input: RespElement) -> RedisCommand:
         # unsure if there are future instances that will receive commands in non-array form
         raise ValueError("invalid command format: expected serialized RESP array")
 
-    array = parsed_input.value
-    if len(array) < 1:
+    return command_from_args([element.value for element in parsed_input.value])
+
+
+def command_from_args(args: list[bytes]) -> RedisCommand:
+    """Return a RedisCommand instance from a command name and its arguments
+    (eg, decoded by the parser's fast path for commands).
+
+    Raises:
+        CommandEmpty: If the list is empty.
+        UnrecognizedCommand: If the command name is not recognized.
+        MissingArgument: If required arguments of the command are missing.
+    """
+    if len(args) < 1:
         raise CommandEmpty
 
-    command_name = array[0].value.upper()
+    command_name = args[0].upper()
     if command := NAME_TO_COMMANDS_MAP.get(command_name):
-        command_args = [element.value for element in array[1:]]
+        command_args = args[1:]
+        command.arg_parser.check_arity(len(command_args))
         logging.info(f"received command: {command_name} with args {command_args}")
         return command(command_args)
 
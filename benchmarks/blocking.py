@@ -0,0 +1,107 @@
+"""Measures wake-up latency and idle cost of clients blocked on keys.
+
+- `polling`: the blocked client checks the key every 20 ms (the way WAIT
+  waits for replicas),
+- `signal`: the blocked client sleeps in `BlockedClients.wait_for` and is
+  woken up by the write to the key.
+
+Latency is the time from a push to a key to the blocked client returning
+the pushed element. Idle cost is the CPU time used by the process while
+many clients are blocked and nothing is written.
+
+Usage:
+    python -m benchmarks.blocking --rounds 1000 --idle-clients 1000
+"""
+
+import argparse
+import statistics
+import threading
+import time
+from collections import deque
+
+from app.blocking import BlockedClients
+
+POLL_INTERVAL = 0.02
+
+
+def _poll(items: deque, timeout: float | None):
+    deadline = None if timeout is None else time.monotonic() + timeout
+    while not items:
+        if deadline is not None and time.monotonic() >= deadline:
+            return None
+        time.sleep(POLL_INTERVAL)
+    return items.popleft()
+
+
+def _latencies(mode: str, rounds: int) -> list[float]:
+    clients = BlockedClients()
+    items: deque = deque()
+    latencies: list[float] = []
+
+    def attempt():
+        return items.popleft() if items else None
+
+    def client():
+        for _ in range(rounds):
+            if mode == "polling":
+                pushed_at = _poll(items, None)
+            else:
+                pushed_at = clients.wait_for([b"key"], None, attempt)
+            latencies.append(time.perf_counter() - pushed_at)
+
+    thread = threading.Thread(target=client)
+    thread.start()
+    for _ in range(rounds):
+        time.sleep(0.001)  # let the client block
+        items.append(time.perf_counter())
+        clients.signal(b"key")
+        while len(latencies) < rounds and items:
+            time.sleep(0.0001)
+    thread.join()
+    return latencies
+
+
+def _none():
+    return None
+
+
+def _idle_cpu(mode: str, idle_clients: int, seconds: float) -> float:
+    clients = BlockedClients()
+    items: deque = deque()
+    threads = [
+        threading.Thread(
+            target=_poll if mode == "polling" else clients.wait_for,
+            args=(items, seconds) if mode == "polling" else ([b"key"], seconds, _none),
+        )
+        for _ in range(idle_clients)
+    ]
+    start = time.process_time()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return time.process_time() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=1000)
+    parser.add_argument("--idle-clients", type=int, default=1000)
+    parser.add_argument("--idle-seconds", type=float, default=2.0)
+    args = parser.parse_args()
+
+    for mode in ("polling", "signal"):
+        rounds = args.rounds // 10 if mode == "polling" else args.rounds
+        latencies = sorted(_latencies(mode, rounds))
+        p99 = latencies[int(len(latencies) * 0.99)]
+        cpu = _idle_cpu(mode, args.idle_clients, args.idle_seconds)
+        print(
+            f"{mode:>8} wake-up p50={statistics.median(latencies) * 1e6:9.1f} us"
+            f" p99={p99 * 1e6:9.1f} us"
+            f" idle cpu ({args.idle_clients} clients, {args.idle_seconds:.0f} s)"
+            f"={cpu:.3f} s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""Compares the threaded and asyncio io models of the server.
+
+For each io model and client count, a server is spawned and the benchmark,
+1. opens `clients` connections and reports the connect rate (connections/sec),
+2. keeps all but `active` connections idle and sends PING from the `active`
+   connections in a loop, reporting throughput and p50/p99 latency.
+
+Usage:
+    python -m benchmarks.connections --clients 1000 10000 --active 100
+
+Note that 10k connections require a high enough open file limit (`ulimit -n`),
+the script raises the soft limit to the hard limit where possible.
+"""
+
+import argparse
+import asyncio
+import resource
+import statistics
+import subprocess
+import sys
+import time
+
+PING = b"*1\r\n$4\r\nPING\r\n"
+PONG = b"+PONG\r\n"
+
+
+def _raise_open_file_limit():
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if soft < hard:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+
+
+def _start_server(port: int, io_model: str) -> subprocess.Popen:
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "app.main", "--port", str(port), "--io-model", io_model],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    time.sleep(1)
+    return proc
+
+
+async def _open_connections(port: int, count: int, batch: int = 200) -> list:
+    conns = []
+    for start in range(0, count, batch):
+        size = min(batch, count - start)
+        conns.extend(
+            await asyncio.gather(
+                *[asyncio.open_connection("localhost", port) for _ in range(size)]
+            )
+        )
+    return conns
+
+
+async def _ping_loop(reader, writer, deadline: float, latencies: list[float]):
+    while time.perf_counter() < deadline:
+        start = time.perf_counter()
+        writer.write(PING)
+        await reader.readexactly(len(PONG))
+        latencies.append(time.perf_counter() - start)
+
+
+async def _run(port: int, clients: int, active: int, duration: float) -> dict:
+    start = time.perf_counter()
+    conns = await _open_connections(port, clients)
+    connect_elapsed = time.perf_counter() - start
+
+    latencies: list[float] = []
+    deadline = time.perf_counter() + duration
+    await asyncio.gather(
+        *[
+            _ping_loop(reader, writer, deadline, latencies)
+            for reader, writer in conns[:active]
+        ]
+    )
+
+    for _, writer in conns:
+        writer.close()
+
+    quantiles = statistics.quantiles(latencies, n=100)
+    return {
+        "conn/s": clients / connect_elapsed,
+        "ops/s": len(latencies) / duration,
+        "p50 ms": quantiles[49] * 1000,
+        "p99 ms": quantiles[98] * 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--port", type=int, default=6390)
+    parser.add_argument("--clients", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--active", type=int, default=100)
+    parser.add_argument("--duration", type=float, default=5.0)
+    parser.add_argument(
+        "--io-models", nargs="+", default=["threaded", "asyncio"], dest="io_models"
+    )
+    args = parser.parse_args()
+
+    _raise_open_file_limit()
+    for io_model in args.io_models:
+        for clients in args.clients:
+            proc = _start_server(args.port, io_model)
+            try:
+                result = asyncio.run(
+                    _run(args.port, clients, min(args.active, clients), args.duration)
+                )
+            finally:
+                proc.terminate()
+                proc.wait()
+
+            stats = "  ".join(f"{k}={v:,.2f}" for k, v in result.items())
+            print(f"{io_model:>8} clients={clients:<6} {stats}")
+
+
+if __name__ == "__main__":
+    main()
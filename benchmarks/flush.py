@@ -0,0 +1,69 @@
+"""Measures how long FLUSHALL stalls other clients, with and without ASYNC.
+
+A keyspace of N keys is flushed while a probe thread reads a key in a loop,
+the longest gap between two reads of the probe is the stall seen by other
+clients (either waiting on the storage lock or on the GIL).
+
+Usage:
+    python -m benchmarks.flush --keys 1000000
+"""
+
+import argparse
+import threading
+import time
+
+from app.storage.in_memory import ThreadSafeStorage
+from app.storage.in_memory.errors import KeyDoesNotExist
+from app.storage.types import RedisValue
+
+
+def _probe(storage: ThreadSafeStorage, stop: threading.Event, gaps: list[float]):
+    last = time.perf_counter()
+    longest = 0.0
+    while not stop.is_set():
+        try:
+            storage.get(b"probe")
+        except KeyDoesNotExist:
+            pass
+        now = time.perf_counter()
+        longest = max(longest, now - last)
+        last = now
+    gaps.append(longest)
+
+
+def _measure(keys: int, lazy: bool) -> tuple[float, float]:
+    storage = ThreadSafeStorage()
+    for i in range(keys):
+        storage.set(b"key:%d" % i, RedisValue(b"value:%d" % i))
+
+    stop, gaps = threading.Event(), []
+    probe = threading.Thread(target=_probe, args=(storage, stop, gaps))
+    probe.start()
+    time.sleep(0.1)
+
+    start = time.perf_counter()
+    storage.flush(lazy=lazy)
+    elapsed = time.perf_counter() - start
+    while storage.memory_stats().lazyfree_pending_objects:
+        time.sleep(0.01)
+
+    stop.set()
+    probe.join()
+    return elapsed, gaps[0]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--keys", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    for lazy in (False, True):
+        elapsed, stall = _measure(args.keys, lazy)
+        print(
+            f"{'ASYNC' if lazy else 'SYNC':>5} flush={elapsed * 1e3:9.2f}ms  "
+            f"longest stall={stall * 1e3:9.2f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""Measures memory used per small hash and field access speed per encoding.
+
+- `dict`: fields in a plain dict (the layout without compact encoding),
+- `hashtable`: `HashTable`, a dict plus the scan table used by HSCAN (the
+  encoding of large hashes),
+- `listpack`: `Listpack`, fields and values packed in a single bytes
+  object (the encoding of small hashes).
+
+Hashes look like small user profiles (a few short fields). Memory is
+measured with tracemalloc for the structures and their contents (keys and
+values wrapping them are left out). Reads and writes are measured on the
+structures, without storage and command dispatch.
+
+Usage:
+    python -m benchmarks.hashes --hashes 100000 --fields 10
+"""
+
+import argparse
+import time
+import tracemalloc
+
+from app.storage.structures import HashTable, Listpack
+
+
+def _profile(i: int, fields: int) -> list[tuple[bytes, bytes]]:
+    return [(b"field:%d" % f, b"value:%d:%d" % (i, f)) for f in range(fields)]
+
+
+def _memory(build, hashes: int, fields: int) -> int:
+    tracemalloc.start()
+    structures = [build(_profile(i, fields)) for i in range(hashes)]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del structures
+    return size
+
+
+def _ops(op, rounds: int) -> float:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        op()
+    return rounds / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--hashes", type=int, default=100_000)
+    parser.add_argument("--fields", type=int, default=10)
+    parser.add_argument("--rounds", type=int, default=200_000)
+    args = parser.parse_args()
+
+    per_million = 1_000_000 / args.hashes / 1024**2
+    pairs = _profile(0, args.fields)
+    last_field, new_pair = pairs[-1][0], [(pairs[0][0], b"updated")]
+    encodings = [("dict", dict), ("hashtable", HashTable), ("listpack", Listpack)]
+    for name, build in encodings:
+        size = _memory(build, args.hashes, args.fields)
+        fields = build(pairs)
+        hget = _ops(lambda: fields.get(last_field), args.rounds)
+        hset = _ops(lambda: fields.update(new_pair), args.rounds)
+        print(
+            f"{name:>9} MiB per 1M hashes={size * per_million:8.1f}"
+            f" hget ops/s={hget:>12,.0f} hset ops/s={hset:>12,.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""Measures KEYS with a selective literal prefix pattern (eg,
+`session:1234:*`) for a growing keyspace, with and without the prefix index
+(`--prefix-index`).
+
+Keys are `session:<id>:<n>` with 10 keys per session, so a session pattern
+always matches 10 keys. With the index, the time of KEYS stays proportional
+to the matches instead of the keyspace.
+
+Usage:
+    python -m benchmarks.keys_prefix --keys 100000 1000000
+"""
+
+import argparse
+import time
+
+from app.storage.in_memory import SimpleStorage
+from app.storage.types import RedisValue
+
+
+def _measure(storage: SimpleStorage, pattern: bytes, rounds: int) -> float:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        storage.keys(pattern)
+    return (time.perf_counter() - start) / rounds
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--keys", type=int, nargs="+", default=[100_000, 1_000_000])
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    for keys in args.keys:
+        db = {
+            b"session:%d:%d" % (i // 10, i % 10): RedisValue(b"v") for i in range(keys)
+        }
+        for prefix_index in (False, True):
+            storage = SimpleStorage(dict(db), prefix_index=prefix_index)
+            pattern = b"session:%d:*" % (keys // 20)
+            elapsed = _measure(storage, pattern, args.rounds)
+            print(
+                f"keys={keys:<9} prefix_index={prefix_index!s:<5} "
+                f"matches={len(storage.keys(pattern))} time={elapsed * 1e3:10.3f}ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""Measures the time taken to serialize the reply of KEYS for a large
+number of matching keys.
+
+- `resp`: the reply is built from one `BulkString` per key serialized with
+  `Array` (how replies were built before the encoder),
+- `encoder`: the reply is appended directly into a single bytearray.
+
+Usage:
+    python -m benchmarks.keys_reply --keys 100000
+"""
+
+import argparse
+import time
+
+from app.resp import encoder
+from app.resp.types import Array, BulkString
+from app.storage.in_memory import SimpleStorage
+from app.storage.in_memory.base import RedisValue
+
+
+def _measure(fn, rounds: int) -> float:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        fn()
+    return (time.perf_counter() - start) / rounds
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--keys", type=int, default=100_000)
+    parser.add_argument("--rounds", type=int, default=10)
+    args = parser.parse_args()
+
+    storage = SimpleStorage()
+    for i in range(args.keys):
+        storage.set(b"key:%d" % i, RedisValue(raw_bytes=b"value"))
+    keys = storage.keys(b"*")
+
+    def _encoder() -> bytes:
+        buf = bytearray()
+        encoder.write_bulk_string_array(buf, keys)
+        return bytes(buf)
+
+    serializers = [
+        ("resp", lambda: bytes(Array([BulkString(k) for k in keys]))),
+        ("encoder", _encoder),
+    ]
+    for name, fn in serializers:
+        elapsed = _measure(fn, args.rounds)
+        print(f"{name:>8} keys={args.keys:<8} time={elapsed * 1000:8.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
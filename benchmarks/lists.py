@@ -0,0 +1,71 @@
+"""Measures memory and push/pop throughput of list values (QuickList)
+against a deque of byte strings (one python object per element).
+
+Usage:
+    python -m benchmarks.lists --elements 1000000
+"""
+
+import argparse
+import time
+import tracemalloc
+from collections import deque
+
+from app.storage.structures import QuickList
+
+
+def _memory(build) -> int:
+    tracemalloc.start()
+    structure = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del structure
+    return size
+
+
+def _ops(fn, rounds: int) -> float:
+    start = time.perf_counter()
+    fn(rounds)
+    return rounds / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--elements", type=int, default=1_000_000)
+    args = parser.parse_args()
+    n = args.elements
+
+    def _deque():
+        items = deque()
+        for i in range(n):
+            items.append(b"job:%d" % i)
+        return items
+
+    def _quicklist():
+        items = QuickList()
+        for i in range(n):
+            items.push_right(b"job:%d" % i)
+        return items
+
+    for name, build in [("deque", _deque), ("quicklist", _quicklist)]:
+        print(f"{name:>9} MiB per {n} elements={_memory(build) / 1024**2:8.1f}")
+
+    def _queue(rounds: int):
+        items = QuickList()
+        for i in range(rounds):
+            items.push_left(b"job")
+        for i in range(rounds):
+            items.pop_right()
+
+    items = _quicklist()
+
+    def _lrange(rounds: int):
+        for i in range(rounds):
+            start = (i * 7919) % (n - 100)
+            items.range(start, start + 100)
+
+    print(f"push+pop pairs/s={_ops(_queue, n):>12,.0f}")
+    print(f"LRANGE 100 ops/s={_ops(_lrange, 10_000):>10,.0f}")
+
+
+if __name__ == "__main__":
+    main()
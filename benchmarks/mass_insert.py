@@ -0,0 +1,95 @@
+"""Measures how the receive path scales with the size of a pipelined mass
+insert (like `redis-cli --pipe`).
+
+A stream of N SET commands is sent over a socket pair and read back the way
+a connection does, for,
+- `legacy`: recv(512), `buf += chunk`, `buf = buf[pos:]` on immutable bytes
+  (the receive path before the stream parser),
+- `legacy-64k`: same as legacy with recv(65536), every parsed command copies
+  the remaining buffer so larger reads make it quadratic,
+- `stream`: the connection's RespStreamParser (recv_into a reused buffer).
+
+Only receiving and parsing is measured (commands are not executed). With a
+linear receive path, time per command stays constant as N grows.
+
+Usage:
+    python -m benchmarks.mass_insert --commands 10000 20000 40000 80000
+"""
+
+import argparse
+import socket
+import threading
+import time
+
+from app.resp.stream import RespStreamParser
+from app.resp.types.array import bytes_to_resp
+
+
+def _mass_insert_stream(commands: int) -> bytes:
+    return b"".join(
+        b"*3\r\n$3\r\nSET\r\n$%d\r\nkey:%d\r\n$5\r\nvalue\r\n" % (len(b"key:%d" % i), i)
+        for i in range(commands)
+    )
+
+
+def _legacy(sock: socket.socket, read_size: int = 512) -> int:
+    parsed = 0
+    buf = b""
+    while chunk := sock.recv(read_size):
+        buf += chunk
+        while buf:
+            try:
+                _, pos = bytes_to_resp(buf)
+            except EOFError:
+                break
+            buf = buf[pos:]
+            parsed += 1
+    return parsed
+
+
+def _stream(sock: socket.socket) -> int:
+    parsed = 0
+    parser = RespStreamParser()
+    while parser.recv_into(sock):
+        for _ in parser:
+            parsed += 1
+    return parsed
+
+
+def _measure(receive, data: bytes) -> float:
+    server, client = socket.socketpair()
+    sender = threading.Thread(target=lambda: (client.sendall(data), client.close()))
+
+    start = time.perf_counter()
+    sender.start()
+    receive(server)
+    elapsed = time.perf_counter() - start
+
+    sender.join()
+    server.close()
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--commands", type=int, nargs="+", default=[10_000, 20_000, 40_000, 80_000]
+    )
+    args = parser.parse_args()
+
+    receivers = [
+        ("legacy", _legacy),
+        ("legacy-64k", lambda sock: _legacy(sock, 65536)),
+        ("stream", _stream),
+    ]
+    for name, receive in receivers:
+        for commands in args.commands:
+            elapsed = _measure(receive, _mass_insert_stream(commands))
+            print(
+                f"{name:>10} commands={commands:<8} time={elapsed:8.3f}s  "
+                f"us/command={elapsed / commands * 1e6:8.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""Measures the parse path of pipelined SET/GET commands, from bytes in the
+connection buffer to RedisCommand instances.
+
+- `resp`: every frame is parsed to RESP types (`Array` of `BulkString`)
+  which are unwrapped to the command arguments (the path before the
+  command fast path),
+- `fast`: frames are decoded directly to lists of byte strings by the
+  parser's fast path for commands.
+
+With --chunk, the stream is fed in chunks of that many bytes (like reads
+from a socket), so frames crossing the end of a chunk are parsed in parts.
+
+Usage:
+    python -m benchmarks.parse_commands --commands 100000 --chunk 64
+"""
+
+import argparse
+import time
+
+from app.resp.stream import RespStreamParser
+from app.utils.command_from_resp import command_from_args, command_from_resp_array
+
+
+def _set_get_stream(commands: int) -> bytes:
+    out = []
+    for i in range(commands // 2):
+        key = b"key:%d" % i
+        out.append(b"*3\r\n$3\r\nSET\r\n$%d\r\n%s\r\n$5\r\nvalue\r\n" % (len(key), key))
+        out.append(b"*2\r\n$3\r\nGET\r\n$%d\r\n%s\r\n" % (len(key), key))
+    return b"".join(out)
+
+
+def _measure(
+    data: bytes, fast: bool, build_commands: bool, chunk: int
+) -> tuple[int, float]:
+    parser = RespStreamParser(commands=fast)
+    chunk = chunk or len(data)
+
+    parsed = 0
+    start = time.perf_counter()
+    for offset in range(0, len(data), chunk):
+        parser.feed(data[offset : offset + chunk])
+        for element, _ in parser:
+            if build_commands:
+                if isinstance(element, list):
+                    command_from_args(element)
+                else:
+                    command_from_resp_array(element)
+            parsed += 1
+    return parsed, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--commands", type=int, default=100_000)
+    parser.add_argument("--chunk", type=int, default=0, help="bytes per feed")
+    args = parser.parse_args()
+
+    data = _set_get_stream(args.commands)
+    for build_commands in (False, True):
+        stage = "parse+command" if build_commands else "parse"
+        for name, fast in (("resp", False), ("fast", True)):
+            parsed, elapsed = _measure(data, fast, build_commands, args.chunk)
+            print(f"{stage:>13} {name:>5} ops/s={parsed / elapsed:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
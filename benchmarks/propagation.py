@@ -0,0 +1,79 @@
+"""Measures the cost of building the bytes a write propagates to replicas.
+
+- `serialize`: the write is serialized again from its arguments (the way
+  writes used to be propagated),
+- `request`: the bytes of the request the write was parsed from are
+  propagated (see `RedisCommand.replication_payload`), and copied once out
+  of the input buffer when there are replicas to send them to
+  (`request+copy`).
+
+Writes are HSET commands with a number of fields, parsed from a pipelined
+stream the way a connection does.
+
+Usage:
+    python -m benchmarks.propagation --writes 100000 --fields 1 4 16
+"""
+
+import argparse
+import time
+
+from app.commands.base import RedisCommand
+from app.resp import encoder
+from app.resp.stream import RespStreamParser
+from app.utils.command_from_resp import command_from_args
+
+
+def _serialize(commands: list[RedisCommand]):
+    for command in commands:
+        bytes(command)
+
+
+def _request(commands: list[RedisCommand]):
+    for command in commands:
+        command.replication_payload()
+
+
+def _request_copy(commands: list[RedisCommand]):
+    for command in commands:
+        bytes(command.replication_payload())
+
+
+def _parse(writes: int, fields: int) -> list[RedisCommand]:
+    pairs = [element for i in range(fields) for element in (b"f%d" % i, b"v" * 16)]
+    parser = RespStreamParser(commands=True)
+    parser.feed(
+        b"".join(encoder.command(b"HSET", b"h:%d" % i, *pairs) for i in range(writes))
+    )
+    commands = []
+    for args, size in parser:
+        command = command_from_args(args)  # type: ignore[arg-type]
+        command.request = parser.span(size)
+        commands.append(command)
+    return commands
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--writes", type=int, default=100_000)
+    parser.add_argument("--fields", type=int, nargs="+", default=[1, 4, 16])
+    args = parser.parse_args()
+
+    modes = [
+        ("serialize", _serialize),
+        ("request", _request),
+        ("request+copy", _request_copy),
+    ]
+    for fields in args.fields:
+        commands = _parse(args.writes, fields)
+        for mode, propagate in modes:
+            start = time.perf_counter()
+            propagate(commands)
+            elapsed = time.perf_counter() - start
+            print(
+                f"HSET {fields:>2} fields {mode:>12}"
+                f" {elapsed / args.writes * 1e9:8.1f} ns/write"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""Measures propagation of writes to replicas, with one slow replica.
+
+- `thread`: each write starts a thread that sends it to every replica in
+  turn while holding the pool lock (the way writes used to be broadcast),
+- `queue`: each write is appended to the outbound buffer of every replica,
+  which is sent by a writer thread per replica (see `ReplicaOutput`).
+
+Replicas are threads reading from a socket pair, the slow one reads 4 KB
+at a time and sleeps after each read. Writes carry a sequence number, a
+write received after a later one counts as reordered. Reported times are
+how long the writes took to broadcast (for the client making them) and
+until the fast and slow replicas received all of them.
+
+Usage:
+    python -m benchmarks.replication --writes 20000 --replicas 3
+"""
+
+import argparse
+import logging
+import socket
+import threading
+import time
+
+from app.replication.pool import ReplicaConnectionPool
+
+SLOW_READ_SIZE = 4096
+
+
+class _Replica:
+    """Reads writes from a socket, counting writes received out of order."""
+
+    def __init__(self, sock: socket.socket, writes: int, delay: float):
+        self.reordered = 0
+        self.done = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, args=(sock, writes, delay), daemon=True
+        )
+        self._thread.start()
+
+    def _run(self, sock: socket.socket, writes: int, delay: float):
+        received, last, pending = 0, -1, b""
+        read_size = SLOW_READ_SIZE if delay else 65536
+        while received < writes:
+            data = sock.recv(read_size)
+            if not data:
+                break
+            lines = (pending + data).split(b"\n")
+            pending = lines.pop()
+            for line in lines:
+                seq = int(line.split(b" ")[0])
+                self.reordered += seq < last
+                last = max(last, seq)
+                received += 1
+            if delay:
+                time.sleep(delay)
+        self.done.set()
+
+
+def _legacy_broadcast(lock: threading.RLock, socks: list[socket.socket], data: bytes):
+    with lock:
+        for sock in socks:
+            sock.sendall(data)
+
+
+def _run(mode: str, writes: int, size: int, replicas: int, delay: float):
+    pairs = [socket.socketpair() for _ in range(replicas + 1)]
+    fakes = [
+        _Replica(replica, writes, delay if i == 0 else 0)
+        for i, (_, replica) in enumerate(pairs)
+    ]
+    pool = ReplicaConnectionPool()
+    lock = threading.RLock()
+    socks = [master for master, _ in pairs]
+    for i, sock in enumerate(socks):
+        pool.add(str(i), sock)
+
+    start = time.perf_counter()
+    for seq in range(writes):
+        data = (b"%d " % seq).ljust(size - 1, b"x") + b"\n"
+        if mode == "thread":
+            threading.Thread(target=_legacy_broadcast, args=(lock, socks, data)).start()
+        else:
+            pool.broadcast_to_all_connections(data)
+    broadcast = time.perf_counter() - start
+    for fake in fakes[1:]:
+        fake.done.wait()
+    fast = time.perf_counter() - start
+    fakes[0].done.wait()
+    slow = time.perf_counter() - start
+
+    reordered = sum(fake.reordered for fake in fakes)
+    for i in range(len(socks)):
+        pool.remove(str(i))
+    return broadcast, fast, slow, reordered
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--writes", type=int, default=20000)
+    parser.add_argument("--size", type=int, default=100, help="bytes per write")
+    parser.add_argument("--replicas", type=int, default=3, help="fast replicas")
+    parser.add_argument("--slow-delay", type=float, default=0.001)
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)  # replicas removed at the end of each run
+
+    for mode in ("thread", "queue"):
+        broadcast, fast, slow, reordered = _run(
+            mode, args.writes, args.size, args.replicas, args.slow_delay
+        )
+        print(
+            f"{mode:>6} {args.writes / broadcast:10.0f} writes/s broadcast"
+            f" fast replicas done={fast * 1000:8.1f} ms"
+            f" slow replica done={slow * 1000:8.1f} ms reordered={reordered}"
+        )
+
+
+if __name__ == "__main__":
+    main()
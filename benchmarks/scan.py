@@ -0,0 +1,65 @@
+"""Measures how long the storage lock is held to enumerate the keyspace,
+with KEYS (all keys at once) and SCAN (one COUNT sized step at a time).
+
+The longest add to a scan table is reported too, it includes the resizes
+of the table (which is rehashed a few buckets per add, see `ScanTable`).
+
+Usage:
+    python -m benchmarks.scan --keys 1000000 --count 100
+"""
+
+import argparse
+import gc
+import time
+
+from app.storage.in_memory import ThreadSafeStorage
+from app.storage.in_memory.scan import ScanTable
+from app.storage.types import RedisValue
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--keys", type=int, default=1_000_000)
+    parser.add_argument("--count", type=int, default=100)
+    args = parser.parse_args()
+
+    table: ScanTable[bytes] = ScanTable()
+    longest = 0.0
+    gc.disable()  # collections would be the longest pauses
+    for i in range(args.keys):
+        add_start = time.perf_counter()
+        table.add(b"key:%d" % i)
+        longest = max(longest, time.perf_counter() - add_start)
+    gc.enable()
+    print(f"ADD  keys={len(table):<9} longest add={longest * 1e3:8.3f}ms")
+
+    storage = ThreadSafeStorage()
+    start = time.perf_counter()
+    for i in range(args.keys):
+        storage.set(b"key:%d" % i, RedisValue(b"value"))
+    print(f"SET  us/key={(time.perf_counter() - start) / args.keys * 1e6:8.2f}")
+
+    start = time.perf_counter()
+    keys = storage.keys(b"*")
+    elapsed = time.perf_counter() - start
+    print(f"KEYS keys={len(keys):<9} lock held={elapsed * 1e3:8.2f}ms")
+
+    cursor, steps, found, longest = 0, 0, 0, 0.0
+    start = time.perf_counter()
+    while True:
+        step_start = time.perf_counter()
+        cursor, keys = storage.scan(cursor, args.count)
+        longest = max(longest, time.perf_counter() - step_start)
+        steps += 1
+        found += len(keys)
+        if cursor == 0:
+            break
+    elapsed = time.perf_counter() - start
+    print(
+        f"SCAN keys={found:<9} steps={steps} total={elapsed * 1e3:.2f}ms  "
+        f"longest lock held={longest * 1e3:8.3f}ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""Measures memory and throughput of large integer sets per encoding.
+
+- `set`: members in a plain python set of byte strings (the layout without
+  compact encoding, `HashSet` in the hashtable encoding),
+- `intset`: `IntSet`, members sorted in an array of 64 bit integers.
+
+Memory is measured with tracemalloc for the structures and their members.
+SISMEMBER is measured on the structures (parsing the member for intsets),
+SINTER with `intersection` on a large set and a set 1000 times smaller (the
+small set is iterated first), and on two large sets that share half of their members.
+
+Usage:
+    python -m benchmarks.sets --members 1000000
+"""
+
+import argparse
+import random
+import time
+import tracemalloc
+
+from app.storage.structures import HashSet, IntSet
+from app.storage.structures.set import intersection
+
+
+def _build(encoding: str, numbers: list[int]):
+    if encoding == "intset":
+        return IntSet(numbers)
+    return HashSet(b"%d" % number for number in numbers)
+
+
+def _memory(encoding: str, numbers: list[int]) -> int:
+    tracemalloc.start()
+    members = _build(encoding, numbers)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del members
+    return size
+
+
+def _ops(op, rounds: int) -> float:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        op()
+    return rounds / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--members", type=int, default=1_000_000)
+    parser.add_argument("--rounds", type=int, default=200_000)
+    args = parser.parse_args()
+
+    rand = random.Random(0)
+    numbers = rand.sample(range(100 * args.members), args.members)
+    overlapping = numbers[: args.members // 2] + [
+        -n - 1 for n in numbers[: args.members // 2]
+    ]
+    small = rand.sample(numbers, max(args.members // 1000, 1))
+    lookups = [b"%d" % rand.choice(numbers) for _ in range(1024)]
+
+    for encoding in ("set", "intset"):
+        size = _memory(encoding, numbers)
+        large, other = _build(encoding, numbers), _build(encoding, overlapping)
+        few = _build(encoding, small)
+
+        it = iter(range(args.rounds))
+        sismember = _ops(lambda: lookups[next(it) & 1023] in large, args.rounds)
+        sinter_small = _ops(lambda: intersection([large, few]), 100)
+        start = time.perf_counter()
+        intersection([large, other])
+        sinter_large = time.perf_counter() - start
+        print(
+            f"{encoding:>6} MiB={size / 1024**2:8.1f}"
+            f" sismember ops/s={sismember:>11,.0f}"
+            f" sinter(large, small) ops/s={sinter_small:>8,.0f}"
+            f" sinter(large, large) s={sinter_large:.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
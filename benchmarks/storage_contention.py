@@ -0,0 +1,72 @@
+"""Measures throughput of the thread-safe storages when accessed from many
+connection threads at once.
+
+Each thread runs a mix of GET, SET and INCR-like updates on random keys,
+for,
+- `global-lock`: ThreadSafeStorage (a single lock for the keyspace),
+- `striped`: StripedLockStorage (a lock per stripe of keys).
+
+Usage:
+    python -m benchmarks.storage_contention --threads 8 32 128
+"""
+
+import argparse
+import random
+import threading
+import time
+
+from app.storage.in_memory import StripedLockStorage, ThreadSafeStorage
+from app.storage.in_memory.base import RedisStorage
+from app.storage.types import RedisValue
+
+
+def _incr(value: RedisValue) -> RedisValue:
+    value.raw_bytes = b"%d" % (int(value.raw_bytes) + 1)
+    return value
+
+
+def _worker(storage: RedisStorage, keys: list[bytes], ops: int):
+    for _ in range(ops):
+        key = random.choice(keys)
+        op = random.random()
+        if op < 0.5:
+            storage.get(key)
+        elif op < 0.8:
+            storage.set(key, RedisValue(raw_bytes=b"0"))
+        else:
+            storage.update(key, _incr)
+
+
+def _measure(storage: RedisStorage, threads: int, ops: int, keyspace: int) -> float:
+    keys = [b"key:%d" % i for i in range(keyspace)]
+    for key in keys:
+        storage.set(key, RedisValue(raw_bytes=b"0"))
+
+    workers = [
+        threading.Thread(target=_worker, args=(storage, keys, ops))
+        for _ in range(threads)
+    ]
+    start = time.perf_counter()
+    for t in workers:
+        t.start()
+    for t in workers:
+        t.join()
+    return threads * ops / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--threads", type=int, nargs="+", default=[8, 32, 128])
+    parser.add_argument("--ops", type=int, default=20_000, help="ops per thread")
+    parser.add_argument("--keyspace", type=int, default=10_000)
+    args = parser.parse_args()
+
+    storages = [("global-lock", ThreadSafeStorage), ("striped", StripedLockStorage)]
+    for threads in args.threads:
+        for name, storage_cls in storages:
+            ops = _measure(storage_cls(), threads, args.ops, args.keyspace)
+            print(f"{name:>11} threads={threads:<4} ops/s={ops:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""Measures appends, memory and range reads of a large stream.
+
+- `list`: entries as (ID, fields and values) tuples in a python list (the
+  layout without blocks, for comparison of memory),
+- `stream`: `Stream`, entries in blocks of delta encoded IDs and packed
+  fields and values (stream-node-max-entries 100, stream-node-max-bytes
+  4096).
+
+XADD appends entries of a sensor reading (two fields) with increasing IDs,
+memory is measured with tracemalloc on a tenth of the entries. XRANGE reads
+COUNT entries from random IDs, and XREAD the entries after an ID near the
+end of the stream.
+
+Usage:
+    python -m benchmarks.streams --entries 10000000
+"""
+
+import argparse
+import random
+import time
+import tracemalloc
+
+from app.storage.structures import Stream
+from app.storage.structures.stream import MAX_ID, increment
+
+START_MS = 1_700_000_000_000
+
+
+def _entries(count: int):
+    for i in range(count):
+        # a few entries per millisecond
+        yield (
+            (START_MS + i // 4, i % 4),
+            [
+                b"sensor",
+                b"%d" % (i % 64),
+                b"temp",
+                b"%d" % (i % 500),
+            ],
+        )
+
+
+def _build(encoding: str, count: int):
+    if encoding == "list":
+        return [(stream_id, elements) for stream_id, elements in _entries(count)]
+    stream = Stream()
+    for stream_id, elements in _entries(count):
+        stream.add(stream_id, elements, 100, 4096)
+    return stream
+
+
+def _memory(encoding: str, count: int) -> int:
+    tracemalloc.start()
+    entries = _build(encoding, count)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del entries
+    return size
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entries", type=int, default=10_000_000)
+    parser.add_argument("--rounds", type=int, default=10_000)
+    args = parser.parse_args()
+
+    sample = max(args.entries // 10, 1)
+    for encoding in ("list", "stream"):
+        size = _memory(encoding, sample)
+        print(f"{encoding:>6} bytes/entry={size / sample:6.1f}")
+
+    start = time.perf_counter()
+    stream = _build("stream", args.entries)
+    elapsed = time.perf_counter() - start
+    print(f"xadd {args.entries:,} entries: {args.entries / elapsed:>11,.0f} ops/s")
+
+    rand = random.Random(0)
+    last_ms = START_MS + args.entries // 4
+    for count in (10, 100, 1000):
+        starts = [(rand.randrange(START_MS, last_ms), 0) for _ in range(args.rounds)]
+        start = time.perf_counter()
+        for stream_id in starts:
+            stream.range(stream_id, MAX_ID, count)
+        elapsed = time.perf_counter() - start
+        print(f"xrange count {count:>4}: {elapsed / args.rounds * 1e6:8.1f} us/op")
+
+    tail = stream.range((last_ms - 2, 0), MAX_ID)[0][0]
+    start = time.perf_counter()
+    for _ in range(args.rounds):
+        stream.range(increment(tail), MAX_ID)
+    elapsed = time.perf_counter() - start
+    print(f"xread tail: {elapsed / args.rounds * 1e6:8.1f} us/op")
+
+
+if __name__ == "__main__":
+    main()
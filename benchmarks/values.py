@@ -0,0 +1,78 @@
+"""Measures memory used per key and INCR throughput for the value layout.
+
+- `dataclass`: values as a plain dataclass holding bytes (the layout before
+  slotted values), INCR parses and formats the string on every call,
+- `slots`: `RedisValue` with `__slots__`, integer looking strings are stored
+  as native int and incremented in place.
+
+Memory is measured with tracemalloc for values and their contents (keys are
+left out), for both counters (integer strings) and short strings. INCR is
+measured on a single value, without storage and command dispatch.
+
+Usage:
+    python -m benchmarks.values --keys 1000000
+"""
+
+import argparse
+import time
+import tracemalloc
+from dataclasses import dataclass
+from typing import Callable
+
+from app.commands.handlers.incr import _incr_value
+from app.storage.types import RedisEncoding, RedisValue
+
+
+@dataclass
+class _DataclassValue:
+    raw_bytes: bytes
+    expiry: int | None = None
+    encoding: RedisEncoding = RedisEncoding.STRING
+    lru: int = 0
+
+
+def _legacy_incr(value: _DataclassValue) -> _DataclassValue:
+    value.raw_bytes = str(int(value.raw_bytes.decode()) + 1).encode()
+    return value
+
+
+def _values_memory(value_cls, contents: Callable[[int], bytes], keys: int) -> int:
+    tracemalloc.start()
+    values = [value_cls(contents(i)) for i in range(keys)]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del values
+    return size
+
+
+def _incr_ops(incr, value, rounds: int) -> float:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        incr(value)
+    return rounds / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--keys", type=int, default=1_000_000)
+    parser.add_argument("--rounds", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    per_million = 1_000_000 / args.keys / 1024**2
+    workloads = [
+        ("counters", lambda i: b"%d" % (i * 7919)),
+        ("strings", lambda i: b"value:%d" % i),
+    ]
+    for workload, contents in workloads:
+        for name, value_cls in [("dataclass", _DataclassValue), ("slots", RedisValue)]:
+            size = _values_memory(value_cls, contents, args.keys)
+            print(f"{workload:>8} {name:>9} MiB per 1M keys={size * per_million:8.1f}")
+
+    legacy = _incr_ops(_legacy_incr, _DataclassValue(b"0"), args.rounds)
+    native = _incr_ops(_incr_value, RedisValue(b"0"), args.rounds)
+    print(f"incr dataclass ops/s={legacy:>12,.0f}")
+    print(f"incr     slots ops/s={native:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""Measures the latency of WAIT with replicas answering GETACK right away.
+
+- `polling`: WAIT checks the acks every 20 ms and asks replicas for them
+  from a new thread each time (the way WAIT used to wait for replicas),
+- `notify`: WAIT sends GETACK once and sleeps in
+  `ReplicaConnectionPool.wait_for_acks` until the acks wake it up.
+
+Replicas are threads reading GETACK from a socket pair, which ack the
+offset of the last write. Each round makes a write (moving the offset) and
+waits for all the replicas to ack it.
+
+Usage:
+    python -m benchmarks.wait --rounds 200 --replicas 1 3 10
+"""
+
+import argparse
+import logging
+import socket
+import statistics
+import threading
+import time
+
+from app.replication.pool import GET_ACK, ReplicaConnectionPool
+
+POLL_INTERVAL = 0.02
+
+
+class _Replicas:
+    """Replicas acking the current offset on each GETACK."""
+
+    def __init__(self, pool: ReplicaConnectionPool, count: int):
+        self.offset = 0
+        for i in range(count):
+            master, replica = socket.socketpair()
+            pool.add(str(i), master)
+            threading.Thread(
+                target=self._serve, args=(pool, str(i), replica), daemon=True
+            ).start()
+
+    def _serve(self, pool: ReplicaConnectionPool, uid: str, sock: socket.socket):
+        with sock:
+            while data := sock.recv(4096):
+                for _ in range(data.count(GET_ACK)):
+                    pool.update_last_ack_offset(uid, self.offset)
+
+
+def _poll(pool: ReplicaConnectionPool, offset: int, required: int) -> int:
+    threads = 0
+    while pool.count_acked_connections(offset) < required:
+        threading.Thread(
+            target=pool.request_offset_ack_from_connections, args=(offset,)
+        ).start()
+        threads += 1
+        time.sleep(POLL_INTERVAL)
+    return threads
+
+
+def _latencies(mode: str, replicas: int, rounds: int) -> tuple[list[float], int]:
+    pool = ReplicaConnectionPool()
+    fakes = _Replicas(pool, replicas)
+    latencies: list[float] = []
+    threads = 0
+    for _ in range(rounds):
+        fakes.offset += 100  # a write propagated to the replicas
+        start = time.perf_counter()
+        if mode == "polling":
+            threads += _poll(pool, fakes.offset, replicas)
+        else:
+            acked = pool.wait_for_acks(fakes.offset, replicas, timeout=5)
+            assert acked == replicas
+        latencies.append(time.perf_counter() - start)
+    for i in range(replicas):
+        pool.remove(str(i))  # closes the socket of the master, ending _serve
+    return latencies, threads
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=200)
+    parser.add_argument("--replicas", type=int, nargs="+", default=[1, 3, 10])
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)  # replicas removed at the end of each run
+
+    for replicas in args.replicas:
+        for mode in ("polling", "notify"):
+            latencies, threads = _latencies(mode, replicas, args.rounds)
+            latencies.sort()
+            p99 = latencies[int(len(latencies) * 0.99)]
+            print(
+                f"{replicas:>3} replicas {mode:>8}"
+                f" p50={statistics.median(latencies) * 1e6:9.1f} us"
+                f" p99={p99 * 1e6:9.1f} us"
+                f" threads/wait={threads / args.rounds:.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""Measures GET/SET throughput of the server for a varying number of worker
+processes (`--workers`).
+
+Load is generated from multiple client processes, each sending pipelined
+batches of SET and GET commands on random keys.
+
+Usage:
+    python -m benchmarks.workers --workers 1 2 4 8 16 --clients 32
+"""
+
+import argparse
+import multiprocessing
+import random
+import socket
+import subprocess
+import sys
+import time
+
+
+def _command(*args: bytes) -> bytes:
+    out = [b"*%d\r\n" % len(args)]
+    out.extend(b"$%d\r\n%s\r\n" % (len(arg), arg) for arg in args)
+    return b"".join(out)
+
+
+def _recv_replies(sock: socket.socket, count: int):
+    """Reads `count` single line replies (+OK, $-1 or bulk strings)."""
+    buf = b""
+    replies = 0
+    pos = 0
+    while replies < count:
+        end = buf.find(b"\r\n", pos)
+        if end == -1:
+            buf = buf[pos:] + sock.recv(65536)
+            pos = 0
+            continue
+        if buf[pos : pos + 1] == b"$" and buf[pos + 1 : end] != b"-1":
+            length = int(buf[pos + 1 : end])
+            if len(buf) < end + 2 + length + 2:
+                buf = buf[pos:] + sock.recv(65536)
+                pos = 0
+                continue
+            end += length + 2
+        pos = end + 2
+        replies += 1
+
+
+def _client(port: int, duration: float, pipeline: int, keyspace: int, out):
+    sock = socket.create_connection(("localhost", port))
+    ops = 0
+    deadline = time.perf_counter() + duration
+    while time.perf_counter() < deadline:
+        batch = []
+        for _ in range(pipeline):
+            key = b"key:%d" % random.randrange(keyspace)
+            if random.random() < 0.5:
+                batch.append(_command(b"SET", key, b"value"))
+            else:
+                batch.append(_command(b"GET", key))
+        sock.sendall(b"".join(batch))
+        _recv_replies(sock, pipeline)
+        ops += pipeline
+    out.put(ops)
+
+
+def _run(
+    port: int, workers: int, clients: int, duration: float, pipeline: int
+) -> float:
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "app.main", "--port", str(port)]
+        + ["--workers", str(workers)],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    time.sleep(1 + workers * 0.1)
+    try:
+        out = multiprocessing.Queue()
+        procs = [
+            multiprocessing.Process(
+                target=_client, args=(port, duration, pipeline, 100_000, out)
+            )
+            for _ in range(clients)
+        ]
+        for p in procs:
+            p.start()
+        total = sum(out.get() for _ in procs)
+        for p in procs:
+            p.join()
+        return total / duration
+    finally:
+        proc.terminate()
+        proc.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--port", type=int, default=6391)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8, 16])
+    parser.add_argument("--clients", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=5.0)
+    parser.add_argument("--pipeline", type=int, default=100)
+    args = parser.parse_args()
+
+    baseline = None
+    for workers in args.workers:
+        ops = _run(args.port, workers, args.clients, args.duration, args.pipeline)
+        baseline = baseline or ops
+        print(
+            f"workers={workers:<3} ops/s={ops:>12,.0f}  speedup={ops / baseline:.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
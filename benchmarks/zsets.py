@@ -0,0 +1,65 @@
+"""Measures ZADD throughput and ZRANGE BYSCORE latency of a large sorted set.
+
+- `SortedSet`: the skiplist encoding, a dict of scores along with a
+  `ScoreIndex` of (score, member) items in sorted sublists.
+
+ZADD inserts members with random scores one at a time into an empty sorted
+set (the layout OBJECT ENCODING reports as skiplist), then updates the
+scores of random members. ZRANGE BYSCORE locates a random score range and
+reads the members in it (with their scores), for ranges of a few sizes.
+
+Usage:
+    python -m benchmarks.zsets --members 1000000
+"""
+
+import argparse
+import random
+import time
+
+from app.storage.structures import SortedSet
+
+
+def _rate(count: int, seconds: float) -> str:
+    return f"{count / seconds:>11,.0f} ops/s"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--members", type=int, default=1_000_000)
+    parser.add_argument("--rounds", type=int, default=10_000)
+    args = parser.parse_args()
+
+    rand = random.Random(0)
+    members = [b"member:%d" % i for i in range(args.members)]
+    scores = [rand.random() * args.members for _ in range(args.members)]
+
+    zset = SortedSet()
+    start = time.perf_counter()
+    for member, score in zip(members, scores):
+        zset.add(member, score)
+    print(f"zadd (insert)  {_rate(args.members, time.perf_counter() - start)}")
+
+    updates = [
+        (rand.choice(members), rand.random() * args.members) for _ in range(args.rounds)
+    ]
+    start = time.perf_counter()
+    for member, score in updates:
+        zset.add(member, score)
+    print(f"zadd (update)  {_rate(len(updates), time.perf_counter() - start)}")
+
+    for width in (10, 100, 1000):
+        # score ranges holding about width members
+        lows = [rand.random() * (args.members - width) for _ in range(args.rounds)]
+        start = time.perf_counter()
+        for low in lows:
+            first, last = zset.score_range(low, False, low + width, False)
+            zset.range(first, last)
+        elapsed = time.perf_counter() - start
+        print(
+            f"zrange byscore ~{width:>4} members:"
+            f" {elapsed / args.rounds * 1e6:8.1f} us/op"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -9,9 +9,9 @@ REPLICA_PORTS = [5000, 5001, 5002]  # spawn 3 replicas
 REDIS_CLI = shutil.which("redis-cli")
 
 
-def start_master():
+def start_master(io_model: str):
     return subprocess.Popen(
-        [SERVER_CMD, "--port", str(MASTER_PORT)],
+        [SERVER_CMD, "--port", str(MASTER_PORT), "--io-model", io_model],
         stdout=subprocess.PIPE,
         stderr=subprocess.PIPE,
     )
@@ -47,15 +47,12 @@ def get_replication_offset(port: int) -> int:
     return int(lines[-1])
 
 
-def main():
-    if REDIS_CLI is None:
-        sys.exit("redis-cli not found in PATH")
-
+def main(io_model: str):
     procs = []
     try:
         # Start master
-        print("Starting master...")
-        master_proc = start_master()
+        print(f"Starting master ({io_model} io model)...")
+        master_proc = start_master(io_model)
         procs.append(master_proc)
         time.sleep(1)
 
@@ -105,11 +102,17 @@ def main():
 
         print("Replication offsets match for all replicas.")
 
-        print("=== REPLICATION TEST PASSED ===")
+        print(f"=== REPLICATION TEST PASSED ({io_model}) ===")
 
     finally:
         stop_all(procs)
 
 
 if __name__ == "__main__":
-    main()
+    if REDIS_CLI is None:
+        sys.exit("redis-cli not found in PATH")
+
+    # WAIT must be served while the master reads acks from replicas in both
+    # io models
+    for io_model in ("threaded", "asyncio"):
+        main(io_model)
@@ -0,0 +1,43 @@
+import pytest
+
+from app.commands.args.mapping import map_to_int, map_to_str_list
+from app.commands.args.parser import CommandArgParser
+from app.commands.errors import MissingArgument
+from app.commands.handlers import CommandGet, CommandSet
+
+
+def test_parse_positional_arguments():
+    parser = CommandArgParser().add_argument("key", 0).add_argument("value", 1)
+    assert parser.min_args == 2
+    assert parser.parse_args([b"foo", b"bar", b"extra"]) == {
+        "key": b"foo",
+        "value": b"bar",
+    }
+
+
+def test_parse_optional_captured_and_mapped_arguments():
+    parser = (
+        CommandArgParser()
+        .add_argument("count", 0, map_fn=map_to_int)
+        .add_argument("flag", 1, required=False, default=b"none")
+        .add_argument("rest", 2, required=False, capture=True, map_fn=map_to_str_list)
+    )
+    assert parser.min_args == 1
+    assert parser.parse_args([b"10"]) == {"count": 10, "flag": b"none", "rest": None}
+    assert parser.parse_args([b"10", b"x", b"a", b"b"]) == {
+        "count": 10,
+        "flag": b"x",
+        "rest": ["a", "b"],
+    }
+
+
+def test_missing_argument():
+    parser = CommandArgParser().add_argument("key", 0).add_argument("value", 1)
+    with pytest.raises(MissingArgument, match="at position 1 - 'value'"):
+        parser.parse_args([b"foo"])
+
+
+def test_command_argument_schema_is_shared_by_class():
+    assert CommandGet([b"foo"]).args == {"key": b"foo"}
+    assert CommandSet([b"foo", b"bar"]).args["expiry"] is None
+    assert CommandSet.arg_parser is CommandSet([b"a", b"b"]).arg_parser
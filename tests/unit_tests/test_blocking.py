@@ -0,0 +1,106 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from app.blocking import BlockedClients
+
+
+class _Waiter:
+    """Waits in a thread for items of a key."""
+
+    def __init__(self, clients: BlockedClients, key: bytes, timeout=None):
+        self.items: list[bytes] = []
+        self.attempts = 0
+        self.result = None
+        self._thread = threading.Thread(
+            target=self._run, args=(clients, key, timeout), daemon=True
+        )
+        self._thread.start()
+
+    def _attempt(self):
+        self.attempts += 1
+        return self.items.pop() if self.items else None
+
+    def _run(self, clients, key, timeout):
+        self.result = clients.wait_for([key], timeout, self._attempt)
+
+    def join(self):
+        self._thread.join(timeout=1)
+        assert not self._thread.is_alive()
+
+
+def _wait_until_blocked(clients: BlockedClients, keys: int):
+    deadline = time.monotonic() + 1
+    while len(clients) < keys and time.monotonic() < deadline:
+        time.sleep(0.001)
+
+
+def test_signal_only_wakes_clients_blocked_on_key():
+    clients = BlockedClients()
+    a, b = _Waiter(clients, b"a"), _Waiter(clients, b"b")
+    _wait_until_blocked(clients, 2)
+
+    a.items.append(b"x")
+    clients.signal(b"a")
+    a.join()
+    assert a.result == b"x"
+    assert b.attempts == 1  # only attempted once blocked
+
+    b.items.append(b"y")
+    clients.signal(b"b")
+    b.join()
+    assert b.result == b"y"
+    assert len(clients) == 0
+
+
+def test_timeouts_expire_in_order():
+    clients = BlockedClients()
+    waiters = [(timeout, _Waiter(clients, b"k", timeout)) for timeout in (0.3, 0.05)]
+    start = time.monotonic()
+    for timeout, waiter in sorted(waiters):
+        waiter.join()
+        assert timeout <= time.monotonic() - start < timeout + 0.1
+        assert waiter.result is None
+    assert len(clients) == 0
+
+
+def test_failed_attempt_unblocks_client():
+    clients = BlockedClients()
+
+    def attempt():
+        raise KeyError("wrong type")
+
+    with pytest.raises(KeyError):
+        clients.wait_for([b"k"], None, attempt)
+    assert len(clients) == 0
+
+
+def test_async_waiters_are_woken_up_from_other_threads():
+    clients = BlockedClients()
+    items: list[bytes] = []
+
+    async def main():
+        waiters = [
+            asyncio.create_task(
+                clients.wait_for_async(
+                    [b"k"], timeout, lambda: items.pop() if items else None
+                )
+            )
+            for timeout in (1, 0.05)
+        ]
+        await asyncio.sleep(0.01)
+        assert len(clients) == 1
+
+        def push():
+            items.append(b"x")
+            clients.signal(b"k")
+
+        threading.Thread(target=push).start()
+        return await asyncio.gather(*waiters)
+
+    # the push is popped by one of the waiters, the other one times out
+    results = asyncio.run(main())
+    assert sorted(results, key=bool) == [None, b"x"]
+    assert len(clients) == 0
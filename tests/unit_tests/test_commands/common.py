@@ -9,6 +9,9 @@ from app.replication.pool import ReplicaConnectionPool
 from app.storage.in_memory import SimpleStorage
 from app.storage.rdb import RDBManager
 
+# reply to commands run against a key holding a value of another type
+WRONGTYPE = b"-WRONGTYPE Operation against a key holding the wrong kind of value\r\n"
+
 
 def mock_socket():
     """Returns a mock socket for testing.
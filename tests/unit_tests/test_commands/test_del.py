@@ -0,0 +1,63 @@
+from time import time
+
+import pytest
+from app.commands import (
+    CommandDel,
+    CommandFlushAll,
+    CommandFlushDb,
+    CommandSet,
+    CommandUnlink,
+)
+from app.storage.types import RedisValue
+from tests.unit_tests.test_commands.common import CommandTestBase
+
+
+class TestCommandDel(CommandTestBase):
+    @pytest.mark.parametrize("command_cls", [CommandDel, CommandUnlink])
+    def test_delete_keys(self, command_cls):
+        self.execute_command(CommandSet([b"foo", b"1"]))
+        self.execute_command(CommandSet([b"bar", b"2"]))
+        expired = int(time() * 1000) - 1
+        self.exec_ctx.storage.set(b"old", RedisValue(b"3", expiry=expired))
+
+        result = self.execute_command(command_cls([b"foo", b"bar", b"old", b"nope"]))
+        assert result == b":2\r\n"
+        assert self.exec_ctx.storage.keys() == []
+
+    def test_serialization(self):
+        assert (
+            bytes(CommandDel([b"a", b"b"]))
+            == b"*3\r\n$3\r\nDEL\r\n$1\r\na\r\n$1\r\nb\r\n"
+        )
+        assert bytes(CommandUnlink([b"a"])) == b"*2\r\n$6\r\nUNLINK\r\n$1\r\na\r\n"
+
+
+class TestCommandFlush(CommandTestBase):
+    @pytest.mark.parametrize(
+        "command",
+        [
+            CommandFlushAll([]),
+            CommandFlushAll([b"async"]),
+            CommandFlushDb([b"SYNC"]),
+        ],
+    )
+    def test_flush(self, command):
+        for i in range(100):
+            self.execute_command(CommandSet([b"key:%d" % i, b"v"]))
+
+        assert self.execute_command(command) == b"+OK\r\n"
+        assert self.exec_ctx.storage.keys() == []
+        assert self.exec_ctx.storage.memory_stats().used_memory == 0
+
+        # keyspace remains usable after being flushed
+        self.execute_command(CommandSet([b"foo", b"bar"]))
+        assert self.exec_ctx.storage.keys() == [b"foo"]
+
+    def test_flush_invalid_mode(self):
+        result = self.execute_command(CommandFlushAll([b"LATER"]))
+        assert result == b"-ERR syntax error\r\n"
+        assert bytes(CommandFlushDb([b"ASYNC"])) == (
+            b"*2\r\n$7\r\nFLUSHDB\r\n$5\r\nASYNC\r\n"
+        )
+        # the serialized name doesn't shadow name() of the command
+        assert CommandFlushDb([]).name() == "CommandFlushDb"
@@ -0,0 +1,138 @@
+import pytest
+from app.commands import (
+    CommandGet,
+    CommandHDel,
+    CommandHGet,
+    CommandHGetAll,
+    CommandHIncrBy,
+    CommandHLen,
+    CommandHMGet,
+    CommandHScan,
+    CommandHSet,
+    CommandObject,
+    CommandSet,
+)
+from app.resp.types.array import bytes_to_resp
+from tests.unit_tests.test_commands.common import WRONGTYPE, CommandTestBase
+
+
+class TestCommandHashes(CommandTestBase):
+    def _hscan(self, *args: bytes) -> tuple[bytes, list[bytes]]:
+        reply, _ = bytes_to_resp(self.execute_command(CommandHScan([b"hash", *args])))
+        cursor, elements = reply.value
+        return cursor.value, [element.value for element in elements.value]
+
+    def _encoding(self) -> bytes:
+        return self.execute_command(CommandObject([b"ENCODING", b"hash"]))
+
+    def test_set_and_get(self):
+        assert self.execute_command(CommandHSet([b"hash", b"a", b"1", b"b", b"2"])) == (
+            b":2\r\n"
+        )
+        assert self.execute_command(CommandHSet([b"hash", b"b", b"3", b"c", b"4"])) == (
+            b":1\r\n"
+        )
+        assert self.execute_command(CommandHGet([b"hash", b"b"])) == b"$1\r\n3\r\n"
+        assert self.execute_command(CommandHGet([b"hash", b"z"])) == b"$-1\r\n"
+        assert self.execute_command(CommandHGet([b"nope", b"a"])) == b"$-1\r\n"
+        assert self.execute_command(CommandHMGet([b"hash", b"a", b"z", b"c"])) == (
+            b"*3\r\n$1\r\n1\r\n$-1\r\n$1\r\n4\r\n"
+        )
+        assert self.execute_command(CommandHLen([b"hash"])) == b":3\r\n"
+        assert self.execute_command(CommandHGetAll([b"hash"])) == (
+            b"*6\r\n$1\r\na\r\n$1\r\n1\r\n$1\r\nb\r\n$1\r\n3\r\n$1\r\nc\r\n$1\r\n4\r\n"
+        )
+        assert self.execute_command(CommandHGetAll([b"nope"])) == b"*0\r\n"
+
+    def test_hset_odd_arguments(self):
+        result = self.execute_command(CommandHSet([b"hash", b"a", b"1", b"b"]))
+        assert result == b"-ERR wrong number of arguments for 'hset' command\r\n"
+
+    def test_hdel(self):
+        self.execute_command(CommandHSet([b"hash", b"a", b"1", b"b", b"2"]))
+        assert self.execute_command(CommandHDel([b"hash", b"a", b"z"])) == b":1\r\n"
+        assert self.execute_command(CommandHDel([b"hash", b"b"])) == b":1\r\n"
+
+        # empty hashes are removed
+        assert self.exec_ctx.storage.keys() == []
+        assert self.execute_command(CommandHDel([b"hash", b"b"])) == b":0\r\n"
+
+    def test_hincrby(self):
+        assert self.execute_command(CommandHIncrBy([b"hash", b"n", b"5"])) == b":5\r\n"
+        assert self.execute_command(CommandHIncrBy([b"hash", b"n", b"-7"])) == (
+            b":-2\r\n"
+        )
+        assert self.execute_command(CommandHIncrBy([b"hash", b"n", b"x"])) == (
+            b"-ERR value is not an integer or out of range\r\n"
+        )
+
+        self.execute_command(
+            CommandHSet([b"hash", b"s", b"abc", b"big", b"%d" % (2**63 - 1)])
+        )
+        assert self.execute_command(CommandHIncrBy([b"hash", b"s", b"1"])) == (
+            b"-ERR hash value is not an integer\r\n"
+        )
+        assert self.execute_command(CommandHIncrBy([b"hash", b"big", b"1"])) == (
+            b"-ERR increment or decrement would overflow\r\n"
+        )
+
+    @pytest.mark.parametrize(
+        "pairs",
+        [
+            [(b"f%d" % i, b"v") for i in range(129)],  # too many fields
+            [(b"f", b"v" * 65)],  # value too long
+        ],
+    )
+    def test_conversion_to_hashtable(self, pairs):
+        self.execute_command(CommandHSet([b"hash", b"a", b"1"]))
+        assert self._encoding() == b"$8\r\nlistpack\r\n"
+
+        for field, value in pairs:
+            self.execute_command(CommandHSet([b"hash", field, value]))
+        assert self._encoding() == b"$9\r\nhashtable\r\n"
+        assert self.execute_command(CommandHLen([b"hash"])) == (
+            b":%d\r\n" % (len(pairs) + 1)
+        )
+        assert self.execute_command(CommandHGet([b"hash", b"a"])) == b"$1\r\n1\r\n"
+
+    def test_conversion_thresholds_from_config(self):
+        self.exec_ctx.config.hash_max_listpack_entries = 2
+        self.execute_command(CommandHSet([b"hash", b"a", b"1", b"b", b"2"]))
+        assert self._encoding() == b"$8\r\nlistpack\r\n"
+        self.execute_command(CommandHIncrBy([b"hash", b"c", b"1"]))
+        assert self._encoding() == b"$9\r\nhashtable\r\n"
+
+    def test_hscan(self):
+        pairs = [[b"f%d" % i, b"v%d" % i] for i in range(200)]
+        self.execute_command(CommandHSet([b"hash", *(e for p in pairs for e in p)]))
+
+        seen, cursor = {}, b"0"
+        while True:
+            cursor, elements = self._hscan(cursor, b"COUNT", b"20")
+            seen.update(zip(elements[::2], elements[1::2]))
+            if cursor == b"0":
+                break
+        assert seen == dict(map(tuple, pairs))
+
+    def test_hscan_listpack_match(self):
+        self.execute_command(CommandHSet([b"hash", b"name", b"x", b"age", b"3"]))
+        assert self._hscan(b"0", b"MATCH", b"n*") == (b"0", [b"name", b"x"])
+
+        result = self.execute_command(CommandHScan([b"hash", b"0", b"TYPE", b"hash"]))
+        assert result == b"-ERR syntax error\r\n"
+
+    def test_wrongtype(self):
+        self.execute_command(CommandSet([b"str", b"1"]))
+        self.execute_command(CommandHSet([b"hash", b"a", b"1"]))
+        assert self.execute_command(CommandHSet([b"str", b"a", b"1"])) == WRONGTYPE
+        assert self.execute_command(CommandHGet([b"str", b"a"])) == WRONGTYPE
+        assert self.execute_command(CommandHScan([b"str", b"0"])) == WRONGTYPE
+        assert self.execute_command(CommandGet([b"hash"])) == WRONGTYPE
+
+    def test_serialization(self):
+        assert bytes(CommandHSet([b"h", b"f", b"v"])) == (
+            b"*4\r\n$4\r\nHSET\r\n$1\r\nh\r\n$1\r\nf\r\n$1\r\nv\r\n"
+        )
+        assert bytes(CommandHIncrBy([b"h", b"f", b"2"])) == (
+            b"*4\r\n$7\r\nHINCRBY\r\n$1\r\nh\r\n$1\r\nf\r\n$1\r\n2\r\n"
+        )
@@ -11,6 +11,11 @@ class TestCommandIncr(CommandTestBase):
             (None, b":1\r\n"),
             (b"5", b":6\r\n"),
             (b"abc", b"-ERR value is not an integer or out of range\r\n"),
+            (b"05", b"-ERR value is not an integer or out of range\r\n"),
+            (
+                b"9223372036854775807",
+                b"-ERR value is not an integer or out of range\r\n",
+            ),
         ],
     )
     def test_incr_various(self, initial, expected):
@@ -19,3 +24,10 @@ class TestCommandIncr(CommandTestBase):
         cmd = CommandIncr([b"counter"])
         result = self.execute_command(cmd)
         assert result == expected
+
+    def test_incr_keeps_int_encoding(self):
+        self.exec_ctx.storage.set(b"counter", RedisValue(b"41"))
+        self.execute_command(CommandIncr([b"counter"]))
+        value = self.exec_ctx.storage.get(b"counter")
+        assert value.payload == 42
+        assert value.raw_bytes == b"42"
@@ -0,0 +1,140 @@
+import threading
+
+import pytest
+from app.commands import (
+    CommandBLPop,
+    CommandBRPop,
+    CommandExec,
+    CommandGet,
+    CommandIncr,
+    CommandLIndex,
+    CommandLLen,
+    CommandLPop,
+    CommandLPush,
+    CommandLRange,
+    CommandLTrim,
+    CommandMulti,
+    CommandObject,
+    CommandRPop,
+    CommandRPush,
+    CommandSet,
+)
+from tests.unit_tests.test_commands.common import WRONGTYPE, CommandTestBase
+
+
+class TestCommandLists(CommandTestBase):
+    def _lrange(self, start: bytes = b"0", stop: bytes = b"-1") -> bytes:
+        return self.execute_command(CommandLRange([b"list", start, stop]))
+
+    def test_push_and_range(self):
+        assert self.execute_command(CommandRPush([b"list", b"b", b"c"])) == b":2\r\n"
+        assert self.execute_command(CommandLPush([b"list", b"a", b"z"])) == b":4\r\n"
+        assert self._lrange() == b"*4\r\n$1\r\nz\r\n$1\r\na\r\n$1\r\nb\r\n$1\r\nc\r\n"
+        assert self._lrange(b"-2", b"100") == b"*2\r\n$1\r\nb\r\n$1\r\nc\r\n"
+        assert self._lrange(b"3", b"1") == b"*0\r\n"
+        assert self.execute_command(CommandLLen([b"list"])) == b":4\r\n"
+        assert self.execute_command(CommandLIndex([b"list", b"-1"])) == b"$1\r\nc\r\n"
+        assert self.execute_command(CommandLIndex([b"list", b"9"])) == b"$-1\r\n"
+
+    def test_pop(self):
+        self.execute_command(CommandRPush([b"list", b"a", b"b", b"c", b"d"]))
+        assert self.execute_command(CommandLPop([b"list"])) == b"$1\r\na\r\n"
+        assert self.execute_command(CommandRPop([b"list", b"2"])) == (
+            b"*2\r\n$1\r\nd\r\n$1\r\nc\r\n"
+        )
+        assert (
+            self.execute_command(CommandLPop([b"list", b"5"])) == b"*1\r\n$1\r\nb\r\n"
+        )
+
+        # empty lists are removed
+        assert self.exec_ctx.storage.keys() == []
+        assert self.exec_ctx.storage.memory_stats().used_memory == 0
+        assert self.execute_command(CommandLPop([b"list"])) == b"$-1\r\n"
+        assert self.execute_command(CommandLPop([b"list", b"1"])) == b"*-1\r\n"
+
+    def test_ltrim(self):
+        self.execute_command(CommandRPush([b"list", *(b"%d" % i for i in range(10))]))
+        assert self.execute_command(CommandLTrim([b"list", b"2", b"-3"])) == b"+OK\r\n"
+        assert self.execute_command(CommandLLen([b"list"])) == b":6\r\n"
+        assert self.execute_command(CommandLIndex([b"list", b"0"])) == b"$1\r\n2\r\n"
+
+        self.execute_command(CommandLTrim([b"list", b"5", b"1"]))
+        assert self.exec_ctx.storage.keys() == []
+
+    def test_wrongtype(self):
+        self.execute_command(CommandSet([b"str", b"1"]))
+        self.execute_command(CommandRPush([b"list", b"a"]))
+        assert self.execute_command(CommandLPush([b"str", b"a"])) == WRONGTYPE
+        assert self.execute_command(CommandLRange([b"str", b"0", b"1"])) == WRONGTYPE
+        assert self.execute_command(CommandGet([b"list"])) == WRONGTYPE
+        assert self.execute_command(CommandIncr([b"list"])) == WRONGTYPE
+
+    @pytest.mark.parametrize(
+        "command",
+        [CommandLRange([b"list", b"a", b"1"]), CommandLIndex([b"list", b"1.5"])],
+    )
+    def test_invalid_index(self, command):
+        result = self.execute_command(command)
+        assert result == b"-ERR value is not an integer or out of range\r\n"
+
+    def test_object_encoding(self):
+        self.execute_command(CommandRPush([b"list", b"a"]))
+        result = self.execute_command(CommandObject([b"ENCODING", b"list"]))
+        assert result == b"$9\r\nquicklist\r\n"
+
+    def test_serialization(self):
+        assert bytes(CommandRPush([b"l", b"a"])) == (
+            b"*3\r\n$5\r\nRPUSH\r\n$1\r\nl\r\n$1\r\na\r\n"
+        )
+        assert bytes(CommandLPop([b"l", b"2"])) == (
+            b"*3\r\n$4\r\nLPOP\r\n$1\r\nl\r\n$1\r\n2\r\n"
+        )
+        # the serialized name doesn't shadow name() of the command
+        assert CommandLPush([b"l", b"a"]).name() == "CommandLPush"
+        assert CommandRPop([b"l"]).name() == "CommandRPop"
+
+    def test_blocking_pop_without_waiting(self):
+        self.execute_command(CommandRPush([b"b", b"x", b"y"]))
+        command = CommandBRPop([b"a", b"b", b"0"])
+        assert self.execute_command(command) == b"*2\r\n$1\r\nb\r\n$1\r\ny\r\n"
+        # replicas pop from the key without blocking
+        assert command.replication_payload() == b"*2\r\n$4\r\nRPOP\r\n$1\r\nb\r\n"
+        assert bytes(CommandBLPop([b"a", b"b", b"0"])) == (
+            b"*4\r\n$5\r\nBLPOP\r\n$1\r\na\r\n$1\r\nb\r\n$1\r\n0\r\n"
+        )
+        assert command.name() == "CommandBRPop"
+
+    def test_blocking_pop_woken_by_push(self):
+        results = []
+        command = CommandBLPop([b"a", b"b", b"5"])
+        thread = threading.Thread(
+            target=lambda: results.append(self.execute_command(command))
+        )
+        thread.start()
+        while not len(self.exec_ctx.blocked_clients):
+            thread.join(timeout=0.001)
+
+        self.execute_command(CommandRPush([b"b", b"x", b"y"]))
+        thread.join(timeout=1)
+        assert results == [b"*2\r\n$1\r\nb\r\n$1\r\nx\r\n"]
+        assert self._lrange() == b"*0\r\n"
+        assert len(self.exec_ctx.blocked_clients) == 0
+
+    def test_blocking_pop_timeout(self):
+        command = CommandBLPop([b"a", b"0.01"])
+        assert self.execute_command(command) == b"*-1\r\n"
+        assert command.replication_payload() == b""  # nothing to propagate
+
+        self.execute_command(CommandSet([b"str", b"1"]))
+        assert self.execute_command(CommandBLPop([b"str", b"0.01"])) == WRONGTYPE
+        assert self.execute_command(CommandBLPop([b"a", b"-1"])) == (
+            b"-ERR timeout is negative\r\n"
+        )
+        assert self.execute_command(CommandBLPop([b"a", b"x"])) == (
+            b"-ERR timeout is not a float or out of range\r\n"
+        )
+
+    def test_blocking_pop_in_transaction(self):
+        self.execute_command(CommandMulti([]))
+        self.execute_command(CommandBLPop([b"a", b"0"]))
+        assert self.execute_command(CommandExec([])) == b"*1\r\n*-1\r\n"
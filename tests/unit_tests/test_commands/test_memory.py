@@ -0,0 +1,44 @@
+from app.commands import CommandInfo, CommandMemory, CommandSet
+from app.storage.in_memory.memory import entry_size
+from app.storage.types import RedisValue
+from tests.unit_tests.test_commands.common import CommandTestBase
+
+
+class TestCommandMemory(CommandTestBase):
+    def test_memory_usage(self):
+        self.execute_command(CommandSet([b"foo", b"bar"]))
+        expected = entry_size(b"foo", RedisValue(b"bar"))
+
+        result = self.execute_command(CommandMemory([b"USAGE", b"foo"]))
+        assert result == b":%d\r\n" % expected
+        result = self.execute_command(
+            CommandMemory([b"usage", b"foo", b"SAMPLES", b"5"])
+        )
+        assert result == b":%d\r\n" % expected
+
+    def test_memory_usage_missing_key(self):
+        result = self.execute_command(CommandMemory([b"USAGE", b"nope"]))
+        assert result == b"$-1\r\n"
+
+    def test_memory_usage_syntax_error(self):
+        result = self.execute_command(CommandMemory([b"USAGE", b"foo", b"SAMPLES"]))
+        assert result.startswith(b"-ERR syntax error")
+
+    def test_memory_stats(self):
+        self.execute_command(CommandSet([b"foo", b"bar"]))
+        self.execute_command(CommandSet([b"baz", b"qux"]))
+        result = self.execute_command(CommandMemory([b"STATS"]))
+        assert result.startswith(b"*16\r\n")
+        assert b"$10\r\nkeys.count\r\n:2\r\n" in result
+        assert b"$13\r\ndataset.bytes\r\n:12\r\n" in result
+
+    def test_info_memory_tracks_peak(self):
+        self.execute_command(CommandSet([b"foo", b"x" * 1000]))
+        self.execute_command(CommandSet([b"foo", b"bar"]))
+        result = self.execute_command(CommandInfo([b"memory"]))
+
+        used = entry_size(b"foo", RedisValue(b"bar"))
+        peak = entry_size(b"foo", RedisValue(b"x" * 1000))
+        assert b"used_memory:%d\r\n" % used in result
+        assert b"used_memory_peak:%d\r\n" % peak in result
+        assert b"used_memory_dataset:6\r\n" in result
@@ -0,0 +1,53 @@
+import pytest
+from app.commands import CommandObject, CommandSet
+from app.commands.errors import UnrecognizedCommand
+from app.storage.types import RedisValue
+from tests.unit_tests.test_commands.common import CommandTestBase
+
+
+class TestCommandObject(CommandTestBase):
+    @pytest.mark.parametrize(
+        "value,expected",
+        [
+            (b"12345", b"$3\r\nint\r\n"),
+            (b"-7", b"$3\r\nint\r\n"),
+            (b"007", b"$6\r\nembstr\r\n"),
+            (b"bar", b"$6\r\nembstr\r\n"),
+            (b"x" * 45, b"$3\r\nraw\r\n"),
+        ],
+    )
+    def test_object_encoding(self, value, expected):
+        self.execute_command(CommandSet([b"foo", value]))
+        result = self.execute_command(CommandObject([b"encoding", b"foo"]))
+        assert result == expected
+
+    def test_object_encoding_missing_key(self):
+        result = self.execute_command(CommandObject([b"ENCODING", b"nope"]))
+        assert result == b"$-1\r\n"
+
+    def test_unknown_subcommand(self):
+        with pytest.raises(UnrecognizedCommand):
+            CommandObject([b"FREQ", b"foo"])
+
+
+@pytest.mark.parametrize(
+    "raw_bytes,payload",
+    [
+        (b"0", 0),
+        (b"-42", -42),
+        (b"9223372036854775807", 2**63 - 1),
+        (b"9223372036854775808", b"9223372036854775808"),  # out of int64 range
+        (b"-0", b"-0"),
+        (b"+1", b"+1"),
+        (b" 1", b" 1"),
+        (b"", b""),
+    ],
+)
+def test_redis_value_int_encoding(raw_bytes, payload):
+    value = RedisValue(raw_bytes)
+    assert value.payload == payload
+    assert value.raw_bytes == raw_bytes  # int encoding is lossless
+
+
+def test_redis_value_has_no_dict():
+    assert not hasattr(RedisValue(b"v"), "__dict__")
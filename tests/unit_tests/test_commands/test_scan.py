@@ -0,0 +1,47 @@
+import pytest
+from app.commands import CommandScan, CommandSet
+from app.resp.types.array import bytes_to_resp
+from tests.unit_tests.test_commands.common import CommandTestBase
+
+
+class TestCommandScan(CommandTestBase):
+    def _scan(self, *args: bytes) -> tuple[bytes, list[bytes]]:
+        reply, _ = bytes_to_resp(self.execute_command(CommandScan(list(args))))
+        cursor, keys = reply.value
+        return cursor.value, [key.value for key in keys.value]
+
+    def test_scan_iterates_all_keys(self):
+        keys = [b"key:%d" % i for i in range(100)]
+        for key in keys:
+            self.execute_command(CommandSet([key, b"v"]))
+
+        cursor, seen = b"0", []
+        while True:
+            cursor, step = self._scan(cursor, b"COUNT", b"7")
+            seen.extend(step)
+            if cursor == b"0":
+                break
+        assert sorted(seen) == sorted(keys)
+
+    def test_scan_match(self):
+        self.execute_command(CommandSet([b"foo", b"1"]))
+        self.execute_command(CommandSet([b"bar", b"2"]))
+        cursor, keys = self._scan(b"0", b"match", b"f*", b"COUNT", b"100")
+        assert cursor == b"0"
+        assert keys == [b"foo"]
+
+    @pytest.mark.parametrize(
+        "args,expected",
+        [
+            ([b"abc"], b"-ERR invalid cursor\r\n"),
+            ([b"0", b"COUNT"], b"-ERR syntax error\r\n"),
+            ([b"0", b"COUNT", b"0"], b"-ERR syntax error\r\n"),
+            (
+                [b"0", b"COUNT", b"x"],
+                b"-ERR value is not an integer or out of range\r\n",
+            ),
+            ([b"0", b"LIMIT", b"1"], b"-ERR syntax error\r\n"),
+        ],
+    )
+    def test_scan_invalid_arguments(self, args, expected):
+        assert self.execute_command(CommandScan(args)) == expected
@@ -0,0 +1,161 @@
+import pytest
+from app.commands import (
+    CommandGet,
+    CommandObject,
+    CommandSAdd,
+    CommandSCard,
+    CommandSDiff,
+    CommandSInter,
+    CommandSInterStore,
+    CommandSIsMember,
+    CommandSMembers,
+    CommandSRem,
+    CommandSScan,
+    CommandSUnion,
+    CommandSet,
+)
+from app.resp.types.array import bytes_to_resp
+from tests.unit_tests.test_commands.common import WRONGTYPE, CommandTestBase
+
+
+class TestCommandSets(CommandTestBase):
+    def _members(self, command) -> list[bytes]:
+        reply, _ = bytes_to_resp(self.execute_command(command))
+        return sorted(element.value for element in reply.value)
+
+    def _sscan(self, *args: bytes) -> tuple[bytes, list[bytes]]:
+        reply, _ = bytes_to_resp(self.execute_command(CommandSScan([b"set", *args])))
+        cursor, elements = reply.value
+        return cursor.value, [element.value for element in elements.value]
+
+    def _encoding(self, key: bytes) -> bytes:
+        return self.execute_command(CommandObject([b"ENCODING", key]))
+
+    def test_add_and_members(self):
+        assert self.execute_command(CommandSAdd([b"set", b"3", b"1", b"2"])) == (
+            b":3\r\n"
+        )
+        assert self.execute_command(CommandSAdd([b"set", b"2", b"4"])) == b":1\r\n"
+        assert self._members(CommandSMembers([b"set"])) == [b"1", b"2", b"3", b"4"]
+        assert self.execute_command(CommandSCard([b"set"])) == b":4\r\n"
+        assert self.execute_command(CommandSIsMember([b"set", b"3"])) == b":1\r\n"
+        assert self.execute_command(CommandSIsMember([b"set", b"9"])) == b":0\r\n"
+        assert self.execute_command(CommandSIsMember([b"nope", b"3"])) == b":0\r\n"
+        assert self.execute_command(CommandSMembers([b"nope"])) == b"*0\r\n"
+
+    def test_srem(self):
+        self.execute_command(CommandSAdd([b"set", b"a", b"b"]))
+        assert self.execute_command(CommandSRem([b"set", b"a", b"z"])) == b":1\r\n"
+        assert self.execute_command(CommandSRem([b"set", b"b"])) == b":1\r\n"
+
+        # empty sets are removed
+        assert self.exec_ctx.storage.keys() == []
+        assert self.execute_command(CommandSRem([b"set", b"b"])) == b":0\r\n"
+
+    @pytest.mark.parametrize(
+        "members",
+        [
+            [b"1", b"abc"],  # not an integer
+            [b"1", b"01"],  # not the canonical form of an integer
+            [b"%d" % i for i in range(513)],  # too many members
+        ],
+    )
+    def test_conversion_to_hashtable(self, members):
+        self.execute_command(CommandSAdd([b"set", b"1"]))
+        assert self._encoding(b"set") == b"$6\r\nintset\r\n"
+
+        for member in members:
+            self.execute_command(CommandSAdd([b"set", member]))
+        assert self._encoding(b"set") == b"$9\r\nhashtable\r\n"
+        assert self._members(CommandSMembers([b"set"])) == sorted(set(members))
+
+    def test_conversion_threshold_from_config(self):
+        self.exec_ctx.config.set_max_intset_entries = 2
+        self.execute_command(CommandSAdd([b"set", b"1", b"2"]))
+        assert self._encoding(b"set") == b"$6\r\nintset\r\n"
+        self.execute_command(CommandSAdd([b"set", b"3"]))
+        assert self._encoding(b"set") == b"$9\r\nhashtable\r\n"
+
+    def test_algebra(self):
+        self.execute_command(CommandSAdd([b"a", b"1", b"2", b"3", b"x"]))
+        self.execute_command(CommandSAdd([b"b", b"2", b"3", b"4"]))
+        self.execute_command(CommandSAdd([b"c", b"3", b"x"]))
+
+        assert self._members(CommandSInter([b"a", b"b", b"c"])) == [b"3"]
+        assert self._members(CommandSInter([b"a", b"nope"])) == []
+        assert self._members(CommandSUnion([b"b", b"c", b"nope"])) == [
+            b"2",
+            b"3",
+            b"4",
+            b"x",
+        ]
+        assert self._members(CommandSDiff([b"a", b"b", b"nope"])) == [b"1", b"x"]
+
+    def test_sinterstore(self):
+        self.execute_command(CommandSAdd([b"a", b"1", b"2", b"3"]))
+        self.execute_command(CommandSAdd([b"b", b"2", b"3", b"4"]))
+        self.execute_command(CommandSet([b"dest", b"string"]))
+
+        result = self.execute_command(CommandSInterStore([b"dest", b"a", b"b"]))
+        assert result == b":2\r\n"
+        assert self._members(CommandSMembers([b"dest"])) == [b"2", b"3"]
+        assert self._encoding(b"dest") == b"$6\r\nintset\r\n"
+
+        # the destination can be one of the sources
+        result = self.execute_command(CommandSInterStore([b"a", b"a", b"dest"]))
+        assert result == b":2\r\n"
+
+        # an empty intersection removes the destination
+        result = self.execute_command(CommandSInterStore([b"dest", b"a", b"nope"]))
+        assert result == b":0\r\n"
+        assert sorted(self.exec_ctx.storage.keys()) == [b"a", b"b"]
+
+    def test_sscan(self):
+        members = [b"m%d" % i for i in range(200)]
+        self.execute_command(CommandSAdd([b"set", *members]))
+        self.execute_command(CommandSRem([b"set", b"m0"]))
+
+        seen, cursor = set(), b"0"
+        while True:
+            cursor, elements = self._sscan(cursor, b"COUNT", b"20")
+            seen.update(elements)
+            if cursor == b"0":
+                break
+        assert seen == set(members[1:])
+
+    def test_sscan_intset_match(self):
+        self.execute_command(CommandSAdd([b"set", b"1", b"12", b"2"]))
+        assert self._sscan(b"0", b"COUNT", b"1") == (b"0", [b"1", b"2", b"12"])
+        assert self._sscan(b"0", b"MATCH", b"1*") == (b"0", [b"1", b"12"])
+        assert (
+            self.execute_command(CommandSScan([b"nope", b"0"]))
+            == b"*2\r\n$1\r\n0\r\n*0\r\n"
+        )
+
+        result = self.execute_command(CommandSScan([b"set", b"0", b"TYPE", b"set"]))
+        assert result == b"-ERR syntax error\r\n"
+
+    def test_wrongtype(self):
+        self.execute_command(CommandSet([b"str", b"1"]))
+        self.execute_command(CommandSAdd([b"set", b"a"]))
+        assert self.execute_command(CommandSAdd([b"str", b"a"])) == WRONGTYPE
+        assert self.execute_command(CommandSIsMember([b"str", b"a"])) == WRONGTYPE
+        assert self.execute_command(CommandSInter([b"set", b"str"])) == WRONGTYPE
+        assert self.execute_command(CommandSScan([b"str", b"0"])) == WRONGTYPE
+        assert self.execute_command(CommandGet([b"set"])) == WRONGTYPE
+
+    def test_serialization(self):
+        # the serialized name doesn't shadow name() of the command
+        assert CommandSInter([b"a"]).name() == "CommandSInter"
+        assert bytes(CommandSAdd([b"s", b"m"])) == (
+            b"*3\r\n$4\r\nSADD\r\n$1\r\ns\r\n$1\r\nm\r\n"
+        )
+        assert bytes(CommandSUnion([b"a", b"b"])) == (
+            b"*3\r\n$6\r\nSUNION\r\n$1\r\na\r\n$1\r\nb\r\n"
+        )
+        assert bytes(CommandSInterStore([b"d", b"a"])) == (
+            b"*3\r\n$11\r\nSINTERSTORE\r\n$1\r\nd\r\n$1\r\na\r\n"
+        )
+        assert bytes(CommandSScan([b"s", b"0", b"COUNT", b"5"])) == (
+            b"*5\r\n$5\r\nSSCAN\r\n$1\r\ns\r\n$1\r\n0\r\n$5\r\nCOUNT\r\n$1\r\n5\r\n"
+        )
@@ -0,0 +1,225 @@
+import threading
+from unittest.mock import patch
+
+from app.commands import (
+    CommandObject,
+    CommandSet,
+    CommandXAdd,
+    CommandXLen,
+    CommandXRange,
+    CommandXRead,
+    CommandXRevRange,
+    CommandXTrim,
+)
+from app.resp.types.array import bytes_to_resp
+from tests.unit_tests.test_commands.common import WRONGTYPE, CommandTestBase
+
+
+def _entry(stream_id: bytes, *elements: bytes) -> bytes:
+    reply = b"*2\r\n$%d\r\n%b\r\n*%d\r\n" % (len(stream_id), stream_id, len(elements))
+    return reply + b"".join(b"$%d\r\n%b\r\n" % (len(e), e) for e in elements)
+
+
+class TestCommandStreams(CommandTestBase):
+    def setup_method(self):
+        super().setup_method()
+        for i in range(1, 6):
+            self.execute_command(CommandXAdd([b"log", b"%d-1" % i, b"n", b"%d" % i]))
+
+    def _ids(self, command) -> list[bytes]:
+        reply, _ = bytes_to_resp(self.execute_command(command))
+        return [entry.value[0].value for entry in reply.value]
+
+    def test_xadd_ids(self):
+        assert self.execute_command(CommandXAdd([b"log", b"5-*", b"n", b"6"])) == (
+            b"$3\r\n5-2\r\n"
+        )
+        assert self.execute_command(CommandXAdd([b"log", b"7", b"n", b"7"])) == (
+            b"$3\r\n7-0\r\n"
+        )
+        assert self.execute_command(CommandXAdd([b"log", b"7-0", b"n", b"x"])) == (
+            b"-ERR The ID specified in XADD is equal or smaller than the target "
+            b"stream top item\r\n"
+        )
+        assert self.execute_command(CommandXAdd([b"new", b"0-0", b"n", b"x"])) == (
+            b"-ERR The ID specified in XADD must be greater than 0-0\r\n"
+        )
+        assert self.execute_command(CommandXAdd([b"new", b"0-*", b"n", b"x"])) == (
+            b"$3\r\n0-1\r\n"
+        )
+        assert self.execute_command(CommandXAdd([b"new", b"1-x", b"n", b"x"])) == (
+            b"-ERR Invalid stream ID specified as stream command argument\r\n"
+        )
+        assert self.execute_command(CommandXAdd([b"new", b"*", b"n"])) == (
+            b"-ERR wrong number of arguments for 'xadd' command\r\n"
+        )
+        assert self.execute_command(CommandXLen([b"log"])) == b":7\r\n"
+
+    def test_xadd_generated_ids(self):
+        with patch("app.commands.handlers.streams.xadd.time", return_value=9.0):
+            command = CommandXAdd([b"log", b"*", b"n", b"6"])
+            assert self.execute_command(command) == b"$6\r\n9000-0\r\n"
+            assert self.execute_command(CommandXAdd([b"log", b"*", b"n", b"7"])) == (
+                b"$6\r\n9000-1\r\n"
+            )
+        # replicas are sent the generated ID
+        assert bytes(command) == (
+            b"*5\r\n$4\r\nXADD\r\n$3\r\nlog\r\n$6\r\n9000-0\r\n$1\r\nn\r\n$1\r\n6\r\n"
+        )
+
+    def test_xadd_options(self):
+        assert self.execute_command(
+            CommandXAdd([b"new", b"NOMKSTREAM", b"*", b"n", b"x"])
+        ) == (b"$-1\r\n")
+        assert self.exec_ctx.storage.keys() == [b"log"]
+
+        self.execute_command(CommandXAdd([b"log", b"MAXLEN", b"3", b"*", b"n", b"6"]))
+        assert self.execute_command(CommandXLen([b"log"])) == b":3\r\n"
+        assert self._ids(CommandXRange([b"log", b"-", b"+"]))[0] == b"4-1"
+        assert self.execute_command(
+            CommandXAdd([b"log", b"MAXLEN", b"-1", b"*", b"n", b"6"])
+        ) == (b"-ERR The MAXLEN argument must be >= 0.\r\n")
+
+    def test_xrange(self):
+        assert self.execute_command(CommandXRange([b"log", b"2", b"3-1"])) == (
+            b"*2\r\n" + _entry(b"2-1", b"n", b"2") + _entry(b"3-1", b"n", b"3")
+        )
+        assert self._ids(CommandXRange([b"log", b"-", b"+", b"COUNT", b"2"])) == [
+            b"1-1",
+            b"2-1",
+        ]
+        assert self._ids(CommandXRange([b"log", b"(2-1", b"(5-1"])) == [
+            b"3-1",
+            b"4-1",
+        ]
+        assert self._ids(CommandXRevRange([b"log", b"+", b"4", b"COUNT", b"3"])) == [
+            b"5-1",
+            b"4-1",
+        ]
+        assert self.execute_command(CommandXRange([b"log", b"5", b"1"])) == b"*0\r\n"
+        assert self.execute_command(CommandXRange([b"none", b"-", b"+"])) == b"*0\r\n"
+        assert self.execute_command(CommandXRange([b"log", b"x", b"+"])) == (
+            b"-ERR Invalid stream ID specified as stream command argument\r\n"
+        )
+        assert self.execute_command(CommandXRange([b"log", b"(+", b"+"])) == (
+            b"-ERR Invalid stream ID specified as stream command argument\r\n"
+        )
+
+    def test_xread(self):
+        result = self.execute_command(
+            CommandXRead([b"COUNT", b"1", b"STREAMS", b"log", b"none", b"3-1", b"0"])
+        )
+        assert result == (
+            b"*1\r\n*2\r\n$3\r\nlog\r\n*1\r\n" + _entry(b"4-1", b"n", b"4")
+        )
+        command = CommandXRead([b"STREAMS", b"log", b"$"])
+        assert self.execute_command(command) == b"*-1\r\n"
+        assert self.execute_command(CommandXRead([b"STREAMS", b"log", b"5-1"])) == (
+            b"*-1\r\n"
+        )
+        assert self.execute_command(CommandXRead([b"STREAMS", b"log"])) == (
+            b"-ERR Unbalanced 'xread' list of streams: for each stream key an ID "
+            b"or '$' must be specified.\r\n"
+        )
+        assert CommandXRead(
+            [b"COUNT", b"1", b"STREAMS", b"a", b"b", b"0", b"0"]
+        ).keys() == [
+            b"a",
+            b"b",
+        ]
+
+    def test_xread_block(self):
+        results = []
+        command = CommandXRead(
+            [b"BLOCK", b"0", b"STREAMS", b"other", b"log", b"0", b"$"]
+        )
+        assert command.blocks()
+        assert not CommandXRead([b"STREAMS", b"log", b"0"]).blocks()
+        thread = threading.Thread(
+            target=lambda: results.append(self.execute_command(command))
+        )
+        thread.start()
+        while not len(self.exec_ctx.blocked_clients):
+            thread.join(timeout=0.001)
+
+        # only entries added after the call are returned for $
+        self.execute_command(CommandXAdd([b"log", b"6-1", b"n", b"6"]))
+        thread.join(timeout=1)
+        assert results == [
+            b"*1\r\n*2\r\n$3\r\nlog\r\n*1\r\n" + _entry(b"6-1", b"n", b"6")
+        ]
+
+        command = CommandXRead([b"BLOCK", b"10", b"STREAMS", b"log", b"$"])
+        assert self.execute_command(command) == b"*-1\r\n"
+        assert self.execute_command(
+            CommandXRead([b"BLOCK", b"-1", b"STREAMS", b"log", b"$"])
+        ) == (b"-ERR timeout is negative\r\n")
+
+    def test_xtrim(self):
+        assert (
+            self.execute_command(CommandXTrim([b"log", b"MAXLEN", b"2"])) == b":3\r\n"
+        )
+        assert self._ids(CommandXRange([b"log", b"-", b"+"])) == [b"4-1", b"5-1"]
+        # the stream is kept once empty, and so is its last ID
+        assert self.execute_command(CommandXTrim([b"log", b"MAXLEN", b"=", b"0"])) == (
+            b":2\r\n"
+        )
+        assert self.execute_command(CommandXLen([b"log"])) == b":0\r\n"
+        assert self.execute_command(
+            CommandXAdd([b"log", b"5-1", b"n", b"x"])
+        ).startswith(b"-ERR The ID specified in XADD is equal or smaller")
+        assert (
+            self.execute_command(CommandXTrim([b"none", b"MAXLEN", b"0"])) == b":0\r\n"
+        )
+        assert self.execute_command(CommandXTrim([b"log", b"MINID", b"0"])) == (
+            b"-ERR syntax error\r\n"
+        )
+
+    def test_approximate_trim_removes_whole_blocks(self):
+        self.exec_ctx.config.stream_node_max_entries = 2
+        for i in range(1, 11):
+            self.execute_command(CommandXAdd([b"new", b"%d-1" % i, b"n", b"%d" % i]))
+        assert self.execute_command(CommandXTrim([b"new", b"MAXLEN", b"~", b"7"])) == (
+            b":2\r\n"
+        )
+        assert self.execute_command(CommandXLen([b"new"])) == b":8\r\n"
+
+    def test_approximate_trim_propagates_exact_length(self):
+        self.exec_ctx.config.stream_node_max_entries = 2
+        for i in range(1, 11):
+            self.execute_command(CommandXAdd([b"new", b"%d-1" % i, b"n", b"%d" % i]))
+        command = CommandXTrim([b"new", b"MAXLEN", b"~", b"7"])
+        self.execute_command(command)
+        assert command.replication_payload() == bytes(
+            CommandXTrim([b"new", b"MAXLEN", b"=", b"8"])
+        )
+
+        command = CommandXAdd([b"new", b"MAXLEN", b"~", b"6", b"11-1", b"n", b"11"])
+        self.execute_command(command)
+        assert self.execute_command(CommandXLen([b"new"])) == b":7\r\n"
+        assert command.replication_payload() == bytes(
+            CommandXAdd([b"new", b"MAXLEN", b"=", b"7", b"11-1", b"n", b"11"])
+        )
+
+    def test_type_and_wrongtype(self):
+        assert self.execute_command(CommandObject([b"ENCODING", b"log"])) == (
+            b"$6\r\nstream\r\n"
+        )
+        self.execute_command(CommandSet([b"str", b"1"]))
+        assert (
+            self.execute_command(CommandXAdd([b"str", b"*", b"n", b"x"])) == WRONGTYPE
+        )
+        assert self.execute_command(CommandXRange([b"str", b"-", b"+"])) == WRONGTYPE
+        assert (
+            self.execute_command(CommandXRead([b"STREAMS", b"str", b"0"])) == WRONGTYPE
+        )
+
+    def test_serialization(self):
+        # the serialized name doesn't shadow name() of the command
+        assert CommandXRevRange([b"s", b"+", b"-"]).name() == "CommandXRevRange"
+        assert bytes(CommandXRevRange([b"s", b"+", b"-"])) == (
+            b"*4\r\n$9\r\nXREVRANGE\r\n$1\r\ns\r\n$1\r\n+\r\n$1\r\n-\r\n"
+        )
+        assert bytes(CommandXTrim([b"s", b"MAXLEN", b"~", b"10"])) == (
+            b"*5\r\n$5\r\nXTRIM\r\n$1\r\ns\r\n$6\r\nMAXLEN\r\n$1\r\n~\r\n$2\r\n10\r\n"
+        )
@@ -0,0 +1,192 @@
+import pytest
+from app.commands import (
+    CommandGet,
+    CommandObject,
+    CommandSet,
+    CommandZAdd,
+    CommandZCard,
+    CommandZIncrBy,
+    CommandZRange,
+    CommandZRank,
+    CommandZRem,
+    CommandZScan,
+    CommandZScore,
+)
+from app.resp.types.array import bytes_to_resp
+from tests.unit_tests.test_commands.common import WRONGTYPE, CommandTestBase
+
+
+class TestCommandZSets(CommandTestBase):
+    def setup_method(self):
+        super().setup_method()
+        self.execute_command(
+            CommandZAdd([b"board", b"1", b"a", b"2", b"b", b"3", b"c", b"4", b"d"])
+        )
+
+    def _zrange(self, *args: bytes) -> list[bytes]:
+        reply, _ = bytes_to_resp(self.execute_command(CommandZRange([b"board", *args])))
+        return [element.value for element in reply.value]
+
+    def _zscan(self, *args: bytes) -> tuple[bytes, list[bytes]]:
+        reply, _ = bytes_to_resp(self.execute_command(CommandZScan([b"board", *args])))
+        cursor, elements = reply.value
+        return cursor.value, [element.value for element in elements.value]
+
+    def _encoding(self) -> bytes:
+        return self.execute_command(CommandObject([b"ENCODING", b"board"]))
+
+    def test_zadd_and_read(self):
+        assert self.execute_command(
+            CommandZAdd([b"board", b"2.5", b"a", b"5", b"e"])
+        ) == (b":1\r\n")
+        assert self.execute_command(CommandZCard([b"board"])) == b":5\r\n"
+        assert self.execute_command(CommandZScore([b"board", b"a"])) == b"$3\r\n2.5\r\n"
+        assert self.execute_command(CommandZScore([b"board", b"z"])) == b"$-1\r\n"
+        assert self.execute_command(CommandZRank([b"board", b"a"])) == b":1\r\n"
+        assert self.execute_command(CommandZRank([b"board", b"z"])) == b"$-1\r\n"
+        assert self.execute_command(CommandZRank([b"board", b"e", b"WITHSCORE"])) == (
+            b"*2\r\n:4\r\n$1\r\n5\r\n"
+        )
+
+    def test_zadd_options(self):
+        add = lambda *args: self.execute_command(CommandZAdd([b"board", *args]))  # noqa: E731
+        assert add(b"NX", b"9", b"a", b"5", b"e") == b":1\r\n"
+        assert add(b"XX", b"CH", b"9", b"a", b"6", b"f") == b":1\r\n"
+        assert add(b"GT", b"CH", b"1", b"a") == b":0\r\n"
+        assert add(b"LT", b"CH", b"1", b"a") == b":1\r\n"
+        assert add(b"INCR", b"2", b"a") == b"$1\r\n3\r\n"
+        assert add(b"XX", b"INCR", b"2", b"z") == b"$-1\r\n"
+        assert add(b"NX", b"XX", b"1", b"a") == (
+            b"-ERR XX and NX options at the same time are not compatible\r\n"
+        )
+        assert add(b"1", b"a", b"2") == b"-ERR syntax error\r\n"
+        assert add(b"x", b"a") == b"-ERR value is not a valid float\r\n"
+        for score in (b"1e400", b"-1e400", b"nan", b"-NaN"):
+            assert add(score, b"a") == b"-ERR value is not a valid float\r\n"
+        assert add(b"INF", b"inf", b"-Infinity", b"-inf") == b":2\r\n"
+
+        # nothing added, no key is created
+        self.execute_command(CommandZAdd([b"new", b"XX", b"1", b"a"]))
+        assert sorted(self.exec_ctx.storage.keys()) == [b"board"]
+
+    def test_zincrby(self):
+        result = self.execute_command(CommandZIncrBy([b"board", b"1.5", b"a"]))
+        assert result == b"$3\r\n2.5\r\n"
+        result = self.execute_command(CommandZIncrBy([b"board", b"-inf", b"new"]))
+        assert result == b"$4\r\n-inf\r\n"
+        result = self.execute_command(CommandZIncrBy([b"board", b"+inf", b"new"]))
+        assert result == b"-ERR resulting score is not a number (NaN)\r\n"
+        result = self.execute_command(CommandZIncrBy([b"board", b"1e400", b"a"]))
+        assert result == b"-ERR value is not a valid float\r\n"
+        assert self._zrange(b"0", b"1") == [b"new", b"b"]
+
+    def test_zrange_by_rank(self):
+        assert self._zrange(b"0", b"-1") == [b"a", b"b", b"c", b"d"]
+        assert self._zrange(b"1", b"2", b"WITHSCORES") == [b"b", b"2", b"c", b"3"]
+        assert self._zrange(b"0", b"1", b"REV") == [b"d", b"c"]
+        assert self._zrange(b"-2", b"100") == [b"c", b"d"]
+        assert self._zrange(b"3", b"1") == []
+
+    def test_zrange_by_score(self):
+        assert self._zrange(b"2", b"3", b"BYSCORE") == [b"b", b"c"]
+        assert self._zrange(b"(2", b"+inf", b"BYSCORE") == [b"c", b"d"]
+        assert self._zrange(b"3", b"(1", b"BYSCORE", b"REV") == [b"c", b"b"]
+        assert self._zrange(b"-inf", b"inf", b"BYSCORE", b"LIMIT", b"1", b"2") == [
+            b"b",
+            b"c",
+        ]
+        assert self._zrange(
+            b"+inf", b"-inf", b"BYSCORE", b"REV", b"LIMIT", b"1", b"-1"
+        ) == [b"c", b"b", b"a"]
+
+    def test_zrange_by_lex(self):
+        self.execute_command(
+            CommandZAdd([b"lex", b"0", b"a", b"0", b"b", b"0", b"c", b"0", b"d"])
+        )
+        zrange = lambda *args: self.execute_command(CommandZRange([b"lex", *args]))  # noqa: E731
+        assert zrange(b"[b", b"(d", b"BYLEX") == b"*2\r\n$1\r\nb\r\n$1\r\nc\r\n"
+        assert (
+            zrange(b"-", b"+", b"BYLEX", b"LIMIT", b"3", b"5") == b"*1\r\n$1\r\nd\r\n"
+        )
+        assert (
+            zrange(b"+", b"[b", b"BYLEX", b"REV")
+            == b"*3\r\n$1\r\nd\r\n$1\r\nc\r\n$1\r\nb\r\n"
+        )
+        assert zrange(b"+", b"-", b"BYLEX") == b"*0\r\n"
+
+    @pytest.mark.parametrize(
+        "args,expected",
+        [
+            ([b"a", b"1"], b"-ERR value is not an integer or out of range\r\n"),
+            ([b"0", b"1", b"LIMIT", b"0", b"1"], b"-ERR syntax error, LIMIT is only"),
+            ([b"x", b"1", b"BYSCORE"], b"-ERR min or max is not a float\r\n"),
+            (
+                [b"a", b"b", b"BYLEX"],
+                b"-ERR min or max not valid string range item\r\n",
+            ),
+            ([b"0", b"1", b"BYSCORE", b"BYLEX"], b"-ERR syntax error\r\n"),
+        ],
+    )
+    def test_zrange_errors(self, args, expected):
+        result = self.execute_command(CommandZRange([b"board", *args]))
+        assert result.startswith(expected)
+
+    def test_zrem(self):
+        assert self.execute_command(CommandZRem([b"board", b"a", b"z"])) == b":1\r\n"
+        self.execute_command(CommandZRem([b"board", b"b", b"c", b"d"]))
+        assert self.exec_ctx.storage.keys() == []
+
+    def test_zscan(self):
+        scores = {b"m%d" % i: b"%d" % i for i in range(200)}
+        self.execute_command(
+            CommandZAdd([b"board", *(e for m, s in scores.items() for e in (s, m))])
+        )
+        self.execute_command(CommandZRem([b"board", b"a", b"b", b"c", b"d"]))
+        assert self._encoding() == b"$8\r\nskiplist\r\n"
+
+        seen, cursor = {}, b"0"
+        while True:
+            cursor, elements = self._zscan(cursor, b"COUNT", b"20")
+            seen.update(zip(elements[::2], elements[1::2]))
+            if cursor == b"0":
+                break
+        assert seen == scores
+
+    def test_zscan_listpack_match(self):
+        assert self._zscan(b"0", b"COUNT", b"1") == (
+            b"0",
+            [b"a", b"1", b"b", b"2", b"c", b"3", b"d", b"4"],
+        )
+        assert self._zscan(b"0", b"MATCH", b"[bc]") == (b"0", [b"b", b"2", b"c", b"3"])
+
+    def test_conversion_to_skiplist(self):
+        assert self._encoding() == b"$8\r\nlistpack\r\n"
+        self.execute_command(CommandZAdd([b"board", b"1", b"x" * 65]))
+        assert self._encoding() == b"$8\r\nskiplist\r\n"
+        assert self._zrange(b"0", b"1") == [b"a", b"x" * 65]
+
+    def test_conversion_threshold_from_config(self):
+        self.exec_ctx.config.zset_max_listpack_entries = 4
+        self.execute_command(CommandZAdd([b"board", b"9", b"a"]))
+        assert self._encoding() == b"$8\r\nlistpack\r\n"
+        self.execute_command(CommandZIncrBy([b"board", b"5", b"e"]))
+        assert self._encoding() == b"$8\r\nskiplist\r\n"
+        assert self._zrange(b"0", b"-1") == [b"b", b"c", b"d", b"e", b"a"]
+
+    def test_wrongtype(self):
+        self.execute_command(CommandSet([b"str", b"1"]))
+        assert self.execute_command(CommandZAdd([b"str", b"1", b"a"])) == WRONGTYPE
+        assert self.execute_command(CommandZRange([b"str", b"0", b"1"])) == WRONGTYPE
+        assert self.execute_command(CommandZScan([b"str", b"0"])) == WRONGTYPE
+        assert self.execute_command(CommandGet([b"board"])) == WRONGTYPE
+
+    def test_serialization(self):
+        assert bytes(CommandZAdd([b"z", b"NX", b"1", b"m"])) == (
+            b"*5\r\n$4\r\nZADD\r\n$1\r\nz\r\n$2\r\nNX\r\n$1\r\n1\r\n$1\r\nm\r\n"
+        )
+        assert bytes(CommandZRange([b"z", b"0", b"1", b"REV"])) == (
+            b"*5\r\n$6\r\nZRANGE\r\n$1\r\nz\r\n$1\r\n0\r\n$1\r\n1\r\n$3\r\nREV\r\n"
+        )
+        assert bytes(CommandZScan([b"z", b"0", b"MATCH", b"a*"])) == (
+            b"*5\r\n$5\r\nZSCAN\r\n$1\r\nz\r\n$1\r\n0\r\n$5\r\nMATCH\r\n$2\r\na*\r\n"
+        )
@@ -0,0 +1,117 @@
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+from app.connection.common import _flush_output, _process_buffered_input
+from app.context import ConnectionContext
+from app.resp.stream import RespStreamParser
+from tests.unit_tests.test_commands.common import _test_execution_context
+
+
+def _command(*args: bytes) -> bytes:
+    out = [b"*%d\r\n" % len(args)]
+    out.extend(b"$%d\r\n%s\r\n" % (len(arg), arg) for arg in args)
+    return b"".join(out)
+
+
+def _connection(max_send: int | None = None) -> tuple[ConnectionContext, list]:
+    """Connection context over a mock socket that records sendmsg calls,
+    sending at most max_send bytes per call."""
+    calls = []
+
+    def sendmsg(buffers):
+        data = b"".join(bytes(buf) for buf in buffers)
+        sent = data if max_send is None else data[:max_send]
+        calls.append(sent)
+        return len(sent)
+
+    sock = MagicMock()
+    sock.sendmsg.side_effect = sendmsg
+    return ConnectionContext(sock=sock), calls
+
+
+def test_pipelined_replies_flushed_once():
+    conn_ctx, calls = _connection()
+    parser = RespStreamParser()
+    parser.feed(
+        _command(b"SET", b"foo", b"bar")
+        + _command(b"GET", b"foo")
+        + _command(b"UNKNOWN")
+        + _command(b"PING")
+    )
+
+    _process_buffered_input(parser, conn_ctx, _test_execution_context())
+
+    assert len(calls) == 1
+    assert calls[0].startswith(b"+OK\r\n$3\r\nbar\r\n-")
+    assert calls[0].endswith(b"+PONG\r\n")
+    assert conn_ctx.output == []
+    conn_ctx.sock.sendall.assert_not_called()
+
+
+def test_replies_flushed_before_blocking_command():
+    conn_ctx, calls = _connection()
+    parser = RespStreamParser()
+    parser.feed(
+        _command(b"SET", b"foo", b"bar")
+        + _command(b"BLPOP", b"list", b"0.01")
+        + _command(b"PING")
+    )
+
+    _process_buffered_input(parser, conn_ctx, _test_execution_context())
+
+    assert calls == [b"+OK\r\n", b"*-1\r\n+PONG\r\n"]
+
+
+def test_flush_output_resumes_partial_sends():
+    conn_ctx, calls = _connection(max_send=3)
+    conn_ctx.output.extend([b"+OK\r\n", b"$3\r\nbar\r\n", b":1\r\n"])
+
+    _flush_output(conn_ctx)
+
+    assert b"".join(calls) == b"+OK\r\n$3\r\nbar\r\n:1\r\n"
+    assert conn_ctx.output == []
+
+
+class _ReplicaSocket:
+    """Replica socket recording the bytes sent to it."""
+
+    def __init__(self):
+        self.received = b""
+        self.sent = threading.Event()
+
+    def sendall(self, data: bytes):
+        self.received += data
+        self.sent.set()
+
+    def close(self):
+        pass
+
+
+def test_writes_propagated_as_received():
+    exec_ctx = _test_execution_context()
+    replica = _ReplicaSocket()
+    exec_ctx.replica_pool.add("replica", replica)
+    conn_ctx, _ = _connection()
+    parser = RespStreamParser(commands=True)
+    writes = [
+        _command(b"set", b"foo", b"bar"),
+        _command(b"MULTI"),
+        _command(b"INCR", b"n"),
+        _command(b"EXEC"),
+        _command(b"SET", b"k", b"v", b"EX", b"10"),
+    ]
+    parser.feed(writes[0] + _command(b"GET", b"foo") + b"".join(writes[1:]))
+
+    with patch("app.commands.handlers.set.time", return_value=100.0):
+        _process_buffered_input(parser, conn_ctx, exec_ctx)
+
+    # the request of each write as received (once in a transaction), relative
+    # expiry times are rewritten to absolute ones
+    expected = writes[0] + writes[2] + _command(b"SET", b"k", b"v", b"PXAT", b"110000")
+    deadline = time.monotonic() + 1
+    while len(replica.received) < len(expected) and time.monotonic() < deadline:
+        replica.sent.wait(timeout=0.01)
+    assert replica.received == expected
+    assert exec_ctx.info.get_offset() == len(expected)
+    exec_ctx.replica_pool.remove("replica")
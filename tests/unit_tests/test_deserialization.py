@@ -68,3 +68,11 @@ def test_deserialize_array():
 
     assert isinstance(array[6], SimpleError)
     assert array[6].value == b"Element"
+
+
+def test_deserialize_null_bulk_string():
+    input = b"$-1\r\n"
+    element, pos = bytes_to_resp(input)
+    assert isinstance(element, BulkString)
+    assert element.value == b""
+    assert pos == len(input)
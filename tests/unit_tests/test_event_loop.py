@@ -0,0 +1,189 @@
+import socket
+import threading
+import time
+
+from app.connection import event_loop, serve_client_connections_async
+from app.context import ExecutionContext
+from app.replication.pool import ReplicaConnectionPool
+from tests.unit_tests.test_commands.common import _test_execution_context
+
+
+def _start_async_server(exec_ctx: ExecutionContext | None = None) -> int:
+    server_socket = socket.create_server(("localhost", 0))
+    threading.Thread(
+        target=serve_client_connections_async,
+        args=(server_socket, exec_ctx or _test_execution_context()),
+        daemon=True,
+    ).start()
+    return server_socket.getsockname()[1]
+
+
+def _recv_exact(sock: socket.socket, length: int) -> bytes:
+    buf = b""
+    while len(buf) < length:
+        chunk = sock.recv(length - len(buf))
+        assert chunk, "connection closed"
+        buf += chunk
+    return buf
+
+
+def test_async_server_handles_commands():
+    port = _start_async_server()
+    with socket.create_connection(("localhost", port), timeout=5) as sock:
+        sock.sendall(b"*1\r\n$4\r\nPING\r\n")
+        assert _recv_exact(sock, 7) == b"+PONG\r\n"
+
+        sock.sendall(b"*3\r\n$3\r\nSET\r\n$3\r\nfoo\r\n$3\r\nbar\r\n")
+        assert _recv_exact(sock, 5) == b"+OK\r\n"
+
+
+def test_async_server_handles_pipelined_commands_across_clients():
+    port = _start_async_server()
+    clients = [
+        socket.create_connection(("localhost", port), timeout=5) for _ in range(10)
+    ]
+    try:
+        for sock in clients:
+            sock.sendall(b"*1\r\n$4\r\nPING\r\n" * 3)
+        for sock in clients:
+            assert _recv_exact(sock, 21) == b"+PONG\r\n" * 3
+    finally:
+        for sock in clients:
+            sock.close()
+
+
+def test_async_server_serves_clients_while_one_is_blocked():
+    port = _start_async_server()
+    with (
+        socket.create_connection(("localhost", port), timeout=5) as blocked,
+        socket.create_connection(("localhost", port), timeout=5) as pusher,
+    ):
+        # blocks forever unless woken up by the push
+        blocked.sendall(b"*3\r\n$5\r\nBLPOP\r\n$1\r\na\r\n$1\r\n0\r\n")
+        time.sleep(0.05)
+
+        start = time.monotonic()
+        pusher.sendall(b"*3\r\n$5\r\nRPUSH\r\n$1\r\na\r\n$1\r\nx\r\n")
+        assert _recv_exact(pusher, 4) == b":1\r\n"
+        assert time.monotonic() - start < 0.5
+        assert _recv_exact(blocked, 18) == b"*2\r\n$1\r\na\r\n$1\r\nx\r\n"
+
+
+def test_async_server_blocks_clients_without_threads(monkeypatch):
+    # fewer threads than blocked clients
+    monkeypatch.setattr(event_loop, "MAX_BLOCKED_CLIENTS", 2)
+    port = _start_async_server()
+    blocked = [
+        socket.create_connection(("localhost", port), timeout=5) for _ in range(4)
+    ]
+    try:
+        for sock in blocked:
+            sock.sendall(b"*3\r\n$5\r\nBLPOP\r\n$1\r\na\r\n$1\r\n0\r\n")
+
+        with socket.create_connection(("localhost", port), timeout=5) as client:
+            # the timeout starts right away, rather than once a thread is free
+            start = time.monotonic()
+            client.sendall(b"*3\r\n$5\r\nBLPOP\r\n$1\r\nb\r\n$4\r\n0.05\r\n")
+            assert _recv_exact(client, 5) == b"*-1\r\n"
+            assert time.monotonic() - start < 0.5
+
+            client.sendall(b"*6\r\n$5\r\nRPUSH\r\n$1\r\na\r\n" + b"$1\r\nx\r\n" * 4)
+            assert _recv_exact(client, 4) == b":4\r\n"
+        for sock in blocked:
+            assert _recv_exact(sock, 18) == b"*2\r\n$1\r\na\r\n$1\r\nx\r\n"
+    finally:
+        for sock in blocked:
+            sock.close()
+
+
+def test_async_server_xread_block_reads_entries_added_once_blocked():
+    port = _start_async_server()
+    with (
+        socket.create_connection(("localhost", port), timeout=5) as blocked,
+        socket.create_connection(("localhost", port), timeout=5) as client,
+    ):
+        client.sendall(
+            b"*5\r\n$4\r\nXADD\r\n$1\r\ns\r\n$3\r\n1-1\r\n$1\r\nf\r\n$1\r\nv\r\n"
+        )
+        assert _recv_exact(client, 9) == b"$3\r\n1-1\r\n"
+
+        blocked.sendall(
+            b"*6\r\n$5\r\nXREAD\r\n$5\r\nBLOCK\r\n$1\r\n0\r\n"
+            b"$7\r\nSTREAMS\r\n$1\r\ns\r\n$1\r\n$\r\n"
+        )
+        time.sleep(0.05)
+        client.sendall(
+            b"*5\r\n$4\r\nXADD\r\n$1\r\ns\r\n$3\r\n1-2\r\n$1\r\nf\r\n$1\r\nv\r\n"
+        )
+        assert _recv_exact(client, 9) == b"$3\r\n1-2\r\n"
+
+        reply = b"*1\r\n*2\r\n$1\r\ns\r\n*1\r\n*2\r\n$3\r\n1-2\r\n*2\r\n$1\r\nf\r\n$1\r\nv\r\n"
+        assert _recv_exact(blocked, len(reply)) == reply
+
+
+class _Replica:
+    """Replica connected to the master, acking any offset on GETACK until
+    its socket is shut down."""
+
+    def __init__(self, port: int):
+        self.sock = socket.create_connection(("localhost", port), timeout=5)
+        self.sock.sendall(b"*3\r\n$5\r\nPSYNC\r\n$1\r\n?\r\n$2\r\n-1\r\n")
+        self.received = b""
+        threading.Thread(target=self._run, daemon=True).start()
+
+    def _run(self):
+        acked = 0
+        with self.sock:
+            while chunk := self.sock.recv(4096):
+                self.received += chunk
+                for _ in range(self.received.count(b"GETACK") - acked):
+                    self.sock.sendall(
+                        b"*3\r\n$8\r\nREPLCONF\r\n$3\r\nACK\r\n$4\r\n1000\r\n"
+                    )
+                    acked += 1
+
+
+def test_async_server_serves_replica_acks_during_wait():
+    port = _start_async_server()
+    replica = _Replica(port)
+    with socket.create_connection(("localhost", port), timeout=5) as client:
+        deadline = time.monotonic() + 1
+        while b"FULLRESYNC" not in replica.received and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        client.sendall(b"*3\r\n$3\r\nSET\r\n$3\r\nfoo\r\n$3\r\nbar\r\n")
+        assert _recv_exact(client, 5) == b"+OK\r\n"
+
+        start = time.monotonic()
+        client.sendall(b"*3\r\n$4\r\nWAIT\r\n$1\r\n1\r\n$4\r\n2000\r\n")
+        assert _recv_exact(client, 4) == b":1\r\n"
+        assert time.monotonic() - start < 0.5
+    replica.sock.shutdown(socket.SHUT_RDWR)
+
+
+def test_async_server_disconnects_replica_that_stops_reading():
+    exec_ctx = _test_execution_context()
+    exec_ctx.replica_pool = ReplicaConnectionPool(output_buffer_limit=1 << 20)
+    port = _start_async_server(exec_ctx)
+    with (
+        socket.create_connection(("localhost", port), timeout=5) as replica,
+        socket.create_connection(("localhost", port), timeout=5) as client,
+    ):
+        replica.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 4096)
+        replica.sendall(b"*3\r\n$5\r\nPSYNC\r\n$1\r\n?\r\n$2\r\n-1\r\n")
+        deadline = time.monotonic() + 1
+        while not exec_ctx.replica_pool._pool and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        # the replica never reads, writes propagated to it pile up
+        value = b"x" * 65536
+        set_value = b"*3\r\n$3\r\nSET\r\n$1\r\nk\r\n$%d\r\n%s\r\n" % (
+            len(value),
+            value,
+        )
+        for _ in range(256):  # 16 MB, more than the socket buffers can hold
+            client.sendall(set_value)
+            assert _recv_exact(client, 5) == b"+OK\r\n"
+            if not exec_ctx.replica_pool._pool:
+                break
+        assert not exec_ctx.replica_pool._pool
@@ -0,0 +1,102 @@
+from time import time
+
+import pytest
+
+from app.commands import CommandConfig, CommandInfo, CommandSet
+from app.storage.in_memory import SimpleStorage, StripedLockStorage
+from app.storage.in_memory.errors import OutOfMemory
+from app.storage.in_memory.eviction import (
+    LFU_INIT_VAL,
+    EvictionPool,
+    MaxMemoryPolicy,
+    initial_clock,
+    lfu_counter,
+    lfu_touch,
+)
+from app.storage.in_memory.memory import entry_size
+from app.storage.types import RedisValue
+from tests.unit_tests.test_commands.common import CommandTestBase
+
+ENTRY_SIZE = entry_size(b"key:000", RedisValue(b"value"))
+
+
+def _fill(storage, count: int, expiry: int | None = None):
+    for i in range(count):
+        storage.set(b"key:%03d" % i, RedisValue(b"value", expiry=expiry))
+
+
+def test_noeviction_rejects_writes_over_maxmemory():
+    storage = SimpleStorage(maxmemory=10 * ENTRY_SIZE)
+    _fill(storage, 11)  # the limit is checked before writes
+    with pytest.raises(OutOfMemory):
+        storage.set(b"foo", RedisValue(b"bar"))
+    stats = storage.memory_stats()
+    assert (stats.used_memory, stats.evicted_keys) == (11 * ENTRY_SIZE, 0)
+
+
+@pytest.mark.parametrize(
+    "policy", [MaxMemoryPolicy.ALLKEYS_LRU, MaxMemoryPolicy.ALLKEYS_LFU]
+)
+@pytest.mark.parametrize("storage_cls", [SimpleStorage, StripedLockStorage])
+def test_allkeys_policies_keep_memory_within_limit(storage_cls, policy):
+    maxmemory = 100 * ENTRY_SIZE
+    storage = storage_cls(maxmemory=maxmemory, maxmemory_policy=policy)
+    _fill(storage, 1000)
+
+    stats = storage.memory_stats()
+    assert stats.used_memory <= maxmemory + 64 * ENTRY_SIZE  # a write per stripe
+    assert stats.evicted_keys == 1000 - stats.keys
+
+
+def test_volatile_policies_only_evict_keys_with_expiry():
+    storage = SimpleStorage(
+        maxmemory=20 * ENTRY_SIZE, maxmemory_policy=MaxMemoryPolicy.VOLATILE_TTL
+    )
+    for i in range(10):
+        storage.set(b"persistent:%d" % i, RedisValue(b"value"))
+    _fill(storage, 20, expiry=int(time() * 1000) + 60_000)
+
+    assert all(storage.get(b"persistent:%d" % i) for i in range(10))
+    assert storage.memory_stats().evicted_keys > 0
+
+    storage.set(b"big", RedisValue(b"x" * 100 * ENTRY_SIZE))
+    with pytest.raises(OutOfMemory):  # no keys with an expiry left to evict
+        for i in range(20):
+            storage.set(b"more:%d" % i, RedisValue(b"value"))
+
+
+def test_eviction_pool_keeps_best_candidates():
+    pool = EvictionPool(size=3)
+    for score, key in [(5, b"a"), (1, b"b"), (9, b"c"), (7, b"d"), (7, b"d")]:
+        pool.insert(score, key)
+    assert [pool.pop(), pool.pop(), pool.pop(), pool.pop()] == [b"c", b"d", b"a", None]
+
+
+def test_lfu_counter_grows_logarithmically():
+    lru = initial_clock(MaxMemoryPolicy.ALLKEYS_LFU)
+    assert lfu_counter(lru) == LFU_INIT_VAL
+    for _ in range(1000):
+        lru = lfu_touch(lru)
+    assert LFU_INIT_VAL < lfu_counter(lru) < 100
+
+
+class TestMaxMemoryCommands(CommandTestBase):
+    def test_set_replies_oom(self):
+        self.exec_ctx.storage = SimpleStorage(maxmemory=1)
+        self.execute_command(CommandSet([b"foo", b"bar"]))
+        result = self.execute_command(CommandSet([b"baz", b"bar"]))
+        assert result.startswith(b"-OOM")
+
+    def test_config_get_maxmemory(self):
+        self.exec_ctx.config.maxmemory = 1024
+        result = self.execute_command(
+            CommandConfig([b"GET", b"maxmemory", b"maxmemory-policy"])
+        )
+        assert b"$4\r\n1024\r\n" in result
+        assert b"$10\r\nnoeviction\r\n" in result
+
+    def test_info_reports_memory(self):
+        self.execute_command(CommandSet([b"foo", b"bar"]))
+        result = self.execute_command(CommandInfo([b"memory", b"stats"]))
+        assert b"used_memory:%d\r\n" % entry_size(b"foo", RedisValue(b"bar")) in result
+        assert b"evicted_keys:0\r\n" in result
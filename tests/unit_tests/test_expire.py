@@ -0,0 +1,54 @@
+from time import time
+
+import pytest
+
+from app.info import Info
+from app.storage.in_memory import SimpleStorage, StripedLockStorage
+from app.storage.in_memory.expire import active_expire_cycle
+from app.storage.types import RedisValue
+
+
+def _now_ms() -> int:
+    return int(time() * 1000)
+
+
+@pytest.mark.parametrize("storage_cls", [SimpleStorage, StripedLockStorage])
+def test_active_expire_removes_only_expired_keys(storage_cls):
+    storage = storage_cls()
+    for i in range(100):
+        storage.set(b"expired:%d" % i, RedisValue(b"v", expiry=_now_ms() - 1))
+    storage.set(b"volatile", RedisValue(b"v", expiry=_now_ms() + 60_000))
+    storage.set(b"persistent", RedisValue(b"v"))
+
+    assert storage.active_expire(30) == 30
+    assert active_expire_cycle(storage, time_limit=1) == 70
+    assert sorted(storage.keys()) == [b"persistent", b"volatile"]
+    assert storage.expire_stats() == (100, 1)
+
+
+def test_ttl_index_skips_stale_entries():
+    storage = SimpleStorage()
+    storage.set(b"foo", RedisValue(b"v", expiry=_now_ms() - 1))
+    storage.set(b"foo", RedisValue(b"v"))  # expiry removed by overwrite
+    storage.set(b"bar", RedisValue(b"v", expiry=_now_ms() - 1))
+    storage.remove(b"bar")
+
+    assert storage.active_expire(10) == 0
+    assert storage.get(b"foo").raw_bytes == b"v"
+    assert storage.expire_stats() == (0, 0)
+
+
+def test_keys_excludes_expired_keys():
+    storage = SimpleStorage()
+    storage.set(b"foo", RedisValue(b"v", expiry=_now_ms() - 1))
+    storage.set(b"bar", RedisValue(b"v"))
+    assert storage.keys() == [b"bar"]
+    assert storage.keys(b"f*") == []
+
+
+def test_info_stats_section():
+    info = Info()
+    info.update_expire_stats(42, 12.3456)
+    stats = info.get_sections_by_names(["stats"])["stats"]
+    assert b"expired_keys:42\r\n" in stats
+    assert b"expired_stale_perc:12.35\r\n" in stats
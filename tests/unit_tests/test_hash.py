@@ -0,0 +1,66 @@
+import random
+
+import pytest
+
+from app.storage.structures import HashTable, Listpack
+
+
+def test_listpack_whole_fields_only():
+    # fields must match a whole field, not part of an element or a value
+    lp = Listpack([(b"ab", b"cab"), (b"", b"b"), (b"b", b"")])
+    assert len(lp) == 3
+    assert lp.get(b"b") == b""
+    assert lp.get(b"") == b"b"
+    assert lp.get(b"ab") == b"cab"
+    assert lp.get(b"ca") is None
+    assert lp.get(b"cab") is None
+    assert lp.get(b"a") is None
+
+
+@pytest.mark.parametrize("hash_cls", [Listpack, HashTable])
+def test_hash_matches_dict(hash_cls):
+    rand = random.Random(7)
+    expected: dict[bytes, bytes] = {}
+    fields = hash_cls()
+    for step in range(3000):
+        field = b"f%d" % rand.randrange(50)
+        if rand.random() < 0.6:
+            value = b"v%d" % step
+            assert fields.update([(field, value)]) == (field not in expected)
+            expected[field] = value
+        else:
+            assert fields.delete([field]) == (expected.pop(field, None) is not None)
+        assert fields.get(field) == expected.get(field)
+        assert len(fields) == len(expected)
+
+    assert sorted(fields.items()) == sorted(expected.items())
+    assert fields.data_size() == sum(len(f) + len(v) for f, v in expected.items())
+
+
+def test_hashtable_scan():
+    fields = HashTable((b"f%d" % i, b"v%d" % i) for i in range(1000))
+    seen, cursor = {}, 0
+    while True:
+        cursor, pairs = fields.scan(cursor, 10)
+        seen.update(pairs)
+        if cursor == 0:
+            break
+    assert seen == dict(fields.items())
+
+
+def test_listpack_is_smaller():
+    pairs = [(b"field:%d" % i, b"value:%d" % i) for i in range(10)]
+    assert Listpack(pairs).memory_usage() * 2 < HashTable(pairs).memory_usage()
+
+
+def test_listpack_offsets_widen():
+    lp = Listpack([(b"a", b"x" * 40000)])
+    assert lp.offsets.typecode == "H"
+    lp.update([(b"b", b"y" * 30000)])
+    assert lp.offsets.typecode == "I"
+    assert lp.get(b"b") == b"y" * 30000
+
+    lp = Listpack([(b"a", b"x"), (b"b", b"y")])
+    lp.update([(b"a", b"x" * 70000)])
+    assert lp.offsets.typecode == "I"
+    assert lp.items() == [(b"a", b"x" * 70000), (b"b", b"y")]
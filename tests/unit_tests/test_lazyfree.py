@@ -0,0 +1,47 @@
+import time
+
+from app.storage.in_memory import SimpleStorage, StripedLockStorage
+from app.storage.in_memory.lazyfree import LazyFree, _release
+from app.storage.types import RedisValue
+
+
+def _wait_freed(lazyfree: LazyFree, timeout: float = 5):
+    deadline = time.monotonic() + timeout
+    while lazyfree.pending_objects and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert lazyfree.pending_objects == 0
+
+
+def test_release_empties_containers():
+    db = {b"a": RedisValue(b"1"), b"b": RedisValue(b"2")}
+    nested = [db, {1, 2}, [[1], [2]]]
+    _release((nested,))
+    assert db == {} and nested == []
+
+
+def test_small_objects_are_freed_synchronously():
+    lazyfree = LazyFree()
+    lazyfree.free(RedisValue(b"value"))
+    assert lazyfree._thread is None
+
+
+def test_flush_async_frees_in_background():
+    lazyfree = LazyFree()
+    storage = SimpleStorage(
+        {b"key:%d" % i: RedisValue(b"v") for i in range(1000)}, lazyfree=lazyfree
+    )
+    db = storage.db
+    storage.flush(lazy=True)
+
+    assert storage.keys() == []
+    _wait_freed(lazyfree)
+    assert db == {}  # detached keyspace was taken apart
+
+
+def test_striped_flush_async():
+    storage = StripedLockStorage(
+        {b"key:%d" % i: RedisValue(b"v") for i in range(5000)}, stripes=4
+    )
+    storage.flush(lazy=True)
+    assert storage.keys() == []
+    assert storage.memory_stats().keys == 0
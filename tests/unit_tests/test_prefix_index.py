@@ -0,0 +1,56 @@
+import random
+from time import time
+
+import pytest
+
+from app.storage.in_memory import SimpleStorage, StripedLockStorage
+from app.storage.in_memory import prefix_index
+from app.storage.in_memory.prefix_index import PrefixIndex, literal_prefix
+from app.storage.types import RedisValue
+
+
+@pytest.mark.parametrize(
+    "pattern,prefix",
+    [
+        (b"session:1234:*", b"session:1234:"),
+        (b"user:?:name", b"user:"),
+        (b"h[ae]llo", b"h"),
+        (b"*:suffix", b""),
+        (b"literal", b"literal"),
+    ],
+)
+def test_literal_prefix(pattern, prefix):
+    assert literal_prefix(pattern) == prefix
+
+
+def test_prefix_index_across_sublists(monkeypatch):
+    monkeypatch.setattr(prefix_index, "SUBLIST_SIZE", 4)
+    keys = [b"%s:%d" % (group, i) for group in (b"a", b"b", b"c") for i in range(30)]
+    random.shuffle(keys)
+
+    index = PrefixIndex(keys[:20])
+    for key in keys[20:]:
+        index.add(key)
+    for key in keys[::3]:
+        index.discard(key)
+    index.discard(b"missing")
+
+    remaining = set(keys) - set(keys[::3])
+    for prefix in (b"a:", b"b:1", b"c:29", b"d", b""):
+        expected = sorted(k for k in remaining if k.startswith(prefix))
+        assert list(index.with_prefix(prefix)) == expected
+
+
+@pytest.mark.parametrize("storage_cls", [SimpleStorage, StripedLockStorage])
+def test_keys_with_prefix_index(storage_cls):
+    expired = int(time() * 1000) - 1
+    db = {b"session:%d:%d" % (i % 10, i): RedisValue(b"v") for i in range(200)}
+    db[b"session:1:expired"] = RedisValue(b"v", expiry=expired)
+    indexed = storage_cls(dict(db), prefix_index=True)
+    plain = storage_cls(dict(db))
+    indexed.remove(b"session:1:11")
+    plain.remove(b"session:1:11")
+
+    for pattern in (b"session:1:*", b"session:1:1?", b"session:*", b"*:1:*", b"x*"):
+        assert sorted(indexed.keys(pattern)) == sorted(plain.keys(pattern))
+    assert b"session:1:expired" not in indexed.keys(b"session:1:*")
@@ -0,0 +1,66 @@
+import random
+
+import pytest
+
+from app.storage.structures import quicklist
+from app.storage.structures.quicklist import PackedChunk, QuickList
+
+
+def test_packed_chunk():
+    chunk = PackedChunk([b"a", b"", b"ccc"])
+    assert len(chunk) == 3
+    assert chunk[2] == b"ccc"
+    assert chunk.slice(1, 3) == [b"", b"ccc"]
+    assert chunk.unpack() == [b"a", b"", b"ccc"]
+
+
+def test_quicklist_matches_list(monkeypatch):
+    monkeypatch.setattr(quicklist, "CHUNK_SIZE", 4)
+    rand = random.Random(7)
+    expected: list[bytes] = []
+    ql = QuickList()
+    for step in range(5000):
+        op = rand.random()
+        element = b"%d" % step
+        if op < 0.3:
+            ql.push_left(element)
+            expected.insert(0, element)
+        elif op < 0.6:
+            ql.push_right(element)
+            expected.append(element)
+        elif op < 0.75 and expected:
+            assert ql.pop_left() == expected.pop(0)
+        elif op < 0.9 and expected:
+            assert ql.pop_right() == expected.pop()
+        elif op < 0.99 and expected:
+            index = rand.randrange(-len(expected), len(expected))
+            assert ql.index(index) == expected[index]
+            start = rand.randrange(len(expected))
+            stop = rand.randrange(start, len(expected) + 1)
+            assert ql.range(start, stop) == expected[start:stop]
+        elif expected:
+            start = rand.randrange(len(expected) // 4 + 1)
+            stop = rand.randrange(len(expected) * 3 // 4, len(expected) + 1)
+            ql.trim(start, stop)
+            expected = expected[start:stop]
+
+        assert len(ql) == len(expected)
+        assert all(len(chunk) == 4 for chunk in list(ql._chunks)[1:-1])
+        assert ql.data_size() == sum(map(len, expected))
+    assert ql.range(0, len(ql)) == expected
+
+
+def test_quicklist_errors():
+    ql = QuickList([b"a"])
+    with pytest.raises(IndexError):
+        ql.index(1)
+    ql.pop_left()
+    with pytest.raises(IndexError):
+        ql.pop_right()
+    assert ql.memory_usage() > 0
+
+
+def test_quicklist_packs_interior_chunks():
+    ql = QuickList(b"%d" % i for i in range(10 * quicklist.CHUNK_SIZE))
+    assert sum(isinstance(chunk, PackedChunk) for chunk in ql._chunks) == 9
+    assert ql.memory_usage() < len(ql) * 16
@@ -0,0 +1,161 @@
+import threading
+import time
+
+from app.replication.output import ReplicaOutput
+from app.replication.pool import ACK_RETRY_INTERVAL, GET_ACK, ReplicaConnectionPool
+
+
+class _Replica:
+    """Socket of a replica which answers GETACK with the given offsets (one
+    per GETACK, the last one is repeated) from another thread."""
+
+    def __init__(self, pool: ReplicaConnectionPool, uid: str, *offsets: int):
+        self.pool, self.uid, self.offsets = pool, uid, list(offsets)
+        self.getacks = 0
+        pool.add(uid, self)
+
+    def sendall(self, data: bytes):
+        assert data == GET_ACK
+        self.getacks += 1
+        if self.offsets:
+            offset = self.offsets.pop(0) if len(self.offsets) > 1 else self.offsets[0]
+            threading.Thread(
+                target=self.pool.update_last_ack_offset, args=(self.uid, offset)
+            ).start()
+
+    def close(self):
+        pass
+
+
+def test_wait_returns_without_getack_once_acked():
+    pool = ReplicaConnectionPool()
+    replica = _Replica(pool, "a", 10)
+    pool.update_last_ack_offset("a", 10)
+    assert pool.wait_for_acks(10, 1, timeout=1) == 1
+    assert replica.getacks == 0
+
+
+def test_wait_returns_once_required_acks_arrive():
+    pool = ReplicaConnectionPool()
+    replicas = [_Replica(pool, "a", 10), _Replica(pool, "b", 12), _Replica(pool, "c")]
+    start = time.monotonic()
+    assert pool.wait_for_acks(10, 2, timeout=5) == 2
+    assert time.monotonic() - start < ACK_RETRY_INTERVAL
+    # GETACK is sent to each replica by its writer thread
+    _wait_until(lambda: [replica.getacks for replica in replicas] == [1, 1, 1])
+
+
+def test_wait_times_out_with_acks_received():
+    pool = ReplicaConnectionPool()
+    _Replica(pool, "a", 10)
+    silent = _Replica(pool, "b")
+    start = time.monotonic()
+    assert pool.wait_for_acks(10, 2, timeout=0.5) == 1
+    assert time.monotonic() - start >= 0.5
+    assert silent.getacks == 1  # a pending GETACK is not sent again
+
+
+def test_replicas_behind_are_asked_again():
+    pool = ReplicaConnectionPool()
+    replica = _Replica(pool, "a", 4, 10)
+    assert pool.wait_for_acks(10, 1, timeout=5) == 1
+    assert replica.getacks == 2
+
+
+def test_concurrent_waits_are_woken_by_their_offset():
+    pool = ReplicaConnectionPool()
+    _Replica(pool, "a")
+    results: dict[int, int] = {}
+
+    def wait(offset: int):
+        results[offset] = pool.wait_for_acks(offset, 1, timeout=5)
+
+    threads = [threading.Thread(target=wait, args=(offset,)) for offset in (5, 20)]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.05)
+
+    pool.update_last_ack_offset("a", 5)
+    threads[0].join(timeout=1)
+    assert results == {5: 1}
+
+    pool.update_last_ack_offset("a", 20)
+    threads[1].join(timeout=1)
+    assert results == {5: 1, 20: 1}
+    assert not pool._waiting
+
+
+class _SlowSocket:
+    """Socket whose sends block until released, recording what was sent."""
+
+    def __init__(self, fail: bool = False):
+        self.sent: list[bytes] = []
+        self.closed = False
+        self.release = threading.Event()
+        self._fail = fail
+
+    def sendall(self, data: bytes):
+        self.release.wait(timeout=1)
+        if self._fail:
+            raise BrokenPipeError("broken pipe")
+        self.sent.append(data)
+
+    def close(self):
+        self.closed = True
+
+
+def _wait_until(condition):
+    deadline = time.monotonic() + 1
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.001)
+    assert condition()
+
+
+def test_output_sends_preamble_then_writes_batched_in_order():
+    sock = _SlowSocket()
+    output = ReplicaOutput("a", sock, limit=0, on_error=lambda: None, preamble=[b"p"])
+    for i in range(5):
+        assert output.write(b"%d" % i)
+    sock.release.set()
+    _wait_until(lambda: len(output) == 0)
+    assert sock.sent == [b"p", b"01234"]  # buffered while sending the preamble
+    output.close()
+
+
+def test_broadcast_does_not_wait_for_slow_replicas():
+    pool = ReplicaConnectionPool()
+    slow, fast = _SlowSocket(), _SlowSocket()
+    fast.release.set()
+    pool.add("slow", slow)
+    pool.add("fast", fast)
+    assert pool.broadcast_to_all_connections(b"a") == 2
+    assert pool.broadcast_to_all_connections(b"b") == 2
+    _wait_until(lambda: b"".join(fast.sent) == b"ab")
+    assert slow.sent == []
+
+    slow.release.set()
+    _wait_until(lambda: b"".join(slow.sent) == b"ab")
+
+
+def test_replicas_over_output_buffer_limit_are_disconnected():
+    pool = ReplicaConnectionPool(output_buffer_limit=10)
+    slow, fast = _SlowSocket(), _SlowSocket()
+    fast.release.set()
+    pool.add("slow", slow)
+    pool.add("fast", fast)
+    assert pool.broadcast_to_all_connections(b"123456") == 2
+    _wait_until(lambda: fast.sent and not len(pool._pool["fast"].output))
+    # the slow replica is still sending the first write
+    assert pool.broadcast_to_all_connections(b"123456") == 1
+    assert slow.closed and not fast.closed
+    slow.release.set()
+
+
+def test_replicas_failing_to_send_are_disconnected():
+    pool = ReplicaConnectionPool()
+    sock = _SlowSocket(fail=True)
+    sock.release.set()
+    pool.add("a", sock)
+    pool.broadcast_to_all_connections(b"a")
+    _wait_until(lambda: sock.closed)
+    assert pool.broadcast_to_all_connections(b"b") == 0
@@ -0,0 +1,116 @@
+import itertools
+from time import time
+
+import pytest
+
+from app.storage.in_memory import SimpleStorage, StripedLockStorage
+from app.storage.in_memory.scan import (
+    REHASH_BUCKETS_PER_STEP,
+    ScanTable,
+    next_cursor,
+)
+from app.storage.types import RedisEncoding, RedisValue
+
+
+def _scan_all(scan, count: int = 10, on_step=None) -> list:
+    cursor, seen = 0, []
+    while True:
+        cursor, elements = scan(cursor, count)
+        seen.extend(elements)
+        if on_step:
+            on_step()
+        if cursor == 0:
+            return seen
+
+
+def test_next_cursor_visits_every_bucket_once():
+    mask, cursor, visited = 15, 0, []
+    while True:
+        visited.append(cursor)
+        cursor = next_cursor(cursor, mask)
+        if cursor == 0:
+            break
+    assert visited[:4] == [0, 8, 4, 12]
+    assert sorted(visited) == list(range(16))
+
+
+def test_scan_table_returns_all_elements():
+    table = ScanTable(range(1000))
+    assert sorted(_scan_all(table.scan)) == list(range(1000))
+
+
+@pytest.mark.parametrize("grow", [True, False])
+def test_scan_table_survives_resizes(grow):
+    # elements present for the whole iteration are returned at least once
+    # while the table grows (or shrinks) between steps
+    # (bytes, as small ints hash to themselves and share a bucket)
+    stable = [b"%d" % i for i in range(500)]
+    extra = (b"%d" % i for i in range(1000, 9000))
+    churn = [b"%d" % i for i in range(500, 4000)]
+    table = ScanTable(stable + ([] if grow else churn))
+
+    def _resize():
+        if grow:
+            for element in itertools.islice(extra, 200):
+                table.add(element)
+        elif churn:
+            for _ in range(200):
+                if churn:
+                    table.discard(churn.pop())
+
+    seen = set(_scan_all(table.scan, on_step=_resize))
+    assert set(stable) <= seen
+
+
+def test_scan_table_rehashes_incrementally():
+    keys = [b"key:%d" % i for i in range(1025)]
+    table = ScanTable(keys[:1024])
+    assert table._old is None and len(table._table) == 1024
+
+    # the table grows, its buckets are then moved a few per add
+    table.add(keys[1024])
+    assert table._old is not None and len(table._table) == 2048
+    assert sum(bucket is not None for bucket in table._table) == 1
+    table.add(b"extra")
+    assert table._rehash_index == REHASH_BUCKETS_PER_STEP
+    table.discard(b"extra")
+
+    # elements are found in either table until the rehash is complete
+    assert sorted(_scan_all(table.scan)) == sorted(keys)
+    for key in keys[::2]:
+        table.discard(key)
+    assert sorted(_scan_all(table.scan)) == sorted(keys[1::2])
+    for key in keys[1::2]:
+        table.discard(key)
+    assert len(table) == 0 and _scan_all(table.scan) == []
+
+
+def test_storage_scan_filters():
+    expired = int(time() * 1000) - 1
+    storage = SimpleStorage(
+        {
+            b"user:1": RedisValue(b"a"),
+            b"user:2": RedisValue(b"b"),
+            b"item:1": RedisValue(b"c"),
+            b"user:3": RedisValue(b"d", expiry=expired),
+            b"user:4": RedisValue(b"e", encoding=RedisEncoding.LIST),
+        }
+    )
+    assert sorted(_scan_all(lambda c, n: storage.scan(c, n, b"user:*"))) == [
+        b"user:1",
+        b"user:2",
+        b"user:4",
+    ]
+    assert sorted(_scan_all(lambda c, n: storage.scan(c, n, None, "string"))) == [
+        b"item:1",
+        b"user:1",
+        b"user:2",
+    ]
+
+
+def test_striped_storage_scan():
+    storage = StripedLockStorage(
+        {b"key:%d" % i: RedisValue(b"v") for i in range(2000)}, stripes=8
+    )
+    keys = _scan_all(lambda c, n: storage.scan(c, n), count=50)
+    assert sorted(keys) == sorted(b"key:%d" % i for i in range(2000))
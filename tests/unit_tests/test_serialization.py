@@ -5,6 +5,7 @@ from app.resp import (
     SimpleError,
     Array,
 )
+from app.resp import encoder, shared
 
 
 def test_serialize_simple_string():
@@ -44,3 +45,27 @@ def test_serialize_array():
     expected = b"*3\r\n+Hello\r\n:123\r\n$5\r\nWorld\r\n"
     result = bytes(Array(value))
     assert result == expected
+
+
+def test_encoder_writes_into_buffer():
+    buf = bytearray()
+    encoder.write_array_header(buf, 4)
+    encoder.write_bulk_string(buf, b"foo")
+    encoder.write_bulk_string(buf, None)
+    encoder.write_integer(buf, -5)
+    encoder.write_simple_string(buf, b"OK")
+    assert buf == b"*4\r\n$3\r\nfoo\r\n$-1\r\n:-5\r\n+OK\r\n"
+
+
+def test_encoder_matches_resp_types():
+    values = [b"a", b"bb", b"ccc"]
+    assert encoder.bulk_string_array(values) == bytes(
+        Array([BulkString(v) for v in values])
+    )
+    assert encoder.integer(12345) == bytes(Integer(b"12345"))
+    assert encoder.error(b"ERR oops") == bytes(SimpleError(b"ERR oops"))
+
+
+def test_shared_integers():
+    assert encoder.integer(42) is shared.INTEGERS[42]
+    assert encoder.integer(shared.SHARED_INTEGERS) == b":10000\r\n"
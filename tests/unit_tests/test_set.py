@@ -0,0 +1,51 @@
+import random
+
+import pytest
+
+from app.storage.structures import HashSet, IntSet
+from app.storage.structures.set import difference, intersection, union
+
+
+def test_intset_matches_set():
+    rand = random.Random(7)
+    expected: set[int] = set()
+    intset = IntSet()
+    for _ in range(3000):
+        numbers = [rand.randrange(-100, 100) for _ in range(rand.choice([1, 20]))]
+        if rand.random() < 0.6:
+            assert intset.add(numbers) == len(set(numbers) - expected)
+            expected.update(numbers)
+        else:
+            members = [b"%d" % number for number in numbers]
+            assert intset.remove(members) == len(set(numbers) & expected)
+            expected.difference_update(numbers)
+        assert list(intset.numbers()) == sorted(expected)
+
+    assert b"%d" % min(expected) in intset
+    assert b"abc" not in intset
+    assert b"+1" not in intset  # not the canonical form of an integer
+
+
+def test_intset_is_smaller():
+    numbers = range(1000)
+    members = HashSet(b"%d" % number for number in numbers)
+    assert IntSet(numbers).memory_usage() * 5 < members.memory_usage()
+
+
+@pytest.mark.parametrize("encoding", [IntSet, HashSet])
+def test_set_algebra(encoding):
+    def make(numbers):
+        if encoding is IntSet:
+            return IntSet(numbers)
+        return HashSet(b"%d" % number for number in numbers)
+
+    a, b, c = make(range(0, 10)), make(range(5, 15)), make(range(8, 20))
+    # mixed encodings are compared as byte strings
+    mixed = HashSet([b"9", b"x"])
+
+    assert sorted(intersection([a, b, c]), key=int) == [b"8", b"9"]
+    assert intersection([a, b, mixed]) == [b"9"]
+    assert intersection([a, make([])]) == []
+    assert sorted(union([a, c]), key=int) == [b"%d" % i for i in range(20)]
+    assert sorted(union([a, mixed])) == sorted([b"%d" % i for i in range(10)] + [b"x"])
+    assert sorted(difference(a, [b, mixed]), key=int) == [b"%d" % i for i in range(5)]
@@ -0,0 +1,139 @@
+import os
+import threading
+import time
+
+import pytest
+
+from app.commands import (
+    CommandBLPop,
+    CommandFlushAll,
+    CommandFlushDb,
+    CommandGet,
+    CommandKeys,
+    CommandRPush,
+    CommandScan,
+    CommandSet,
+)
+from app.connection import accept_client_connections
+from app.resp.types.array import bytes_to_resp
+from app.sharding import ShardRouter
+from app.sharding.errors import CrossShardKeys
+from tests.unit_tests.test_commands.common import (
+    CommandTestBase,
+    _test_execution_context,
+)
+
+
+def _key_owned_by(router: ShardRouter, worker_id: int) -> bytes:
+    return next(
+        key
+        for key in (f"key:{i}".encode() for i in range(1000))
+        if router.owner_of(key) == worker_id
+    )
+
+
+def test_route_keys_to_owner():
+    router = ShardRouter(worker_id=0, num_workers=4, port=0)
+    key = _key_owned_by(router, 3)
+    assert router.route([key]) == 3
+    assert router.route([]) == 0
+
+
+def test_route_rejects_keys_owned_by_different_workers():
+    router = ShardRouter(worker_id=0, num_workers=2, port=0)
+    with pytest.raises(CrossShardKeys):
+        router.route([_key_owned_by(router, 0), _key_owned_by(router, 1)])
+
+
+class TestShardedCommands(CommandTestBase):
+    def setup_method(self):
+        super().setup_method()
+        port = os.getpid()  # namespaces unix socket paths for this test run
+        self.exec_ctx.shard_router = ShardRouter(0, 2, port)
+
+        # run worker 1 in the background, listening for forwarded commands
+        self.peer_exec_ctx = _test_execution_context()
+        self.peer_exec_ctx.shard_router = ShardRouter(1, 2, port)
+        threading.Thread(
+            target=accept_client_connections,
+            args=(self.peer_exec_ctx.shard_router.listen(), self.peer_exec_ctx, True),
+            daemon=True,
+        ).start()
+
+    def test_local_key_is_executed_locally(self):
+        key = _key_owned_by(self.exec_ctx.shard_router, 0)
+        assert self.execute_command(CommandSet([key, b"value"])) == b"+OK\r\n"
+        assert self.exec_ctx.storage.get(key).raw_bytes == b"value"
+        assert self.peer_exec_ctx.storage.keys() == []
+
+    def test_remote_key_is_forwarded_to_owner(self):
+        key = _key_owned_by(self.exec_ctx.shard_router, 1)
+        assert self.execute_command(CommandSet([key, b"value"])) == b"+OK\r\n"
+        assert self.execute_command(CommandGet([key])) == b"$5\r\nvalue\r\n"
+        assert self.exec_ctx.storage.keys() == []
+        assert self.peer_exec_ctx.storage.get(key).raw_bytes == b"value"
+        assert self.exec_ctx.info.workers.forwarded_commands == 2
+
+    def test_forwarded_nil_replies_are_relayed_as_received(self):
+        key = _key_owned_by(self.exec_ctx.shard_router, 1)
+        assert self.execute_command(CommandBLPop([key, b"0.01"])) == b"*-1\r\n"
+        assert self.execute_command(CommandGet([key])) == b"$-1\r\n"
+        assert self.execute_command(CommandSet([key, b""])) == b"+OK\r\n"
+        assert self.execute_command(CommandGet([key])) == b"$0\r\n\r\n"
+
+    def test_blocked_forwarded_command_does_not_stall_others(self):
+        key = _key_owned_by(self.exec_ctx.shard_router, 1)
+        replies = []
+        blpop = threading.Thread(
+            target=lambda: replies.append(
+                self.execute_command(CommandBLPop([key, b"1"]))
+            )
+        )
+        blpop.start()
+        time.sleep(0.05)  # BLPOP is blocked on worker 1
+
+        start = time.monotonic()
+        assert self.execute_command(CommandRPush([key, b"x"])) == b":1\r\n"
+        assert time.monotonic() - start < 0.5
+        blpop.join(timeout=1)
+        assert replies == [b"*2\r\n$%d\r\n%s\r\n$1\r\nx\r\n" % (len(key), key)]
+
+    def test_keys_are_gathered_from_all_workers(self):
+        local = _key_owned_by(self.exec_ctx.shard_router, 0)
+        remote = _key_owned_by(self.exec_ctx.shard_router, 1)
+        for key in (local, remote):
+            assert self.execute_command(CommandSet([key, b"value"])) == b"+OK\r\n"
+
+        reply = self.execute_command(CommandKeys([b"*"]))
+        assert reply == b"*2\r\n" + b"".join(
+            b"$%d\r\n%s\r\n" % (len(key), key) for key in (local, remote)
+        )
+        assert self.execute_command(CommandKeys([b"none*"])) == b"*0\r\n"
+
+    def test_scan_iterates_over_all_workers(self):
+        keys = {b"key:%d" % i for i in range(100)}
+        for key in keys:
+            assert self.execute_command(CommandSet([key, b"value"])) == b"+OK\r\n"
+        assert self.exec_ctx.storage.keys() and self.peer_exec_ctx.storage.keys()
+
+        seen, cursor = [], b"0"
+        while True:
+            reply, _ = bytes_to_resp(
+                self.execute_command(CommandScan([cursor, b"COUNT", b"10"]))
+            )
+            cursor, elements = reply.value
+            cursor = cursor.value
+            seen.extend(element.value for element in elements.value)
+            if cursor == b"0":
+                break
+        assert set(seen) == keys
+
+    @pytest.mark.parametrize("command", [CommandFlushAll, CommandFlushDb])
+    def test_flush_removes_keys_of_all_workers(self, command):
+        for worker_id in (0, 1):
+            key = _key_owned_by(self.exec_ctx.shard_router, worker_id)
+            assert self.execute_command(CommandSet([key, b"value"])) == b"+OK\r\n"
+
+        assert self.execute_command(command([])) == b"+OK\r\n"
+        assert self.exec_ctx.storage.keys() == []
+        assert self.peer_exec_ctx.storage.keys() == []
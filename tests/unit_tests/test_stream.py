@@ -0,0 +1,94 @@
+import random
+
+import pytest
+
+from app.storage.structures import Stream
+from app.storage.structures.stream import MAX_ID, MIN_ID, decrement, increment
+
+
+def _entries(count: int, rand: random.Random):
+    stream_id = (1, 0)
+    for i in range(count):
+        # mostly increasing sequence numbers, with jumps of the milliseconds
+        # that don't fit in a block (more than 32 bits)
+        jump = rand.choice([0, 0, 0, 1, 5, 2**33])
+        stream_id = (stream_id[0] + jump, 0) if jump else increment(stream_id)
+        if rand.random() < 0.8:
+            elements = [b"sensor", b"%d" % i, b"temp", b"%d" % rand.randrange(100)]
+        else:
+            elements = [b"other", b"x" * rand.randrange(50)]
+        yield stream_id, elements
+
+
+def test_stream_matches_list():
+    rand = random.Random(7)
+    expected = list(_entries(3000, rand))
+    stream = Stream()
+    for stream_id, elements in expected:
+        stream.add(stream_id, elements, node_max_entries=16, node_max_bytes=256)
+    assert len(stream) == len(expected)
+    assert stream.last_id == expected[-1][0]
+    assert stream.range(MIN_ID, MAX_ID) == expected
+    assert stream.reverse_range(MIN_ID, MAX_ID) == expected[::-1]
+
+    for _ in range(300):
+        i, j = sorted(rand.randrange(len(expected)) for _ in range(2))
+        start, end = expected[i][0], expected[j][0]
+        count = rand.choice([None, 1, 7, 100])
+        assert stream.range(start, end, count) == expected[i : j + 1][:count]
+        assert (
+            stream.reverse_range(start, end, count) == expected[i : j + 1][::-1][:count]
+        )
+        # bounds between IDs
+        assert stream.range(increment(start), decrement(end)) == expected[i + 1 : j]
+
+
+@pytest.mark.parametrize("approximate", [False, True])
+def test_stream_trim(approximate):
+    rand = random.Random(3)
+    expected = list(_entries(500, rand))
+    stream = Stream()
+    for stream_id, elements in expected:
+        stream.add(stream_id, elements, node_max_entries=10, node_max_bytes=4096)
+
+    size = stream.memory_usage()
+    for maxlen in (400, 123, 122, 50, 0):
+        length = len(stream)
+        assert stream.trim(maxlen, approximate) == length - len(stream)
+        assert stream.range(MIN_ID, MAX_ID) == expected[len(expected) - len(stream) :]
+        if approximate:
+            assert maxlen <= len(stream) < maxlen + 10
+        else:
+            assert len(stream) == maxlen
+        assert stream.memory_usage() <= size
+
+    # the last ID is kept for IDs of new entries
+    assert stream.last_id == expected[-1][0]
+    assert stream.range(MIN_ID, MAX_ID) == []
+
+
+def test_stream_ids():
+    assert increment((1, 2**64 - 1)) == (2, 0)
+    assert increment(MAX_ID) is None
+    assert decrement((2, 0)) == (1, 2**64 - 1)
+    assert decrement(MIN_ID) is None
+
+    # IDs far apart are kept in separate blocks
+    stream = Stream()
+    for stream_id in [(1, 0), (1, 2**40), (2**63, 0), MAX_ID]:
+        stream.add(stream_id, [b"f", b"v"], node_max_entries=100, node_max_bytes=4096)
+    assert [entry_id for entry_id, _ in stream.range(MIN_ID, MAX_ID)] == [
+        (1, 0),
+        (1, 2**40),
+        (2**63, 0),
+        MAX_ID,
+    ]
+
+
+def test_stream_blocks_are_compact():
+    stream = Stream()
+    for i in range(10_000):
+        elements = [b"sensor", b"%d" % (i % 10), b"temp", b"%d" % (i % 40)]
+        stream.add((1_700_000_000_000 + i, 0), elements, 100, 4096)
+    # IDs and values only, the fields are shared within blocks
+    assert stream.memory_usage() / len(stream) < 32
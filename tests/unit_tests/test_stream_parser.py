@@ -0,0 +1,165 @@
+import socket
+import threading
+
+import pytest
+
+from app.resp import Array, BulkString, Integer, SimpleString
+from app.resp.errors import InvalidStartingByte
+from app.resp.stream import COMPACT_THRESHOLD, MIN_READ_SIZE, RespStreamParser
+
+SET_COMMAND = b"*3\r\n$3\r\nSET\r\n$3\r\nfoo\r\n$3\r\nbar\r\n"
+
+
+def test_parse_complete_element():
+    parser = RespStreamParser()
+    parser.feed(SET_COMMAND)
+    elements = list(parser)
+    assert elements == [
+        (Array([BulkString(b"SET"), BulkString(b"foo"), BulkString(b"bar")]), 31)
+    ]
+    assert list(parser) == []
+
+
+def test_parse_element_fed_byte_by_byte():
+    parser = RespStreamParser()
+    elements = []
+    for i in range(len(SET_COMMAND)):
+        parser.feed(SET_COMMAND[i : i + 1])
+        elements.extend(parser)
+    assert len(elements) == 1
+    assert elements[0][1] == len(SET_COMMAND)
+
+
+def test_parse_pipelined_elements_split_across_feeds():
+    data = SET_COMMAND + b"+OK\r\n:42\r\n*2\r\n*1\r\n$1\r\na\r\n$-1\r\n" + SET_COMMAND
+    parser = RespStreamParser()
+    parser.feed(data[:40])
+    first = list(parser)
+    parser.feed(data[40:])
+    rest = list(parser)
+
+    elements = [element for element, _ in first + rest]
+    assert elements[1:4] == [
+        SimpleString(b"OK"),
+        Integer(b"42"),
+        Array([Array([BulkString(b"a")]), BulkString(b"")]),
+    ]
+    assert len(elements) == 5
+    assert sum(size for _, size in first + rest) == len(data)
+
+
+def test_reset_after_protocol_error():
+    parser = RespStreamParser()
+    parser.feed(b"?invalid\r\n")
+    with pytest.raises(InvalidStartingByte):
+        list(parser)
+
+    parser.reset()
+    parser.feed(SET_COMMAND)
+    assert len(list(parser)) == 1
+
+
+def test_recv_into_pipelined_input_larger_than_read_size():
+    commands = 20_000
+    data = SET_COMMAND * commands
+    server, client = socket.socketpair()
+    threading.Thread(target=lambda: (client.sendall(data), client.close())).start()
+
+    parser = RespStreamParser()
+    parsed, parsed_bytes = 0, 0
+    while parser.recv_into(server):
+        for element, size in parser:
+            parsed += 1
+            parsed_bytes += size
+    server.close()
+
+    assert parsed == commands
+    assert parsed_bytes == len(data)
+    # parsed input is reclaimed, the buffer doesn't grow with the stream
+    assert len(parser._buf) < len(data)
+
+
+def test_recv_into_large_bulk_string_across_reads():
+    value = b"x" * (3 * MIN_READ_SIZE + COMPACT_THRESHOLD)
+    data = SET_COMMAND + b"$%d\r\n%s\r\n" % (len(value), value)
+    server, client = socket.socketpair()
+    threading.Thread(target=lambda: (client.sendall(data), client.close())).start()
+
+    parser = RespStreamParser()
+    elements = []
+    while parser.recv_into(server):
+        elements.extend(element for element, _ in parser)
+    server.close()
+
+    assert elements[-1] == BulkString(value)
+
+
+def test_read_size_adapts_to_load():
+    server, client = socket.socketpair()
+    parser = RespStreamParser()
+
+    client.sendall(b"x" * MIN_READ_SIZE)
+    assert parser.recv_into(server) == MIN_READ_SIZE
+    assert parser._read_size == 2 * MIN_READ_SIZE  # read filled, grow
+
+    client.sendall(b"x")
+    assert parser.recv_into(server) == 1
+    assert parser._read_size == MIN_READ_SIZE  # mostly idle, shrink
+
+    server.close()
+    client.close()
+
+
+def test_commands_decoded_to_byte_strings():
+    parser = RespStreamParser(commands=True)
+    parser.feed(SET_COMMAND + b"+OK\r\n*2\r\n$3\r\nGET\r\n:1\r\n" + SET_COMMAND)
+    assert list(parser) == [
+        ([b"SET", b"foo", b"bar"], len(SET_COMMAND)),
+        (SimpleString(b"OK"), 5),  # not an array
+        (Array([BulkString(b"GET"), Integer(b"1")]), 17),  # not all bulk strings
+        ([b"SET", b"foo", b"bar"], len(SET_COMMAND)),
+    ]
+
+
+def test_incomplete_command_resumes_on_fast_path():
+    parser = RespStreamParser(commands=True)
+    parser.feed(SET_COMMAND[:20])
+    assert list(parser) == []
+    parser.feed(SET_COMMAND[20:] + SET_COMMAND)
+
+    elements = [element for element, _ in parser]
+    assert elements == [[b"SET", b"foo", b"bar"], [b"SET", b"foo", b"bar"]]
+
+
+def test_command_fed_byte_by_byte_is_decoded_to_byte_strings():
+    parser = RespStreamParser(commands=True)
+    elements = []
+    for i in range(len(SET_COMMAND)):
+        parser.feed(SET_COMMAND[i : i + 1])
+        elements.extend(parser)
+    assert elements == [([b"SET", b"foo", b"bar"], len(SET_COMMAND))]
+
+
+def test_incomplete_frame_of_other_elements_is_parsed_from_its_start():
+    parser = RespStreamParser(commands=True)
+    parser.feed(b"*2\r\n$3\r\nGET\r\n")
+    assert list(parser) == []
+    parser.feed(b":1\r\n" + SET_COMMAND)
+    assert list(parser) == [
+        (Array([BulkString(b"GET"), Integer(b"1")]), 17),
+        ([b"SET", b"foo", b"bar"], len(SET_COMMAND)),
+    ]
+
+
+def test_span_of_element_received_in_parts():
+    parser = RespStreamParser(commands=True)
+    parser.feed(SET_COMMAND[:20])
+    assert list(parser) == []
+    parser.feed(SET_COMMAND[20:] + SET_COMMAND)
+
+    spans = []
+    for _, size in parser:
+        with parser.span(size) as span:
+            spans.append(bytes(span))
+    assert spans == [SET_COMMAND, SET_COMMAND]
+    parser.feed(b"x" * 2 * MIN_READ_SIZE)  # buffer can grow once released
@@ -0,0 +1,80 @@
+import threading
+
+import pytest
+
+from app.storage.in_memory import StripedLockStorage
+from app.storage.in_memory.errors import KeyDoesNotExist
+from app.storage.types import RedisValue
+
+
+def test_get_set_remove():
+    storage = StripedLockStorage(stripes=4)
+    storage.set(b"foo", RedisValue(raw_bytes=b"bar"))
+    assert storage.get(b"foo").raw_bytes == b"bar"
+
+    storage.remove(b"foo")
+    with pytest.raises(KeyDoesNotExist):
+        storage.get(b"foo")
+
+
+def test_keys_and_restore_span_all_stripes():
+    db = {b"key:%d" % i: RedisValue(raw_bytes=b"%d" % i) for i in range(100)}
+    storage = StripedLockStorage(db, stripes=8)
+
+    assert sorted(storage.keys()) == sorted(db)
+    assert sorted(storage.keys(b"key:1?")) == [b"key:%d" % i for i in range(10, 20)]
+
+
+def test_concurrent_updates_are_not_lost():
+    storage = StripedLockStorage(stripes=4)
+    keys = [b"counter:%d" % i for i in range(8)]
+    for key in keys:
+        storage.set(key, RedisValue(raw_bytes=b"0"))
+
+    def incr(value: RedisValue) -> RedisValue:
+        value.raw_bytes = b"%d" % (int(value.raw_bytes) + 1)
+        return value
+
+    def worker():
+        for _ in range(500):
+            for key in keys:
+                storage.update(key, incr)
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert all(storage.get(key).raw_bytes == b"4000" for key in keys)
+
+
+def test_multi_key_locking_holds_stripes_of_keys():
+    storage = StripedLockStorage(stripes=4)
+    blocked = threading.Event()
+
+    with storage.locked([b"a", b"b"]):
+        # another thread can't write to a held stripe until it is released
+        writer = threading.Thread(
+            target=lambda: (
+                storage.set(b"a", RedisValue(raw_bytes=b"1")),
+                blocked.set(),
+            )
+        )
+        writer.start()
+        assert not blocked.wait(0.1)
+
+    writer.join()
+    assert storage.get(b"a").raw_bytes == b"1"
+
+
+def test_view_many_spans_stripes():
+    storage = StripedLockStorage(stripes=8)
+    keys = [b"key:%d" % i for i in range(20)]
+    for key in keys[::2]:
+        storage.set(key, RedisValue(raw_bytes=key))
+
+    values = storage.view_many(keys, lambda values: values)
+    assert [v.raw_bytes if v else None for v in values] == [
+        key if i % 2 == 0 else None for i, key in enumerate(keys)
+    ]
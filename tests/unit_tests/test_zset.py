@@ -0,0 +1,59 @@
+import math
+import random
+
+import pytest
+
+from app.storage.structures import SortedSet, ZListpack, zset
+
+
+@pytest.mark.parametrize("zset_cls", [ZListpack, SortedSet])
+def test_zset_matches_sorted_list(zset_cls, monkeypatch):
+    monkeypatch.setattr(zset, "SUBLIST_SIZE", 4)
+    rand = random.Random(7)
+    expected: dict[bytes, float] = {}
+    members = zset_cls()
+    for step in range(3000):
+        member, score = b"m%d" % rand.randrange(60), float(rand.randrange(20))
+        if rand.random() < 0.65:
+            assert members.add(member, score) == (member not in expected)
+            expected[member] = score
+        else:
+            assert members.remove(member) == (expected.pop(member, None) is not None)
+
+        items = sorted((s, m) for m, s in expected.items())
+        assert members.items() == items
+        if not items:
+            continue
+        member = rand.choice(items)[1]
+        assert members.rank(member) == items.index((expected[member], member))
+        assert members.score(member) == expected[member]
+
+        start = rand.randrange(len(items) + 1)
+        stop = rand.randrange(start, len(items) + 1)
+        assert members.range(start, stop) == [(m, s) for s, m in items[start:stop]]
+
+        low, high = sorted(float(rand.randrange(-1, 21)) for _ in range(2))
+        start, stop = members.score_range(low, True, high, False)
+        assert items[start:stop] == [item for item in items if low < item[0] <= high]
+
+
+@pytest.mark.parametrize("zset_cls", [ZListpack, SortedSet])
+def test_zset_infinite_scores(zset_cls):
+    members = zset_cls([(-math.inf, b"a"), (0.0, b"b"), (math.inf, b"c")])
+    assert members.score_range(-math.inf, False, math.inf, False) == (0, 3)
+    assert members.score_range(-math.inf, True, math.inf, True) == (1, 2)
+    assert members.score_range(math.inf, True, math.inf, False) == (3, 3)
+
+
+@pytest.mark.parametrize("zset_cls", [ZListpack, SortedSet])
+def test_zset_lex_range(zset_cls):
+    members = zset_cls((0.0, member) for member in [b"a", b"b", b"c", b"d"])
+    assert members.lex_range(None, False, None, False) == (0, 4)
+    assert members.lex_range(b"b", False, b"c", True) == (1, 2)
+    assert members.lex_range(b"b", True, b"z", False) == (2, 4)
+    assert members.lex_range(b"c", False, b"a", False) == (2, 2)
+
+
+def test_zlistpack_is_smaller():
+    items = [(float(i), b"player:%d" % i) for i in range(100)]
+    assert ZListpack(items).memory_usage() * 3 < SortedSet(items).memory_usage()